@@ -4,3 +4,14 @@ class SDocMarkup:
     TEXT = "Text"
 
     ALL = {RST, HTML, TEXT}
+
+
+class SDocParser:
+    # The textX parser generated from the SDoc grammar.
+    TEXTX = "textx"
+    # The hand-written parser, see strictdoc/backend/sdoc/native_parser.py.
+    NATIVE = "native"
+    # Both parsers, the models created by the parsers are compared.
+    CONFORMANCE = "conformance"
+
+    ALL = [TEXTX, NATIVE, CONFORMANCE]
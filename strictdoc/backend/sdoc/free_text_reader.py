@@ -7,7 +7,7 @@ from strictdoc.backend.sdoc.models.anchor import Anchor
 from strictdoc.backend.sdoc.models.free_text import FreeTextContainer
 from strictdoc.backend.sdoc.models.inline_link import InlineLink
 from strictdoc.backend.sdoc.processor import ParseContext
-from strictdoc.helpers.textx import drop_textx_meta
+from strictdoc.helpers.textx import drop_textx_meta, restore_position_slots
 
 
 class SDFreeTextReader:
@@ -20,6 +20,7 @@ class SDFreeTextReader:
             classes=[FreeTextContainer, InlineLink, Anchor],
             use_regexp_group=True,
         )
+        restore_position_slots(meta_model)
 
         parse_context = ParseContext(file_path)
 
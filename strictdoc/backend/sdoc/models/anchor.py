@@ -14,10 +14,20 @@ from strictdoc.backend.sdoc.models.model import (
 from strictdoc.helpers.auto_described import auto_described
 from strictdoc.helpers.cast import assert_cast
 from strictdoc.helpers.mid import MID
+from strictdoc.helpers.textx import TextXPositionSlots
 
 
 @auto_described
-class Anchor:
+class Anchor(TextXPositionSlots):
+    __slots__ = (
+        "parent",
+        "value",
+        "title",
+        "has_title",
+        "mid",
+        "reserved_mid",
+    )
+
     def __init__(
         self, parent: SDocNodeFieldIF, value: str, title: Optional[str]
     ) -> None:
@@ -324,8 +324,10 @@ class SDocDocument(SDocDocumentIF):
 
             node_dict = {}
 
-            node_dict["MID"] = node.reserved_mid.get_string_value()
-            map_nodes_by_mid[node.reserved_mid.get_string_value()] = node_dict
+            # A single string object is shared by all index entries of a node.
+            node_mid = node.reserved_mid.get_string_value()
+            node_dict["MID"] = node_mid
+            map_nodes_by_mid[node_mid] = node_dict
 
             for (
                 field_name_,
@@ -336,22 +338,13 @@ class SDocDocument(SDocDocumentIF):
 
                 node_dict[field_name_] = requirement_field_value
 
+                # Only the whole tokens are indexed. The prefix and suffix
+                # search is resolved against a sorted term dictionary, see
+                # StaticSearchIndex.
                 tokens = set(tokenize(requirement_field_value))
                 for token in tokens:
                     if len(token) > 1:
-                        document_index[token].add(
-                            node.reserved_mid.get_string_value()
-                        )
-
-                        for i in range(0, len(token)):
-                            token_incremental = token[: i + 1]
-                            document_index[token_incremental].add(
-                                node.reserved_mid
-                            )
-                            token_deincremental = token[i:]
-                            document_index[token_deincremental].add(
-                                node.reserved_mid
-                            )
+                        document_index[token].add(node_mid)
 
         self.search_index = SDocDocumentSearchIndex(
             document_index, map_nodes_by_mid
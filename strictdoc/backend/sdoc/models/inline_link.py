@@ -6,10 +6,19 @@ from typing import Any
 
 from strictdoc.helpers.auto_described import auto_described
 from strictdoc.helpers.mid import MID
+from strictdoc.helpers.textx import TextXPositionSlots
 
 
 @auto_described()
-class InlineLink:
+class InlineLink(TextXPositionSlots):
+    __slots__ = (
+        "parent",
+        "value",
+        "link",
+        "mid",
+        "reserved_mid",
+    )
+
     def __init__(self, parent: Any, value: str) -> None:
         self.parent: Any = parent
         self.link: str = value
@@ -46,10 +46,14 @@ RESERVED_NON_META_FIELDS = [
 
 
 class SDocNodeFieldIF(ABC):
+    __slots__ = ()
+
     parent: "SDocNodeIF"
 
 
 class SDocNodeIF(ABC):
+    __slots__ = ()
+
     reserved_mid: MID
     mid_permanent: bool
     parent: Union["SDocNodeIF", "SDocDocumentIF", "SDocSectionIF"]
@@ -2,6 +2,7 @@
 @relation(SDOC-SRS-26, scope=file)
 """
 
+import sys
 from collections import OrderedDict
 from typing import Any, Generator, List, Optional, Tuple, Union
 
@@ -33,16 +34,33 @@ from strictdoc.helpers.cast import assert_cast
 from strictdoc.helpers.exception import StrictDocException
 from strictdoc.helpers.mid import MID
 from strictdoc.helpers.string import ensure_newline
+from strictdoc.helpers.textx import TextXPositionSlots
+
+# The nodes and their fields are the most numerous objects of a project. The
+# node classes declare __slots__ to keep the memory footprint of large
+# document trees small. The slots include the grammar attributes, e.g.,
+# SDocNode.fields, which textX visits when calling the object processors, and
+# TextXPositionSlots provides the slots for the source positions.
 
 
 @auto_described
 class SDocNodeContext:
+    __slots__ = ("title_number_string",)
+
     def __init__(self) -> None:
         self.title_number_string: Optional[str] = None
 
 
 @auto_described
-class SDocNodeField:
+class SDocNodeField(TextXPositionSlots):
+    __slots__ = (
+        "parent",
+        "field_name",
+        "parts",
+        "multiline__",
+        "multiline",
+    )
+
     def __init__(
         self,
         parent: Optional["SDocNode"],
@@ -51,9 +69,19 @@ class SDocNodeField:
         multiline__: Optional[str],
     ) -> None:
         self.parent: Optional[SDocNode] = parent
-        self.field_name: str = field_name
-        self.parts: List[Any] = parts
+        self.field_name: str = sys.intern(field_name)
         self.multiline: bool = multiline__ is not None and len(multiline__) > 0
+        # The values of the single-line fields, such as STATUS or the UIDs
+        # that the relations refer to, repeat across the nodes and are
+        # interned to be stored only once.
+        self.parts: List[Any] = (
+            parts
+            if self.multiline
+            else [
+                sys.intern(part_) if isinstance(part_, str) else part_
+                for part_ in parts
+            ]
+        )
 
     @staticmethod
     def create_from_string(
@@ -100,7 +128,36 @@ class SDocNodeField:
 
 
 @auto_described
-class SDocNode(SDocNodeIF):
+class SDocNode(SDocNodeIF, TextXPositionSlots):
+    __slots__ = (
+        "parent",
+        "node_type",
+        "is_composite",
+        "section_contents",
+        "relations",
+        "has_meta",
+        "fields",
+        "fields_as_parsed",
+        "ordered_fields_lookup",
+        "ng_level",
+        "ng_document_reference",
+        "ng_including_document_reference",
+        "ng_line_start",
+        "ng_line_end",
+        "ng_col_start",
+        "ng_col_end",
+        "ng_byte_start",
+        "ng_byte_end",
+        "context",
+        "reserved_mid",
+        "mid_permanent",
+        "ng_resolved_custom_level",
+        "custom_level",
+        "ng_whitelisted",
+        "ng_has_requirements",
+        "autogen",
+    )
+
     def __init__(
         self,
         parent: Union[SDocDocumentIF, SDocSectionIF, SDocNodeIF],
@@ -118,7 +175,7 @@ class SDocNode(SDocNodeIF):
 
         self.parent: Union[SDocDocumentIF, SDocSectionIF, SDocNodeIF] = parent
 
-        self.node_type: str = node_type
+        self.node_type: str = sys.intern(node_type)
 
         if node_type_close is not None and len(node_type_close) > 0:
             if node_type != node_type_close:
@@ -738,6 +795,8 @@ class SDocNode(SDocNodeIF):
 
 @auto_described
 class SDocCompositeNode(SDocNode):
+    __slots__ = ("node_type_close",)
+
     def __init__(
         self,
         parent: Union[SDocDocumentIF, SDocSectionIF, SDocNodeIF],
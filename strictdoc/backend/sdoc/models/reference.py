@@ -2,15 +2,28 @@
 @relation(SDOC-SRS-31, SDOC-SRS-101, scope=file)
 """
 
+import sys
 from typing import Any, Optional, Tuple
 
 from strictdoc.backend.sdoc.models.grammar_element import ReferenceType
 from strictdoc.helpers.auto_described import auto_described
 from strictdoc.helpers.mid import MID
+from strictdoc.helpers.textx import TextXPositionSlots
 
 
 @auto_described
-class FileEntry:
+class FileEntry(TextXPositionSlots):
+    __slots__ = (
+        "parent",
+        "g_file_format",
+        "g_file_path",
+        "file_path_posix",
+        "g_line_range",
+        "line_range",
+        "function",
+        "clazz",
+    )
+
     def __init__(
         self,
         parent: Any,
@@ -64,7 +77,9 @@ class FileEntryFormat:
 
 
 @auto_described
-class Reference:
+class Reference(TextXPositionSlots):
+    __slots__ = ("parent", "ref_type", "role")
+
     def __init__(self, ref_type: str, parent: Any):
         self.parent = parent
         self.ref_type: str = ref_type
@@ -73,13 +88,15 @@ class Reference:
 
 @auto_described
 class FileReference(Reference):
+    __slots__ = ("g_file_entry", "mid")
+
     def __init__(
         self, parent: Any, g_file_entry: FileEntry, role: Optional[str] = None
     ):
         super().__init__(ReferenceType.FILE, parent)
         self.g_file_entry: FileEntry = g_file_entry
         self.role: Optional[str] = (
-            role if role is not None and len(role) > 0 else None
+            sys.intern(role) if role is not None and len(role) > 0 else None
         )
         self.mid = MID.create()
 
@@ -92,27 +109,33 @@ class FileReference(Reference):
 
 @auto_described
 class ParentReqReference(Reference):
+    __slots__ = ("ref_uid", "mid")
+
     def __init__(self, parent: Any, ref_uid: str, role: Optional[str]):
         super().__init__(ReferenceType.PARENT, parent)
-        self.ref_uid: str = ref_uid
+        # The UIDs are interned, so that a reference shares the UID string
+        # with the UID field of the referenced node.
+        self.ref_uid: str = sys.intern(ref_uid)
         # When ROLE: field is not provided for a parent reference, the
         # textX still passes relation_uid as an empty string (instead of None
         # as one could expect).
         self.role: Optional[str] = (
-            role if role is not None and len(role) > 0 else None
+            sys.intern(role) if role is not None and len(role) > 0 else None
         )
         self.mid = MID.create()
 
 
 @auto_described
 class ChildReqReference(Reference):
+    __slots__ = ("ref_uid", "mid")
+
     def __init__(self, parent: Any, ref_uid: str, role: str):
         super().__init__(ReferenceType.CHILD, parent)
-        self.ref_uid = ref_uid
+        self.ref_uid = sys.intern(ref_uid)
         # When ROLE: field is not provided for a child reference, the
         # textX still passes relation_uid as an empty string (instead of None
         # as one could expect).
         self.role: Optional[str] = (
-            role if role is not None and len(role) > 0 else None
+            sys.intern(role) if role is not None and len(role) > 0 else None
         )
         self.mid = MID.create()
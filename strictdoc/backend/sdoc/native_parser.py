@@ -0,0 +1,1160 @@
+"""
+A hand-written parser of the SDoc documents.
+
+The SDoc grammar is line-oriented: almost every rule starts with a fixed
+keyword at the beginning of a line and ends with a line break. This parser
+implements the textX grammar of strictdoc/backend/sdoc/grammar/ rule by rule
+with string comparisons and a few precompiled regular expressions, instead of
+running the generic PEG machinery of textX/Arpeggio which matches the
+multiline field text character by character.
+
+The parser produces the same model objects as textX does:
+
+- The objects are allocated without calling their constructors, the parsed
+  and the default attribute values are collected for every object, and the
+  constructors are called in the same (post-)order as textX calls them.
+- The SDocParsingProcessor object processors are called in the same
+  depth-first order as textX calls them.
+- The source locations (_tx_position, _tx_position_end and the line/column
+  numbers) are computed the same way.
+
+The parser does not produce error messages. When the input does not match
+the grammar, NativeParserNoMatch is raised and the input is expected to be
+parsed with textX, which reports the error.
+
+@relation(SDOC-SRS-18, scope=file)
+"""
+
+import re
+from bisect import bisect_left
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from textx.const import MULT_ONEORMORE, MULT_ZEROORMORE
+from textx.lang import BASE_TYPE_NAMES
+from textx.metamodel import TextXMetaModel
+from textx.model_params import ModelParams
+
+from strictdoc.backend.sdoc.grammar.grammar import REGEX_UID
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.helpers.auto_described import get_attributes
+from strictdoc.helpers.mid import MID
+
+RE_UID = re.compile(REGEX_UID, re.MULTILINE)
+RE_SINGLE_LINE_STRING = re.compile(r"(?!>>>\n)\S.*$", re.MULTILINE)
+RE_SINGLE_LINE_TEXT_PART = re.compile(r"(?!>>>\n)\S.*", re.MULTILINE)
+RE_FIELD_NAME = re.compile(
+    r"(?!^UID)(?!^RELATIONS)[A-Z]+[A-Z_0-9]*", re.MULTILINE
+)
+RE_REQUIREMENT_TYPE = re.compile(r"[A-Z]+(_[A-Z]+)*", re.MULTILINE)
+RE_PREFIX_KEY = re.compile(r"(REQ_)?PREFIX", re.MULTILINE)
+RE_VIEW_STYLE_TAG = re.compile(r"(VIEW_STYLE|REQUIREMENT_STYLE)", re.MULTILINE)
+RE_NODE_IN_TOC_TAG = re.compile(
+    r"(NODE_IN_TOC|REQUIREMENT_IN_TOC)", re.MULTILINE
+)
+RE_METADATA_KEY = re.compile(r"[a-zA-Z_][a-zA-Z0-9_-]*", re.MULTILINE)
+RE_ANCHOR_TITLE = re.compile(r"\w+[\s\w+]*", re.MULTILINE)
+RE_ANCHOR_END = re.compile(r"\](\Z|\n)", re.MULTILINE)
+RE_CHOICE_OPTION = re.compile(r"[\w\/|-]+( *[\w\/|-]+)*", re.MULTILINE)
+RE_FILE_ENTRY_FORMAT = re.compile(r"[A-Z]+[A-Z_]*", re.MULTILINE)
+RE_IS_COMPOSITE = re.compile(r"(True|False)", re.MULTILINE)
+RE_VIEW_STYLE = re.compile(
+    r"(Plain|Simple|Inline|Narrative|Table|Zebra)", re.MULTILINE
+)
+RE_ANY_LINE = re.compile(r".*$", re.MULTILINE)
+RE_ANY_LINE_NO_END = re.compile(r".*", re.MULTILINE)
+RE_NON_EMPTY_LINE = re.compile(r".+$", re.MULTILINE)
+RE_NON_EMPTY_LINE_NO_END = re.compile(r".+", re.MULTILINE)
+# Arpeggio skips the whitespace before the end of input.
+RE_END_OF_INPUT = re.compile(r"[\t\n\r ]*\Z")
+
+BOOLEAN_CHOICE = ("True", "False")
+MARKUP_CHOICE = ("RST", "Text", "HTML")
+REQUIREMENT_STYLE_CHOICE = (
+    "Plain",
+    "Inline",
+    "Simple",
+    "Narrative",
+    "Table",
+    "Zebra",
+)
+AUTO_LEVELS_CHOICE = ("On", "Off")
+LAYOUT_CHOICE = ("Default", "Website")
+FILE_ENTRY_FORMAT_CHOICE = ("Sourcecode", "Python")
+RESERVED_KEYWORDS = ("DOCUMENT", "GRAMMAR")
+
+
+class NativeParserNoMatch(Exception):
+    def __init__(self, position: int):
+        super().__init__(position)
+        self.position: int = position
+
+
+class NativeParserLocation:
+    """
+    The line/column lookup of the parsed objects.
+
+    Replaces the textX parser as the _tx_parser of a document, so that the
+    SDocParsingProcessor can compute the line/column numbers of the objects
+    with the same pos_to_linecol() call. The line/column numbers are computed
+    exactly like in Arpeggio.
+    """
+
+    def __init__(self, input_string: str) -> None:
+        self.input: str = input_string
+        self.line_ends: List[int] = []
+        line_end = input_string.find("\n")
+        while line_end != -1:
+            self.line_ends.append(line_end)
+            line_end = input_string.find("\n", line_end + 1)
+
+    def pos_to_linecol(self, pos: int) -> Tuple[int, int]:
+        line = bisect_left(self.line_ends, pos)
+        col = pos
+        if line > 0:
+            col -= self.line_ends[line - 1] + 1
+        return line + 1, col + 1
+
+
+class NativeParserModel:
+    """
+    The meta-model information that the native parser needs to create the
+    same objects as textX.
+    """
+
+    def __init__(self, meta_model: TextXMetaModel) -> None:
+        self.meta_model: TextXMetaModel = meta_model
+        self.user_classes: Dict[str, Any] = dict(meta_model.user_classes)
+
+        # The attributes that textX initializes on every new object:
+        # [] for the lists, "" for the STRING attributes and None otherwise.
+        self.attr_defaults: Dict[str, List[Tuple[str, Any]]] = {}
+        # The attributes that textX passes to the constructors.
+        self.init_attrs: Dict[Any, Tuple[str, ...]] = {}
+        # The attributes that textX visits when calling the object
+        # processors: (attribute name, grammar rule name of the attribute).
+        self.processed_attrs: Dict[str, List[Tuple[str, str]]] = {}
+        for class_name_, class_ in self.user_classes.items():
+            metaclass = meta_model[class_name_]
+            attr_defaults: List[Tuple[str, Any]] = []
+            processed_attrs: List[Tuple[str, str]] = []
+            for attr_ in metaclass._tx_attrs.values():
+                if attr_.mult in (MULT_ZEROORMORE, MULT_ONEORMORE):
+                    attr_defaults.append((attr_.name, list))
+                elif attr_.cls.__name__ in BASE_TYPE_NAMES:
+                    attr_defaults.append((attr_.name, ""))
+                else:
+                    attr_defaults.append((attr_.name, None))
+                if attr_.cont:
+                    processed_attrs.append((attr_.name, attr_.cls.__name__))
+            self.attr_defaults[class_name_] = attr_defaults
+            self.init_attrs[class_] = (
+                *metaclass._tx_attrs.keys(),
+                "parent",
+            )
+            self.processed_attrs[class_name_] = processed_attrs
+
+    def parse(
+        self,
+        input_string: str,
+        file_path: Optional[str],
+        obj_processors: Dict[str, Callable[..., None]],
+    ) -> SDocDocument:
+        parser = NativeParser(self, input_string)
+        document = parser.parse_document()
+
+        location = NativeParserLocation(input_string)
+        document_attrs = parser.objects[-1][1]
+        document_attrs["_tx_filename"] = file_path
+        document_attrs["_tx_metamodel"] = self.meta_model
+        document_attrs["_tx_parser"] = location
+        document_attrs["_tx_model_params"] = ModelParams({})
+
+        for object_, attrs_ in parser.objects:
+            for name_, value_ in attrs_.items():
+                setattr(object_, name_, value_)
+            init_attrs = self.init_attrs[type(object_)]
+            object_.__init__(
+                **{
+                    name_: value_
+                    for name_, value_ in attrs_.items()
+                    if name_ in init_attrs
+                }
+            )
+
+        self.call_obj_processors(
+            document, type(document).__name__, obj_processors
+        )
+        return document
+
+    def call_obj_processors(
+        self,
+        model_object: Any,
+        rule_name: str,
+        obj_processors: Dict[str, Callable[..., None]],
+    ) -> None:
+        """
+        Call the object processors depth-first, like textX does.
+        """
+
+        class_name = type(model_object).__name__
+        processed_attrs = self.processed_attrs.get(class_name)
+        if processed_attrs is not None:
+            for attr_name_, attr_rule_name_ in processed_attrs:
+                value = getattr(model_object, attr_name_)
+                if isinstance(value, list):
+                    for item_ in value:
+                        if item_ is not None and not isinstance(item_, str):
+                            self.call_obj_processors(
+                                item_, attr_rule_name_, obj_processors
+                            )
+                elif value is not None and not isinstance(value, str):
+                    self.call_obj_processors(
+                        value, attr_rule_name_, obj_processors
+                    )
+            if class_name != rule_name and class_name in obj_processors:
+                obj_processors[class_name](model_object)
+        if rule_name in obj_processors:
+            obj_processors[rule_name](model_object)
+
+
+class NativeParser:
+    """
+    The parser of a single input.
+
+    Every parse_* method matches one grammar rule at the current position.
+    A method that does not match raises NativeParserNoMatch, and the
+    optional and repeated rules restore the position with reset(). The
+    match_* methods match the simple values and return None instead of
+    raising.
+    """
+
+    def __init__(self, model: NativeParserModel, input_string: str) -> None:
+        self.model: NativeParserModel = model
+        self.text: str = input_string
+        self.pos: int = 0
+        # The created objects with their collected attributes, in the order
+        # in which textX calls the constructors.
+        self.objects: List[Tuple[Any, Dict[str, Any]]] = []
+
+    #
+    # Objects.
+    #
+
+    def create(
+        self, class_name: str, position: Optional[int] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        class_ = self.model.user_classes[class_name]
+        model_object = class_.__new__(class_)
+        attrs: Dict[str, Any] = {
+            name_: (default_() if default_ is list else default_)
+            for name_, default_ in self.model.attr_defaults[class_name]
+        }
+        attrs["_tx_position"] = self.pos if position is None else position
+        attrs["_tx_position_end"] = None
+        return model_object, attrs
+
+    def finish(
+        self, model_object: Any, attrs: Dict[str, Any], parent: Any
+    ) -> Any:
+        attrs["_tx_position_end"] = self.pos
+        if parent is not None:
+            attrs["parent"] = parent
+        self.objects.append((model_object, attrs))
+        return model_object
+
+    def mark(self) -> Tuple[int, int]:
+        return self.pos, len(self.objects)
+
+    def reset(self, mark: Tuple[int, int]) -> None:
+        self.pos = mark[0]
+        del self.objects[mark[1] :]
+
+    #
+    # Terminals.
+    #
+
+    def is_at_line_start(self, position: int) -> bool:
+        return position == 0 or self.text[position - 1] == "\n"
+
+    def match_string(self, string: str) -> bool:
+        if self.text.startswith(string, self.pos):
+            self.pos += len(string)
+            return True
+        return False
+
+    def expect_string(self, string: str) -> None:
+        if not self.text.startswith(string, self.pos):
+            raise NativeParserNoMatch(self.pos)
+        self.pos += len(string)
+
+    def match_regex(self, regex: Pattern[str]) -> Optional[str]:
+        match = regex.match(self.text, self.pos)
+        if match is None:
+            return None
+        self.pos = match.end()
+        return match.group(0)
+
+    def expect_regex(self, regex: Pattern[str]) -> str:
+        value = self.match_regex(regex)
+        if value is None:
+            raise NativeParserNoMatch(self.pos)
+        return value
+
+    def match_choice(self, choice: Tuple[str, ...]) -> Optional[str]:
+        for string_ in choice:
+            if self.text.startswith(string_, self.pos):
+                self.pos += len(string_)
+                return string_
+        return None
+
+    def match_line(
+        self,
+        prefix: str,
+        match_value: Callable[[], Optional[str]],
+    ) -> Optional[str]:
+        r"""
+        Match an optional "<prefix><value>\n" line.
+        """
+
+        if not self.text.startswith(prefix, self.pos):
+            return None
+        start = self.pos
+        self.pos += len(prefix)
+        value = match_value()
+        if value is None or not self.match_string("\n"):
+            self.pos = start
+            return None
+        return value
+
+    def match_single_line_string(self) -> Optional[str]:
+        return self.match_regex(RE_SINGLE_LINE_STRING)
+
+    def match_requirement_type(self) -> Optional[str]:
+        if self.text.startswith(RESERVED_KEYWORDS, self.pos):
+            return None
+        return self.match_regex(RE_REQUIREMENT_TYPE)
+
+    #
+    # Document.
+    #
+
+    def parse_document(self) -> SDocDocument:
+        document: SDocDocument
+        document, attrs = self.create("SDocDocument")
+        self.expect_string("[DOCUMENT]\n")
+        if (
+            mid := self.match_line("MID: ", self.match_single_line_string)
+        ) is not None:
+            attrs["mid"] = mid
+        self.expect_string("TITLE: ")
+        attrs["title"] = self.expect_regex(RE_SINGLE_LINE_STRING)
+        self.expect_string("\n")
+
+        attrs["config"] = self.parse_document_config(document)
+
+        if self.text.startswith("VIEWS:\n", self.pos):
+            mark = self.mark()
+            try:
+                attrs["view"] = self.parse_document_view(document)
+            except NativeParserNoMatch:
+                self.reset(mark)
+
+        if self.text.startswith("\n[GRAMMAR]\n", self.pos):
+            mark = self.mark()
+            try:
+                self.pos += 1
+                attrs["grammar"] = self.parse_document_grammar(document)
+            except NativeParserNoMatch:
+                self.reset(mark)
+
+        self.parse_section_contents(document, attrs["section_contents"])
+        self.finish(document, attrs, None)
+
+        if RE_END_OF_INPUT.match(self.text, self.pos) is None:
+            raise NativeParserNoMatch(self.pos)
+        return document
+
+    def parse_document_config(self, document: Any) -> Any:
+        start = self.pos
+        config, attrs = self.create("DocumentConfig")
+
+        if (
+            uid := self.match_line("UID: ", lambda: self.match_regex(RE_UID))
+        ) is not None:
+            attrs["uid"] = uid
+        for prefix_, attr_name_ in (
+            ("VERSION: ", "version"),
+            ("DATE: ", "date"),
+            ("CLASSIFICATION: ", "classification"),
+        ):
+            if (
+                value := self.match_line(prefix_, self.match_single_line_string)
+            ) is not None:
+                attrs[attr_name_] = value
+        self.match_requirement_prefix(attrs)
+        if (
+            root := self.match_line(
+                "ROOT: ", lambda: self.match_choice(BOOLEAN_CHOICE)
+            )
+        ) is not None:
+            attrs["root"] = root
+
+        if self.match_string("OPTIONS:\n"):
+            for prefix_, attr_name_, choice_ in (
+                ("  ENABLE_MID: ", "enable_mid", BOOLEAN_CHOICE),
+                ("  MARKUP: ", "markup", MARKUP_CHOICE),
+                ("  AUTO_LEVELS: ", "auto_levels", AUTO_LEVELS_CHOICE),
+                ("  LAYOUT: ", "layout", LAYOUT_CHOICE),
+            ):
+                if (
+                    value := self.match_line(
+                        prefix_, partial(self.match_choice, choice_)
+                    )
+                ) is not None:
+                    attrs[attr_name_] = value
+            self.match_options_choice(
+                attrs,
+                "view_style_tag",
+                RE_VIEW_STYLE_TAG,
+                "requirement_style",
+                REQUIREMENT_STYLE_CHOICE,
+            )
+            self.match_options_choice(
+                attrs,
+                "node_in_toc_tag",
+                RE_NODE_IN_TOC_TAG,
+                "requirement_in_toc",
+                BOOLEAN_CHOICE,
+            )
+            if (
+                default_view := self.match_line(
+                    "  DEFAULT_VIEW: ", self.match_single_line_string
+                )
+            ) is not None:
+                attrs["default_view"] = default_view
+
+        if self.match_string("METADATA:\n"):
+            attrs["custom_metadata"] = self.parse_document_custom_metadata(
+                config
+            )
+
+        # textX creates no object for a rule that matches an empty string.
+        if self.pos == start:
+            return None
+        return self.finish(config, attrs, document)
+
+    def match_requirement_prefix(self, attrs: Dict[str, Any]) -> None:
+        start = self.pos
+        if (
+            self.match_regex(RE_PREFIX_KEY) is not None
+            and (
+                requirement_prefix := self.match_line(
+                    ": ", self.match_single_line_string
+                )
+            )
+            is not None
+        ):
+            attrs["requirement_prefix"] = requirement_prefix
+        else:
+            self.pos = start
+
+    def match_options_choice(
+        self,
+        attrs: Dict[str, Any],
+        tag_attr: str,
+        tag_regex: Pattern[str],
+        value_attr: str,
+        value_choice: Tuple[str, ...],
+    ) -> None:
+        if not self.text.startswith("  ", self.pos):
+            return
+        start = self.pos
+        self.pos += 2
+        tag = self.match_regex(tag_regex)
+        if tag is not None:
+            value = self.match_line(
+                ": ", lambda: self.match_choice(value_choice)
+            )
+            if value is not None:
+                attrs[tag_attr] = tag
+                attrs[value_attr] = value
+                return
+        self.pos = start
+
+    def parse_document_custom_metadata(self, config: Any) -> Any:
+        custom_metadata, attrs = self.create("DocumentCustomMetadata")
+        while self.text.startswith("  ", self.pos):
+            start = self.pos
+            entry, entry_attrs = self.create(
+                "DocumentCustomMetadataKeyValuePair"
+            )
+            self.pos += 2
+            key = self.match_regex(RE_METADATA_KEY)
+            value = (
+                self.match_line(": ", self.match_single_line_string)
+                if key is not None
+                else None
+            )
+            if value is None:
+                self.pos = start
+                break
+            entry_attrs["key"] = key
+            entry_attrs["value"] = value
+            attrs["entries"].append(
+                self.finish(entry, entry_attrs, custom_metadata)
+            )
+        if len(attrs["entries"]) == 0:
+            return None
+        return self.finish(custom_metadata, attrs, config)
+
+    #
+    # Document view.
+    #
+
+    def parse_document_view(self, document: Any) -> Any:
+        document_view, attrs = self.create("DocumentView")
+        self.expect_string("VIEWS:\n")
+        self.parse_one_or_more(
+            "- ID: ",
+            lambda: self.parse_view_element(document_view),
+            attrs["views"],
+        )
+        return self.finish(document_view, attrs, document)
+
+    def parse_view_element(self, document_view: Any) -> Any:
+        view_element, attrs = self.create("ViewElement")
+        self.expect_string("- ID: ")
+        attrs["view_id"] = self.expect_regex(RE_UID)
+        self.expect_string("\n")
+        if (
+            name := self.match_line("  NAME: ", self.match_single_line_string)
+        ) is not None:
+            attrs["name"] = name
+        self.expect_string("  TAGS:\n")
+        self.parse_one_or_more(
+            "  - OBJECT_TYPE: ",
+            lambda: self.parse_view_element_tags(view_element),
+            attrs["tags"],
+        )
+        if self.text.startswith("  HIDDEN_TAGS:\n", self.pos):
+            mark = self.mark()
+            try:
+                self.pos += len("  HIDDEN_TAGS:\n")
+                self.parse_one_or_more(
+                    "  - ",
+                    lambda: self.parse_view_element_hidden_tag(view_element),
+                    attrs["hidden_tags"],
+                )
+            except NativeParserNoMatch:
+                self.reset(mark)
+                attrs["hidden_tags"] = []
+        return self.finish(view_element, attrs, document_view)
+
+    def parse_view_element_tags(self, view_element: Any) -> Any:
+        view_element_tags, attrs = self.create("ViewElementTags")
+        self.expect_string("  - OBJECT_TYPE: ")
+        attrs["object_type"] = self.expect_regex(RE_SINGLE_LINE_STRING)
+        self.expect_string("\n    VISIBLE_FIELDS:\n")
+        self.parse_one_or_more(
+            "    - NAME: ",
+            lambda: self.parse_view_element_field(view_element_tags),
+            attrs["visible_fields"],
+        )
+        return self.finish(view_element_tags, attrs, view_element)
+
+    def parse_view_element_field(self, view_element_tags: Any) -> Any:
+        view_element_field, attrs = self.create("ViewElementField")
+        self.expect_string("    - NAME: ")
+        attrs["name"] = self.expect_regex(RE_SINGLE_LINE_STRING)
+        self.expect_string("\n")
+        if (
+            placement := self.match_line(
+                "      PLACEMENT: ", self.match_single_line_string
+            )
+        ) is not None:
+            attrs["placement"] = placement
+        return self.finish(view_element_field, attrs, view_element_tags)
+
+    def parse_view_element_hidden_tag(self, view_element: Any) -> Any:
+        hidden_tag, attrs = self.create("ViewElementHiddenTag")
+        self.expect_string("  - ")
+        attrs["hidden_tag"] = self.expect_regex(RE_SINGLE_LINE_STRING)
+        self.expect_string("\n")
+        return self.finish(hidden_tag, attrs, view_element)
+
+    def parse_one_or_more(
+        self,
+        prefix: str,
+        parse_item: Callable[[], Any],
+        items: List[Any],
+    ) -> None:
+        items.append(parse_item())
+        while self.text.startswith(prefix, self.pos):
+            mark = self.mark()
+            try:
+                items.append(parse_item())
+            except NativeParserNoMatch:
+                self.reset(mark)
+                break
+
+    #
+    # Document grammar.
+    #
+
+    def parse_document_grammar(self, document: Any) -> Any:
+        document_grammar, attrs = self.create("DocumentGrammar")
+        self.expect_string("[GRAMMAR]\n")
+        mark = self.mark()
+        try:
+            self.expect_string("ELEMENTS:\n")
+            self.parse_one_or_more(
+                "- TAG: ",
+                lambda: self.parse_grammar_element(document_grammar),
+                attrs["elements"],
+            )
+        except NativeParserNoMatch:
+            self.reset(mark)
+            attrs["elements"] = []
+            self.expect_string("IMPORT_FROM_FILE: ")
+            attrs["import_from_file"] = self.expect_regex(RE_NON_EMPTY_LINE)
+            self.expect_string("\n")
+        return self.finish(document_grammar, attrs, document)
+
+    def parse_grammar_element(self, document_grammar: Any) -> Any:
+        grammar_element, attrs = self.create("GrammarElement")
+        self.expect_string("- TAG: ")
+        tag = self.match_requirement_type()
+        if tag is None:
+            raise NativeParserNoMatch(self.pos)
+        attrs["tag"] = tag
+        self.expect_string("\n")
+        if self.match_string("  PROPERTIES:\n"):
+            if (
+                is_composite := self.match_line(
+                    "    IS_COMPOSITE: ",
+                    lambda: self.match_regex(RE_IS_COMPOSITE),
+                )
+            ) is not None:
+                attrs["property_is_composite"] = is_composite
+            if (
+                prefix := self.match_line(
+                    "    PREFIX: ", lambda: self.match_regex(RE_ANY_LINE_NO_END)
+                )
+            ) is not None:
+                attrs["property_prefix"] = prefix
+            if (
+                view_style := self.match_line(
+                    "    VIEW_STYLE: ", lambda: self.match_regex(RE_VIEW_STYLE)
+                )
+            ) is not None:
+                attrs["property_view_style"] = view_style
+        self.expect_string("  FIELDS:\n")
+        self.parse_one_or_more(
+            "  - TITLE: ",
+            lambda: self.parse_grammar_element_field(grammar_element),
+            attrs["fields"],
+        )
+        if self.text.startswith("  RELATIONS:\n", self.pos):
+            mark = self.mark()
+            try:
+                self.pos += len("  RELATIONS:\n")
+                self.parse_one_or_more(
+                    "  - TYPE: ",
+                    lambda: self.parse_grammar_element_relation(
+                        grammar_element
+                    ),
+                    attrs["relations"],
+                )
+            except NativeParserNoMatch:
+                self.reset(mark)
+                attrs["relations"] = []
+        return self.finish(grammar_element, attrs, document_grammar)
+
+    def parse_grammar_element_field(self, grammar_element: Any) -> Any:
+        start = self.pos
+        self.expect_string("  - TITLE: ")
+        title = self.expect_regex(RE_FIELD_NAME)
+        self.expect_string("\n")
+        human_title = self.match_line(
+            "    HUMAN_TITLE: ", self.match_single_line_string
+        )
+
+        # All field rules start with the same lines, so the TYPE line
+        # decides which rule matches.
+        options: List[str] = []
+        if self.match_string("    TYPE: String\n"):
+            class_name = "GrammarElementFieldString"
+        elif self.match_string("    TYPE: Tag\n"):
+            class_name = "GrammarElementFieldTag"
+        else:
+            if self.match_string("    TYPE: SingleChoice("):
+                class_name = "GrammarElementFieldSingleChoice"
+            elif self.match_string("    TYPE: MultipleChoice("):
+                class_name = "GrammarElementFieldMultipleChoice"
+            else:
+                raise NativeParserNoMatch(self.pos)
+            options.append(self.expect_regex(RE_CHOICE_OPTION))
+            while self.text.startswith(", ", self.pos):
+                option_start = self.pos
+                self.pos += 2
+                option = self.match_regex(RE_CHOICE_OPTION)
+                if option is None:
+                    self.pos = option_start
+                    break
+                options.append(option)
+            self.expect_string(")\n")
+        self.expect_string("    REQUIRED: ")
+        required = self.match_choice(BOOLEAN_CHOICE)
+        if required is None:
+            raise NativeParserNoMatch(self.pos)
+        self.expect_string("\n")
+
+        field, attrs = self.create(class_name, start)
+        attrs["title"] = title
+        if human_title is not None:
+            attrs["human_title"] = human_title
+        if "options" in attrs:
+            attrs["options"] = options
+        attrs["required"] = required
+        return self.finish(field, attrs, grammar_element)
+
+    def parse_grammar_element_relation(self, grammar_element: Any) -> Any:
+        start = self.pos
+        self.expect_string("  - TYPE: ")
+        relation_type = self.match_choice(("Parent", "Child", "File"))
+        if relation_type is None:
+            raise NativeParserNoMatch(self.pos)
+        self.expect_string("\n")
+        relation, attrs = self.create(
+            "GrammarElementRelation" + relation_type, start
+        )
+        attrs["relation_type"] = relation_type
+        if (
+            relation_role := self.match_line(
+                "    ROLE: ", lambda: self.match_regex(RE_NON_EMPTY_LINE_NO_END)
+            )
+        ) is not None:
+            attrs["relation_role"] = relation_role
+        return self.finish(relation, attrs, grammar_element)
+
+    #
+    # Sections and nodes.
+    #
+
+    def parse_section_contents(
+        self, parent: Any, section_contents: List[Any]
+    ) -> None:
+        text = self.text
+        while text.startswith("\n[", self.pos):
+            mark = self.mark()
+            try:
+                section_contents.append(self.parse_section_or_node(parent))
+            except NativeParserNoMatch:
+                self.reset(mark)
+                break
+
+    def parse_section_or_node(self, parent: Any) -> Any:
+        self.expect_string("\n")
+        text = self.text
+        mark = self.mark()
+        parse_functions = []
+        if text.startswith("[SECTION]\n", self.pos):
+            parse_functions.append(self.parse_section)
+        elif text.startswith("[[", self.pos):
+            parse_functions.append(self.parse_composite_node)
+        elif text.startswith("[DOCUMENT_FROM_FILE]\n", self.pos):
+            parse_functions.append(self.parse_document_from_file)
+        elif not text.startswith("[SECTION", self.pos):
+            parse_functions.append(self.parse_node)
+        for parse_function_ in parse_functions:
+            try:
+                return parse_function_(parent)
+            except NativeParserNoMatch:
+                self.reset(mark)
+        raise NativeParserNoMatch(self.pos)
+
+    def parse_section(self, parent: Any) -> Any:
+        section, attrs = self.create("SDocSection")
+        self.expect_string("[SECTION]\n")
+        if (
+            mid := self.match_line("MID: ", self.match_single_line_string)
+        ) is not None:
+            attrs["mid"] = mid
+        if (
+            uid := self.match_line("UID: ", lambda: self.match_regex(RE_UID))
+        ) is not None:
+            attrs["uid"] = uid
+        if (
+            custom_level := self.match_line(
+                "LEVEL: ", self.match_single_line_string
+            )
+        ) is not None:
+            attrs["custom_level"] = custom_level
+        self.expect_string("TITLE: ")
+        attrs["title"] = self.expect_regex(RE_SINGLE_LINE_STRING)
+        self.expect_string("\n")
+        self.match_requirement_prefix(attrs)
+        self.parse_section_contents(section, attrs["section_contents"])
+        self.expect_string("\n[/SECTION]\n")
+        return self.finish(section, attrs, parent)
+
+    def parse_document_from_file(self, parent: Any) -> Any:
+        document_from_file, attrs = self.create("DocumentFromFile")
+        self.expect_string("[DOCUMENT_FROM_FILE]\nFILE: ")
+        attrs["file"] = self.expect_regex(RE_NON_EMPTY_LINE)
+        self.expect_string("\n")
+        return self.finish(document_from_file, attrs, parent)
+
+    def parse_node(self, parent: Any) -> Any:
+        node, attrs = self.create("SDocNode")
+        self.expect_string("[")
+        node_type = self.match_requirement_type()
+        if node_type is None:
+            raise NativeParserNoMatch(self.pos)
+        attrs["node_type"] = node_type
+        self.expect_string("]\n")
+        self.parse_node_fields_and_relations(node, attrs)
+        return self.finish(node, attrs, parent)
+
+    def parse_composite_node(self, parent: Any) -> Any:
+        node, attrs = self.create("SDocCompositeNode")
+        self.expect_string("[[")
+        node_type = self.match_requirement_type()
+        if node_type is None:
+            raise NativeParserNoMatch(self.pos)
+        attrs["node_type"] = node_type
+        self.expect_string("]]\n")
+        self.parse_node_fields_and_relations(node, attrs)
+        self.parse_section_contents(node, attrs["section_contents"])
+        self.expect_string("\n[[/")
+        node_type_close = self.match_requirement_type()
+        if node_type_close is None:
+            raise NativeParserNoMatch(self.pos)
+        attrs["node_type_close"] = node_type_close
+        self.expect_string("]]\n")
+        return self.finish(node, attrs, parent)
+
+    def parse_node_fields_and_relations(
+        self, node: Any, attrs: Dict[str, Any]
+    ) -> None:
+        fields = attrs["fields"]
+        fields.append(self.parse_node_field(node))
+        while True:
+            mark = self.mark()
+            try:
+                fields.append(self.parse_node_field(node))
+            except NativeParserNoMatch:
+                self.reset(mark)
+                break
+
+        if self.text.startswith("RELATIONS:\n", self.pos):
+            mark = self.mark()
+            try:
+                self.pos += len("RELATIONS:\n")
+                self.parse_one_or_more(
+                    "- TYPE: ",
+                    lambda: self.parse_reference(node),
+                    attrs["relations"],
+                )
+            except NativeParserNoMatch:
+                self.reset(mark)
+                attrs["relations"] = []
+
+    def parse_node_field(self, node: Any) -> Any:
+        text = self.text
+        start = self.pos
+        node_field, attrs = self.create("SDocNodeField")
+        mark = self.mark()
+
+        if text.startswith("MID: ", start):
+            self.pos += len("MID: ")
+            value = self.match_regex(RE_SINGLE_LINE_STRING)
+            if value is not None and self.match_string("\n"):
+                attrs["field_name"] = "MID"
+                attrs["parts"].append(value)
+                return self.finish(node_field, attrs, node)
+            self.reset(mark)
+        elif text.startswith("UID: ", start):
+            self.pos += len("UID: ")
+            value = self.match_regex(RE_UID)
+            if value is not None and self.match_string("\n"):
+                attrs["field_name"] = "UID"
+                attrs["parts"].append(value)
+                return self.finish(node_field, attrs, node)
+            self.reset(mark)
+
+        attrs["field_name"] = self.expect_regex(RE_FIELD_NAME)
+        self.expect_string(":")
+
+        # The single-line field value.
+        if text.startswith(" ", self.pos):
+            mark = self.mark()
+            self.pos += 1
+            part = self.match_single_line_text_part(node_field)
+            if part is not None and self.match_string("\n"):
+                attrs["parts"].append(part)
+                return self.finish(node_field, attrs, node)
+            self.reset(mark)
+
+        # The multiline field value.
+        self.expect_string(" >>>\n")
+        attrs["multiline__"] = ">>>\n"
+        parts = attrs["parts"]
+        while (part := self.match_text_part(node_field)) is not None:
+            parts.append(part)
+        if len(parts) == 0 or not self.is_at_line_start(self.pos):
+            raise NativeParserNoMatch(self.pos)
+        self.expect_string("<<<\n")
+        return self.finish(node_field, attrs, node)
+
+    def parse_reference(self, node: Any) -> Any:
+        start = self.pos
+        self.expect_string("- TYPE: ")
+        reference_type = self.match_choice(("Parent\n", "Child\n", "File\n"))
+        if reference_type is None:
+            raise NativeParserNoMatch(self.pos)
+
+        if reference_type == "File\n":
+            reference, attrs = self.create("FileReference", start)
+            if (
+                role := self.match_line(
+                    "  ROLE: ", lambda: self.match_regex(RE_NON_EMPTY_LINE)
+                )
+            ) is not None:
+                attrs["role"] = role
+            attrs["g_file_entry"] = self.parse_file_entry(reference)
+            return self.finish(reference, attrs, node)
+
+        reference, attrs = self.create(
+            "ParentReqReference"
+            if reference_type == "Parent\n"
+            else "ChildReqReference",
+            start,
+        )
+        self.expect_string("  VALUE: ")
+        attrs["ref_uid"] = self.expect_regex(RE_ANY_LINE)
+        self.expect_string("\n")
+        if (
+            role := self.match_line(
+                "  ROLE: ", lambda: self.match_regex(RE_NON_EMPTY_LINE)
+            )
+        ) is not None:
+            attrs["role"] = role
+        return self.finish(reference, attrs, node)
+
+    def parse_file_entry(self, reference: Any) -> Any:
+        file_entry, attrs = self.create("FileEntry")
+        if (
+            file_format := self.match_line(
+                "  FORMAT: ", self.match_file_entry_format
+            )
+        ) is not None:
+            attrs["g_file_format"] = file_format
+        self.expect_string("  VALUE: ")
+        attrs["g_file_path"] = self.expect_regex(RE_ANY_LINE)
+        self.expect_string("\n")
+        for prefix_, attr_name_ in (
+            ("  LINE_RANGE: ", "g_line_range"),
+            ("  FUNCTION: ", "function"),
+            ("  CLASS: ", "clazz"),
+        ):
+            if (
+                value := self.match_line(
+                    prefix_, lambda: self.match_regex(RE_ANY_LINE)
+                )
+            ) is not None:
+                attrs[attr_name_] = value
+        return self.finish(file_entry, attrs, reference)
+
+    def match_file_entry_format(self) -> Optional[str]:
+        file_format = self.match_choice(FILE_ENTRY_FORMAT_CHOICE)
+        if file_format is not None:
+            return file_format
+        return self.match_regex(RE_FILE_ENTRY_FORMAT)
+
+    #
+    # Text.
+    #
+
+    def match_single_line_text_part(self, node_field: Any) -> Any:
+        if self.is_at_line_start(self.pos) and (
+            anchor := self.match_anchor(node_field)
+        ):
+            return anchor
+        if (inline_link := self.match_inline_link(node_field)) is not None:
+            return inline_link
+        return self.match_regex(RE_SINGLE_LINE_TEXT_PART)
+
+    def match_text_part(self, node_field: Any) -> Any:
+        if self.is_at_line_start(self.pos) and (
+            anchor := self.match_anchor(node_field)
+        ):
+            return anchor
+        if (inline_link := self.match_inline_link(node_field)) is not None:
+            return inline_link
+        end = self.find_normal_string_end(self.pos)
+        if end == self.pos:
+            return None
+        normal_string = self.text[self.pos : end]
+        self.pos = end
+        return normal_string
+
+    def match_inline_link(self, node_field: Any) -> Any:
+        if not self.text.startswith("[LINK: ", self.pos):
+            return None
+        match = RE_UID.match(self.text, self.pos + len("[LINK: "))
+        if match is None or not self.text.startswith("]", match.end()):
+            return None
+        inline_link, attrs = self.create("InlineLink")
+        attrs["value"] = match.group(0)
+        self.pos = match.end() + 1
+        return self.finish(inline_link, attrs, node_field)
+
+    def match_anchor(self, node_field: Any) -> Any:
+        if not self.text.startswith("[ANCHOR: ", self.pos):
+            return None
+        start = self.pos
+        anchor, attrs = self.create("Anchor")
+        self.pos += len("[ANCHOR: ")
+        value = self.match_regex(RE_UID)
+        if value is None:
+            self.pos = start
+            return None
+        attrs["value"] = value
+        if self.text.startswith(", ", self.pos):
+            title_start = self.pos
+            self.pos += 2
+            title = self.match_regex(RE_ANCHOR_TITLE)
+            if title is None:
+                self.pos = title_start
+            else:
+                attrs["title"] = title
+        if self.match_regex(RE_ANCHOR_END) is None:
+            self.pos = start
+            return None
+        return self.finish(anchor, attrs, node_field)
+
+    def find_normal_string_end(self, position: int) -> int:
+        """
+        Find where the free text of a multiline field ends.
+
+        The text ends at the end of input, at a line starting with "<<<", at
+        an inline link, or at a line starting with an anchor.
+        """
+
+        text = self.text
+        while True:
+            end = len(text)
+            for candidate_ in (
+                text.find("[LINK: ", position),
+                self.find_at_line_start("<<<", position),
+                self.find_at_line_start("[ANCHOR: ", position),
+            ):
+                if candidate_ != -1 and candidate_ < end:
+                    end = candidate_
+            if end == len(text) or self.is_normal_string_end(end):
+                return end
+            position = end + 1
+
+    def find_at_line_start(self, string: str, position: int) -> int:
+        if self.is_at_line_start(position) and self.text.startswith(
+            string, position
+        ):
+            return position
+        found = self.text.find("\n" + string, position)
+        return found + 1 if found != -1 else -1
+
+    def is_normal_string_end(self, position: int) -> bool:
+        text = self.text
+        if text.startswith("[LINK: ", position):
+            return RE_UID.match(text, position + len("[LINK: ")) is not None
+        if not self.is_at_line_start(position):
+            return False
+        if text.startswith("<<<", position):
+            return True
+        return (
+            text.startswith("[ANCHOR: ", position)
+            and RE_UID.match(text, position + len("[ANCHOR: ")) is not None
+        )
+
+
+def find_model_difference(
+    lhs: Any,
+    rhs: Any,
+    path: str = "document",
+    visited: Optional[Dict[int, int]] = None,
+) -> Optional[str]:
+    """
+    Compare the model objects created by two parsers.
+
+    Returns the path to the first different value or None. The textX
+    meta-data, except the source positions, and the randomly generated
+    machine identifiers are not compared.
+    """
+
+    if visited is None:
+        visited = {}
+    if isinstance(lhs, (str, int, float, bool, type(None))) or isinstance(
+        rhs, (str, int, float, bool, type(None))
+    ):
+        if type(lhs) is not type(rhs) or lhs != rhs:
+            return f"{path}: {lhs!r} != {rhs!r}"
+        return None
+    if type(lhs) is not type(rhs):
+        return f"{path}: {type(lhs).__name__} != {type(rhs).__name__}"
+    if isinstance(lhs, (list, tuple)):
+        if len(lhs) != len(rhs):
+            return f"{path}: {len(lhs)} items != {len(rhs)} items"
+        for index_, (lhs_item_, rhs_item_) in enumerate(zip(lhs, rhs)):
+            if difference := find_model_difference(
+                lhs_item_, rhs_item_, f"{path}[{index_}]", visited
+            ):
+                return difference
+        return None
+    if isinstance(lhs, dict):
+        if list(lhs.keys()) != list(rhs.keys()):
+            return f"{path}: {list(lhs.keys())} != {list(rhs.keys())}"
+        for key_, lhs_value_ in lhs.items():
+            if difference := find_model_difference(
+                lhs_value_, rhs[key_], f"{path}[{key_!r}]", visited
+            ):
+                return difference
+        return None
+    if isinstance(lhs, (set, frozenset)):
+        if lhs != rhs:
+            return f"{path}: {lhs!r} != {rhs!r}"
+        return None
+
+    if id(lhs) in visited:
+        if visited[id(lhs)] != id(rhs):
+            return f"{path}: different object references"
+        return None
+    visited[id(lhs)] = id(rhs)
+
+    lhs_state = get_attributes(lhs)
+    rhs_state = get_attributes(rhs)
+    if lhs_state.keys() != rhs_state.keys():
+        return (
+            f"{path}: attributes {sorted(lhs_state.keys())} != "
+            f"{sorted(rhs_state.keys())}"
+        )
+    compare_mids = getattr(lhs, "mid_permanent", False) is True
+    for name_, lhs_value_ in lhs_state.items():
+        rhs_value_ = rhs_state[name_]
+        if name_.startswith("_tx_") and name_ not in (
+            "_tx_position",
+            "_tx_position_end",
+        ):
+            continue
+        if (
+            isinstance(lhs_value_, MID)
+            and isinstance(rhs_value_, MID)
+            and not compare_mids
+        ):
+            continue
+        if difference := find_model_difference(
+            lhs_value_, rhs_value_, f"{path}.{name_}", visited
+        ):
+            return difference
+    return None
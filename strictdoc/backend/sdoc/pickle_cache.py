@@ -4,32 +4,38 @@
 
 import hashlib
 import os
-from pathlib import Path
-from typing import Any
+import pickle
+from typing import Any, Optional, Tuple
 
+from strictdoc.core.cache_store import CacheStore
 from strictdoc.core.project_config import ProjectConfig
-from strictdoc.helpers.md5 import get_file_md5
+from strictdoc.helpers.file_fingerprint import FileFingerprintManifest
+from strictdoc.helpers.md5 import get_md5
 from strictdoc.helpers.pickle import pickle_dump, pickle_load
 
 
 class PickleCache:
     @staticmethod
     def read_from_cache(
-        file_path: str, project_config: ProjectConfig, content_kind: str
+        file_path: str,
+        project_config: ProjectConfig,
+        content_kind: str,
+        dependencies: Optional[str] = None,
     ) -> Any:
-        path_to_cached_file: str = PickleCache.get_cached_file_path(
-            file_path, project_config, content_kind
+        cache_key, version = PickleCache.get_cache_key(
+            file_path, project_config, dependencies
+        )
+        unpickled_content = CacheStore.get_instance(project_config).get(
+            content_kind, cache_key, version=version
         )
-        if os.path.isfile(path_to_cached_file):
-            with open(path_to_cached_file, "rb") as cache_file:
-                unpickled_content = cache_file.read()
+        if unpickled_content is not None:
             try:
                 return pickle_load(unpickled_content)
             except Exception as exception_:
                 raise AssertionError(
                     "MUST NOT REACH HERE: "
-                    f"Error when unpickling a cache file: {path_to_cached_file}. "
-                    "To fix the issue, simply remove the cache file or the whole cache folder. "
+                    f"Error when unpickling a cached item: {file_path}. "
+                    "To fix the issue, simply remove the cache folder. "
                     "Please report this exception to StrictDoc developers: "
                     f"https://github.com/strictdoc-project/strictdoc/issues/new"
                 ) from exception_
@@ -41,20 +47,39 @@ class PickleCache:
         file_path: str,
         project_config: ProjectConfig,
         content_kind: str,
+        dependencies: Optional[str] = None,
     ) -> None:
-        path_to_cached_file: str = PickleCache.get_cached_file_path(
-            file_path, project_config, content_kind
+        cache_key, version = PickleCache.get_cache_key(
+            file_path, project_config, dependencies
+        )
+        # The protocol 0 cannot pickle the objects of the classes with
+        # __slots__, such as the SDoc nodes.
+        pickled_content: bytes = pickle_dump(
+            content, protocol=pickle.HIGHEST_PROTOCOL
+        )
+        CacheStore.get_instance(project_config).put(
+            content_kind, cache_key, pickled_content, version=version
         )
-        path_to_cached_file_dir: str = os.path.dirname(path_to_cached_file)
-        Path(path_to_cached_file_dir).mkdir(parents=True, exist_ok=True)
-        pickled_content: Any = pickle_dump(content)
-        with open(path_to_cached_file, "wb") as cache_file:
-            cache_file.write(pickled_content)
 
     @staticmethod
-    def get_cached_file_path(
-        file_path: str, project_config: ProjectConfig, content_kind: str
-    ) -> str:
+    def get_cache_key(
+        file_path: str,
+        project_config: ProjectConfig,
+        dependencies: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """
+        Return the key of a cached file and the version of its content.
+
+        The key only depends on the file path, so a cached item of a modified
+        file is replaced in the cache store instead of being stored next to
+        the outdated one.
+
+        The version is the checksum of the file content. If the cached item
+        also depends on something else, e.g., on the config options that were
+        used to convert the file, these dependencies are a part of the
+        version too.
+        """
+
         path_to_tmp_dir = project_config.get_path_to_cache_dir()
 
         full_path_to_file = (
@@ -63,24 +88,28 @@ class PickleCache:
             else os.path.abspath(file_path)
         )
 
-        file_md5: str = get_file_md5(file_path)
+        # Looking up the checksum in the manifest only costs a stat() call
+        # unless the file has changed since the checksum was calculated.
+        file_md5: str = FileFingerprintManifest.get_instance(
+            os.path.join(path_to_tmp_dir, "file_fingerprints")
+        ).get_file_md5(
+            full_path_to_file,
+            verify_content=project_config.cache_verify_file_content,
+        )
 
-        # File name contains an MD5 hash of its full path to ensure the
-        # uniqueness of the cached items. Additionally, the unique file name
-        # contains a full path to the output root to prevent collisions
-        # between StrictDoc invocations running against the same set of SDoc
-        # files in parallel.
+        # The key contains an MD5 hash of the file's full path to ensure the
+        # uniqueness of the cached items. Additionally, the key contains a
+        # full path to the output root to prevent collisions between
+        # StrictDoc invocations running against the same set of SDoc files in
+        # parallel.
         unique_identifier = project_config.output_dir + full_path_to_file
         unique_identifier_md5 = hashlib.md5(
             unique_identifier.encode("utf-8")
         ).hexdigest()
-        file_name = os.path.basename(full_path_to_file)
-        file_name += "_" + unique_identifier_md5 + "_" + file_md5
-
-        path_to_cached_file = os.path.join(
-            path_to_tmp_dir,
-            content_kind,
-            file_name,
+        cache_key = (
+            os.path.basename(full_path_to_file) + "_" + unique_identifier_md5
         )
 
-        return path_to_cached_file
+        if dependencies is not None:
+            return cache_key, file_md5 + "_" + get_md5(dependencies)
+        return cache_key, file_md5
@@ -3,6 +3,7 @@ from typing import Any, Optional, Tuple
 
 from textx import TextXSemanticError, TextXSyntaxError, metamodel_from_str
 
+from strictdoc.backend.sdoc.constants import SDocParser
 from strictdoc.backend.sdoc.grammar.grammar_builder import SDocGrammarBuilder
 from strictdoc.backend.sdoc.models.constants import DOCUMENT_MODELS
 from strictdoc.backend.sdoc.models.document import (
@@ -15,12 +16,17 @@ from strictdoc.backend.sdoc.models.node import (
     SDocNodeField,
 )
 from strictdoc.backend.sdoc.models.section import SDocSection
+from strictdoc.backend.sdoc.native_parser import (
+    NativeParserModel,
+    NativeParserNoMatch,
+    find_model_difference,
+)
 from strictdoc.backend.sdoc.pickle_cache import PickleCache
 from strictdoc.backend.sdoc.processor import ParseContext, SDocParsingProcessor
 from strictdoc.core.project_config import ProjectConfig
 from strictdoc.helpers.cast import assert_cast
 from strictdoc.helpers.exception import StrictDocException
-from strictdoc.helpers.textx import drop_textx_meta
+from strictdoc.helpers.textx import drop_textx_meta, restore_position_slots
 
 
 class SDReader:
@@ -29,25 +35,64 @@ class SDReader:
         classes=DOCUMENT_MODELS,
         use_regexp_group=True,
     )
+    restore_position_slots(meta_model)
+
+    native_parser_model = NativeParserModel(meta_model)
 
     @staticmethod
     def _read(
         input_string: str,
         file_path: Optional[str] = None,
         migrate_sections: bool = False,
+        sdoc_parser: str = SDocParser.TEXTX,
+    ) -> Tuple[SDocDocument, ParseContext]:
+        if sdoc_parser == SDocParser.CONFORMANCE:
+            return SDReader._read_conformance(
+                input_string, file_path, migrate_sections
+            )
+        if sdoc_parser == SDocParser.NATIVE:
+            try:
+                return SDReader._read_with_parser(
+                    SDocParser.NATIVE,
+                    input_string,
+                    file_path,
+                    migrate_sections,
+                )
+            except NativeParserNoMatch:
+                # The native parser does not create error messages. The
+                # input is parsed again with textX to report the error.
+                pass
+        return SDReader._read_with_parser(
+            SDocParser.TEXTX, input_string, file_path, migrate_sections
+        )
+
+    @staticmethod
+    def _read_with_parser(
+        sdoc_parser: str,
+        input_string: str,
+        file_path: Optional[str],
+        migrate_sections: bool,
     ) -> Tuple[SDocDocument, ParseContext]:
         parse_context = ParseContext(
             path_to_sdoc_file=file_path, migrate_sections=migrate_sections
         )
         processor = SDocParsingProcessor(parse_context=parse_context)
-        SDReader.meta_model.register_obj_processors(
-            processor.get_default_processors()
-        )
 
         try:
-            document: SDocDocument = SDReader.meta_model.model_from_str(
-                input_string, file_name=file_path
-            )
+            document: SDocDocument
+            if sdoc_parser == SDocParser.NATIVE:
+                document = SDReader.native_parser_model.parse(
+                    input_string,
+                    file_path,
+                    processor.get_default_processors(),
+                )
+            else:
+                SDReader.meta_model.register_obj_processors(
+                    processor.get_default_processors()
+                )
+                document = SDReader.meta_model.model_from_str(
+                    input_string, file_name=file_path
+                )
         except (TextXSyntaxError, TextXSemanticError) as syntax_error_:
             raise StrictDocException(
                 f"Could not parse file: "
@@ -60,14 +105,65 @@ class SDReader:
 
         return document, parse_context
 
+    @staticmethod
+    def _read_conformance(
+        input_string: str,
+        file_path: Optional[str],
+        migrate_sections: bool,
+    ) -> Tuple[SDocDocument, ParseContext]:
+        """
+        Parse the input with both parsers and compare the created models.
+
+        The result of the textX parser is returned. A native parser that
+        accepts an input that textX rejects, rejects an input that textX
+        accepts or creates a different model raises an exception.
+        """
+
+        native_result: Optional[Tuple[SDocDocument, ParseContext]] = None
+        try:
+            native_result = SDReader._read_with_parser(
+                SDocParser.NATIVE, input_string, file_path, migrate_sections
+            )
+        except Exception:  # noqa: S110
+            pass
+
+        try:
+            textx_result = SDReader._read_with_parser(
+                SDocParser.TEXTX, input_string, file_path, migrate_sections
+            )
+        except Exception:
+            if native_result is not None:
+                raise StrictDocException(
+                    "The native SDoc parser does not conform to the textX "
+                    f"parser: {file_path}: "
+                    "the native parser accepts an invalid document."
+                ) from None
+            raise
+
+        difference: Optional[str]
+        if native_result is None:
+            difference = "the native parser rejects a valid document."
+        else:
+            difference = find_model_difference(textx_result, native_result)
+        if difference is not None:
+            raise StrictDocException(
+                "The native SDoc parser does not conform to the textX parser: "
+                f"{file_path}: {difference}"
+            )
+        return textx_result
+
     @staticmethod
     def read(
         input_string: str,
         file_path: Optional[str] = None,
         migrate_sections: bool = False,
+        sdoc_parser: str = SDocParser.TEXTX,
     ) -> SDocDocument:
         document, _ = SDReader.read_with_parse_context(
-            input_string, file_path, migrate_sections=migrate_sections
+            input_string,
+            file_path,
+            migrate_sections=migrate_sections,
+            sdoc_parser=sdoc_parser,
         )
         return document
 
@@ -76,8 +172,11 @@ class SDReader:
         input_string: str,
         file_path: Optional[str] = None,
         migrate_sections: bool = False,
+        sdoc_parser: str = SDocParser.TEXTX,
     ) -> Tuple[SDocDocument, ParseContext]:
-        document, parse_context = SDReader._read(input_string, file_path)
+        document, parse_context = SDReader._read(
+            input_string, file_path, sdoc_parser=sdoc_parser
+        )
 
         # FIXME: When the [SECTION] is gone, remove this.
         if migrate_sections:
@@ -94,8 +193,13 @@ class SDReader:
         Parse a provided .sdoc file and convert it into a Document object.
         """
 
+        # The parsers create equal documents only if the input is valid, so
+        # a document is not reused after switching to another parser.
         unpickled_content = PickleCache.read_from_cache(
-            file_path, project_config, "sdoc"
+            file_path,
+            project_config,
+            "sdoc",
+            dependencies=project_config.sdoc_parser,
         )
         if unpickled_content:
             return assert_cast(unpickled_content, SDocDocument)
@@ -107,6 +211,7 @@ class SDReader:
             sdoc_content,
             file_path=file_path,
             migrate_sections=project_config.is_new_section_behavior(),
+            sdoc_parser=project_config.sdoc_parser,
         )
 
         sdoc.fragments_from_files = parse_context.fragments_from_files
@@ -121,7 +226,13 @@ class SDReader:
         sdoc.build_search_index()
         # @relation(SDOC-SRS-155, scope=range_end)
 
-        PickleCache.save_to_cache(sdoc, file_path, project_config, "sdoc")
+        PickleCache.save_to_cache(
+            sdoc,
+            file_path,
+            project_config,
+            "sdoc",
+            dependencies=project_config.sdoc_parser,
+        )
 
         return sdoc
 
@@ -44,7 +44,11 @@ class SDWriter:
     def __init__(self, project_config: ProjectConfig) -> None:
         self.project_config: ProjectConfig = project_config
 
-    def write_to_file(self, document: SDocDocument) -> None:
+    def write_to_file(self, document: SDocDocument) -> List[str]:
+        """
+        Write the document and its fragments and return the written paths.
+        """
+
         document_content, fragments_dict = self.write_with_fragments(document)
 
         document_meta: DocumentMeta = assert_cast(document.meta, DocumentMeta)
@@ -53,6 +57,7 @@ class SDWriter:
             document_meta.input_doc_full_path, "w", encoding="utf8"
         ) as output_file:
             output_file.write(document_content)
+        written_files: List[str] = [document_meta.input_doc_full_path]
 
         path_to_output_file_dir = os.path.dirname(
             document_meta.input_doc_full_path
@@ -65,6 +70,9 @@ class SDWriter:
             )
             with open(path_to_output_fragment, "w", encoding="utf8") as file_:
                 file_.write(fragment_content_)
+            written_files.append(path_to_output_fragment)
+
+        return written_files
 
     def write(self, document: SDocDocument) -> str:
         document_output, _ = self.write_with_fragments(document)
@@ -2,7 +2,9 @@
 @relation(SDOC-SRS-33, SDOC-SRS-142, scope=file)
 """
 
-from typing import Optional, Union
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from strictdoc.backend.sdoc.pickle_cache import PickleCache
 from strictdoc.backend.sdoc_source_code.models.source_file_info import (
@@ -22,8 +24,17 @@ from strictdoc.backend.sdoc_source_code.reader_robot import (
 )
 from strictdoc.core.project_config import ProjectConfig
 
+SourceFileReader = Union[
+    SourceFileTraceabilityReader,
+    SourceFileTraceabilityReader_Python,
+    SourceFileTraceabilityReader_C,
+    SourceFileTraceabilityReader_Robot,
+]
+
 
 class SourceFileTraceabilityCachingReader:
+    _readers: Dict[Tuple[int, int, str], SourceFileReader] = {}
+
     @staticmethod
     def read_from_file(
         path_to_file: str, project_config: ProjectConfig
@@ -60,15 +71,12 @@ class SourceFileTraceabilityCachingReader:
     @staticmethod
     def _get_reader(
         path_to_file: str, project_config: ProjectConfig
-    ) -> Union[
-        SourceFileTraceabilityReader,
-        SourceFileTraceabilityReader_Python,
-        SourceFileTraceabilityReader_C,
-        SourceFileTraceabilityReader_Robot,
-    ]:
+    ) -> SourceFileReader:
         if project_config.is_activated_source_file_language_parsers():
             if path_to_file.endswith(".py"):
-                return SourceFileTraceabilityReader_Python()
+                return SourceFileTraceabilityCachingReader._get_reader_instance(
+                    "python", SourceFileTraceabilityReader_Python
+                )
             if (
                 path_to_file.endswith(".c")
                 or path_to_file.endswith(".cc")
@@ -78,7 +86,36 @@ class SourceFileTraceabilityCachingReader:
                 or path_to_file.endswith(".cpp")
             ):
                 parse_nodes = project_config.shall_parse_nodes(path_to_file)
-                return SourceFileTraceabilityReader_C(parse_nodes=parse_nodes)
+                return SourceFileTraceabilityCachingReader._get_reader_instance(
+                    "c_with_nodes" if parse_nodes else "c",
+                    lambda: SourceFileTraceabilityReader_C(
+                        parse_nodes=parse_nodes
+                    ),
+                )
             if path_to_file.endswith(".robot"):
-                return SourceFileTraceabilityReader_Robot()
-        return SourceFileTraceabilityReader()
+                return SourceFileTraceabilityCachingReader._get_reader_instance(
+                    "robot", SourceFileTraceabilityReader_Robot
+                )
+        return SourceFileTraceabilityCachingReader._get_reader_instance(
+            "general", SourceFileTraceabilityReader
+        )
+
+    @staticmethod
+    def _get_reader_instance(
+        reader_name: str, create_reader: Callable[[], SourceFileReader]
+    ) -> SourceFileReader:
+        """
+        Return the reader of a kind, created once per process and thread.
+
+        The general reader builds its textX meta-model when it is created,
+        which takes longer than reading a typical source file.
+        """
+
+        reader_key = (os.getpid(), threading.get_ident(), reader_name)
+        reader: Optional[SourceFileReader] = (
+            SourceFileTraceabilityCachingReader._readers.get(reader_key)
+        )
+        if reader is None:
+            reader = create_reader()
+            SourceFileTraceabilityCachingReader._readers[reader_key] = reader
+        return reader
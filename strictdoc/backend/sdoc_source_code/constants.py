@@ -8,6 +8,11 @@ REGEX_REQ = r"(?!scope=)[A-Za-z][A-Za-z0-9_\/\.\\-]+"
 REGEX_ROLE = r"[A-Za-z][A-Za-z0-9\\-]+"
 RESERVED_KEYWORDS = "FIXME|NOTE|TODO|TBD|WARNING"
 
+# Every marker that the source file readers recognize starts with one of
+# these keywords, so text that contains none of them is not parsed.
+RELATION_MARKER_KEYWORD = "@relation"
+MARKER_KEYWORDS = (RELATION_MARKER_KEYWORD, "@sdoc")
+
 
 class FunctionAttribute(Enum):
     STATIC = "static"
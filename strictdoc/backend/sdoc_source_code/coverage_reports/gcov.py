@@ -3,10 +3,12 @@
 """
 
 import hashlib
+import io
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Type
+from typing import Any, Dict, TextIO, Type
 
 from strictdoc.backend.sdoc.document_reference import DocumentReference
 from strictdoc.backend.sdoc.models.document import SDocDocument
@@ -20,10 +22,12 @@ from strictdoc.backend.sdoc.models.reference import (
 from strictdoc.backend.sdoc.models.section import SDocSection
 from strictdoc.core.file_tree import File
 from strictdoc.core.project_config import ProjectConfig
+from strictdoc.helpers.json_stream import iterate_json_array_items
 
 
 @dataclass
 class GCovStatsObject:
+    total_number_of_files: int = 0
     total_number_of_covered_functions: int = 0
     total_number_of_non_covered_functions: int = 0
 
@@ -41,23 +45,38 @@ class GCovJSONReader:
         doc_file: File,
         project_config: ProjectConfig,
     ) -> SDocDocument:
+        if os.path.getsize(doc_file.full_path) == 0:
+            raise RuntimeError("Document is empty")
         with open(doc_file.full_path, encoding="UTF-8") as file:
-            content = file.read()
-        return cls.read_from_string(content, doc_file, project_config)
+            return cls.read_from_stream(file, doc_file, project_config)
 
     @classmethod
     def read_from_string(
         cls: Type["GCovJSONReader"],
         content: str,
-        doc_file: File,  # noqa: ARG003
-        project_config: ProjectConfig,  # noqa: ARG003
+        doc_file: File,
+        project_config: ProjectConfig,
     ) -> SDocDocument:
         if len(content) == 0:
             raise RuntimeError("Document is empty")
-        try:
-            json_content = json.loads(content)
-        except Exception as exception:  # pylint: disable=broad-except
-            raise RuntimeError(str(exception)) from None
+        return cls.read_from_stream(
+            io.StringIO(content), doc_file, project_config
+        )
+
+    @classmethod
+    def read_from_stream(
+        cls: Type["GCovJSONReader"],
+        stream: TextIO,
+        doc_file: File,  # noqa: ARG003
+        project_config: ProjectConfig,  # noqa: ARG003
+    ) -> SDocDocument:
+        """
+        Convert a gcov JSON report while it is being read.
+
+        The report is decoded one item of its "files" array at a time, so the
+        memory is bounded by the largest file entry rather than the whole
+        report.
+        """
 
         document = SDocDocument(
             mid=None,
@@ -75,199 +94,205 @@ class GCovJSONReader:
 
         stats = GCovStatsObject()
 
-        """
-        Parse individual <testcase> elements.
-        """
-
-        json_files = json_content["files"]
-        for json_file_ in json_files:
-            json_file_name = json_file_["file"]
+        try:
+            for json_file_ in iterate_json_array_items(stream, "files"):
+                cls._create_file_section(document, json_file_, stats)
+        except json.JSONDecodeError as exception:
+            raise RuntimeError(str(exception)) from None
 
-            file_section = SDocSection(
-                parent=document,
-                mid=None,
-                uid=None,
-                custom_level=None,
-                title=json_file_name,
-                requirement_prefix=None,
-                section_contents=[],
+        if stats.total_number_of_files > 0:
+            document.section_contents.insert(
+                0, cls._create_summary_node(document, stats)
             )
-            file_section.ng_including_document_reference = DocumentReference()
-            file_section.ng_document_reference = DocumentReference()
-            file_section.ng_document_reference.set_document(document)
-            document.section_contents.append(file_section)
 
-            covered_functions_section = SDocSection(
-                parent=document,
-                mid=None,
-                uid=None,
-                custom_level=None,
-                title="Covered functions",
-                requirement_prefix=None,
-                section_contents=[],
-            )
-            covered_functions_section.ng_including_document_reference = (
-                DocumentReference()
-            )
-            covered_functions_section.ng_document_reference = (
-                DocumentReference()
-            )
-            covered_functions_section.ng_document_reference.set_document(
-                document
-            )
-            file_section.section_contents.append(covered_functions_section)
+        return document
 
-            non_covered_functions_section = SDocSection(
-                parent=document,
-                mid=None,
-                uid=None,
-                custom_level=None,
-                title="Non-covered functions",
-                requirement_prefix=None,
-                section_contents=[],
-            )
-            non_covered_functions_section.ng_including_document_reference = (
-                DocumentReference()
-            )
-            non_covered_functions_section.ng_document_reference = (
-                DocumentReference()
-            )
-            non_covered_functions_section.ng_document_reference.set_document(
-                document
-            )
-            file_section.section_contents.append(non_covered_functions_section)
+    @staticmethod
+    def _create_file_section(
+        document: SDocDocument,
+        json_file_: Dict[str, Any],
+        stats: GCovStatsObject,
+    ) -> None:
+        stats.total_number_of_files += 1
+        json_file_name = json_file_["file"]
 
-            for json_function_ in json_file_["functions"]:
-                json_function_name = json_function_["demangled_name"]
-                is_function_covered = json_function_["execution_count"] > 0
-                stats.add_function(is_function_covered)
+        file_section = SDocSection(
+            parent=document,
+            mid=None,
+            uid=None,
+            custom_level=None,
+            title=json_file_name,
+            requirement_prefix=None,
+            section_contents=[],
+        )
+        file_section.ng_including_document_reference = DocumentReference()
+        file_section.ng_document_reference = DocumentReference()
+        file_section.ng_document_reference.set_document(document)
+        document.section_contents.append(file_section)
 
-                testcase_node = SDocNode(
-                    parent=document,
-                    node_type="TEST_RESULT",
-                    fields=[],
-                    relations=[],
-                )
-                testcase_node.ng_document_reference = DocumentReference()
-                testcase_node.ng_document_reference.set_document(document)
-                testcase_node.ng_including_document_reference = (
-                    DocumentReference()
-                )
-                testcase_node.set_field_value(
+        covered_functions_section = SDocSection(
+            parent=document,
+            mid=None,
+            uid=None,
+            custom_level=None,
+            title="Covered functions",
+            requirement_prefix=None,
+            section_contents=[],
+        )
+        covered_functions_section.ng_including_document_reference = (
+            DocumentReference()
+        )
+        covered_functions_section.ng_document_reference = DocumentReference()
+        covered_functions_section.ng_document_reference.set_document(document)
+        file_section.section_contents.append(covered_functions_section)
+
+        non_covered_functions_section = SDocSection(
+            parent=document,
+            mid=None,
+            uid=None,
+            custom_level=None,
+            title="Non-covered functions",
+            requirement_prefix=None,
+            section_contents=[],
+        )
+        non_covered_functions_section.ng_including_document_reference = (
+            DocumentReference()
+        )
+        non_covered_functions_section.ng_document_reference = (
+            DocumentReference()
+        )
+        non_covered_functions_section.ng_document_reference.set_document(
+            document
+        )
+        file_section.section_contents.append(non_covered_functions_section)
+
+        for json_function_ in json_file_["functions"]:
+            json_function_name = json_function_["demangled_name"]
+            is_function_covered = json_function_["execution_count"] > 0
+            stats.add_function(is_function_covered)
+
+            testcase_node = SDocNode(
+                parent=document,
+                node_type="TEST_RESULT",
+                fields=[],
+                relations=[],
+            )
+            testcase_node.ng_document_reference = DocumentReference()
+            testcase_node.ng_document_reference.set_document(document)
+            testcase_node.ng_including_document_reference = DocumentReference()
+            testcase_node.set_field_value(
+                field_name="UID",
+                form_field_index=0,
+                value=SDocNodeField(
+                    parent=testcase_node,
                     field_name="UID",
-                    form_field_index=0,
-                    value=SDocNodeField(
-                        parent=testcase_node,
-                        field_name="UID",
-                        parts=[
-                            "GCOV:" + json_file_name + ":" + json_function_name
-                        ],
-                        multiline__=None,
-                    ),
-                )
-                # FIXME: Remove?
-                testcase_node.set_field_value(
+                    parts=["GCOV:" + json_file_name + ":" + json_function_name],
+                    multiline__=None,
+                ),
+            )
+            # FIXME: Remove?
+            testcase_node.set_field_value(
+                field_name="STATUS",
+                form_field_index=0,
+                value=SDocNodeField(
+                    parent=testcase_node,
                     field_name="STATUS",
-                    form_field_index=0,
-                    value=SDocNodeField(
-                        parent=testcase_node,
-                        field_name="STATUS",
-                        parts=[
-                            "Covered" if is_function_covered else "Non-covered"
-                        ],
-                        multiline__=None,
-                    ),
-                )
+                    parts=["Covered" if is_function_covered else "Non-covered"],
+                    multiline__=None,
+                ),
+            )
 
-                path = "src/main.c"
-                gcov_path_hash = hashlib.md5(path.encode("utf-8")).hexdigest()
-                # FIXME: Resolve the relative path from a project config.
-                link = (
-                    "../../../../"  # noqa: ISC003
-                    + "coverage."
-                    + Path(json_file_name).name
-                    + ". "
-                    + gcov_path_hash
-                    + ".html"
-                )
-                testcase_node.set_field_value(
+            path = "src/main.c"
+            gcov_path_hash = hashlib.md5(path.encode("utf-8")).hexdigest()
+            # FIXME: Resolve the relative path from a project config.
+            link = (
+                "../../../../"  # noqa: ISC003
+                + "coverage."
+                + Path(json_file_name).name
+                + ". "
+                + gcov_path_hash
+                + ".html"
+            )
+            testcase_node.set_field_value(
+                field_name="STATEMENT",
+                form_field_index=0,
+                value=SDocNodeField(
+                    parent=testcase_node,
                     field_name="STATEMENT",
-                    form_field_index=0,
-                    value=SDocNodeField(
-                        parent=testcase_node,
-                        field_name="STATEMENT",
-                        parts=[
-                            f"""
+                    # The indentation inside the string is a part of the
+                    # generated statement.
+                    parts=[
+                        f"""
                             `LINK <{link}>`_
                             """
-                        ],
-                        multiline__=None,
-                    ),
-                )
-                testcase_node.set_field_value(
+                    ],
+                    multiline__=None,
+                ),
+            )
+            testcase_node.set_field_value(
+                field_name="TITLE",
+                form_field_index=0,
+                value=SDocNodeField(
+                    parent=testcase_node,
                     field_name="TITLE",
-                    form_field_index=0,
-                    value=SDocNodeField(
-                        parent=testcase_node,
-                        field_name="TITLE",
-                        parts=[json_function_name],
-                        multiline__=None,
+                    parts=[json_function_name],
+                    multiline__=None,
+                ),
+            )
+            testcase_node.relations.append(
+                FileReference(
+                    parent=testcase_node,
+                    g_file_entry=FileEntry(
+                        parent=None,
+                        g_file_format=FileEntryFormat.SOURCECODE,
+                        g_file_path=json_file_name,
+                        g_line_range=None,
+                        function=json_function_name,
+                        clazz=None,
                     ),
                 )
-                testcase_node.relations.append(
-                    FileReference(
-                        parent=testcase_node,
-                        g_file_entry=FileEntry(
-                            parent=None,
-                            g_file_format=FileEntryFormat.SOURCECODE,
-                            g_file_path=json_file_name,
-                            g_line_range=None,
-                            function=json_function_name,
-                            clazz=None,
-                        ),
-                    )
+            )
+            if is_function_covered:
+                covered_functions_section.section_contents.append(testcase_node)
+            else:
+                non_covered_functions_section.section_contents.append(
+                    testcase_node
                 )
-                if is_function_covered:
-                    covered_functions_section.section_contents.append(
-                        testcase_node
-                    )
-                else:
-                    non_covered_functions_section.section_contents.append(
-                        testcase_node
-                    )
 
-            summary_table = f"""\
+    @staticmethod
+    def _create_summary_node(
+        document: SDocDocument, stats: GCovStatsObject
+    ) -> SDocNode:
+        summary_table = f"""\
 .. list-table:: Coverage summary
     :widths: 25 10
     :header-rows: 0
 
     * - **Number of files:**
-      - {len(json_content["files"])}
+      - {stats.total_number_of_files}
     * - **Total covered functions:**
       - {stats.total_number_of_covered_functions}
     * - **Total non-covered functions:**
       - {stats.total_number_of_non_covered_functions}
         """
 
-            testcase_node = SDocNode(
-                parent=document,
-                node_type="TEXT",
-                fields=[],
-                relations=[],
-            )
-            testcase_node.ng_document_reference = DocumentReference()
-            testcase_node.ng_document_reference.set_document(document)
-            testcase_node.ng_including_document_reference = DocumentReference()
-            testcase_node.set_field_value(
+        summary_node = SDocNode(
+            parent=document,
+            node_type="TEXT",
+            fields=[],
+            relations=[],
+        )
+        summary_node.ng_document_reference = DocumentReference()
+        summary_node.ng_document_reference.set_document(document)
+        summary_node.ng_including_document_reference = DocumentReference()
+        summary_node.set_field_value(
+            field_name="STATEMENT",
+            form_field_index=0,
+            value=SDocNodeField(
+                parent=summary_node,
                 field_name="STATEMENT",
-                form_field_index=0,
-                value=SDocNodeField(
-                    parent=testcase_node,
-                    field_name="STATEMENT",
-                    parts=[summary_table],
-                    multiline__="True",
-                ),
-            )
-            document.section_contents.insert(0, testcase_node)
-
-        return document
+                parts=[summary_table],
+                multiline__="True",
+            ),
+        )
+        return summary_node
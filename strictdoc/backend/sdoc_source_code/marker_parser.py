@@ -9,6 +9,9 @@ from lark import ParseTree, Token, Tree
 from strictdoc.backend.sdoc_source_code.comment_parser.marker_lexer import (
     MarkerLexer,
 )
+from strictdoc.backend.sdoc_source_code.constants import (
+    RELATION_MARKER_KEYWORD,
+)
 from strictdoc.backend.sdoc_source_code.helpers.comment_preprocessor import (
     preprocess_source_code_comment,
 )
@@ -51,6 +54,11 @@ class MarkerParser:
         node_fields: Dict[str, str] = {}
         source_node: SourceNode = SourceNode(entity_name)
 
+        # Most comments contain no markers, and without the node fields,
+        # there is nothing else to parse in them.
+        if not parse_nodes and RELATION_MARKER_KEYWORD not in input_string:
+            return source_node
+
         input_string = preprocess_source_code_comment(input_string)
 
         tree: ParseTree = MarkerLexer.parse(
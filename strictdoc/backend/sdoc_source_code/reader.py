@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, TypedDict
 from textx import get_location, metamodel_from_str
 
 from strictdoc.backend.sdoc.error_handling import StrictDocSemanticError
+from strictdoc.backend.sdoc_source_code.constants import MARKER_KEYWORDS
 from strictdoc.backend.sdoc_source_code.grammar import SOURCE_FILE_GRAMMAR
 from strictdoc.backend.sdoc_source_code.models.function_range_marker import (
     FunctionRangeMarker,
@@ -251,6 +252,14 @@ class SourceFileTraceabilityReader:
             return SourceFileTraceabilityInfo([])
 
         file_stats = SourceFileStats.create(input_string)
+
+        # Most source files contain no markers. The grammar matches every line
+        # of a file, so parsing these files is skipped altogether.
+        if not any(keyword_ in input_string for keyword_ in MARKER_KEYWORDS):
+            traceability_info = SourceFileTraceabilityInfo([])
+            traceability_info.file_stats = file_stats
+            return traceability_info
+
         parse_context = ParseContext(file_path, file_stats)
 
         parse_source_traceability_processor = partial(
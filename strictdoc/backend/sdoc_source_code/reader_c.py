@@ -4,8 +4,7 @@
 
 from typing import List, Optional, Sequence
 
-import tree_sitter_cpp
-from tree_sitter import Language, Node, Parser
+from tree_sitter import Node
 
 from strictdoc.backend.sdoc_source_code.constants import FunctionAttribute
 from strictdoc.backend.sdoc_source_code.marker_parser import MarkerParser
@@ -29,6 +28,7 @@ from strictdoc.backend.sdoc_source_code.processors.general_language_marker_proce
     source_file_traceability_info_processor,
 )
 from strictdoc.backend.sdoc_source_code.tree_sitter_helpers import (
+    TreeSitterParserPool,
     traverse_tree,
     ts_find_child_node_by_type,
     ts_find_child_nodes_by_type,
@@ -58,12 +58,7 @@ class SourceFileTraceabilityReader_C:
         file_stats = SourceFileStats.create(input_buffer)
         parse_context = ParseContext(file_path, file_stats)
 
-        # Works since Python 3.9 but we also lint this with mypy from Python 3.8.
-        language_arg = tree_sitter_cpp.language()
-        py_language = Language(  # type: ignore[call-arg, unused-ignore]
-            language_arg
-        )
-        parser = Parser(py_language)  # type: ignore[call-arg, unused-ignore]
+        parser = TreeSitterParserPool.get_parser("cpp")
 
         tree = parser.parse(input_buffer)
 
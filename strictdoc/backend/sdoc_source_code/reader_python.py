@@ -5,8 +5,7 @@
 from itertools import islice
 from typing import List, Optional, Sequence
 
-import tree_sitter_python
-from tree_sitter import Language, Node, Parser
+from tree_sitter import Node
 
 from strictdoc.backend.sdoc_source_code.marker_parser import MarkerParser
 from strictdoc.backend.sdoc_source_code.models.function import Function
@@ -28,7 +27,10 @@ from strictdoc.backend.sdoc_source_code.processors.general_language_marker_proce
     range_marker_processor,
     source_file_traceability_info_processor,
 )
-from strictdoc.backend.sdoc_source_code.tree_sitter_helpers import traverse_tree
+from strictdoc.backend.sdoc_source_code.tree_sitter_helpers import (
+    TreeSitterParserPool,
+    traverse_tree,
+)
 from strictdoc.helpers.file_stats import SourceFileStats
 
 
@@ -48,12 +50,7 @@ class SourceFileTraceabilityReader_Python:
         file_stats = SourceFileStats.create(input_buffer)
         parse_context = ParseContext(file_path, file_stats)
 
-        # Works since Python 3.9 but we also lint this with mypy from Python 3.8.
-        language_arg = tree_sitter_python.language()
-        py_language = Language(  # type: ignore[call-arg, unused-ignore]
-            language_arg
-        )
-        parser = Parser(py_language)  # type: ignore[call-arg, unused-ignore]
+        parser = TreeSitterParserPool.get_parser("python")
 
         tree = parser.parse(input_buffer)
 
@@ -234,7 +234,12 @@ class RobotOutputXMLReader:
         doc_file: File,
         project_config: ProjectConfig,
     ) -> SDocDocument:
-        execution_result = ExecutionResult(doc_file.full_path)
+        # Robot parses output.xml incrementally itself. The keywords and
+        # their messages are the bulk of a large output.xml and are not
+        # converted, so they are skipped instead of being kept in memory.
+        execution_result = ExecutionResult(
+            doc_file.full_path, include_keywords=False
+        )
         sdoc_visitor = SdocVisitor(project_config)
         execution_result.visit(sdoc_visitor)
         if sdoc_visitor.document is None:
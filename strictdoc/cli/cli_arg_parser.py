@@ -84,6 +84,7 @@ class ServerCommandConfig:
         reload: bool,
         host: Optional[str],
         port: Optional[int],
+        watch: bool = False,
     ):
         self._input_path: str = input_path
         self.output_path: Optional[str] = output_path
@@ -91,6 +92,7 @@ class ServerCommandConfig:
         self.reload: bool = reload
         self.host: Optional[str] = host
         self.port: Optional[int] = port
+        self.watch: bool = watch
 
     def get_full_input_path(self) -> str:
         return os.path.abspath(self._input_path)
@@ -145,6 +147,7 @@ class ExportCommandConfig:
         view: Optional[str],
         chromedriver: Optional[str],
         requirements_regex: Optional[List[str]],
+        sdoc_parser: Optional[str],
     ):
         assert isinstance(input_paths, list), f"{input_paths}"
         self.input_paths: List[str] = input_paths
@@ -165,6 +168,7 @@ class ExportCommandConfig:
         self.view: Optional[str] = view
         self.chromedriver: Optional[str] = chromedriver
         self.requirements_regex: Optional[List[str]] = requirements_regex
+        self.sdoc_parser: Optional[str] = sdoc_parser
 
     def get_path_to_config(self) -> str:
         # FIXME: The control flow can be improved.
@@ -213,6 +217,35 @@ class DiffCommandConfig:
         self.output_dir: Optional[str] = output_dir
 
 
+class CacheCommandConfig:
+    def __init__(
+        self,
+        *,
+        subcommand: str,
+        config_path: Optional[str],
+        output_dir: Optional[str],
+        max_size_mb: Optional[int],
+    ):
+        self.subcommand: str = subcommand
+        self._config_path: Optional[str] = config_path
+        self.output_dir: Optional[str] = output_dir
+        self.max_size_mb: Optional[int] = max_size_mb
+
+    def get_path_to_config(self) -> str:
+        return (
+            self._config_path if self._config_path is not None else os.getcwd()
+        )
+
+    def validate(self) -> None:
+        if self._config_path is not None and not os.path.exists(
+            self._config_path
+        ):
+            raise CLIValidationError(
+                "Provided path to a configuration file does not exist: "
+                f"{self._config_path}"
+            )
+
+
 class SDocArgsParser:
     def __init__(self, args: argparse.Namespace):
         self.args: argparse.Namespace = args
@@ -220,6 +253,10 @@ class SDocArgsParser:
     def is_debug_mode(self) -> bool:
         return assert_cast(self.args.debug, bool)
 
+    def get_trace_output(self) -> Optional[str]:
+        trace_output: Optional[str] = self.args.trace_output
+        return trace_output
+
     @property
     def is_about_command(self) -> bool:
         return str(self.args.command) == "about"
@@ -269,6 +306,10 @@ class SDocArgsParser:
             and str(self.args.subcommand) == "auto-uid"
         )
 
+    @property
+    def is_cache_command(self) -> bool:
+        return str(self.args.command) == "cache"
+
     def get_export_config(self) -> ExportCommandConfig:
         project_title: Optional[str] = self.args.project_title
 
@@ -291,6 +332,7 @@ class SDocArgsParser:
             self.args.view,
             self.args.chromedriver,
             self.args.requirements_regex,
+            self.args.sdoc_parser,
         )
 
     def get_import_config_reqif(self, _: Any) -> ImportReqIFCommandConfig:
@@ -322,6 +364,15 @@ class SDocArgsParser:
             reload=self.args.reload,
             host=self.args.host,
             port=self.args.port,
+            watch=self.args.watch,
+        )
+
+    def get_cache_config(self) -> CacheCommandConfig:
+        return CacheCommandConfig(
+            subcommand=self.args.subcommand,
+            config_path=self.args.config,
+            output_dir=self.args.output_dir,
+            max_size_mb=getattr(self.args, "max_size_mb", None),
         )
 
     def get_dump_grammar_config(self) -> DumpGrammarCommandConfig:
@@ -4,7 +4,7 @@ from typing import List, NoReturn, Optional
 
 from strictdoc import __version__
 from strictdoc.backend.reqif.sdoc_reqif_fields import ReqIFProfile
-from strictdoc.backend.sdoc.constants import SDocMarkup
+from strictdoc.backend.sdoc.constants import SDocMarkup, SDocParser
 from strictdoc.cli.argument_int_range import IntRange
 
 EXPORT_FORMATS = [
@@ -114,6 +114,18 @@ class CommandParserBuilder:
             help="Enable more verbose printing of errors when they are encountered.",
         )
 
+        main_parser.add_argument(
+            "--trace-output",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help=(
+                "Record the performance of the command and write it to PATH "
+                "as a Chrome trace-event JSON file "
+                "(chrome://tracing, https://ui.perfetto.dev)."
+            ),
+        )
+
         command_subparsers = main_parser.add_subparsers(
             title="command", dest="command"
         )
@@ -123,6 +135,7 @@ class CommandParserBuilder:
         self.add_export_command(command_subparsers)
         self.add_server_command(command_subparsers)
         self.add_manage_command(command_subparsers)
+        self.add_cache_command(command_subparsers)
         self.add_import_command(command_subparsers)
         self.add_version_command(command_subparsers)
         self.add_passthrough_command(command_subparsers)
@@ -268,6 +281,18 @@ class CommandParserBuilder:
             nargs="+",
             action="extend",
         )
+        command_parser_export.add_argument(
+            "--sdoc-parser",
+            choices=SDocParser.ALL,
+            default=None,
+            help=(
+                "The parser of the SDoc files: "
+                "the default textX parser or the faster native parser. "
+                "The conformance mode runs both parsers and fails if the "
+                "parsed documents differ. "
+                "Overrides the sdoc_parser option of the project configuration."
+            ),
+        )
         add_config_argument(command_parser_export)
 
     @staticmethod
@@ -401,6 +426,17 @@ class CommandParserBuilder:
             action="store_false",
             help=argparse.SUPPRESS,
         )
+        command_parser_server.add_argument(
+            "--watch",
+            default=False,
+            action="store_true",
+            help=(
+                "Watch the project files for changes made outside the server, "
+                "e.g., by a version control system or a text editor. "
+                "The changed files are re-indexed and the open pages of "
+                "the affected documents are refreshed."
+            ),
+        )
 
         add_config_argument(command_parser_server)
 
@@ -566,6 +602,55 @@ class CommandParserBuilder:
         )
         add_config_argument(command_parser_auto_uid)
 
+    @staticmethod
+    def add_cache_command(
+        parent_command_parser: "argparse._SubParsersAction[SDocArgumentParser]",
+    ) -> None:
+        cache_command_parser = parent_command_parser.add_parser(
+            "cache",
+            help="Inspect and clean up the StrictDoc cache.",
+            description="See subcommands to manage the StrictDoc cache.",
+            formatter_class=formatter,
+        )
+        cache_command_subparsers = cache_command_parser.add_subparsers(
+            title="subcommand", dest="subcommand"
+        )
+        cache_command_subparsers.required = True
+
+        command_parser_stats = cache_command_subparsers.add_parser(
+            "stats",
+            help="Print the number and the size of the cached items.",
+            formatter_class=formatter,
+        )
+        command_parser_prune = cache_command_subparsers.add_parser(
+            "prune",
+            help="Evict the least recently used cached items.",
+            description=(
+                "This command evicts the least recently used cached items "
+                "until the cache fits the size limit. By default, the "
+                "cache_max_size_mb limit of the project configuration is used."
+            ),
+            formatter_class=formatter,
+        )
+        command_parser_prune.add_argument(
+            "--max-size-mb",
+            type=IntRange(0, 1_000_000),
+            help=(
+                "The size limit to prune the cache to, in megabytes. "
+                "Use 0 to remove all cached items."
+            ),
+        )
+        for command_parser_ in (command_parser_stats, command_parser_prune):
+            command_parser_.add_argument(
+                "--output-dir",
+                type=str,
+                help=(
+                    "The output directory of the exported project. The "
+                    "default cache is located in this directory."
+                ),
+            )
+            add_config_argument(command_parser_)
+
     @staticmethod
     def add_diff_command(
         command_subparsers: "argparse._SubParsersAction[SDocArgumentParser]",
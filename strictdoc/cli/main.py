@@ -16,6 +16,7 @@ sys.path.append(strictdoc_root_path)
 
 from strictdoc import environment
 from strictdoc.cli.cli_arg_parser import (
+    CacheCommandConfig,
     CLIValidationError,
     DiffCommandConfig,
     DumpGrammarCommandConfig,
@@ -27,6 +28,7 @@ from strictdoc.cli.cli_arg_parser import (
     create_sdoc_args_parser,
 )
 from strictdoc.commands.about_command import AboutCommand
+from strictdoc.commands.cache_command import CacheCommand
 from strictdoc.commands.diff_command import DiffCommand
 from strictdoc.commands.dump_grammar_command import DumpGrammarCommand
 from strictdoc.commands.manage_autouid_command import ManageAutoUIDCommand
@@ -41,6 +43,12 @@ from strictdoc.helpers.exception import (
 )
 from strictdoc.helpers.parallelizer import Parallelizer
 from strictdoc.helpers.timing import measure_performance
+from strictdoc.helpers.tracing import (
+    TraceCategory,
+    Tracer,
+    create_trace_report,
+    trace_span,
+)
 from strictdoc.server.server import run_strictdoc_server
 
 
@@ -139,6 +147,23 @@ def _main(parallelizer: Parallelizer, parser: SDocArgsParser) -> None:
             project_config=project_config, parallelizer=parallelizer
         )
 
+    elif parser.is_cache_command:
+        cache_config: CacheCommandConfig = parser.get_cache_config()
+        try:
+            cache_config.validate()
+        except CLIValidationError as exception_:
+            raise exception_
+
+        project_config = ProjectConfigLoader.load_from_path_or_get_default(
+            path_to_config=cache_config.get_path_to_config(),
+            environment=environment,
+        )
+        project_config.integrate_cache_config(cache_config)
+
+        CacheCommand.execute(
+            project_config=project_config, cache_config=cache_config
+        )
+
     elif parser.is_dump_grammar_command:
         dump_config: DumpGrammarCommandConfig = parser.get_dump_grammar_config()
         DumpGrammarCommand.execute(dump_config)
@@ -203,16 +228,34 @@ def main() -> None:
     if parser.is_debug_mode():
         environment.is_debug_mode = True
 
+    # The tracing must be enabled before the worker processes are started.
+    tracer: Optional[Tracer] = None
+    trace_output: Optional[str] = parser.get_trace_output()
+    if trace_output is not None:
+        tracer = Tracer.enable()
+
     parallelizer = Parallelizer.create(enable_parallelization)
 
     exception_info: Optional[ExceptionInfo] = None
     try:
-        _main(parallelizer, parser)
+        with trace_span("Total execution time", TraceCategory.PHASE):
+            _main(parallelizer, parser)
     except StrictDocChildProcessException as exception_info_:
         exception_info = exception_info_.exception_info
     except Exception as exception_:
         exception_info = ExceptionInfo(exception_)
     finally:
+        # The worker processes of the context pools wake up the manager
+        # thread of the shared pool when they exit. If the shared pool is
+        # left to the interpreter exit, that thread can close its wakeup
+        # pipe while the exit handler writes to it.
+        parallelizer.shutdown()
+        if tracer is not None:
+            assert trace_output is not None
+            trace_events = tracer.write_chrome_trace(trace_output)
+            Tracer.disable()
+            print(create_trace_report(trace_events), flush=True)  # noqa: T201
+            print(f"Trace written to: {trace_output}", flush=True)  # noqa: T201
         if exception_info is not None:
             if parser.is_debug_mode():
                 print(exception_info.get_stack_trace(), flush=True)  # noqa: T201
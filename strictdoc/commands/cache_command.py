@@ -0,0 +1,50 @@
+from strictdoc.cli.cli_arg_parser import CacheCommandConfig
+from strictdoc.core.cache_store import CacheStore
+from strictdoc.core.project_config import ProjectConfig
+
+
+class CacheCommand:
+    @staticmethod
+    def execute(
+        project_config: ProjectConfig, cache_config: CacheCommandConfig
+    ) -> None:
+        cache_store = CacheStore.get_instance(project_config)
+
+        if cache_config.subcommand == "stats":
+            print(f"Cache: {cache_store.path_to_db}")  # noqa: T201
+            total_items = 0
+            for bucket_stats_ in cache_store.get_stats():
+                print(  # noqa: T201
+                    f"{bucket_stats_.bucket:<16}"
+                    f"{bucket_stats_.items:>10} items"
+                    f"{CacheCommand._format_size(bucket_stats_.size):>14}"
+                )
+                total_items += bucket_stats_.items
+            print(  # noqa: T201
+                f"{'Total':<16}{total_items:>10} items"
+                f"{CacheCommand._format_size(cache_store.get_total_size()):>14}"
+            )
+            print(  # noqa: T201
+                f"Size limit: {CacheCommand._format_size(cache_store.max_size)}"
+            )
+
+        elif cache_config.subcommand == "prune":
+            max_size = (
+                cache_config.max_size_mb * 1024 * 1024
+                if cache_config.max_size_mb is not None
+                else cache_store.max_size
+            )
+            evicted_items, evicted_size = cache_store.prune(max_size)
+            print(  # noqa: T201
+                f"Evicted {evicted_items} items "
+                f"({CacheCommand._format_size(evicted_size)}), "
+                f"remaining: "
+                f"{CacheCommand._format_size(cache_store.get_total_size())}."
+            )
+
+        else:
+            raise NotImplementedError(cache_config.subcommand)
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        return f"{size / (1024 * 1024):.2f} MB"
@@ -0,0 +1,230 @@
+"""
+A single-file store for all small cached artifacts.
+
+Before the store existed, every cached item (a parsed SDoc document, a
+rendered RST fragment, a compiled Jinja template, etc.) was written to its own
+file and nothing was ever removed. On large projects and CI machines with a
+persistent cache, this resulted in hundreds of thousands of tiny files.
+
+The store keeps all items in a single SQLite database. Each item is identified
+by a bucket (the kind of content) and a key. An optional version, e.g., the
+checksum of the input file, makes an outdated item be replaced instead of
+accumulating next to the new one. When the total size of the stored items
+exceeds the configured limit, the least recently used items are evicted.
+
+SQLite connections must not be shared between processes and threads, so
+every process, including the worker processes of the parallelizer, and every
+thread, such as the request threads of the server, opens its own connection.
+
+@relation(SDOC-SRS-95, scope=file)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from strictdoc.core.project_config import ProjectConfig
+
+
+class CacheBucketStats(NamedTuple):
+    bucket: str
+    items: int
+    size: int
+
+
+class CacheStore:
+    FILE_NAME = "cache.sqlite3"
+
+    # Updating the access time is a write, so it is done at most once per
+    # this period for a given item. This precision is enough for the LRU
+    # eviction.
+    ACCESS_TIME_RESOLUTION_SEC = 60
+
+    # When the size limit is exceeded, the store is pruned down to this
+    # fraction of the limit, so that the eviction does not run on every write.
+    PRUNE_TARGET_RATIO = 0.8
+
+    # The instances of the current thread, keyed by the process and the path
+    # to the store. The instances of a finished thread are released together
+    # with its thread-local data, which closes their connections. The process
+    # is a part of the key because a forked worker process inherits the
+    # thread-local data of the thread that forked it.
+    _thread_local: threading.local = threading.local()
+
+    def __init__(self, path_to_db: str, max_size: int) -> None:
+        assert max_size > 0, max_size
+        self.path_to_db: str = path_to_db
+        self.max_size: int = max_size
+
+        Path(os.path.dirname(path_to_db)).mkdir(parents=True, exist_ok=True)
+        # The connection works in autocommit mode: every write is a single
+        # statement and therefore atomic.
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            path_to_db, timeout=30, isolation_level=None
+        )
+        # auto_vacuum only takes effect if it is set before the table is
+        # created. It allows returning the space of evicted items to the OS.
+        self.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        try:
+            self.connection.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError:
+            # Another process is switching the journal mode right now. The
+            # database stays usable with the default journal mode.
+            pass
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                bucket TEXT NOT NULL,
+                key TEXT NOT NULL,
+                version TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access INTEGER NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (bucket, key)
+            )
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS items_last_access "
+            "ON items (last_access)"
+        )
+
+        # An estimate of the store size, only used to decide when the exact
+        # size has to be checked against the limit. Other processes write to
+        # the same store, so the estimate is never trusted for the eviction.
+        self.estimated_size: int = self.get_total_size()
+
+    @staticmethod
+    def get_instance(project_config: ProjectConfig) -> "CacheStore":
+        path_to_db = os.path.join(
+            project_config.get_path_to_cache_dir(), CacheStore.FILE_NAME
+        )
+        instances: Optional[Dict[Tuple[int, str], CacheStore]] = getattr(
+            CacheStore._thread_local, "instances", None
+        )
+        if instances is None:
+            instances = {}
+            CacheStore._thread_local.instances = instances
+        instance_key = (os.getpid(), path_to_db)
+        cache_store: Optional[CacheStore] = instances.get(instance_key)
+        if cache_store is None:
+            cache_store = CacheStore(
+                path_to_db, max_size=project_config.cache_max_size
+            )
+            instances[instance_key] = cache_store
+        return cache_store
+
+    def get(self, bucket: str, key: str, version: str = "") -> Optional[bytes]:
+        try:
+            row = self.connection.execute(
+                "SELECT value, last_access FROM items "
+                "WHERE bucket = ? AND key = ? AND version = ?",
+                (bucket, key, version),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # The store is busy for too long (e.g., locked by a concurrent
+            # prune). A cache miss only makes the caller recompute the item.
+            return None
+        if row is None:
+            return None
+        value, last_access = row
+
+        now = int(time.time())
+        if now - last_access >= self.ACCESS_TIME_RESOLUTION_SEC:
+            try:
+                self.connection.execute(
+                    "UPDATE items SET last_access = ? "
+                    "WHERE bucket = ? AND key = ?",
+                    (now, bucket, key),
+                )
+            except sqlite3.OperationalError:
+                # A lost access time update only makes the item a better
+                # candidate for eviction.
+                pass
+
+        assert isinstance(value, bytes)
+        return value
+
+    def put(
+        self, bucket: str, key: str, value: bytes, version: str = ""
+    ) -> None:
+        assert isinstance(value, bytes), value
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO items "
+                "(bucket, key, version, size, last_access, value) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (bucket, key, version, len(value), int(time.time()), value),
+            )
+        except sqlite3.OperationalError:
+            # The store is busy for too long (e.g., locked by a concurrent
+            # prune). Caching is only an optimization, so the item is not
+            # stored this time.
+            return
+
+        self.estimated_size += len(value)
+        if self.estimated_size > self.max_size:
+            try:
+                self.estimated_size = self.get_total_size()
+                if self.estimated_size > self.max_size:
+                    self.prune(int(self.max_size * self.PRUNE_TARGET_RATIO))
+            except sqlite3.OperationalError:
+                # Another process holds the lock, e.g., while pruning the
+                # store itself. The size is checked again on the next write.
+                pass
+
+    def prune(self, max_size: int) -> Tuple[int, int]:
+        """
+        Evict the least recently used items until the store fits max_size.
+
+        Returns the number and the total size of the evicted items.
+        """
+
+        assert max_size >= 0, max_size
+        total_size = self.get_total_size()
+
+        evicted_keys: List[Tuple[str, str]] = []
+        evicted_size = 0
+        if total_size > max_size:
+            for bucket_, key_, size_ in self.connection.execute(
+                "SELECT bucket, key, size FROM items ORDER BY last_access"
+            ):
+                evicted_keys.append((bucket_, key_))
+                evicted_size += size_
+                if total_size - evicted_size <= max_size:
+                    break
+
+        if len(evicted_keys) > 0:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.connection.executemany(
+                    "DELETE FROM items WHERE bucket = ? AND key = ?",
+                    evicted_keys,
+                )
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+            self.connection.execute("PRAGMA incremental_vacuum")
+
+        self.estimated_size = total_size - evicted_size
+        return len(evicted_keys), evicted_size
+
+    def get_total_size(self) -> int:
+        total_size = self.connection.execute(
+            "SELECT SUM(size) FROM items"
+        ).fetchone()[0]
+        return int(total_size) if total_size is not None else 0
+
+    def get_stats(self) -> List[CacheBucketStats]:
+        return [
+            CacheBucketStats(bucket_, items_, size_)
+            for bucket_, items_, size_ in self.connection.execute(
+                "SELECT bucket, COUNT(*), SUM(size) FROM items "
+                "GROUP BY bucket ORDER BY bucket"
+            )
+        ]
@@ -8,3 +8,13 @@ class GraphLinkType(IntEnum):
     NODE_TO_CHILD_NODES = 4
     NODE_TO_INCOMING_LINKS = 5
     DOCUMENT_TO_TAGS = 8
+
+
+class GraphStorage:
+    # The links are stored in dictionaries of OrderedSets.
+    DEFAULT = "default"
+    # The links are stored in integer arrays, see
+    # strictdoc/core/graph/compact_many_to_many_set.py.
+    COMPACT = "compact"
+
+    ALL = [DEFAULT, COMPACT]
@@ -0,0 +1,115 @@
+"""
+The reading of the documents and grammars of the document tree.
+
+All document formats are cached with PickleCache, keyed by the file path and
+versioned by the checksum of the file content. The generated documents, such
+as the ReqIF documents and the test and coverage reports, can be large files
+whose parsing and conversion to SDocDocument dominates the reading of the
+document tree, so a second run with unchanged files only unpickles them.
+
+@relation(SDOC-SRS-95, scope=file)
+"""
+
+import json
+from typing import Optional, Union
+
+from strictdoc.backend.reqif.reqif_reader import ReqIFReader
+from strictdoc.backend.sdoc.grammar_reader import SDocGrammarReader
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.backend.sdoc.models.document_grammar import DocumentGrammar
+from strictdoc.backend.sdoc.pickle_cache import PickleCache
+from strictdoc.backend.sdoc.reader import SDReader
+from strictdoc.backend.sdoc_source_code.coverage_reports.gcov import (
+    GCovJSONReader,
+)
+from strictdoc.backend.sdoc_source_code.test_reports.junit_xml_reader import (
+    JUnitXMLReader,
+)
+from strictdoc.backend.sdoc_source_code.test_reports.robot_xml_reader import (
+    RobotOutputXMLReader,
+)
+from strictdoc.core.file_tree import File
+from strictdoc.core.project_config import ProjectConfig
+from strictdoc.helpers.cast import assert_cast
+
+
+class DocumentCachingReader:
+    @staticmethod
+    def read_from_file(
+        doc_file: File, project_config: ProjectConfig
+    ) -> Union[SDocDocument, DocumentGrammar]:
+        doc_full_path = doc_file.full_path
+
+        # The SDoc and grammar readers cache their results themselves.
+        if doc_full_path.endswith(".sdoc"):
+            return SDReader().read_from_file(doc_full_path, project_config)
+        if doc_full_path.endswith(".sgra"):
+            return SDocGrammarReader().read_from_file(
+                doc_full_path, project_config
+            )
+
+        content_kind = DocumentCachingReader._get_content_kind(doc_full_path)
+        dependencies = DocumentCachingReader._get_dependencies(
+            content_kind, project_config
+        )
+        unpickled_content = PickleCache.read_from_cache(
+            doc_full_path, project_config, content_kind, dependencies
+        )
+        if unpickled_content is not None:
+            return assert_cast(unpickled_content, SDocDocument)
+
+        document: SDocDocument
+        if content_kind == "reqif":
+            reqif_documents = ReqIFReader().read_from_file(doc_full_path)
+            assert len(reqif_documents) >= 0
+            document = reqif_documents[0]
+        elif content_kind == "junit_xml":
+            document = JUnitXMLReader.read_from_file(doc_file, project_config)
+        elif content_kind == "gcov_json":
+            document = GCovJSONReader.read_from_file(doc_file, project_config)
+        elif content_kind == "robot_xml":
+            document = RobotOutputXMLReader.read_from_file(
+                doc_file, project_config
+            )
+        else:
+            raise NotImplementedError(content_kind)
+        assert isinstance(document, SDocDocument), document
+
+        PickleCache.save_to_cache(
+            document, doc_full_path, project_config, content_kind, dependencies
+        )
+        return document
+
+    @staticmethod
+    def _get_content_kind(doc_full_path: str) -> str:
+        if doc_full_path.endswith(".reqif"):
+            return "reqif"
+        if doc_full_path.endswith(".junit.xml"):
+            return "junit_xml"
+        if doc_full_path.endswith(".gcov.json"):
+            return "gcov_json"
+        if doc_full_path.endswith(".robot.xml"):
+            return "robot_xml"
+        raise NotImplementedError(doc_full_path)
+
+    @staticmethod
+    def _get_dependencies(
+        content_kind: str, project_config: ProjectConfig
+    ) -> Optional[str]:
+        """
+        Return the config options that a converted document depends on.
+
+        The paths of the LLVM LIT tests are resolved with the test report
+        roots of the config, so a JUnit report must be converted again when
+        these options change.
+        """
+
+        if content_kind == "junit_xml":
+            return json.dumps(
+                [
+                    project_config.source_root_path,
+                    project_config.test_report_root_dict,
+                ],
+                sort_keys=True,
+            )
+        return None
@@ -3,21 +3,10 @@ import sys
 from functools import partial
 from typing import Dict, List, Tuple, Union
 
-from strictdoc.backend.reqif.reqif_reader import ReqIFReader
-from strictdoc.backend.sdoc.grammar_reader import SDocGrammarReader
 from strictdoc.backend.sdoc.models.document import SDocDocument
 from strictdoc.backend.sdoc.models.document_grammar import DocumentGrammar
-from strictdoc.backend.sdoc.reader import SDReader
-from strictdoc.backend.sdoc_source_code.coverage_reports.gcov import (
-    GCovJSONReader,
-)
-from strictdoc.backend.sdoc_source_code.test_reports.junit_xml_reader import (
-    JUnitXMLReader,
-)
-from strictdoc.backend.sdoc_source_code.test_reports.robot_xml_reader import (
-    RobotOutputXMLReader,
-)
 from strictdoc.core.asset_manager import AssetManager
+from strictdoc.core.document_caching_reader import DocumentCachingReader
 from strictdoc.core.document_meta import DocumentMeta
 from strictdoc.core.document_tree import DocumentTree
 from strictdoc.core.file_tree import (
@@ -33,6 +22,7 @@ from strictdoc.helpers.parallelizer import Parallelizer
 from strictdoc.helpers.paths import SDocRelativePath
 from strictdoc.helpers.textx import drop_textx_meta
 from strictdoc.helpers.timing import measure_performance, timing_decorator
+from strictdoc.helpers.tracing import TraceCategory
 
 
 class DocumentFinder:
@@ -52,7 +42,7 @@ class DocumentFinder:
                 )
 
         with measure_performance("Completed finding SDoc and assets"):
-            file_tree, asset_manager = DocumentFinder._build_file_tree(
+            file_tree, asset_manager = DocumentFinder.build_file_tree(
                 project_config=project_config
             )
         with measure_performance("Completed building document tree"):
@@ -71,46 +61,12 @@ class DocumentFinder:
         doc_full_path = doc_file.full_path
 
         with measure_performance(
-            f"Reading SDOC: {os.path.basename(doc_full_path)}"
+            f"Reading SDOC: {os.path.basename(doc_full_path)}",
+            TraceCategory.DOCUMENT,
         ):
-            document_or_grammar: Union[SDocDocument, DocumentGrammar]
-            if doc_full_path.endswith(".sdoc"):
-                sdoc_reader: SDReader = SDReader()
-                document_or_grammar = sdoc_reader.read_from_file(
-                    doc_full_path, project_config
-                )
-                assert isinstance(document_or_grammar, SDocDocument)
-            elif doc_full_path.endswith(".sgra"):
-                sgra_reader = SDocGrammarReader()
-                document_or_grammar = sgra_reader.read_from_file(
-                    doc_full_path, project_config
-                )
-                assert isinstance(document_or_grammar, DocumentGrammar)
-            elif doc_full_path.endswith(".reqif"):
-                reqif_reader = ReqIFReader()
-                reqif_documents = reqif_reader.read_from_file(doc_full_path)
-                assert len(reqif_documents) >= 0
-                document_or_grammar = reqif_documents[0]
-                assert isinstance(document_or_grammar, SDocDocument)
-            elif doc_full_path.endswith(".junit.xml"):
-                junit_xml_reader = JUnitXMLReader()
-                document_or_grammar = junit_xml_reader.read_from_file(
-                    doc_file, project_config
-                )
-                assert isinstance(document_or_grammar, SDocDocument)
-            elif doc_full_path.endswith(".gcov.json"):
-                gcov_json_reader = GCovJSONReader()
-                document_or_grammar = gcov_json_reader.read_from_file(
-                    doc_file, project_config
-                )
-                assert isinstance(document_or_grammar, SDocDocument)
-            elif doc_full_path.endswith(".robot.xml"):
-                robot_reader = RobotOutputXMLReader()
-                document_or_grammar = robot_reader.read_from_file(
-                    doc_file, project_config
-                )
-            else:
-                raise NotImplementedError
+            document_or_grammar: Union[SDocDocument, DocumentGrammar] = (
+                DocumentCachingReader.read_from_file(doc_file, project_config)
+            )
         drop_textx_meta(document_or_grammar)
 
         return doc_file, file_tree_mount_folder, document_or_grammar
@@ -140,79 +96,86 @@ class DocumentFinder:
             project_config=project_config,
         )
 
-        with measure_performance("Completed parsing all documents"):
-            found_documents = parallelizer.run_parallel(
-                file_tree_list, process_document_binding
-            )
+        # The documents are parsed in chunks, so that the project config is
+        # not pickled for every document, and they are registered while the
+        # remaining documents are still being parsed.
+        found_documents = parallelizer.run_parallel_streaming(
+            file_tree_list, process_document_binding
+        )
 
-        doc_file: File
-        for doc_file, file_tree_mount_folder, document in found_documents:
-            assert isinstance(file_tree_mount_folder, str), (
-                file_tree_mount_folder
-            )
+        with measure_performance("Completed parsing all documents"):
+            doc_file: File
+            for doc_file, file_tree_mount_folder, document in found_documents:
+                assert isinstance(file_tree_mount_folder, str), (
+                    file_tree_mount_folder
+                )
 
-            if isinstance(document, DocumentGrammar):
-                map_grammars_by_filenames[doc_file.file_name] = document
-                continue
+                if isinstance(document, DocumentGrammar):
+                    map_grammars_by_filenames[doc_file.file_name] = document
+                    continue
 
-            input_doc_full_path: str = doc_file.full_path
-            map_docs_by_paths[input_doc_full_path] = document
-            document_list.append(document)
+                input_doc_full_path: str = doc_file.full_path
+                map_docs_by_paths[input_doc_full_path] = document
+                document_list.append(document)
 
-            doc_relative_path_folder: SDocRelativePath = SDocRelativePath(
-                os.path.dirname(doc_file.rel_path.relative_path)
-            )
-            output_document_dir_rel_path: SDocRelativePath = SDocRelativePath(
-                os.path.join(
-                    file_tree_mount_folder,
-                    doc_relative_path_folder.relative_path,
+                doc_relative_path_folder: SDocRelativePath = SDocRelativePath(
+                    os.path.dirname(doc_file.rel_path.relative_path)
+                )
+                output_document_dir_rel_path: SDocRelativePath = (
+                    SDocRelativePath(
+                        os.path.join(
+                            file_tree_mount_folder,
+                            doc_relative_path_folder.relative_path,
+                        )
+                        if len(doc_relative_path_folder.relative_path) > 0
+                        else file_tree_mount_folder
+                    )
                 )
-                if len(doc_relative_path_folder.relative_path) > 0
-                else file_tree_mount_folder
-            )
 
-            document_filename = doc_file.file_name
-            document_filename_base = os.path.splitext(document_filename)[0]
+                document_filename = doc_file.file_name
+                document_filename_base = os.path.splitext(document_filename)[0]
 
-            output_document_dir_full_path: str = os.path.join(
-                output_root_html, output_document_dir_rel_path.relative_path
-            )
+                output_document_dir_full_path: str = os.path.join(
+                    output_root_html, output_document_dir_rel_path.relative_path
+                )
 
-            input_doc_assets_dir_rel_path: SDocRelativePath = SDocRelativePath(
-                os.path.join(
-                    file_tree_mount_folder,
-                    doc_relative_path_folder.relative_path,
-                    "_assets",
+                input_doc_assets_dir_rel_path: SDocRelativePath = (
+                    SDocRelativePath(
+                        os.path.join(
+                            file_tree_mount_folder,
+                            doc_relative_path_folder.relative_path,
+                            "_assets",
+                        )
+                        if doc_relative_path_folder.length() > 0
+                        else "/".join((file_tree_mount_folder, "_assets"))
+                    )
                 )
-                if doc_relative_path_folder.length() > 0
-                else "/".join((file_tree_mount_folder, "_assets"))
-            )
 
-            document_meta = DocumentMeta(
-                doc_file.level,
-                file_tree_mount_folder,
-                document_filename,
-                document_filename_base,
-                input_doc_full_path,
-                doc_file.rel_path,
-                doc_relative_path_folder,
-                input_doc_assets_dir_rel_path,
-                output_document_dir_full_path,
-                output_document_dir_rel_path,
-            )
-            document.assign_meta(document_meta)
+                document_meta = DocumentMeta(
+                    doc_file.level,
+                    file_tree_mount_folder,
+                    document_filename,
+                    document_filename_base,
+                    input_doc_full_path,
+                    doc_file.rel_path,
+                    doc_relative_path_folder,
+                    input_doc_assets_dir_rel_path,
+                    output_document_dir_full_path,
+                    output_document_dir_rel_path,
+                )
+                document.assign_meta(document_meta)
 
-            output_document_rel_path: SDocRelativePath = SDocRelativePath(
-                os.path.join(
-                    output_document_dir_rel_path.relative_path,
-                    f"{document_filename_base}.html",
+                output_document_rel_path: SDocRelativePath = SDocRelativePath(
+                    os.path.join(
+                        output_document_dir_rel_path.relative_path,
+                        f"{document_filename_base}.html",
+                    )
                 )
-            )
 
-            map_docs_by_paths[input_doc_full_path] = document
-            map_docs_by_rel_paths[output_document_rel_path.relative_path] = (
-                document
-            )
+                map_docs_by_paths[input_doc_full_path] = document
+                map_docs_by_rel_paths[
+                    output_document_rel_path.relative_path
+                ] = document
 
         return DocumentTree(
             file_trees,
@@ -223,7 +186,7 @@ class DocumentFinder:
         )
 
     @staticmethod
-    def _build_file_tree(
+    def build_file_tree(
         project_config: ProjectConfig,
     ) -> Tuple[List[FileTree], AssetManager]:
         assert isinstance(project_config.input_paths, list)
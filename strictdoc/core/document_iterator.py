@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from typing import Iterator, Tuple, Union
 
 from strictdoc.backend.sdoc.models.document import SDocDocument
@@ -18,11 +17,18 @@ from strictdoc.backend.sdoc.models.section import SDocSection
 from strictdoc.helpers.cast import assert_cast
 
 
-@dataclass
 class DocumentIterationContext:
-    node: SDocElementIF
-    level_stack: Tuple[int, ...]
-    custom_level: bool = False
+    __slots__ = ("node", "level_stack", "custom_level")
+
+    def __init__(
+        self,
+        node: SDocElementIF,
+        level_stack: Tuple[int, ...],
+        custom_level: bool = False,
+    ) -> None:
+        self.node: SDocElementIF = node
+        self.level_stack: Tuple[int, ...] = level_stack
+        self.custom_level: bool = custom_level
 
     def get_level(self) -> int:
         return len(self.level_stack)
@@ -64,3 +64,10 @@ class AbstractBucket(ABC):
         lhs_node: Any,
     ) -> None:
         raise NotImplementedError
+
+    def compact(self) -> None:
+        """
+        Called when the graph is completely built. The buckets that support a
+        more compact storage of the links can switch to it.
+        """
+        return
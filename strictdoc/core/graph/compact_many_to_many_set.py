@@ -0,0 +1,282 @@
+"""
+A many-to-many bucket that stores the links as integer IDs in compact arrays.
+
+ManyToManySet keeps a dictionary of OrderedSets for every node and every edge
+in both directions, which costs several hundred bytes per linked node. This
+bucket maps the nodes and the edges to dense integer IDs and stores the links
+of all nodes in the CSR (compressed sparse row) layout: the links of the node
+with the ID N are the entries offsets[N]...offsets[N + 1] of two integer
+arrays with the linked node IDs and the edge IDs.
+
+The arrays are only built by compact(). The links that are created before
+compact() or edited afterwards, e.g., by the server, are kept in an overlay
+of per-node lists that takes precedence over the arrays. All lookups and
+deletions only visit the links of the nodes involved.
+"""
+
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from strictdoc.core.graph.abstract_bucket import ALL_EDGES, AbstractBucket
+from strictdoc.helpers.ordered_set import OrderedSet
+
+# A link of a node: the ID of the linked node and the ID of the edge.
+Link = Tuple[int, int]
+
+
+class LinkTable:
+    __slots__ = ("offsets", "node_ids", "edge_ids", "overlay")
+
+    def __init__(self) -> None:
+        self.offsets: array[int] = array("i", [0])
+        self.node_ids: array[int] = array("i")
+        self.edge_ids: array[int] = array("i")
+        self.overlay: Dict[int, List[Link]] = {}
+
+    def get_links(self, node_id: int) -> Iterable[Link]:
+        links = self.overlay.get(node_id)
+        if links is not None:
+            return links
+        if node_id + 1 >= len(self.offsets):
+            return ()
+        start, end = self.offsets[node_id], self.offsets[node_id + 1]
+        return zip(self.node_ids[start:end], self.edge_ids[start:end])
+
+    def get_links_for_update(self, node_id: int) -> List[Link]:
+        links = self.overlay.get(node_id)
+        if links is None:
+            links = list(self.get_links(node_id))
+            self.overlay[node_id] = links
+        return links
+
+    def add_link(self, node_id: int, link: Link) -> None:
+        links = self.get_links_for_update(node_id)
+        assert link not in links, link
+
+        # Like in ManyToManySet, the links are grouped by edge in the order
+        # in which the edges are first used.
+        edge_id = link[1]
+        position = len(links)
+        for link_position_, (_, edge_id_) in enumerate(links):
+            if edge_id_ == edge_id:
+                position = link_position_ + 1
+        links.insert(position, link)
+
+    def compact(self, number_of_nodes: int) -> None:
+        offsets: array[int] = array("i", [0])
+        node_ids: array[int] = array("i")
+        edge_ids: array[int] = array("i")
+        for node_id_ in range(number_of_nodes):
+            for linked_node_id_, edge_id_ in self.get_links(node_id_):
+                node_ids.append(linked_node_id_)
+                edge_ids.append(edge_id_)
+            offsets.append(len(node_ids))
+        self.offsets = offsets
+        self.node_ids = node_ids
+        self.edge_ids = edge_ids
+        self.overlay = {}
+
+
+class CompactManyToManySet(AbstractBucket):
+    def __init__(self, lhs_type: Type[Any], rhs_type: Type[Any]) -> None:
+        self._node_ids: Dict[Any, int] = {}
+        self._nodes: List[Any] = []
+        self._edge_ids: Dict[Optional[str], int] = {}
+        self._edges: List[Optional[str]] = []
+        self._links: LinkTable = LinkTable()
+        self._links_reverse: LinkTable = LinkTable()
+        self._lhs_type: type = lhs_type
+        self._rhs_type: type = rhs_type
+
+    def has_link(self, *, lhs_node: Any) -> bool:
+        assert isinstance(lhs_node, self._lhs_type), lhs_node
+        lhs_node_id = self._node_ids.get(lhs_node)
+        if lhs_node_id is None:
+            return False
+        for _ in self._links.get_links(lhs_node_id):
+            return True
+        return False
+
+    def get_count(self, edge: Optional[str] = None) -> int:
+        edge_id = self._edge_ids.get(edge) if edge != ALL_EDGES else None
+        if edge != ALL_EDGES and edge_id is None:
+            return 0
+        total_count = 0
+        for node_id_ in range(len(self._nodes)):
+            for _, edge_id_ in self._links.get_links(node_id_):
+                if edge_id is None or edge_id_ == edge_id:
+                    total_count += 1
+        return total_count
+
+    def get_link_value(
+        self, *, lhs_node: Any, edge: Optional[str] = None
+    ) -> Any:
+        raise NotImplementedError
+
+    def get_link_value_weak(self, *, lhs_node: Any) -> Any:
+        raise NotImplementedError
+
+    def get_link_values(
+        self, *, lhs_node: Any, edge: Optional[str] = ALL_EDGES
+    ) -> OrderedSet[Any]:
+        assert isinstance(lhs_node, self._lhs_type), lhs_node
+        return self._get_linked_nodes(self._links, lhs_node, edge)
+
+    def get_link_values_with_edges(
+        self, *, lhs_node: Any, edge: Optional[str] = ALL_EDGES
+    ) -> List[Tuple[Any, Optional[str]]]:
+        assert isinstance(lhs_node, self._lhs_type), lhs_node
+        lhs_node_id = self._node_ids.get(lhs_node)
+        if lhs_node_id is None:
+            return []
+        nodes, edges = self._nodes, self._edges
+        return [
+            (nodes[node_id_], edges[edge_id_])
+            for node_id_, edge_id_ in self._links.get_links(lhs_node_id)
+            if edge in (ALL_EDGES, edges[edge_id_])
+        ]
+
+    def get_link_values_reverse(
+        self, *, rhs_node: Any, edge: Optional[str] = ALL_EDGES
+    ) -> OrderedSet[Any]:
+        assert isinstance(rhs_node, self._rhs_type), rhs_node
+        return self._get_linked_nodes(self._links_reverse, rhs_node, edge)
+
+    def create_link(
+        self, *, lhs_node: Any, rhs_node: Any, edge: Optional[str] = None
+    ) -> None:
+        assert edge != ALL_EDGES
+        if not isinstance(lhs_node, self._lhs_type):
+            raise TypeError(
+                f"LHS type mismatch: {type(lhs_node)} is not of {self._lhs_type}"
+            )
+        if not isinstance(rhs_node, self._rhs_type):
+            raise TypeError(
+                f"RHS type mismatch: {type(rhs_node)} is not of {self._rhs_type}"
+            )
+        assert lhs_node != rhs_node, (lhs_node, rhs_node)
+
+        lhs_node_id = self._get_or_create_node_id(lhs_node)
+        rhs_node_id = self._get_or_create_node_id(rhs_node)
+        edge_id = self._edge_ids.get(edge)
+        if edge_id is None:
+            edge_id = len(self._edges)
+            self._edge_ids[edge] = edge_id
+            self._edges.append(edge)
+
+        self._links.add_link(lhs_node_id, (rhs_node_id, edge_id))
+        self._links_reverse.add_link(rhs_node_id, (lhs_node_id, edge_id))
+
+    def delete_link(
+        self,
+        *,
+        lhs_node: Any,
+        rhs_node: Any,
+        edge: Optional[str] = ALL_EDGES,
+    ) -> None:
+        assert isinstance(lhs_node, self._lhs_type), lhs_node
+        assert isinstance(rhs_node, self._rhs_type), rhs_node
+
+        assert lhs_node in self._node_ids
+        assert rhs_node in self._node_ids
+        if edge != ALL_EDGES:
+            assert edge in self._edge_ids
+
+        self._delete_link(lhs_node, rhs_node, edge, weak=False)
+
+    def delete_link_weak(
+        self, *, lhs_node: Any, rhs_node: Any, edge: Optional[str] = ALL_EDGES
+    ) -> None:
+        assert isinstance(lhs_node, self._lhs_type), lhs_node
+        assert isinstance(rhs_node, self._rhs_type), rhs_node
+
+        if (
+            lhs_node in self._node_ids
+            and rhs_node in self._node_ids
+            and (edge == ALL_EDGES or edge in self._edge_ids)
+        ):
+            self._delete_link(lhs_node, rhs_node, edge, weak=True)
+
+    def delete_all_links(
+        self,
+        *,
+        lhs_node: Any,
+    ) -> None:
+        assert isinstance(lhs_node, self._lhs_type), lhs_node
+
+        assert lhs_node in self._node_ids
+
+        lhs_node_id = self._node_ids[lhs_node]
+        for rhs_node_id_, _ in self._links.get_links(lhs_node_id):
+            rhs_node_links = self._links_reverse.get_links_for_update(
+                rhs_node_id_
+            )
+            rhs_node_links[:] = [
+                link_ for link_ in rhs_node_links if link_[0] != lhs_node_id
+            ]
+        self._links.overlay[lhs_node_id] = []
+
+    def compact(self) -> None:
+        self._links.compact(len(self._nodes))
+        self._links_reverse.compact(len(self._nodes))
+
+    def _get_or_create_node_id(self, node: Any) -> int:
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._node_ids[node] = node_id
+            self._nodes.append(node)
+        return node_id
+
+    def _get_linked_nodes(
+        self, link_table: LinkTable, node: Any, edge: Optional[str]
+    ) -> OrderedSet[Any]:
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return OrderedSet()
+        nodes = self._nodes
+        if edge == ALL_EDGES:
+            return OrderedSet(
+                [
+                    nodes[node_id_]
+                    for node_id_, _ in link_table.get_links(node_id)
+                ]
+            )
+        edge_id = self._edge_ids.get(edge)
+        return OrderedSet(
+            [
+                nodes[node_id_]
+                for node_id_, edge_id_ in link_table.get_links(node_id)
+                if edge_id_ == edge_id
+            ]
+        )
+
+    def _delete_link(
+        self, lhs_node: Any, rhs_node: Any, edge: Optional[str], weak: bool
+    ) -> None:
+        lhs_node_id = self._node_ids[lhs_node]
+        rhs_node_id = self._node_ids[rhs_node]
+        edge_id = self._edge_ids[edge] if edge != ALL_EDGES else None
+
+        for link_table_, node_id_, linked_node_id_ in (
+            (self._links, lhs_node_id, rhs_node_id),
+            (self._links_reverse, rhs_node_id, lhs_node_id),
+        ):
+            links = link_table_.get_links_for_update(node_id_)
+            if edge_id is None:
+                links[:] = [
+                    link_ for link_ in links if link_[0] != linked_node_id_
+                ]
+            elif weak:
+                if (linked_node_id_, edge_id) in links:
+                    links.remove((linked_node_id_, edge_id))
+            else:
+                links.remove((linked_node_id_, edge_id))
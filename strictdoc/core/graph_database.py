@@ -102,3 +102,7 @@ class GraphDatabase:
         lhs_node: Any,
     ) -> None:
         self._id_to_bucket[link_type].delete_all_links(lhs_node=lhs_node)
+
+    def compact(self) -> None:
+        for bucket_ in self._id_to_bucket.values():
+            bucket_.compact()
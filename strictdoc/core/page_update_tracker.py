@@ -0,0 +1,286 @@
+"""
+The tracking of the HTML pages that are outdated by the edits in the server.
+
+The server generates a page when it is opened and re-generates it when the
+page file is older than the last update of the content the page shows. An
+edit of a node only outdates the pages that show this node:
+
+- The DOCUMENT, TABLE, TRACE and PDF pages of the node's document, of the
+  documents that include the node's document, of the documents with the
+  node's parent and child nodes and of the documents with inline links to the
+  node or to its anchors.
+- The DEEP-TRACE pages of the same documents and of the documents with all
+  ancestor and descendant nodes of the node, because these pages show the
+  complete relation chains.
+- The project-level screens, such as the traceability matrix and the project
+  statistics, which show all nodes.
+
+The pages that depend on the document tree, such as the project index, are
+only outdated by TraceabilityIndex.update_last_updated().
+
+When the project files are changed outside the server, the server builds a
+new index and its tracker takes over the updates of the previous one, see
+update_files().
+
+@relation(SDOC-SRS-2, scope=file)
+"""
+
+import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
+
+from strictdoc.backend.sdoc.models.anchor import Anchor
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.backend.sdoc.models.model import SDocDocumentIF
+from strictdoc.backend.sdoc.models.node import SDocNode
+from strictdoc.backend.sdoc.models.section import SDocSection
+from strictdoc.helpers.cast import assert_cast
+
+if TYPE_CHECKING:
+    from strictdoc.core.traceability_index import TraceabilityIndex
+
+
+class PageUpdateTracker:
+    def __init__(self, traceability_index: "TraceabilityIndex") -> None:
+        self.traceability_index: TraceabilityIndex = traceability_index
+        self.project_last_updated: datetime.datetime = (
+            datetime.datetime.fromtimestamp(0)
+        )
+        self.documents_last_updated: Dict[
+            SDocDocumentIF, datetime.datetime
+        ] = {}
+        self.deep_traces_last_updated: Dict[
+            SDocDocumentIF, datetime.datetime
+        ] = {}
+
+    def update_node(self, node: Union[SDocNode, SDocSection]) -> None:
+        """
+        Mark the pages that show a node and the nodes nested in it as outdated.
+
+        An edit can remove relations, so an edit action calls this method both
+        before and after changing a node.
+        """
+
+        documents: Set[SDocDocumentIF] = set()
+        deep_trace_documents: Set[SDocDocumentIF] = set()
+        self._collect_documents(node, documents, deep_trace_documents)
+
+        now = datetime.datetime.today()
+        self.project_last_updated = now
+        for document_ in documents:
+            self.documents_last_updated[document_] = now
+        for document_ in documents | deep_trace_documents:
+            self.deep_traces_last_updated[document_] = now
+
+    def update_files(
+        self,
+        previous_traceability_index: "TraceabilityIndex",
+        changed_files: List[str],
+    ) -> Optional[Set[SDocDocumentIF]]:
+        """
+        Take over the page updates of the index that is replaced by this index
+        after the project files were changed outside the server.
+
+        Only the pages that depend on the changed files are outdated: the
+        pages that show the nodes of the changed documents, both before and
+        after the change, and the pages of the documents that trace to the
+        changed source files. When a document is added, removed or renamed or
+        when another file, such as a grammar, is changed, all pages are
+        outdated.
+
+        Return the documents with outdated pages or None if all pages are
+        outdated.
+        """
+
+        traceability_index = self.traceability_index
+        documents_by_paths = self._get_documents_by_paths(traceability_index)
+        previous_documents_by_paths = self._get_documents_by_paths(
+            previous_traceability_index
+        )
+        source_file_paths: Set[str] = set()
+        for traceability_index_ in (
+            traceability_index,
+            previous_traceability_index,
+        ):
+            if (
+                source_tree_ := traceability_index_.document_tree.source_tree
+            ) is not None:
+                source_file_paths.update(
+                    source_file_.full_path
+                    for source_file_ in source_tree_.source_files
+                )
+        if {
+            path_: document_.title
+            for path_, document_ in documents_by_paths.items()
+        } != {
+            path_: document_.title
+            for path_, document_ in previous_documents_by_paths.items()
+        } or any(
+            path_ not in documents_by_paths and path_ not in source_file_paths
+            for path_ in changed_files
+        ):
+            return None
+
+        # The pages that show the unchanged documents stay up to date.
+        previous_page_update_tracker = (
+            previous_traceability_index.page_update_tracker
+        )
+        traceability_index.index_last_updated = (
+            previous_traceability_index.index_last_updated
+        )
+        for documents_last_updated_, previous_documents_last_updated_ in (
+            (
+                self.documents_last_updated,
+                previous_page_update_tracker.documents_last_updated,
+            ),
+            (
+                self.deep_traces_last_updated,
+                previous_page_update_tracker.deep_traces_last_updated,
+            ),
+        ):
+            for (
+                document_,
+                last_updated_,
+            ) in previous_documents_last_updated_.items():
+                assert document_.meta is not None
+                documents_last_updated_[
+                    documents_by_paths[document_.meta.input_doc_full_path]
+                ] = last_updated_
+
+        # The old version of a changed document can have relations and links
+        # that the new version does not have anymore, so the pages that depend
+        # on the changed files are collected in both indexes.
+        documents: Set[SDocDocumentIF] = set()
+        deep_trace_documents: Set[SDocDocumentIF] = set()
+        for traceability_index_ in (
+            traceability_index,
+            previous_traceability_index,
+        ):
+            page_update_tracker_ = traceability_index_.page_update_tracker
+            documents_by_paths_ = self._get_documents_by_paths(
+                traceability_index_
+            )
+            documents_by_output_paths_ = {
+                document_.meta.output_document_full_path: document_
+                for document_ in documents_by_paths_.values()
+                if document_.meta is not None
+            }
+            dependencies_ = (
+                traceability_index_.file_dependency_manager.dependencies_now
+            )
+            for path_ in changed_files:
+                changed_document = documents_by_paths_.get(path_)
+                if changed_document is not None:
+                    self._add_document(changed_document, documents)
+                    for node_ in changed_document.section_contents:
+                        if isinstance(node_, (SDocNode, SDocSection)):
+                            page_update_tracker_._collect_documents(
+                                node_, documents, deep_trace_documents
+                            )
+                    continue
+                # The documents that trace to a source file depend on it.
+                for output_path_ in dependencies_.get(path_, ()):
+                    self._add_document(
+                        documents_by_output_paths_.get(output_path_), documents
+                    )
+
+        now = datetime.datetime.today()
+        self.project_last_updated = now
+        outdated_documents: Set[SDocDocumentIF] = set()
+        for document_ in documents | deep_trace_documents:
+            assert document_.meta is not None
+            outdated_document = documents_by_paths[
+                document_.meta.input_doc_full_path
+            ]
+            if document_ in documents:
+                self.documents_last_updated[outdated_document] = now
+            self.deep_traces_last_updated[outdated_document] = now
+            outdated_documents.add(outdated_document)
+        return outdated_documents
+
+    def get_project_last_updated(self) -> datetime.datetime:
+        return max(
+            self.traceability_index.index_last_updated,
+            self.project_last_updated,
+        )
+
+    def get_document_last_updated(
+        self, document: SDocDocument, deep_trace: bool
+    ) -> datetime.datetime:
+        documents_last_updated = (
+            self.deep_traces_last_updated
+            if deep_trace
+            else self.documents_last_updated
+        )
+        document_last_updated = documents_last_updated.get(document)
+        if document_last_updated is None:
+            return self.traceability_index.index_last_updated
+        return max(
+            self.traceability_index.index_last_updated, document_last_updated
+        )
+
+    def _collect_documents(
+        self,
+        node: Union[SDocNode, SDocSection],
+        documents: Set[SDocDocumentIF],
+        deep_trace_documents: Set[SDocDocumentIF],
+    ) -> None:
+        traceability_index = self.traceability_index
+
+        self._add_document(node.get_document(), documents)
+
+        nodes_with_incoming_links: List[
+            Union[SDocNode, SDocSection, Anchor]
+        ] = [node]
+        if isinstance(node, SDocNode):
+            nodes_with_incoming_links.extend(node.get_anchors())
+        for node_ in nodes_with_incoming_links:
+            for incoming_link_ in (
+                traceability_index.get_incoming_links(node_) or []
+            ):
+                link_node = incoming_link_.parent_node()
+                self._add_document(
+                    link_node
+                    if isinstance(link_node, SDocDocument)
+                    else link_node.get_document(),
+                    documents,
+                )
+
+        if isinstance(node, SDocNode):
+            # The direct parents and children are shown on all pages, the more
+            # distant ones only on the DEEP-TRACE pages.
+            for related_node_ in traceability_index.get_parent_requirements(
+                node
+            ) + traceability_index.get_children_requirements(node):
+                self._add_document(related_node_.get_document(), documents)
+            for related_node_ in traceability_index.get_ancestor_requirements(
+                node
+            ) + traceability_index.get_descendant_requirements(node):
+                self._add_document(
+                    related_node_.get_document(), deep_trace_documents
+                )
+
+        for subnode_ in node.section_contents:
+            if isinstance(subnode_, (SDocNode, SDocSection)):
+                self._collect_documents(
+                    subnode_, documents, deep_trace_documents
+                )
+
+    @staticmethod
+    def _get_documents_by_paths(
+        traceability_index: "TraceabilityIndex",
+    ) -> Dict[str, SDocDocument]:
+        documents_by_paths: Dict[str, SDocDocument] = {}
+        for document_ in traceability_index.document_tree.document_list:
+            assert document_.meta is not None
+            documents_by_paths[document_.meta.input_doc_full_path] = document_
+        return documents_by_paths
+
+    @staticmethod
+    def _add_document(
+        document: Optional[SDocDocumentIF], documents: Set[SDocDocumentIF]
+    ) -> None:
+        while document is not None and document not in documents:
+            documents.add(document)
+            document = assert_cast(
+                document, SDocDocument
+            ).get_including_document()
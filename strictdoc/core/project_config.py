@@ -10,11 +10,13 @@ import toml
 
 from strictdoc import __version__
 from strictdoc.backend.reqif.sdoc_reqif_fields import ReqIFProfile
-from strictdoc.backend.sdoc.constants import SDocMarkup
+from strictdoc.backend.sdoc.constants import SDocMarkup, SDocParser
 from strictdoc.cli.cli_arg_parser import (
+    CacheCommandConfig,
     ExportCommandConfig,
     ServerCommandConfig,
 )
+from strictdoc.core.constants import GraphStorage
 from strictdoc.core.environment import SDocRuntimeEnvironment
 from strictdoc.helpers.auto_described import auto_described
 from strictdoc.helpers.exception import StrictDocException
@@ -68,6 +70,7 @@ class ProjectConfig:
     DEFAULT_PROJECT_TITLE = "Untitled Project"
     DEFAULT_DIR_FOR_SDOC_ASSETS = "_static"
     DEFAULT_DIR_FOR_SDOC_CACHE = "output/_cache"
+    DEFAULT_CACHE_MAX_SIZE_MB = 512
 
     DEFAULT_FEATURES: List[str] = [
         ProjectFeature.TABLE_SCREEN,
@@ -87,6 +90,8 @@ class ProjectConfig:
         project_title: str,
         dir_for_sdoc_assets: str,
         dir_for_sdoc_cache: str,
+        cache_verify_file_content: bool,
+        cache_max_size_mb: int,
         project_features: List[str],
         server_host: str,
         server_port: int,
@@ -111,6 +116,8 @@ class ProjectConfig:
         config_last_update: Optional[datetime.datetime],
         chromedriver: Optional[str],
         section_behavior: Optional[str],
+        sdoc_parser: str,
+        graph_storage: str,
         statistics_generator: Optional[str],
         requirements_regex: Optional[List[str]],
     ) -> None:
@@ -144,6 +151,8 @@ class ProjectConfig:
         dir_for_sdoc_cache = os.path.join(dir_for_sdoc_cache, __version__)
 
         self.dir_for_sdoc_cache: str = dir_for_sdoc_cache
+        self.cache_verify_file_content: bool = cache_verify_file_content
+        self.cache_max_size: int = cache_max_size_mb * 1024 * 1024
 
         self.project_features: List[str] = project_features
         self.server_host: str = server_host
@@ -205,15 +214,17 @@ class ProjectConfig:
             config_last_update
         )
         self.is_running_on_server: bool = False
+        self.server_watch_files: bool = False
         self.view: Optional[str] = None
         self.chromedriver: Optional[str] = chromedriver
         self.section_behavior: Optional[str] = section_behavior
+        self.sdoc_parser: str = sdoc_parser
+        self.graph_storage: str = graph_storage
 
         self.statistics_generator: Optional[str] = statistics_generator
 
         self.requirements_regex: Optional[List[str]] = requirements_regex
 
-
     @staticmethod
     def default_config(environment: SDocRuntimeEnvironment) -> "ProjectConfig":
         assert isinstance(environment, SDocRuntimeEnvironment)
@@ -222,6 +233,8 @@ class ProjectConfig:
             project_title=ProjectConfig.DEFAULT_PROJECT_TITLE,
             dir_for_sdoc_assets=ProjectConfig.DEFAULT_DIR_FOR_SDOC_ASSETS,
             dir_for_sdoc_cache=ProjectConfig.DEFAULT_DIR_FOR_SDOC_CACHE,
+            cache_verify_file_content=False,
+            cache_max_size_mb=ProjectConfig.DEFAULT_CACHE_MAX_SIZE_MB,
             project_features=ProjectConfig.DEFAULT_FEATURES,
             server_host=ProjectConfig.DEFAULT_SERVER_HOST,
             server_port=ProjectConfig.DEFAULT_SERVER_PORT,
@@ -244,6 +257,8 @@ class ProjectConfig:
             config_last_update=None,
             chromedriver=None,
             section_behavior=ProjectConfig.DEFAULT_SECTION_BEHAVIOR,
+            sdoc_parser=SDocParser.TEXTX,
+            graph_storage=GraphStorage.DEFAULT,
             statistics_generator=None,
             requirements_regex=[],
         )
@@ -253,6 +268,7 @@ class ProjectConfig:
         self, server_config: ServerCommandConfig
     ) -> None:
         self.is_running_on_server = True
+        self.server_watch_files = server_config.watch
         if (server_host_ := server_config.host) is not None:
             self.server_host = server_host_
         if (server_port_ := server_config.port) is not None:
@@ -283,6 +299,17 @@ class ProjectConfig:
         self.generate_bundle_document = False
         self.export_included_documents = True
 
+    def integrate_cache_config(self, cache_config: CacheCommandConfig) -> None:
+        if (output_dir_ := cache_config.output_dir) is not None:
+            # Locate the same default cache folder that the export command
+            # uses for this output folder.
+            if self.dir_for_sdoc_cache.startswith(
+                ProjectConfig.DEFAULT_DIR_FOR_SDOC_CACHE
+            ):
+                self.dir_for_sdoc_cache = os.path.join(
+                    os.path.abspath(output_dir_), "_cache", __version__
+                )
+
     def integrate_export_config(
         self, export_config: ExportCommandConfig
     ) -> None:
@@ -330,6 +357,9 @@ class ProjectConfig:
 
         self.requirements_regex = export_config.requirements_regex
 
+        if export_config.sdoc_parser is not None:
+            self.sdoc_parser = export_config.sdoc_parser
+
         if (
             export_config.enable_mathjax
             and ProjectFeature.MATHJAX not in self.project_features
@@ -505,6 +535,8 @@ class ProjectConfigLoader:
         project_title = ProjectConfig.DEFAULT_PROJECT_TITLE
         dir_for_sdoc_assets = ProjectConfig.DEFAULT_DIR_FOR_SDOC_ASSETS
         dir_for_sdoc_cache = ProjectConfig.DEFAULT_DIR_FOR_SDOC_CACHE
+        cache_verify_file_content = False
+        cache_max_size_mb = ProjectConfig.DEFAULT_CACHE_MAX_SIZE_MB
         project_features = ProjectConfig.DEFAULT_FEATURES
         server_host = ProjectConfig.DEFAULT_SERVER_HOST
         server_port = ProjectConfig.DEFAULT_SERVER_PORT
@@ -530,6 +562,8 @@ class ProjectConfigLoader:
         chromedriver: Optional[str] = None
 
         section_behavior: str = ProjectConfig.DEFAULT_SECTION_BEHAVIOR
+        sdoc_parser: str = SDocParser.TEXTX
+        graph_storage: str = GraphStorage.DEFAULT
         statistics_generator: Optional[str] = None
 
         requirements_regex: List[str] = []
@@ -543,6 +577,30 @@ class ProjectConfigLoader:
             dir_for_sdoc_cache = project_content.get(
                 "cache_dir", dir_for_sdoc_cache
             )
+            cache_verify_file_content = project_content.get(
+                "cache_verify_file_content", cache_verify_file_content
+            )
+            if not isinstance(cache_verify_file_content, bool):
+                print(  # noqa: T201
+                    f"error: strictdoc.toml: 'cache_verify_file_content' "
+                    f"parameter must be a boolean: "
+                    f"'{cache_verify_file_content}'."
+                )
+                sys.exit(1)
+            cache_max_size_mb = project_content.get(
+                "cache_max_size_mb", cache_max_size_mb
+            )
+            if (
+                not isinstance(cache_max_size_mb, int)
+                or isinstance(cache_max_size_mb, bool)
+                or cache_max_size_mb <= 0
+            ):
+                print(  # noqa: T201
+                    f"error: strictdoc.toml: 'cache_max_size_mb' "
+                    f"parameter must be a positive integer: "
+                    f"'{cache_max_size_mb}'."
+                )
+                sys.exit(1)
 
             project_features = project_content.get("features", project_features)
             if not isinstance(project_features, list):
@@ -715,6 +773,22 @@ class ProjectConfigLoader:
             )
             assert section_behavior in ("[SECTION]", "[[SECTION]]")
 
+            sdoc_parser = project_content.get("sdoc_parser", sdoc_parser)
+            if sdoc_parser not in SDocParser.ALL:
+                print(  # noqa: T201
+                    f"error: strictdoc.toml: 'sdoc_parser' parameter must be "
+                    f"one of {', '.join(SDocParser.ALL)}: '{sdoc_parser}'."
+                )
+                sys.exit(1)
+
+            graph_storage = project_content.get("graph_storage", graph_storage)
+            if graph_storage not in GraphStorage.ALL:
+                print(  # noqa: T201
+                    f"error: strictdoc.toml: 'graph_storage' parameter must be "
+                    f"one of {', '.join(GraphStorage.ALL)}: '{graph_storage}'."
+                )
+                sys.exit(1)
+
             if "source_nodes" in project_content:
                 source_nodes_config = project_content["source_nodes"]
                 assert isinstance(source_nodes_config, list)
@@ -770,6 +844,8 @@ class ProjectConfigLoader:
             project_title=project_title,
             dir_for_sdoc_assets=dir_for_sdoc_assets,
             dir_for_sdoc_cache=dir_for_sdoc_cache,
+            cache_verify_file_content=cache_verify_file_content,
+            cache_max_size_mb=cache_max_size_mb,
             project_features=project_features,
             server_host=server_host,
             server_port=server_port,
@@ -792,6 +868,8 @@ class ProjectConfigLoader:
             config_last_update=config_last_update,
             chromedriver=chromedriver,
             section_behavior=section_behavior,
+            sdoc_parser=sdoc_parser,
+            graph_storage=graph_storage,
             statistics_generator=statistics_generator,
-            requirements_regex=requirements_regex
+            requirements_regex=requirements_regex,
         )
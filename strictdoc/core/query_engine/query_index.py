@@ -0,0 +1,298 @@
+"""
+Field-level inverted indexes for the query engine.
+
+Evaluating a query node by node means reading every field of every node on
+every search. The query index keeps the following lookup tables, so that
+QueryObject can answer most query expressions with set operations on node
+numbers:
+
+- The node numbers of each node type, of all nodes, sections and source files.
+- Per-field postings: the numbers of the nodes that have a given exact value
+  of a given field. These answer node["FIELD"] == "..." and its negation.
+- A text corpus per document: all field values of all nodes joined with a
+  separator, which answers node.contains() with a single substring search
+  per document. A term dictionary cannot answer node.contains() because the
+  expression matches any substring, not only whole words.
+- The sets of nodes that have parent and child relations.
+
+The index is updated incrementally: the server invalidates a document after
+each edit action and the document is re-indexed on the next search. The
+relation sets depend on all documents, so they are recalculated lazily after
+any change.
+
+@relation(SDOC-SRS-155, scope=file)
+"""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.backend.sdoc.models.document_grammar import DocumentGrammar
+from strictdoc.backend.sdoc.models.model import SDocExtendedElementIF
+from strictdoc.backend.sdoc.models.node import SDocNode
+from strictdoc.backend.sdoc.models.section import SDocSection
+from strictdoc.backend.sdoc_source_code.models.source_file_info import (
+    SourceFileTraceabilityInfo,
+)
+from strictdoc.helpers.cast import assert_cast
+
+if TYPE_CHECKING:
+    from strictdoc.core.traceability_index import TraceabilityIndex
+
+
+class DocumentQueryIndex:
+    # Separates the field values in the text corpus. The query grammar only
+    # allows alphanumeric strings in node.contains(), so a match never spans
+    # two fields or two nodes.
+    TEXT_SEPARATOR = "\0"
+
+    def __init__(self) -> None:
+        # All indexed node numbers of the document, in the document order.
+        self.node_ids: List[int] = []
+
+        # The (field name, field value) postings added by the document's nodes.
+        self.field_values: Set[Tuple[str, str]] = set()
+
+        # The text of all nodes, and the start offset of each node's text.
+        self.text: str = ""
+        self.text_offsets: List[int] = []
+        self.text_node_ids: List[int] = []
+
+    def lookup_text(self, string: str) -> Set[int]:
+        result: Set[int] = set()
+        position = self.text.find(string)
+        while position != -1:
+            text_idx = bisect_right(self.text_offsets, position) - 1
+            result.add(self.text_node_ids[text_idx])
+            # Each node matches only once, continue from the next node.
+            if text_idx + 1 == len(self.text_offsets):
+                break
+            position = self.text.find(string, self.text_offsets[text_idx + 1])
+        return result
+
+
+class QueryIndex:
+    def __init__(self, traceability_index: "TraceabilityIndex") -> None:
+        self.traceability_index: TraceabilityIndex = traceability_index
+
+        self._nodes: Dict[int, SDocExtendedElementIF] = {}
+        self._next_node_id: int = 0
+
+        self._documents: Dict[SDocDocument, DocumentQueryIndex] = {}
+        self._invalidated_documents: Set[SDocDocument] = set()
+        self._source_file_ids: Optional[List[int]] = None
+
+        self.all_ids: Set[int] = set()
+        # SDocNode objects, including the composite nodes.
+        self.node_ids: Set[int] = set()
+        # SDocNode objects, for which the field postings are available.
+        self.field_indexed_ids: Set[int] = set()
+        self.section_ids: Set[int] = set()
+        self.source_file_ids: Set[int] = set()
+        # "REQUIREMENT" -> {1, 2, 3, ...}
+        self.node_type_ids: Dict[str, Set[int]] = {}
+        # "STATUS" -> "Active" -> {1, 2, 3, ...}
+        self.field_postings: Dict[str, Dict[str, Set[int]]] = {}
+
+        self._has_parent_ids: Optional[Set[int]] = None
+        self._has_child_ids: Optional[Set[int]] = None
+
+    def invalidate_document(self, document: SDocDocument) -> None:
+        self._invalidated_documents.add(document)
+
+    def get_node(self, node_id: int) -> SDocExtendedElementIF:
+        return self._nodes[node_id]
+
+    def get_nodes(self, node_ids: Set[int]) -> List[SDocExtendedElementIF]:
+        """
+        Return the nodes in the order of the documents, then the source files.
+        """
+
+        assert self._source_file_ids is not None
+        result: List[SDocExtendedElementIF] = []
+        for document_ in self.traceability_index.document_tree.document_list:
+            for node_id_ in self._documents[document_].node_ids:
+                if node_id_ in node_ids:
+                    result.append(self._nodes[node_id_])
+        for node_id_ in self._source_file_ids:
+            if node_id_ in node_ids:
+                result.append(self._nodes[node_id_])
+        return result
+
+    def update(self) -> None:
+        """
+        Index the new and the invalidated documents.
+
+        Called before each search.
+        """
+
+        documents = self.traceability_index.document_tree.document_list
+        current_documents = set(documents)
+        for document_ in list(self._documents.keys()):
+            if (
+                document_ not in current_documents
+                or document_ in self._invalidated_documents
+            ):
+                self._remove_document(document_)
+        self._invalidated_documents.clear()
+
+        for document_ in documents:
+            if document_ not in self._documents:
+                self._add_document(document_)
+
+        if self._source_file_ids is None:
+            self._add_source_files()
+
+    def lookup_field_value(self, field_name: str, value: str) -> Set[int]:
+        field_values = self.field_postings.get(field_name)
+        if field_values is None:
+            return set()
+        return field_values.get(value, set())
+
+    def get_ids_with_field(self, field_name: str) -> Set[int]:
+        field_values = self.field_postings.get(field_name)
+        if field_values is None:
+            return set()
+        result: Set[int] = set()
+        for node_ids_ in field_values.values():
+            result.update(node_ids_)
+        return result
+
+    def lookup_text(self, string: str) -> Set[int]:
+        result: Set[int] = set()
+        for document_index_ in self._documents.values():
+            result.update(document_index_.lookup_text(string))
+        return result
+
+    def get_has_parent_ids(self) -> Set[int]:
+        if self._has_parent_ids is None:
+            self._has_parent_ids = {
+                node_id_
+                for node_id_ in self.node_ids
+                if self.traceability_index.has_parent_requirements(
+                    assert_cast(self._nodes[node_id_], SDocNode)
+                )
+            }
+        return self._has_parent_ids
+
+    def get_has_child_ids(self) -> Set[int]:
+        if self._has_child_ids is None:
+            self._has_child_ids = {
+                node_id_
+                for node_id_ in self.node_ids
+                if self.traceability_index.has_children_requirements(
+                    assert_cast(self._nodes[node_id_], SDocNode)
+                )
+            }
+        return self._has_child_ids
+
+    def _add_document(self, document: SDocDocument) -> None:
+        document_index = DocumentQueryIndex()
+        text_parts: List[str] = []
+        text_length = 0
+
+        document_iterator = self.traceability_index.get_document_iterator(
+            document
+        )
+        for node_, _ in document_iterator.all_content(print_fragments=False):
+            node_id = self._add_node(node_)
+            document_index.node_ids.append(node_id)
+
+            node_text_parts: List[str]
+            if isinstance(node_, SDocNode):
+                self.node_ids.add(node_id)
+                self.node_type_ids.setdefault(node_.node_type, set()).add(
+                    node_id
+                )
+                self._add_node_fields(document_index, node_id, node_)
+                node_text_parts = [
+                    field_.get_text_value()
+                    for field_ in node_.enumerate_fields()
+                ]
+            elif isinstance(node_, SDocSection):
+                self.section_ids.add(node_id)
+                node_text_parts = [node_.title]
+            else:
+                continue
+
+            node_text = "".join(
+                part_ + DocumentQueryIndex.TEXT_SEPARATOR
+                for part_ in node_text_parts
+            )
+            document_index.text_offsets.append(text_length)
+            document_index.text_node_ids.append(node_id)
+            text_parts.append(node_text)
+            text_length += len(node_text)
+
+        document_index.text = "".join(text_parts)
+        self._documents[document] = document_index
+        self._reset_relations()
+
+    def _add_node_fields(
+        self, document_index: DocumentQueryIndex, node_id: int, node: SDocNode
+    ) -> None:
+        document = node.get_document()
+        if not isinstance(document, SDocDocument):
+            return
+        document_grammar = document.grammar
+        if not isinstance(document_grammar, DocumentGrammar):
+            return
+        element = document_grammar.elements_by_type.get(node.node_type)
+        if element is None:
+            return
+        self.field_indexed_ids.add(node_id)
+        for grammar_field_ in element.fields:
+            field_value = node._get_cached_field(grammar_field_.title, False)
+            if field_value is None:
+                continue
+            self.field_postings.setdefault(grammar_field_.title, {}).setdefault(
+                field_value, set()
+            ).add(node_id)
+            document_index.field_values.add((grammar_field_.title, field_value))
+
+    def _add_source_files(self) -> None:
+        self._source_file_ids = []
+        source_tree = self.traceability_index.document_tree.source_tree
+        if source_tree is None:
+            return
+        file_traceability_index = (
+            self.traceability_index.get_file_traceability_index()
+        )
+        for source_file_ in source_tree.source_files:
+            source_file_info: SourceFileTraceabilityInfo = (
+                file_traceability_index.get_coverage_info(
+                    source_file_.in_doctree_source_file_rel_path_posix
+                )
+            )
+            node_id = self._add_node(source_file_info)
+            self.source_file_ids.add(node_id)
+            self._source_file_ids.append(node_id)
+
+    def _add_node(self, node: SDocExtendedElementIF) -> int:
+        node_id = self._next_node_id
+        self._next_node_id += 1
+        self._nodes[node_id] = node
+        self.all_ids.add(node_id)
+        return node_id
+
+    def _remove_document(self, document: SDocDocument) -> None:
+        document_index = self._documents.pop(document)
+        removed_ids = set(document_index.node_ids)
+        for node_id_ in removed_ids:
+            del self._nodes[node_id_]
+        self.all_ids -= removed_ids
+        self.node_ids -= removed_ids
+        self.field_indexed_ids -= removed_ids
+        self.section_ids -= removed_ids
+        for node_type_ids_ in self.node_type_ids.values():
+            node_type_ids_.difference_update(removed_ids)
+        for field_name_, field_value_ in document_index.field_values:
+            field_values = self.field_postings[field_name_]
+            field_values[field_value_] -= removed_ids
+            if len(field_values[field_value_]) == 0:
+                del field_values[field_value_]
+        self._reset_relations()
+
+    def _reset_relations(self) -> None:
+        self._has_parent_ids = None
+        self._has_child_ids = None
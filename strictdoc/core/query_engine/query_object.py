@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Union
 
 from strictdoc.backend.sdoc.models.document import SDocDocument
 from strictdoc.backend.sdoc.models.document_grammar import (
@@ -8,11 +8,15 @@ from strictdoc.backend.sdoc.models.grammar_element import GrammarElement
 from strictdoc.backend.sdoc.models.model import (
     SDocExtendedElementIF,
 )
-from strictdoc.backend.sdoc.models.node import SDocNode, SDocNodeField, SDocCompositeNode
+from strictdoc.backend.sdoc.models.node import (
+    SDocNode,
+    SDocNodeField,
+)
 from strictdoc.backend.sdoc.models.section import SDocSection
 from strictdoc.backend.sdoc_source_code.models.source_file_info import (
     SourceFileTraceabilityInfo,
 )
+from strictdoc.core.query_engine.query_index import QueryIndex
 from strictdoc.core.traceability_index import TraceabilityIndex
 from strictdoc.helpers.cast import assert_cast
 
@@ -150,156 +154,269 @@ class QueryNullObject:
         return True
 
 
-class QueryObject:
-    def __init__(
-        self, query: Query, traceability_index: TraceabilityIndex
-    ) -> None:
-        self.query: Query = query
-        self.traceability_index: TraceabilityIndex = traceability_index
+class CompiledExpression(NamedTuple):
+    evaluate: Callable[[SDocExtendedElementIF], bool]
+    # A relative estimate of how expensive the evaluation is for one node.
+    cost: int
+    # The expression raises an error for some nodes, for example
+    # node.has_parent_requirements for sections. Such an expression is never
+    # reordered because the expressions before it may be guarding it,
+    # for example node.is_requirement.
+    may_raise: bool
 
-    def evaluate(self, node: SDocExtendedElementIF) -> bool:
-        return self._evaluate(node, self.query.root_expression)
 
-    def _evaluate(self, node: SDocExtendedElementIF, expression: Any) -> bool:
-        if isinstance(expression, EqualExpression):
-            return self._evaluate_equal(node, expression)
-        if isinstance(expression, NotEqualExpression):
-            return self._evaluate_not_equal(node, expression)
+class QueryCompiler:
+    """
+    Compile query expressions to Python closures.
+
+    The compilation happens once per query, so that the evaluation of a node
+    does not dispatch on the expression classes and does not look up the
+    grammar fields again for every node. The subexpressions of and/or
+    expressions that cannot raise errors are reordered to evaluate the cheap
+    ones first.
+    """
+
+    def __init__(self, traceability_index: TraceabilityIndex) -> None:
+        self.traceability_index: TraceabilityIndex = traceability_index
+        self._compiled_expressions: Dict[Any, CompiledExpression] = {}
+        # GrammarElement -> {"UID", "TITLE", ...}
+        self._element_field_titles: Dict[GrammarElement, Set[str]] = {}
+
+    def compile(self, expression: Any) -> CompiledExpression:
+        compiled_expression = self._compiled_expressions.get(expression)
+        if compiled_expression is None:
+            compiled_expression = self._compile(expression)
+            self._compiled_expressions[expression] = compiled_expression
+        return compiled_expression
+
+    def _compile(self, expression: Any) -> CompiledExpression:
+        if isinstance(expression, (EqualExpression, NotEqualExpression)):
+            return self._compile_equal(expression)
         if isinstance(expression, NodeContainsExpression):
-            return self._evaluate_node_contains(node, expression)
+            return self._compile_node_contains(expression)
         if isinstance(expression, NodeContainsAnyFreeTextExpression):
-            return self._evaluate_node_contains_any_text(node)
+            return CompiledExpression(
+                self._evaluate_node_contains_any_text, cost=5, may_raise=True
+            )
         if isinstance(expression, NodeHasParentRequirementsExpression):
-            return self._evaluate_node_has_parent_requirements(node)
+            return CompiledExpression(
+                self._evaluate_node_has_parent_requirements,
+                cost=3,
+                may_raise=True,
+            )
         if isinstance(expression, NodeHasChildRequirementsExpression):
-            return self._evaluate_node_has_child_requirements(node)
+            return CompiledExpression(
+                self._evaluate_node_has_child_requirements,
+                cost=3,
+                may_raise=True,
+            )
         if isinstance(expression, NodeIsRequirementExpression):
-            return (
-                isinstance(node, SDocNode) and node.node_type == "REQUIREMENT"
+            return CompiledExpression(
+                lambda node_: (
+                    isinstance(node_, SDocNode)
+                    and node_.node_type == "REQUIREMENT"
+                ),
+                cost=1,
+                may_raise=False,
             )
         if isinstance(expression, NodeIsSectionExpression):
-            return (
-                isinstance(node, SDocNode) and node.node_type == "SECTION"
-            ) or isinstance(node, SDocSection)
+            return CompiledExpression(
+                lambda node_: (
+                    (
+                        isinstance(node_, SDocNode)
+                        and node_.node_type == "SECTION"
+                    )
+                    or isinstance(node_, SDocSection)
+                ),
+                cost=1,
+                may_raise=False,
+            )
         if isinstance(expression, NodeIsSourceFileExpression):
-            return isinstance(node, SourceFileTraceabilityInfo)
+            return CompiledExpression(
+                lambda node_: isinstance(node_, SourceFileTraceabilityInfo),
+                cost=1,
+                may_raise=False,
+            )
         if isinstance(
             expression, NodeIsSourceFileWithCompleteCoverageExpression
         ):
-            return (
-                isinstance(node, SourceFileTraceabilityInfo)
-                and node.get_coverage() == 100
+            return CompiledExpression(
+                lambda node_: (
+                    isinstance(node_, SourceFileTraceabilityInfo)
+                    and node_.get_coverage() == 100
+                ),
+                cost=1,
+                may_raise=False,
             )
         if isinstance(
             expression, NodeIsSourceFileWithPartialCoverageExpression
         ):
-            return isinstance(node, SourceFileTraceabilityInfo) and (
-                0 < node.get_coverage() < 100
+            return CompiledExpression(
+                lambda node_: (
+                    isinstance(node_, SourceFileTraceabilityInfo)
+                    and (0 < node_.get_coverage() < 100)
+                ),
+                cost=1,
+                may_raise=False,
             )
         if isinstance(expression, NodeIsSourceFileWithNoCoverageExpression):
-            return (
-                isinstance(node, SourceFileTraceabilityInfo)
-                and node.get_coverage() == 0
+            return CompiledExpression(
+                lambda node_: (
+                    isinstance(node_, SourceFileTraceabilityInfo)
+                    and node_.get_coverage() == 0
+                ),
+                cost=1,
+                may_raise=False,
             )
         if isinstance(expression, NodeIsRootExpression):
-            if isinstance(node, SDocNode):
-                return node.is_root
-            raise RuntimeError(
-                "The node.is_root expression can be only called on nodes."
+            return CompiledExpression(
+                self._evaluate_node_is_root, cost=1, may_raise=True
             )
         if isinstance(expression, NotExpression):
-            return not self._evaluate(node, expression.expression)
+            compiled_expression = self.compile(expression.expression)
+            evaluate_expression = compiled_expression.evaluate
+            return compiled_expression._replace(
+                evaluate=lambda node_: not evaluate_expression(node_)
+            )
+        if isinstance(expression, (AndExpression, OrExpression)):
+            return self._compile_and_or(expression)
+        if isinstance(expression, (InExpression, NotInExpression)):
+            return self._compile_in(expression)
+        raise AssertionError(expression)
+
+    def _compile_and_or(
+        self, expression: Union[AndExpression, OrExpression]
+    ) -> CompiledExpression:
+        compiled_expressions: List[CompiledExpression] = []
+        # Sort each run of the subexpressions that do not raise errors by
+        # their cost. The subexpressions that may raise errors stay where
+        # they are.
+        safe_run: List[CompiledExpression] = []
+        for sub_expression_ in expression.expressions:
+            compiled_sub_expression = self.compile(sub_expression_)
+            if compiled_sub_expression.may_raise:
+                compiled_expressions.extend(
+                    sorted(safe_run, key=lambda c_: c_.cost)
+                )
+                compiled_expressions.append(compiled_sub_expression)
+                safe_run = []
+            else:
+                safe_run.append(compiled_sub_expression)
+        compiled_expressions.extend(sorted(safe_run, key=lambda c_: c_.cost))
+
+        evaluates = tuple(c_.evaluate for c_ in compiled_expressions)
+        evaluate: Callable[[SDocExtendedElementIF], bool]
         if isinstance(expression, AndExpression):
-            for sub_expression_ in expression.expressions:
-                if not self._evaluate(node, sub_expression_):
-                    return False
-            return True
-        if isinstance(expression, OrExpression):
-            for sub_expression_ in expression.expressions:
-                if self._evaluate(node, sub_expression_):
-                    return True
-            return False
-        if isinstance(expression, InExpression):
-            if (
-                rhs_value := self._evaluate_value(node, expression.rhs_expr)
-            ) is not None and (
-                lhs_value := self._evaluate_value(node, expression.lhs_expr)
-            ) is not None:
-                return lhs_value in rhs_value
-            return False
-        if isinstance(expression, NotInExpression):
-            if (
-                rhs_value := self._evaluate_value(node, expression.rhs_expr)
-            ) is not None and (
-                lhs_value := self._evaluate_value(node, expression.lhs_expr)
+
+            def evaluate(node: SDocExtendedElementIF) -> bool:
+                for evaluate_ in evaluates:
+                    if not evaluate_(node):
+                        return False
+                return True
+        else:
+
+            def evaluate(node: SDocExtendedElementIF) -> bool:
+                for evaluate_ in evaluates:
+                    if evaluate_(node):
+                        return True
+                return False
+
+        return CompiledExpression(
+            evaluate,
+            cost=sum(c_.cost for c_ in compiled_expressions),
+            may_raise=any(c_.may_raise for c_ in compiled_expressions),
+        )
+
+    def _compile_equal(
+        self, expression: Union[EqualExpression, NotEqualExpression]
+    ) -> CompiledExpression:
+        evaluate_lhs = self._compile_value(expression.lhs_expr)
+        evaluate_rhs = self._compile_value(expression.rhs_expr)
+        is_equal = isinstance(expression, EqualExpression)
+        may_raise = isinstance(
+            expression.lhs_expr, NodeFieldExpression
+        ) or isinstance(expression.rhs_expr, NodeFieldExpression)
+
+        if isinstance(expression.rhs_expr, (StringExpression, NoneExpression)):
+            # The most common case: node["FIELD"] == "Value".
+            rhs_value = evaluate_rhs(None)
+
+            def evaluate(node: SDocExtendedElementIF) -> bool:
+                return (evaluate_lhs(node) == rhs_value) == is_equal
+        else:
+
+            def evaluate(node: SDocExtendedElementIF) -> bool:
+                return (evaluate_lhs(node) == evaluate_rhs(node)) == is_equal
+
+        return CompiledExpression(evaluate, cost=2, may_raise=may_raise)
+
+    def _compile_in(
+        self, expression: Union[InExpression, NotInExpression]
+    ) -> CompiledExpression:
+        evaluate_lhs = self._compile_value(expression.lhs_expr)
+        evaluate_rhs = self._compile_value(expression.rhs_expr)
+        is_in = isinstance(expression, InExpression)
+
+        def evaluate(node: SDocExtendedElementIF) -> bool:
+            if (rhs_value := evaluate_rhs(node)) is not None and (
+                lhs_value := evaluate_lhs(node)
             ) is not None:
-                return lhs_value not in rhs_value
+                return (lhs_value in rhs_value) == is_in
             return False
-        assert 0, expression
-
-    def _evaluate_equal(
-        self, node: SDocExtendedElementIF, expression: EqualExpression
-    ) -> bool:
-        return self._evaluate_value(
-            node, expression.lhs_expr
-        ) == self._evaluate_value(node, expression.rhs_expr)
 
-    def _evaluate_not_equal(
-        self, node: SDocExtendedElementIF, expression: NotEqualExpression
-    ) -> bool:
-        return self._evaluate_value(
-            node, expression.lhs_expr
-        ) != self._evaluate_value(node, expression.rhs_expr)
+        return CompiledExpression(
+            evaluate,
+            cost=3,
+            may_raise=isinstance(expression.lhs_expr, NodeFieldExpression)
+            or isinstance(expression.rhs_expr, NodeFieldExpression),
+        )
 
-    def _evaluate_value(
-        self, node: SDocExtendedElementIF, expression: Any
-    ) -> Optional[str]:
+    def _compile_value(
+        self, expression: Any
+    ) -> Callable[[Optional[SDocExtendedElementIF]], Optional[str]]:
         if isinstance(expression, NodeFieldExpression):
-            return self._evaluate_node_field_expression(node, expression)
+            return self._compile_node_field_expression(expression)
         if isinstance(expression, StringExpression):
-            return expression.string
+            string = expression.string
+            return lambda _: string
         if isinstance(expression, NoneExpression):
-            return None
-        assert 0, expression
+            return lambda _: None
+        raise AssertionError(expression)
 
-    def _evaluate_node_field_expression(
-        self,
-        node: SDocExtendedElementIF,
-        expression: NodeFieldExpression,
-    ) -> Optional[str]:
+    def _compile_node_field_expression(
+        self, expression: NodeFieldExpression
+    ) -> Callable[[Optional[SDocExtendedElementIF]], Optional[str]]:
         field_name = expression.field_name
-        if (
-            isinstance(node, SDocNode)
-            or isinstance(node, SDocCompositeNode)
-            and node.is_requirement()
-            and node.node_type == "REQUIREMENT"
-        ):
-            requirement: SDocNode = assert_cast(node, SDocNode)
-            requirement_document: SDocDocument = assert_cast(
-                requirement.get_document(), SDocDocument
-            )
-            document_grammar: DocumentGrammar = assert_cast(
-                requirement_document.grammar, DocumentGrammar
-            )
-            element: GrammarElement = document_grammar.elements_by_type[
-                requirement.node_type
-            ]
-            grammar_field_titles = list(map(lambda f: f.title, element.fields))
-            if field_name not in grammar_field_titles:
-                return None
-            field_value = requirement._get_cached_field(field_name, False)
-            if field_value is not None:
-                return field_value
-            return None
-        elif isinstance(node, SDocSection) and node.is_section():
-            section: SDocSection = assert_cast(node, SDocSection)
-            if field_name == "UID":
-                return section.reserved_uid
-            elif field_name == "TITLE":
-                return section.title
-            raise AttributeError(f"No such section field: {field_name}.")
-        else:
-            raise NotImplementedError
+        element_field_titles = self._element_field_titles
+
+        def evaluate(node: Optional[SDocExtendedElementIF]) -> Optional[str]:
+            if isinstance(node, SDocNode):
+                requirement_document: SDocDocument = assert_cast(
+                    node.get_document(), SDocDocument
+                )
+                document_grammar: DocumentGrammar = assert_cast(
+                    requirement_document.grammar, DocumentGrammar
+                )
+                element: GrammarElement = document_grammar.elements_by_type[
+                    node.node_type
+                ]
+                field_titles = element_field_titles.get(element)
+                if field_titles is None:
+                    field_titles = {field_.title for field_ in element.fields}
+                    element_field_titles[element] = field_titles
+                if field_name not in field_titles:
+                    return None
+                return node._get_cached_field(field_name, False)
+            elif isinstance(node, SDocSection) and node.is_section():
+                if field_name == "UID":
+                    return node.reserved_uid
+                elif field_name == "TITLE":
+                    return node.title
+                raise AttributeError(f"No such section field: {field_name}.")
+            else:
+                raise NotImplementedError
+
+        return evaluate
 
     def _evaluate_node_has_parent_requirements(
         self, node: SDocExtendedElementIF
@@ -323,28 +440,27 @@ class QueryObject:
             )
         return self.traceability_index.has_children_requirements(node)
 
-    def _evaluate_node_contains(
-        self,
-        node: SDocExtendedElementIF,
+    @staticmethod
+    def _compile_node_contains(
         expression: NodeContainsExpression,
-    ) -> bool:
-        if isinstance(node, SDocNode):
-            requirement = assert_cast(node, SDocNode)
-            requirement_field_: SDocNodeField
-            for requirement_field_ in requirement.enumerate_fields():
-                if expression.string in requirement_field_.get_text_value():
-                    return True
-            return False
-        if isinstance(node, SDocSection):
-            section = assert_cast(node, SDocSection)
-            if expression.string in section.title:
-                return True
-            return False
-        raise NotImplementedError
+    ) -> CompiledExpression:
+        string = expression.string
 
-    def _evaluate_node_contains_any_text(
-        self, node: SDocExtendedElementIF
-    ) -> bool:
+        def evaluate(node: SDocExtendedElementIF) -> bool:
+            if isinstance(node, SDocNode):
+                requirement_field_: SDocNodeField
+                for requirement_field_ in node.enumerate_fields():
+                    if string in requirement_field_.get_text_value():
+                        return True
+                return False
+            if isinstance(node, SDocSection):
+                return string in node.title
+            raise NotImplementedError
+
+        return CompiledExpression(evaluate, cost=10, may_raise=True)
+
+    @staticmethod
+    def _evaluate_node_contains_any_text(node: SDocExtendedElementIF) -> bool:
         if not isinstance(node, SDocSection) and not (
             isinstance(node, SDocNode) and node.node_type == "SECTION"
         ):
@@ -354,3 +470,162 @@ class QueryObject:
                 f"the error, prepend your query with node.is_section."
             )
         return node.has_any_text_nodes()
+
+    @staticmethod
+    def _evaluate_node_is_root(node: SDocExtendedElementIF) -> bool:
+        if isinstance(node, SDocNode):
+            return node.is_root
+        raise RuntimeError(
+            "The node.is_root expression can be only called on nodes."
+        )
+
+
+class QueryObject:
+    def __init__(
+        self, query: Query, traceability_index: TraceabilityIndex
+    ) -> None:
+        self.query: Query = query
+        self.traceability_index: TraceabilityIndex = traceability_index
+        self._compiler: QueryCompiler = QueryCompiler(traceability_index)
+        self._evaluate_root: Callable[[SDocExtendedElementIF], bool] = (
+            self._compiler.compile(query.root_expression).evaluate
+        )
+
+    def evaluate(self, node: SDocExtendedElementIF) -> bool:
+        return self._evaluate_root(node)
+
+    def find_nodes(self) -> List[SDocExtendedElementIF]:
+        """
+        Find all nodes of all documents and all source files that match.
+
+        The result is the same as calling evaluate() on every node but the
+        expressions are answered with set operations on the query index
+        whenever possible. The and/or/not expressions narrow down the set of
+        candidate nodes for their subexpressions the same way the short-circuit
+        evaluation does, so a subexpression is never evaluated for a node for
+        which evaluate() would not evaluate it either.
+        """
+
+        query_index: QueryIndex = self.traceability_index.query_index
+        query_index.update()
+        node_ids = self._find(
+            query_index, self.query.root_expression, query_index.all_ids
+        )
+        return query_index.get_nodes(node_ids)
+
+    def _find(
+        self, query_index: QueryIndex, expression: Any, candidates: Set[int]
+    ) -> Set[int]:
+        if len(candidates) == 0:
+            return set()
+        if isinstance(expression, (EqualExpression, NotEqualExpression)):
+            return self._find_equal(query_index, expression, candidates)
+        if isinstance(expression, NodeContainsExpression):
+            indexed_candidates = candidates & (
+                query_index.node_ids | query_index.section_ids
+            )
+            return (
+                indexed_candidates & query_index.lookup_text(expression.string)
+            ) | self._find_by_evaluation(
+                query_index, expression, candidates - indexed_candidates
+            )
+        if isinstance(expression, NodeIsRequirementExpression):
+            return candidates & query_index.node_type_ids.get(
+                "REQUIREMENT", set()
+            )
+        if isinstance(expression, NodeIsSectionExpression):
+            return candidates & (
+                query_index.node_type_ids.get("SECTION", set())
+                | query_index.section_ids
+            )
+        if isinstance(expression, NodeIsSourceFileExpression):
+            return candidates & query_index.source_file_ids
+        if isinstance(
+            expression,
+            (
+                NodeIsSourceFileWithCompleteCoverageExpression,
+                NodeIsSourceFileWithPartialCoverageExpression,
+                NodeIsSourceFileWithNoCoverageExpression,
+            ),
+        ):
+            return self._find_by_evaluation(
+                query_index,
+                expression,
+                candidates & query_index.source_file_ids,
+            )
+        if isinstance(expression, NodeHasParentRequirementsExpression):
+            # Let evaluate() raise the error for the other node types.
+            self._find_by_evaluation(
+                query_index, expression, candidates - query_index.node_ids
+            )
+            return candidates & query_index.get_has_parent_ids()
+        if isinstance(expression, NodeHasChildRequirementsExpression):
+            self._find_by_evaluation(
+                query_index, expression, candidates - query_index.node_ids
+            )
+            return candidates & query_index.get_has_child_ids()
+        if isinstance(expression, NotExpression):
+            return candidates - self._find(
+                query_index, expression.expression, candidates
+            )
+        if isinstance(expression, AndExpression):
+            for sub_expression_ in expression.expressions:
+                candidates = self._find(
+                    query_index, sub_expression_, candidates
+                )
+            return candidates
+        if isinstance(expression, OrExpression):
+            result: Set[int] = set()
+            for sub_expression_ in expression.expressions:
+                matches = self._find(query_index, sub_expression_, candidates)
+                result |= matches
+                candidates = candidates - matches
+            return result
+        return self._find_by_evaluation(query_index, expression, candidates)
+
+    def _find_equal(
+        self,
+        query_index: QueryIndex,
+        expression: Union[EqualExpression, NotEqualExpression],
+        candidates: Set[int],
+    ) -> Set[int]:
+        if isinstance(expression.lhs_expr, NodeFieldExpression):
+            field_expression, value_expression = (
+                expression.lhs_expr,
+                expression.rhs_expr,
+            )
+        elif isinstance(expression.rhs_expr, NodeFieldExpression):
+            field_expression, value_expression = (
+                expression.rhs_expr,
+                expression.lhs_expr,
+            )
+        else:
+            return self._find_by_evaluation(query_index, expression, candidates)
+
+        matches: Set[int]
+        indexed_candidates = candidates & query_index.field_indexed_ids
+        if isinstance(value_expression, StringExpression):
+            matches = indexed_candidates & query_index.lookup_field_value(
+                field_expression.field_name, value_expression.string
+            )
+        elif isinstance(value_expression, NoneExpression):
+            matches = indexed_candidates - query_index.get_ids_with_field(
+                field_expression.field_name
+            )
+        else:
+            return self._find_by_evaluation(query_index, expression, candidates)
+        if isinstance(expression, NotEqualExpression):
+            matches = indexed_candidates - matches
+        return matches | self._find_by_evaluation(
+            query_index, expression, candidates - indexed_candidates
+        )
+
+    def _find_by_evaluation(
+        self, query_index: QueryIndex, expression: Any, candidates: Set[int]
+    ) -> Set[int]:
+        evaluate = self._compiler.compile(expression).evaluate
+        return {
+            node_id_
+            for node_id_ in sorted(candidates)
+            if evaluate(query_index.get_node(node_id_))
+        }
@@ -0,0 +1,246 @@
+"""
+The transitive closure of the parent and child relations between the nodes.
+
+The DEEP-TRACE pages show the complete chains of the parent and child
+relations of every node. Instead of walking these chains node by node for
+every question like "which documents does this node trace to", the index
+computes the sets of all ancestors and all descendants of every node once:
+
+- The nodes with relations are numbered in the document order.
+- The strongly connected components of the relation graph are found with
+  Tarjan's algorithm. A valid project has no relation cycles, but the index
+  does not rely on it.
+- Tarjan's algorithm completes a component only after all components it links
+  to, so the set of a component is the union of the sets of its linked
+  components. The sets are stored as bitsets (Python integers) over the node
+  numbers, and a union is a single OR operation.
+
+The index is built on the first query. When the server adds a relation, the
+sets of the affected nodes are extended in place. When a relation or a node
+is removed, the index is rebuilt on the next query.
+
+@relation(SDOC-SRS-66, scope=file)
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from strictdoc.backend.sdoc.models.node import SDocNode
+
+if TYPE_CHECKING:
+    from strictdoc.core.traceability_index import TraceabilityIndex
+
+
+def iterate_bits(bits: int) -> Iterator[int]:
+    # Searching the binary string is much faster than extracting the bits one
+    # by one from a large integer.
+    bits_string = bin(bits)[:1:-1]
+    position = bits_string.find("1")
+    while position != -1:
+        yield position
+        position = bits_string.find("1", position + 1)
+
+
+def compute_closure(links: List[List[int]]) -> List[int]:
+    """
+    Calculate the bitsets of the nodes that are reachable from every node.
+
+    The links of the node N are links[N]. The iterative version of Tarjan's
+    algorithm is used, so that long relation chains do not hit the recursion
+    limit.
+    """
+
+    number_of_nodes = len(links)
+    closure: List[int] = [0] * number_of_nodes
+    indexes: List[int] = [-1] * number_of_nodes
+    lowlinks: List[int] = [0] * number_of_nodes
+    is_on_stack: List[bool] = [False] * number_of_nodes
+    stack: List[int] = []
+    next_index = 0
+
+    for root_node_id_ in range(number_of_nodes):
+        if indexes[root_node_id_] != -1:
+            continue
+
+        indexes[root_node_id_] = lowlinks[root_node_id_] = next_index
+        next_index += 1
+        stack.append(root_node_id_)
+        is_on_stack[root_node_id_] = True
+        work_stack = [(root_node_id_, iter(links[root_node_id_]))]
+        while work_stack:
+            node_id, node_links = work_stack[-1]
+            for linked_node_id_ in node_links:
+                if indexes[linked_node_id_] == -1:
+                    indexes[linked_node_id_] = next_index
+                    lowlinks[linked_node_id_] = next_index
+                    next_index += 1
+                    stack.append(linked_node_id_)
+                    is_on_stack[linked_node_id_] = True
+                    work_stack.append(
+                        (linked_node_id_, iter(links[linked_node_id_]))
+                    )
+                    break
+                if is_on_stack[linked_node_id_]:
+                    lowlinks[node_id] = min(
+                        lowlinks[node_id], indexes[linked_node_id_]
+                    )
+            else:
+                work_stack.pop()
+                if work_stack:
+                    parent_node_id = work_stack[-1][0]
+                    lowlinks[parent_node_id] = min(
+                        lowlinks[parent_node_id], lowlinks[node_id]
+                    )
+                if lowlinks[node_id] != indexes[node_id]:
+                    continue
+
+                # The node is the root of a component, and the closures of
+                # all components it links to are complete.
+                component: List[int] = []
+                while True:
+                    component_node_id = stack.pop()
+                    is_on_stack[component_node_id] = False
+                    component.append(component_node_id)
+                    if component_node_id == node_id:
+                        break
+                # The links within a cycle add the nodes of the cycle itself.
+                component_closure = 0
+                for component_node_id_ in component:
+                    for linked_node_id_ in links[component_node_id_]:
+                        component_closure |= closure[linked_node_id_] | (
+                            1 << linked_node_id_
+                        )
+                for component_node_id_ in component:
+                    closure[component_node_id_] = component_closure
+
+    return closure
+
+
+class ReachabilityIndex:
+    def __init__(self, traceability_index: "TraceabilityIndex") -> None:
+        self.traceability_index: TraceabilityIndex = traceability_index
+        self._is_built: bool = False
+
+        self._nodes: List[SDocNode] = []
+        self._node_ids: Dict[SDocNode, int] = {}
+        self._ancestors: List[int] = []
+        self._descendants: List[int] = []
+
+    def get_ancestors(self, node: SDocNode) -> List[SDocNode]:
+        node_id = self._get_node_id(node)
+        if node_id is None:
+            return []
+        return self._get_nodes(self._ancestors[node_id])
+
+    def get_descendants(self, node: SDocNode) -> List[SDocNode]:
+        node_id = self._get_node_id(node)
+        if node_id is None:
+            return []
+        return self._get_nodes(self._descendants[node_id])
+
+    def get_connected_nodes(self, nodes: Iterable[SDocNode]) -> List[SDocNode]:
+        """
+        Return all ancestors and descendants of the given nodes.
+        """
+
+        connected_nodes = 0
+        for node_ in nodes:
+            node_id = self._get_node_id(node_)
+            if node_id is not None:
+                connected_nodes |= (
+                    self._ancestors[node_id] | self._descendants[node_id]
+                )
+        return self._get_nodes(connected_nodes)
+
+    def create_relation(self, child: SDocNode, parent: SDocNode) -> None:
+        if not self._is_built:
+            return
+
+        child_id = self._create_node_id(child)
+        parent_id = self._create_node_id(parent)
+
+        # The child and its descendants get the parent and its ancestors as
+        # new ancestors, and vice versa.
+        new_ancestors = self._ancestors[parent_id] | (1 << parent_id)
+        new_descendants = self._descendants[child_id] | (1 << child_id)
+        for node_id_ in iterate_bits(new_descendants):
+            self._ancestors[node_id_] |= new_ancestors
+        for node_id_ in iterate_bits(new_ancestors):
+            self._descendants[node_id_] |= new_descendants
+
+    def invalidate(self) -> None:
+        self._is_built = False
+        self._nodes = []
+        self._node_ids = {}
+        self._ancestors = []
+        self._descendants = []
+
+    def _get_node_id(self, node: SDocNode) -> Optional[int]:
+        if not self._is_built:
+            self._build()
+        return self._node_ids.get(node)
+
+    def _create_node_id(self, node: SDocNode) -> int:
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._nodes.append(node)
+            self._node_ids[node] = node_id
+            self._ancestors.append(0)
+            self._descendants.append(0)
+        return node_id
+
+    def _get_nodes(self, bits: int) -> List[SDocNode]:
+        nodes = self._nodes
+        return [nodes[node_id_] for node_id_ in iterate_bits(bits)]
+
+    def _build(self) -> None:
+        traceability_index = self.traceability_index
+
+        self.invalidate()
+        nodes = self._nodes
+        node_ids = self._node_ids
+
+        def get_node_id_(node_: SDocNode) -> int:
+            node_id_ = node_ids.get(node_)
+            if node_id_ is None:
+                node_id_ = len(nodes)
+                nodes.append(node_)
+                node_ids[node_] = node_id_
+            return node_id_
+
+        for document_ in traceability_index.document_tree.document_list:
+            for node_, _ in traceability_index.get_document_iterator(
+                document_
+            ).all_content(print_fragments=False):
+                if isinstance(node_, SDocNode) and (
+                    traceability_index.has_parent_requirements(node_)
+                    or traceability_index.has_children_requirements(node_)
+                ):
+                    get_node_id_(node_)
+
+        # The related nodes that are not found in the documents, if any, are
+        # numbered when they are first met.
+        parent_links: List[List[int]] = []
+        child_links: List[List[int]] = []
+        while len(parent_links) < len(nodes):
+            node = nodes[len(parent_links)]
+            parent_links.append(
+                [
+                    get_node_id_(parent_)
+                    for parent_ in traceability_index.get_parent_requirements(
+                        node
+                    )
+                ]
+            )
+            child_links.append(
+                [
+                    get_node_id_(child_)
+                    for child_ in traceability_index.get_children_requirements(
+                        node
+                    )
+                ]
+            )
+
+        self._ancestors = compute_closure(parent_links)
+        self._descendants = compute_closure(child_links)
+        self._is_built = True
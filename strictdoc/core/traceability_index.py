@@ -26,12 +26,16 @@ from strictdoc.core.file_dependency_manager import FileDependencyManager
 from strictdoc.core.file_traceability_index import FileTraceabilityIndex
 from strictdoc.core.graph.abstract_bucket import ALL_EDGES
 from strictdoc.core.graph_database import GraphDatabase
+from strictdoc.core.page_update_tracker import PageUpdateTracker
 from strictdoc.core.project_config import ProjectConfig
+from strictdoc.core.query_engine.query_index import QueryIndex
+from strictdoc.core.reachability_index import ReachabilityIndex
 from strictdoc.core.source_tree import SourceFile
 from strictdoc.core.transforms.validation_error import (
     SingleValidationError,
 )
 from strictdoc.core.tree_cycle_detector import TreeCycleDetector
+from strictdoc.core.uid_autocomplete_index import UIDAutocompleteIndex
 from strictdoc.helpers.cast import assert_cast, assert_optional_cast
 from strictdoc.helpers.file_modification_time import set_file_modification_time
 from strictdoc.helpers.mid import MID
@@ -67,15 +71,12 @@ class TraceabilityIndex:
         self.strictdoc_last_update: datetime.datetime = (
             datetime.datetime.fromtimestamp(0)
         )
-
-        # The timestamp is used by HTML/JS for invalidating the search index
-        # cache in the IndexedDB database.
-        # If no documents have to be re-generated with the second+ run of
-        # StrictDoc, this timestamp is set of a modification date of the first
-        # SDoc document, see export_static_html_search_index.
-        self.search_index_timestamp: datetime.datetime = datetime.datetime.now(
-            datetime.timezone.utc
+        self.query_index: QueryIndex = QueryIndex(self)
+        self.uid_autocomplete_index: UIDAutocompleteIndex = (
+            UIDAutocompleteIndex(self)
         )
+        self.page_update_tracker: PageUpdateTracker = PageUpdateTracker(self)
+        self.reachability_index: ReachabilityIndex = ReachabilityIndex(self)
 
     @property
     def document_iterators(self) -> Dict[SDocDocument, DocumentCachingIterator]:
@@ -244,6 +245,26 @@ class TraceabilityIndex:
             )
         )
 
+    def get_ancestor_requirements(
+        self, requirement: SDocNode
+    ) -> List[SDocNode]:
+        """
+        Return the parents of a node, their parents and so on.
+        """
+
+        assert isinstance(requirement, SDocNode)
+        return self.reachability_index.get_ancestors(requirement)
+
+    def get_descendant_requirements(
+        self, requirement: SDocNode
+    ) -> List[SDocNode]:
+        """
+        Return the children of a node, their children and so on.
+        """
+
+        assert isinstance(requirement, SDocNode)
+        return self.reachability_index.get_descendants(requirement)
+
     def has_tags(self, document: SDocDocument) -> bool:
         return self.graph_database.has_link(
             link_type=GraphLinkType.DOCUMENT_TO_TAGS,
@@ -426,9 +447,10 @@ class TraceabilityIndex:
         Update the index's last updated date to the current time.
 
         This is a rather broad way of signalling that all documents of the index
-        need to be re-generated when they are opened next time. Several UI
-        actions use this method to ensure a complete re-generation of all
-        documents.
+        need to be re-generated when they are opened next time. The UI actions
+        that change a document as a whole use this method to ensure a complete
+        re-generation of all documents. The actions that change single nodes
+        use PageUpdateTracker.update_node() instead.
         """
         self.index_last_updated = datetime.datetime.today()
 
@@ -446,10 +468,13 @@ class TraceabilityIndex:
                 lhs_node=requirement.reserved_uid,
                 rhs_node=requirement,
             )
+        self.uid_autocomplete_index.create_node(requirement)
 
     def update_requirement_uid(
         self, requirement: SDocNode, old_uid: Optional[str]
     ) -> None:
+        self.uid_autocomplete_index.update_node(requirement)
+
         if old_uid is None:
             if requirement.reserved_uid:
                 self.graph_database.create_link(
@@ -512,6 +537,7 @@ class TraceabilityIndex:
             rhs_node=requirement,
             edge=role,
         )
+        self.reachability_index.create_relation(requirement, parent_requirement)
 
         cycle_detector = TreeCycleDetector()
 
@@ -585,6 +611,7 @@ class TraceabilityIndex:
             rhs_node=child_requirement,
             edge=role,
         )
+        self.reachability_index.create_relation(child_requirement, requirement)
 
         cycle_detector = TreeCycleDetector()
 
@@ -727,6 +754,8 @@ class TraceabilityIndex:
     def delete_requirement(self, requirement: SDocNode) -> None:
         assert isinstance(requirement, SDocNode), SDocNode
 
+        self.uid_autocomplete_index.delete_node(requirement)
+
         self.graph_database.delete_link(
             link_type=GraphLinkType.MID_TO_NODE,
             lhs_node=requirement.reserved_mid,
@@ -746,6 +775,7 @@ class TraceabilityIndex:
                 link_type=GraphLinkType.NODE_TO_CHILD_NODES,
                 lhs_node=requirement,
             )
+            self.reachability_index.invalidate()
 
     def remove_requirement_parent_uid(
         self, requirement: SDocNode, parent_uid: str, role: Optional[str]
@@ -771,6 +801,7 @@ class TraceabilityIndex:
             rhs_node=requirement,
             edge=role,
         )
+        self.reachability_index.invalidate()
 
         document = assert_cast(requirement.get_document(), SDocDocument)
         parent_requirement_document = assert_cast(
@@ -826,6 +857,7 @@ class TraceabilityIndex:
             rhs_node=requirement,
             edge=role,
         )
+        self.reachability_index.invalidate()
 
         # If there are no requirements linking between the documents,
         # remove the link.
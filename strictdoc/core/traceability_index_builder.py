@@ -6,7 +6,18 @@ import datetime
 import glob
 import os
 import sys
-from typing import Any, Dict, Iterator, List, Optional, Set, Union
+from functools import partial
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from textx import TextXSyntaxError
 
@@ -28,7 +39,10 @@ from strictdoc.backend.sdoc.validations.sdoc_validator import SDocValidator
 from strictdoc.backend.sdoc_source_code.caching_reader import (
     SourceFileTraceabilityCachingReader,
 )
-from strictdoc.core.constants import GraphLinkType
+from strictdoc.backend.sdoc_source_code.models.source_file_info import (
+    SourceFileTraceabilityInfo,
+)
+from strictdoc.core.constants import GraphLinkType, GraphStorage
 from strictdoc.core.document_finder import DocumentFinder
 from strictdoc.core.document_iterator import DocumentCachingIterator
 from strictdoc.core.document_tree import DocumentTree
@@ -37,6 +51,9 @@ from strictdoc.core.file_traceability_index import FileTraceabilityIndex
 from strictdoc.core.finders.source_files_finder import (
     SourceFilesFinder,
 )
+from strictdoc.core.graph.compact_many_to_many_set import (
+    CompactManyToManySet,
+)
 from strictdoc.core.graph.many_to_many_set import ManyToManySet
 from strictdoc.core.graph.one_to_one_dictionary import OneToOneDictionary
 from strictdoc.core.graph_database import GraphDatabase
@@ -50,6 +67,9 @@ from strictdoc.core.source_tree import SourceFile, SourceTree
 from strictdoc.core.traceability_index import (
     TraceabilityIndex,
 )
+from strictdoc.core.traceability_index_snapshot import (
+    TraceabilityIndexSnapshot,
+)
 from strictdoc.core.tree_cycle_detector import TreeCycleDetector
 from strictdoc.helpers.cast import assert_cast
 from strictdoc.helpers.deprecation_engine import DEPRECATION_ENGINE
@@ -58,11 +78,14 @@ from strictdoc.helpers.file_modification_time import (
     get_file_modification_time,
 )
 from strictdoc.helpers.mid import MID
-from strictdoc.helpers.parallelizer import Parallelizer
+from strictdoc.helpers.parallelizer import NullParallelizer, Parallelizer
 from strictdoc.helpers.timing import measure_performance, timing_decorator
+from strictdoc.helpers.tracing import TraceCategory
 
 
 class TraceabilityIndexBuilder:
+    MIN_SOURCE_FILES_TO_PARALLELIZE = 16
+
     @staticmethod
     def create(
         *,
@@ -98,6 +121,46 @@ class TraceabilityIndexBuilder:
         ):
             strictdoc_last_update = project_config.config_last_update
 
+        snapshot_fingerprint: str = TraceabilityIndexSnapshot.get_fingerprint(
+            project_config, strictdoc_last_update, skip_source_files
+        )
+        traceability_index: Optional[TraceabilityIndex] = (
+            TraceabilityIndexSnapshot.read_from_cache(
+                project_config, snapshot_fingerprint
+            )
+        )
+        if traceability_index is None:
+            traceability_index = TraceabilityIndexBuilder._create_from_inputs(
+                project_config=project_config,
+                parallelizer=parallelizer,
+                strictdoc_last_update=strictdoc_last_update,
+                skip_source_files=skip_source_files,
+            )
+            TraceabilityIndexSnapshot.save_to_cache(
+                traceability_index, project_config, snapshot_fingerprint
+            )
+
+        #
+        # Resolve all modification dates to support the incremental generation of
+        # all artifacts.
+        #
+
+        file_dependency_manager = traceability_index.file_dependency_manager
+
+        file_dependency_manager.resolve_modification_dates(
+            traceability_index.strictdoc_last_update
+        )
+
+        return traceability_index
+
+    @staticmethod
+    def _create_from_inputs(
+        *,
+        project_config: ProjectConfig,
+        parallelizer: Parallelizer,
+        strictdoc_last_update: datetime.datetime,
+        skip_source_files: bool,
+    ) -> TraceabilityIndex:
         document_tree, asset_manager = DocumentFinder.find_sdoc_content(
             project_config=project_config, parallelizer=parallelizer
         )
@@ -135,17 +198,40 @@ class TraceabilityIndexBuilder:
                 project_config=project_config
             )
             source_files = source_tree.source_files
-            source_file: SourceFile
-            for source_file in source_files:
-                with measure_performance(
-                    f"Reading source: {source_file.in_doctree_source_file_rel_path}"
-                ):
-                    traceability_info = (
-                        SourceFileTraceabilityCachingReader.read_from_file(
-                            source_file.full_path, project_config
-                        )
+
+            # Sending the files to the worker processes only pays off for many files.
+            source_file_parallelizer: Parallelizer = (
+                parallelizer
+                if len(source_files)
+                >= TraceabilityIndexBuilder.MIN_SOURCE_FILES_TO_PARALLELIZE
+                else NullParallelizer()
+            )
+            # The small project config is bound to the processing function,
+            # so the files are read by the already running workers of the
+            # shared pool and the config is pickled once per chunk of files.
+            with measure_performance("Completed reading all source files"):
+                traceability_infos = list(
+                    source_file_parallelizer.run_parallel_streaming(
+                        [
+                            (
+                                source_file_.full_path,
+                                source_file_.in_doctree_source_file_rel_path,
+                            )
+                            for source_file_ in source_files
+                        ],
+                        partial(
+                            TraceabilityIndexBuilder._process_worker_read_source_file,
+                            project_config,
+                        ),
                     )
+                )
 
+            # The results come in the order of the source files, so the
+            # resulting index does not depend on the order of completion.
+            source_file: SourceFile
+            for source_file, traceability_info in zip(
+                source_files, traceability_infos
+            ):
                 if traceability_info:
                     traceability_index.create_traceability_info(
                         source_file,
@@ -200,19 +286,67 @@ class TraceabilityIndexBuilder:
 
             traceability_index.document_tree.attach_source_tree(source_tree)
 
-        #
-        # Resolve all modification dates to support the incremental generation of
-        # all artifacts.
-        #
-
-        file_dependency_manager = traceability_index.file_dependency_manager
+        if project_config.is_activated_deep_trace_screen():
+            TraceabilityIndexBuilder._add_deep_trace_dependencies(
+                traceability_index
+            )
 
-        file_dependency_manager.resolve_modification_dates(
-            traceability_index.strictdoc_last_update
-        )
+        # All links are created, the server edits are stored on top of the
+        # compacted links.
+        traceability_index.graph_database.compact()
 
         return traceability_index
 
+    @staticmethod
+    def _add_deep_trace_dependencies(
+        traceability_index: TraceabilityIndex,
+    ) -> None:
+        """
+        Register the documents that the DEEP-TRACE page of a document shows.
+
+        The documents of the direct parents and children of the nodes are
+        registered for all pages of a document when the relations are
+        resolved. Only the DEEP-TRACE page also shows the more distant
+        ancestors and descendants, so only this page depends on their
+        documents. This way, a change in a long relation chain does not
+        re-generate all pages of every connected document.
+        """
+
+        file_dependency_manager = traceability_index.file_dependency_manager
+        for document_ in traceability_index.document_tree.document_list:
+            assert document_.meta is not None
+            # The documents with the Website layout have no DEEP-TRACE page.
+            if document_.config.layout == "Website":
+                continue
+            document_nodes = [
+                node_
+                for node_, _ in traceability_index.get_document_iterator(
+                    document_
+                ).all_content(print_fragments=False)
+                if isinstance(node_, SDocNode)
+            ]
+            related_documents: Set[SDocDocument] = set()
+            for (
+                related_node_
+            ) in traceability_index.reachability_index.get_connected_nodes(
+                document_nodes
+            ):
+                related_documents.add(
+                    assert_cast(related_node_.get_document(), SDocDocument)
+                )
+            related_documents.discard(document_)
+            for related_document_ in related_documents:
+                assert related_document_.meta is not None
+                file_dependency_manager.add_dependency(
+                    related_document_.meta.input_doc_full_path,
+                    document_.meta.get_html_deep_traceability_path(),
+                )
+
+        # The closure is cheap to rebuild, and the export does not query it
+        # again, so its memory is released. The server queries rebuild it on
+        # demand.
+        traceability_index.reachability_index.invalidate()
+
     @staticmethod
     @timing_decorator("Build traceability graph")
     def create_from_document_tree(
@@ -226,6 +360,11 @@ class TraceabilityIndexBuilder:
         ] = {}
         d_07_file_traceability_index = FileTraceabilityIndex()
 
+        many_to_many_set: Type[Union[ManyToManySet, CompactManyToManySet]] = (
+            CompactManyToManySet
+            if project_config.graph_storage == GraphStorage.COMPACT
+            else ManyToManySet
+        )
         graph_database = GraphDatabase(
             [
                 (
@@ -249,15 +388,15 @@ class TraceabilityIndexBuilder:
                 ),
                 (
                     GraphLinkType.NODE_TO_PARENT_NODES,
-                    ManyToManySet(SDocNode, SDocNode),
+                    many_to_many_set(SDocNode, SDocNode),
                 ),
                 (
                     GraphLinkType.NODE_TO_CHILD_NODES,
-                    ManyToManySet(SDocNode, SDocNode),
+                    many_to_many_set(SDocNode, SDocNode),
                 ),
                 (
                     GraphLinkType.NODE_TO_INCOMING_LINKS,
-                    ManyToManySet(MID, InlineLink),
+                    many_to_many_set(MID, InlineLink),
                 ),
                 (
                     GraphLinkType.DOCUMENT_TO_TAGS,
@@ -818,6 +957,18 @@ class TraceabilityIndexBuilder:
 
         return traceability_index
 
+    @staticmethod
+    def _process_worker_read_source_file(
+        project_config: ProjectConfig, source_file_paths: Tuple[str, str]
+    ) -> Optional[SourceFileTraceabilityInfo]:
+        path_to_source_file, source_file_rel_path = source_file_paths
+        with measure_performance(
+            f"Reading source: {source_file_rel_path}", TraceCategory.SOURCE_FILE
+        ):
+            return SourceFileTraceabilityCachingReader.read_from_file(
+                path_to_source_file, project_config
+            )
+
     @staticmethod
     def _filter_nodes(
         project_config: ProjectConfig, traceability_index: TraceabilityIndex
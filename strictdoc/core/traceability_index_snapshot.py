@@ -0,0 +1,203 @@
+"""
+A persistent snapshot of a fully resolved traceability index.
+
+Parsing the documents is already cached per file by PickleCache but the
+traceability graph still has to be resolved on every run. The snapshot stores
+the complete traceability index, so that an unchanged project is loaded with a
+single unpickling step. The snapshot is keyed by a fingerprint of all inputs
+(documents, grammars, test reports, source files, project configuration), so
+any change to the inputs makes StrictDoc rebuild the index from scratch.
+
+The snapshot is stored in the CacheStore, one item per output directory and
+set of input paths, so it counts towards the cache size limit and is evicted
+like any other cached item. A new fingerprint replaces the outdated snapshot.
+The server, which rebuilds the index after every edit, does not save
+snapshots.
+
+@relation(SDOC-SRS-95, scope=file)
+"""
+
+import datetime
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+from strictdoc import __version__
+from strictdoc.core.cache_store import CacheStore
+from strictdoc.core.document_finder import DocumentFinder
+from strictdoc.core.finders.source_files_finder import SourceFilesFinder
+from strictdoc.core.project_config import ProjectConfig, ProjectFeature
+from strictdoc.core.traceability_index import TraceabilityIndex
+from strictdoc.helpers.deprecation_engine import DEPRECATION_ENGINE
+from strictdoc.helpers.pickle import pickle_dump, pickle_load
+from strictdoc.helpers.timing import measure_performance
+
+
+class TraceabilityIndexSnapshot:
+    CACHE_BUCKET = "traceability_index"
+
+    @staticmethod
+    def get_fingerprint(
+        project_config: ProjectConfig,
+        strictdoc_last_update: datetime.datetime,
+        skip_source_files: bool,
+    ) -> str:
+        """
+        Calculate a fingerprint of everything the traceability index depends on.
+
+        Only the file metadata is used (path, size and modification time), so
+        calculating the fingerprint costs a directory walk and one stat() call
+        per file but no file reading.
+        """
+
+        fingerprint = hashlib.md5()
+
+        def update_(value: Any) -> None:
+            fingerprint.update(repr(value).encode("utf-8"))
+            fingerprint.update(b"\0")
+
+        update_(__version__)
+        update_(strictdoc_last_update)
+        update_(skip_source_files)
+        update_(
+            TraceabilityIndexSnapshot._get_project_config_state(project_config)
+        )
+
+        file_trees, asset_manager = DocumentFinder.build_file_tree(
+            project_config=project_config
+        )
+        for file_tree_ in file_trees:
+            for _, doc_file_, _ in file_tree_.iterate():
+                update_(
+                    TraceabilityIndexSnapshot._get_file_state(
+                        doc_file_.full_path
+                    )
+                )
+        for asset_dir_ in asset_manager.iterate():
+            update_(asset_dir_.full_path)
+
+        if not skip_source_files and project_config.is_feature_activated(
+            ProjectFeature.REQUIREMENT_TO_SOURCE_TRACEABILITY
+        ):
+            source_tree = SourceFilesFinder.find_source_files(
+                project_config=project_config
+            )
+            for source_file_ in source_tree.source_files:
+                update_(
+                    TraceabilityIndexSnapshot._get_file_state(
+                        source_file_.full_path
+                    )
+                )
+
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def read_from_cache(
+        project_config: ProjectConfig, fingerprint: str
+    ) -> Optional[TraceabilityIndex]:
+        with measure_performance("Load traceability index snapshot"):
+            # The fingerprint is the version of the stored item, so an
+            # outdated snapshot is detected without reading the whole index.
+            snapshot_content: Optional[bytes] = CacheStore.get_instance(
+                project_config
+            ).get(
+                TraceabilityIndexSnapshot.CACHE_BUCKET,
+                TraceabilityIndexSnapshot._get_cache_key(project_config),
+                version=fingerprint,
+            )
+            if snapshot_content is None:
+                return None
+
+            try:
+                unpickled_content: Optional[
+                    Tuple[TraceabilityIndex, Dict[str, str]]
+                ] = pickle_load(snapshot_content)
+            except Exception:
+                # A broken or incompatible snapshot is not an error, the
+                # index is simply rebuilt.
+                return None
+
+        if unpickled_content is None:
+            return None
+
+        traceability_index, deprecations = unpickled_content
+        assert isinstance(traceability_index, TraceabilityIndex), (
+            traceability_index
+        )
+
+        # The deprecations are normally collected while the index is built.
+        # Replay them, so that the snapshot does not hide them from a user.
+        for deprecation_key_, deprecation_message_ in deprecations.items():
+            DEPRECATION_ENGINE.add_message(
+                deprecation_key_, deprecation_message_
+            )
+
+        traceability_index.index_last_updated = datetime.datetime.today()
+        return traceability_index
+
+    @staticmethod
+    def save_to_cache(
+        traceability_index: TraceabilityIndex,
+        project_config: ProjectConfig,
+        fingerprint: str,
+    ) -> None:
+        # The server rebuilds the index after every edit and keeps it in
+        # memory. Only the next cold start would read the snapshot, so the
+        # whole index is not serialized again for every edit.
+        if project_config.is_running_on_server:
+            return
+
+        # The snapshot is only an optimization, so any failure to save it
+        # skips the snapshot instead of failing the run. For example, very
+        # deep document trees can exceed the recursion limit of the pickle
+        # module, and the cache directory can be read-only.
+        with measure_performance("Save traceability index snapshot"):
+            try:
+                pickled_content = pickle_dump(
+                    (traceability_index, dict(DEPRECATION_ENGINE.deprecations)),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                CacheStore.get_instance(project_config).put(
+                    TraceabilityIndexSnapshot.CACHE_BUCKET,
+                    TraceabilityIndexSnapshot._get_cache_key(project_config),
+                    pickled_content,
+                    version=fingerprint,
+                )
+            except Exception as exception_:
+                print(  # noqa: T201
+                    "warning: Skip saving the traceability index snapshot: "
+                    f"{exception_.__class__.__name__}: {exception_}."
+                )
+
+    @staticmethod
+    def _get_cache_key(project_config: ProjectConfig) -> str:
+        assert project_config.input_paths is not None
+        # Like with PickleCache, the output root is part of the identifier to
+        # prevent collisions between StrictDoc invocations running against
+        # the same input in parallel.
+        unique_identifier = project_config.output_dir + "".join(
+            map(os.path.abspath, project_config.input_paths)
+        )
+        return hashlib.md5(unique_identifier.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_project_config_state(
+        project_config: ProjectConfig,
+    ) -> List[Tuple[str, str]]:
+        # Only the plain data of the config is relevant. Nested objects, such
+        # as the runtime environment, do not have a stable representation.
+        return [
+            (name_, repr(value_))
+            for name_, value_ in sorted(vars(project_config).items())
+            if value_ is None
+            or isinstance(
+                value_,
+                (str, int, float, bool, list, dict, datetime.datetime),
+            )
+        ]
+
+    @staticmethod
+    def _get_file_state(path_to_file: str) -> Tuple[str, int, int]:
+        file_stat = os.stat(path_to_file)
+        return path_to_file, file_stat.st_size, file_stat.st_mtime_ns
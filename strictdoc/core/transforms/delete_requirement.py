@@ -51,6 +51,9 @@ class DeleteRequirementCommand:
     def perform(self) -> None:
         self.validate()
 
+        self.traceability_index.page_update_tracker.update_node(
+            self.requirement
+        )
         self.traceability_index.delete_requirement(self.requirement)
 
         requirement_parent: Union[SDocSectionIF, SDocDocumentIF, SDocNodeIF] = (
@@ -58,5 +61,3 @@ class DeleteRequirementCommand:
         )
 
         requirement_parent.section_contents.remove(self.requirement)
-
-        self.traceability_index.update_last_updated()
@@ -39,6 +39,6 @@ class DeleteSectionCommand:
         section_parent: Union[SDocSection, SDocDocument] = assert_cast(
             section.parent, (SDocSection, SDocDocument)
         )
+        self.traceability_index.page_update_tracker.update_node(section)
         section_parent.section_contents.remove(section)
-
-        self.traceability_index.update_last_updated()
+        self.traceability_index.uid_autocomplete_index.delete_node(section)
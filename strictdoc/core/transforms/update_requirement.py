@@ -194,6 +194,10 @@ class CreateOrUpdateNodeCommand:
 
             existing_uid = requirement.reserved_uid
 
+            # The pages that show the existing relations and links of the node
+            # are outdated too.
+            traceability_index.page_update_tracker.update_node(requirement)
+
             existing_node_fields = list(requirement.enumerate_fields())
 
             # Clearing all existing fields because they will be recreated from
@@ -434,7 +438,7 @@ class CreateOrUpdateNodeCommand:
             requirement, existing_node_fields
         )
 
-        traceability_index.update_last_updated()
+        traceability_index.page_update_tracker.update_node(requirement)
 
         return CreateOrUpdateNodeResult(
             this_document_requirements_to_update=list(
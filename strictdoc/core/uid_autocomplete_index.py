@@ -0,0 +1,243 @@
+"""
+The index for the UID autocompletion of the node relation fields.
+
+A node matches an autocomplete query when every word of the query is a
+substring of the node's lowercase UID or title. The index avoids visiting every
+node on every keystroke:
+
+- The UIDs are kept in a sorted list, so the nodes whose UID starts with the
+  first query word are found with a binary search. These nodes are returned
+  first, in the order of their UIDs.
+- The UIDs and titles of all nodes are joined into text blocks of
+  BLOCK_SIZE nodes. The other matching nodes are found with a substring search
+  in the blocks, in the document order. When a node is created, updated or
+  deleted, only the text block of this node is joined again.
+- Each block has a bitmask of the character pairs that occur in its text.
+  A block is not searched if any pair of adjacent characters of the query
+  words is missing from it, so a query with a rare word only searches the few
+  blocks that can contain the word.
+
+@relation(SDOC-SRS-120, scope=file)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.backend.sdoc.models.node import SDocNode
+from strictdoc.backend.sdoc.models.section import SDocSection
+
+if TYPE_CHECKING:
+    from strictdoc.core.traceability_index import TraceabilityIndex
+
+
+class UIDAutocompleteBlock:
+    # The lowercase UIDs and titles have no line breaks, and the query words
+    # have no whitespace, so a match never spans two nodes.
+    SEPARATOR = "\n"
+
+    def __init__(self) -> None:
+        self.node_ids: List[int] = []
+        self.text: str = ""
+        self.text_offsets: List[int] = []
+        self.bigram_mask: int = 0
+        self.is_stale: bool = True
+
+    @staticmethod
+    def get_bigram_mask(text: str) -> int:
+        # Not using hash() because the string hashes are randomized for every
+        # Python process.
+        bigram_mask = 0
+        for lhs_, rhs_ in set(zip(text, text[1:])):
+            bigram_mask |= 1 << ((ord(lhs_) * 31 + ord(rhs_)) % 4096)
+        return bigram_mask
+
+
+class UIDAutocompleteIndex:
+    BLOCK_SIZE = 1024
+
+    def __init__(self, traceability_index: "TraceabilityIndex") -> None:
+        self.traceability_index: TraceabilityIndex = traceability_index
+        self._is_built: bool = False
+        self._next_node_id: int = 0
+
+        self._nodes: Dict[int, SDocNode] = {}
+        self._node_ids: Dict[SDocNode, int] = {}
+        # "req-001"
+        self._uid_keys: Dict[int, str] = {}
+        # "req-001 requirement title"
+        self._words: Dict[int, str] = {}
+        # ("req-001", node_id), sorted.
+        self._uids: List[Tuple[str, int]] = []
+        self._blocks: Dict[int, UIDAutocompleteBlock] = {}
+
+    def search(
+        self, query: str, exclude_node_mid: Optional[str], limit: int
+    ) -> List[SDocNode]:
+        if not self._is_built:
+            self._build()
+
+        query_words = query.lower().split()
+        result: List[SDocNode] = []
+        visited_node_ids: Set[int] = set()
+
+        def add_if_matches_(node_id_: int) -> None:
+            visited_node_ids.add(node_id_)
+            node_ = self._nodes[node_id_]
+            words_ = self._words[node_id_]
+            if node_.reserved_mid != exclude_node_mid and all(
+                query_word_ in words_ for query_word_ in query_words
+            ):
+                result.append(node_)
+
+        if len(query_words) > 0:
+            uid_prefix = query_words[0]
+            uid_idx = bisect_left(self._uids, (uid_prefix, -1))
+            while (
+                len(result) < limit
+                and uid_idx < len(self._uids)
+                and self._uids[uid_idx][0].startswith(uid_prefix)
+            ):
+                add_if_matches_(self._uids[uid_idx][1])
+                uid_idx += 1
+
+        # Searching the longest word finds the fewest candidates.
+        search_word = max(query_words, key=len) if len(query_words) > 0 else ""
+        query_bigram_mask = 0
+        for query_word_ in query_words:
+            query_bigram_mask |= UIDAutocompleteBlock.get_bigram_mask(
+                query_word_
+            )
+        for block_idx_ in sorted(self._blocks.keys()):
+            if len(result) >= limit:
+                break
+            block = self._get_block(block_idx_)
+            if query_bigram_mask & ~block.bigram_mask != 0:
+                continue
+            position = block.text.find(search_word)
+            while position != -1 and len(result) < limit:
+                text_idx = bisect_right(block.text_offsets, position) - 1
+                node_id = block.node_ids[text_idx]
+                if node_id not in visited_node_ids:
+                    add_if_matches_(node_id)
+                if text_idx + 1 == len(block.text_offsets):
+                    break
+                position = block.text.find(
+                    search_word, block.text_offsets[text_idx + 1]
+                )
+        return result
+
+    def create_node(self, node: SDocNode) -> None:
+        if not self._is_built:
+            return
+        if (node_id := self._add_node(node)) is not None:
+            insort(self._uids, (self._uid_keys[node_id], node_id))
+
+    def update_node(self, node: SDocNode) -> None:
+        if not self._is_built:
+            return
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            self.create_node(node)
+            return
+        uid_and_words = self._get_uid_and_words(node)
+        if uid_and_words is None:
+            self._remove_node_id(node_id)
+            return
+        self._remove_uid(node_id)
+        self._uid_keys[node_id], self._words[node_id] = uid_and_words
+        insort(self._uids, (self._uid_keys[node_id], node_id))
+        self._blocks[node_id // self.BLOCK_SIZE].is_stale = True
+
+    def delete_node(self, node: Union[SDocNode, SDocSection]) -> None:
+        """
+        Delete a node and all nodes nested in it.
+        """
+
+        if not self._is_built:
+            return
+        if (
+            isinstance(node, SDocNode)
+            and (node_id := self._node_ids.get(node)) is not None
+        ):
+            self._remove_node_id(node_id)
+        if node.section_contents is not None:
+            for subnode_ in node.section_contents:
+                if isinstance(subnode_, (SDocNode, SDocSection)):
+                    self.delete_node(subnode_)
+
+    def _build(self) -> None:
+        self._is_built = True
+        document_: SDocDocument
+        for document_ in self.traceability_index.document_tree.document_list:
+            document_iterator = self.traceability_index.get_document_iterator(
+                document_
+            )
+            for node_, _ in document_iterator.all_content(
+                print_fragments=False
+            ):
+                if (
+                    isinstance(node_, SDocNode)
+                    and (node_id_ := self._add_node(node_)) is not None
+                ):
+                    self._uids.append((self._uid_keys[node_id_], node_id_))
+        self._uids.sort()
+
+    def _add_node(self, node: SDocNode) -> Optional[int]:
+        uid_and_words = self._get_uid_and_words(node)
+        if uid_and_words is None:
+            return None
+        node_id = self._next_node_id
+        self._next_node_id += 1
+        self._nodes[node_id] = node
+        self._node_ids[node] = node_id
+        self._uid_keys[node_id], self._words[node_id] = uid_and_words
+        block = self._blocks.setdefault(
+            node_id // self.BLOCK_SIZE, UIDAutocompleteBlock()
+        )
+        block.node_ids.append(node_id)
+        block.is_stale = True
+        return node_id
+
+    def _remove_uid(self, node_id: int) -> None:
+        uid_idx = bisect_left(self._uids, (self._uid_keys[node_id], node_id))
+        assert self._uids[uid_idx][1] == node_id
+        del self._uids[uid_idx]
+
+    def _remove_node_id(self, node_id: int) -> None:
+        self._remove_uid(node_id)
+        node = self._nodes.pop(node_id)
+        del self._node_ids[node]
+        del self._uid_keys[node_id]
+        del self._words[node_id]
+        block = self._blocks[node_id // self.BLOCK_SIZE]
+        block.node_ids.remove(node_id)
+        block.is_stale = True
+
+    def _get_block(self, block_idx: int) -> UIDAutocompleteBlock:
+        block = self._blocks[block_idx]
+        if block.is_stale:
+            block.text_offsets = []
+            text_length = 0
+            for node_id_ in block.node_ids:
+                block.text_offsets.append(text_length)
+                text_length += len(self._words[node_id_]) + len(
+                    UIDAutocompleteBlock.SEPARATOR
+                )
+            block.text = "".join(
+                self._words[node_id_] + UIDAutocompleteBlock.SEPARATOR
+                for node_id_ in block.node_ids
+            )
+            block.bigram_mask = UIDAutocompleteBlock.get_bigram_mask(block.text)
+            block.is_stale = False
+        return block
+
+    @staticmethod
+    def _get_uid_and_words(node: SDocNode) -> Optional[Tuple[str, str]]:
+        if node.node_type == "SECTION" or node.reserved_uid is None:
+            return None
+        uid = node.reserved_uid.strip().lower()
+        words = uid
+        if node.reserved_title is not None:
+            words = words + " " + node.reserved_title.strip().lower()
+        return uid, words
@@ -22,6 +22,66 @@
     return intersection;
   }
 
+  function lowerBound(size, getKey, value) {
+    let low = 0;
+    let high = size;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (getKey(middle) < value) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+    return low;
+  }
+
+  function reverseString(string) {
+    return string.split("").reverse().join("");
+  }
+
+  // The search index is a list of per-document shards. Each shard stores the
+  // sorted whole tokens ("terms"), the node numbers of each term ("postings")
+  // and the term indexes sorted by the reversed terms ("suffix_order"). A
+  // query matches all terms that start or end with it, both are found with a
+  // binary search. The node numbers of a shard are shifted by its offset in
+  // the combined list of nodes. See static_search_index.py.
+  function lookupTerm(searchIndex, query) {
+    const results = new Set();
+
+    for (const shard of searchIndex) {
+      const terms = shard.index.terms;
+      const postings = shard.index.postings;
+      const suffixOrder = shard.index.suffix_order;
+      const addPostings = (termIdx) => {
+        postings[termIdx].forEach((nodeNumber) => results.add(shard.offset +
+          nodeNumber));
+      };
+
+      let termIdx = lowerBound(terms.length, (idx) => terms[idx], query);
+      while (termIdx < terms.length && terms[termIdx].startsWith(query)) {
+        addPostings(termIdx);
+        termIdx++;
+      }
+
+      let orderIdx = lowerBound(
+        suffixOrder.length,
+        (idx) => reverseString(terms[suffixOrder[idx]]),
+        reverseString(query)
+      );
+      while (orderIdx < suffixOrder.length) {
+        termIdx = suffixOrder[orderIdx];
+        if (!terms[termIdx].endsWith(query)) {
+          break;
+        }
+        addPostings(termIdx);
+        orderIdx++;
+      }
+    }
+
+    return results;
+  }
+
   class SearchResultsView {
     static PAGE_SIZE = 5;
 
@@ -308,25 +368,22 @@
       if (!searchQuery.includes('"')) {
         let uniqueResults = new Set();
         for (const token of queryDict["terms"]) {
-          const tokenResults = window.SDOC_SEARCH_INDEX[token];
-          if (tokenResults) {
-            uniqueResults = new Set([...uniqueResults, ...tokenResults]);
-          }
+          const tokenResults = lookupTerm(window.SDOC_SEARCH_INDEX, token);
+          uniqueResults = new Set([...uniqueResults, ...tokenResults]);
         }
         results.push(...uniqueResults);
       }
     } else {
       const firstTerm = queryDict["terms"][0];
-      const firstTermResults = window.SDOC_SEARCH_INDEX[firstTerm];
-      if (firstTermResults && firstTermResults.length > 0) {
-        let uniqueResults = new Set(firstTermResults);
+      const firstTermResults = lookupTerm(window.SDOC_SEARCH_INDEX,
+        firstTerm);
+      if (firstTermResults.size > 0) {
+        let uniqueResults = firstTermResults;
 
         if (queryDict["terms"].length > 1) {
           for (let i = 1; i < queryDict["terms"].length; i++) {
-            const termResults = window.SDOC_SEARCH_INDEX[queryDict["terms"][
-              i
-            ]];
-            const termUniqueResults = new Set(termResults);
+            const termUniqueResults = lookupTerm(window.SDOC_SEARCH_INDEX,
+              queryDict["terms"][i]);
 
             uniqueResults = intersectSets([uniqueResults, termUniqueResults]);
             if (uniqueResults.size === 0) {
@@ -402,10 +459,8 @@
   }
 
   window.addEventListener("load", async () => {
-    const DB_VERSION = 1;
-    const timestampMeta = document.querySelector(
-      'meta[name="strictdoc-search-index-timestamp"]'
-    )?.content;
+    // Version 2: the indexes are cached per shard in the "shards" store.
+    const DB_VERSION = 2;
     const projectHash = document.querySelector(
       'meta[name="strictdoc-project-hash"]'
     )?.content;
@@ -413,47 +468,56 @@
       'meta[name="strictdoc-search-index-path"]'
     )?.content;
 
-    if (!projectHash || !pathToSearchIndex || !timestampMeta) {
+    if (!projectHash || !pathToSearchIndex) {
       console.error("Search: Missing required meta tags!");
       return;
     }
 
     const dbName = "strictdoc_search_index_" + projectHash;
 
-    const openDB = (name, version = 1) =>
+    const openDB = (name, version) =>
       new Promise((resolve, reject) => {
         const request = indexedDB.open(name, version);
         request.onupgradeneeded = (e) => {
           const db = e.target.result;
-          db.createObjectStore("indexes", {
-            keyPath: "name"
-          });
+          // Version 1 stored the whole index as a single entry.
+          if (db.objectStoreNames.contains("indexes")) {
+            db.deleteObjectStore("indexes");
+          }
+          if (!db.objectStoreNames.contains("shards")) {
+            db.createObjectStore("shards", {
+              keyPath: "name"
+            });
+          }
         };
         request.onsuccess = () => resolve(request.result);
         request.onerror = () => reject(request.error);
       });
 
-    const deleteDB = (name) =>
+    const getFromStore = (db, storeName, key) =>
       new Promise((resolve, reject) => {
-        const delReq = indexedDB.deleteDatabase(name);
-        delReq.onsuccess = () => resolve();
-        delReq.onerror = () => reject(delReq.error);
+        const tx = db.transaction(storeName, "readonly");
+        const store = tx.objectStore(storeName);
+        const req = store.get(key);
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
       });
 
-    const getFromStore = (db, storeName, key) =>
+    const getAllKeysFromStore = (db, storeName) =>
       new Promise((resolve, reject) => {
         const tx = db.transaction(storeName, "readonly");
         const store = tx.objectStore(storeName);
-        const req = store.get(key);
+        const req = store.getAllKeys();
         req.onsuccess = () => resolve(req.result);
         req.onerror = () => reject(req.error);
       });
 
-    const saveToStore = (db, storeName, items) =>
+    const updateStore = (db, storeName, items, keysToDelete) =>
       new Promise((resolve, reject) => {
         const tx = db.transaction(storeName, "readwrite");
         const store = tx.objectStore(storeName);
         items.forEach((item) => store.put(item));
+        keysToDelete.forEach((key) => store.delete(key));
         tx.oncomplete = () => resolve();
         tx.onerror = () => reject(tx.error);
       });
@@ -462,72 +526,111 @@
       new Promise((resolve, reject) => {
         const script = document.createElement("script");
         script.src = url;
-        script.onload = () => resolve();
+        script.onload = () => {
+          script.remove();
+          resolve();
+        };
         script.onerror = () => reject(new Error(
           `Failed to load script ${url}`));
         document.head.appendChild(script);
       });
 
-    try {
-      console.log("Search: LOAD_DB_INDEX: Start");
-      const db = await openDB(dbName, DB_VERSION);
-      const tsEntry = await getFromStore(db, "indexes", "TIMESTAMP");
-
-      if (tsEntry && tsEntry.value === timestampMeta) {
-
-        console.time("Search: LOAD_DB_INDEX");
-        const lunrEntry = await getFromStore(db, "indexes",
-          "SDOC_SEARCH_INDEX");
-        const nodesEntry = await getFromStore(db, "indexes",
-          "SDOC_MAP_MID_TO_NODES");
-        console.timeEnd("Search: LOAD_DB_INDEX");
-
-        if (lunrEntry && nodesEntry) {
-          window.SDOC_SEARCH_INDEX = lunrEntry.value;
-          window.SDOC_MAP_MID_TO_NODES = nodesEntry.value;
-          return;
+    // The manifest lists the shard of every document. A shard file name
+    // contains a hash of the shard content, so a shard cached in the DB is
+    // up-to-date if it was loaded from the same path.
+    const loadShard = async (db, manifestUrl, shardEntry) => {
+      if (db) {
+        try {
+          const cachedShard = await getFromStore(db, "shards", shardEntry
+            .name);
+          if (cachedShard && cachedShard.path === shardEntry.path) {
+            return {
+              shard: cachedShard,
+              isNew: false
+            };
+          }
+        } catch (e) {
+          console.error("Search: Failed to read a cached shard:", e);
         }
       }
 
-      db.close();
-      await deleteDB(dbName);
-
-      try {
-        console.time("Search: LOAD_JS_INDEX");
-        await loadScript(new URL(pathToSearchIndex, window.location
-          .href).href);
-        console.timeEnd("Search: LOAD_JS_INDEX");
-        console.log("Search: JS search index loaded successfully.");
-      } catch (e) {
-        console.error("Search: Failed to load JS search index script:",
-          e);
-        return;
-      }
+      await loadScript(new URL(shardEntry.path, manifestUrl).href);
+      const value = window.SDOC_SEARCH_INDEX_SHARDS[shardEntry.name];
+      delete window.SDOC_SEARCH_INDEX_SHARDS[shardEntry.name];
+      console.assert(!!value, "Search: Shard is not defined: " +
+        shardEntry.name);
+      return {
+        shard: {
+          name: shardEntry.name,
+          path: shardEntry.path,
+          value: value
+        },
+        isNew: true
+      };
+    };
+
+    const manifestUrl = new URL(pathToSearchIndex, window.location.href)
+      .href;
 
-      console.time("Search: SAVE_DB_INDEX");
-      const newDB = await openDB(dbName, DB_VERSION);
-      await saveToStore(newDB, "indexes", [{
-        name: "SDOC_SEARCH_INDEX",
-        value: window.SDOC_SEARCH_INDEX
-      }, {
-        name: "SDOC_MAP_MID_TO_NODES",
-        value: window.SDOC_MAP_MID_TO_NODES
-      }, {
-        name: "TIMESTAMP",
-        value: timestampMeta
-      }, ]);
-      console.timeEnd("Search: SAVE_DB_INDEX");
+    try {
+      console.time("Search: LOAD_MANIFEST");
+      await loadScript(manifestUrl);
+      console.timeEnd("Search: LOAD_MANIFEST");
+    } catch (e) {
+      console.error("Search: Failed to load search index manifest:", e);
+      return;
+    }
+    const manifest = window.SDOC_SEARCH_INDEX_MANIFEST;
 
+    let db = null;
+    try {
+      db = await openDB(dbName, DB_VERSION);
     } catch (err) {
-      console.error("Search: Error loading search index:", err);
+      console.error("Search: IndexedDB is not available:", err);
+    }
 
-      try {
-        await loadScript(new URL(pathToSearchIndex, window.location
-          .href).href);
-        console.log("Search: Script loaded without IndexedDB fallback");
-      } catch (e) {
-        console.error("Search: Failed to load search index script:", e);
+    try {
+      console.time("Search: LOAD_SHARDS");
+      const loadedShards = await Promise.all(
+        manifest.shards.map((shardEntry) => loadShard(db, manifestUrl,
+          shardEntry))
+      );
+      console.timeEnd("Search: LOAD_SHARDS");
+
+      // Combine the shards: the node numbers of each shard start from 0,
+      // so they are shifted by the number of nodes in the previous shards.
+      const searchIndex = [];
+      const nodes = [];
+      for (const loadedShard of loadedShards) {
+        const shardValue = loadedShard.shard.value;
+        searchIndex.push({
+          index: shardValue.index,
+          offset: nodes.length
+        });
+        for (const node of shardValue.nodes) {
+          nodes.push(node);
+        }
+      }
+      window.SDOC_SEARCH_INDEX = searchIndex;
+      window.SDOC_MAP_MID_TO_NODES = nodes;
+
+      if (db) {
+        const newShards = loadedShards
+          .filter((loadedShard) => loadedShard.isNew)
+          .map((loadedShard) => loadedShard.shard);
+        const currentShardNames = new Set(
+          manifest.shards.map((shardEntry) => shardEntry.name)
+        );
+        const staleShardNames = (await getAllKeysFromStore(db, "shards"))
+          .filter((name) => !currentShardNames.has(name));
+        if (newShards.length > 0 || staleShardNames.length > 0) {
+          console.time("Search: SAVE_DB_SHARDS");
+          await updateStore(db, "shards", newShards, staleShardNames);
+          console.timeEnd("Search: SAVE_DB_SHARDS");
+        }
       }
+    } catch (err) {
+      console.error("Search: Error loading search index:", err);
     }
   });
 })();
@@ -4,11 +4,13 @@
 
 # mypy: disable-error-code="operator"
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
+import pygments
 from markupsafe import Markup
 from pygments import highlight
 from pygments.formatters.html import HtmlFormatter
+from pygments.lexer import Lexer
 from pygments.lexers import get_lexer_for_filename
 from pygments.lexers.c_cpp import CLexer, CppLexer
 from pygments.lexers.configs import TOMLLexer
@@ -32,6 +34,7 @@ from strictdoc.backend.sdoc_source_code.models.range_marker import (
 from strictdoc.backend.sdoc_source_code.models.source_file_info import (
     SourceFileTraceabilityInfo,
 )
+from strictdoc.core.cache_store import CacheStore
 from strictdoc.core.project_config import ProjectConfig
 from strictdoc.core.source_tree import SourceFile
 from strictdoc.core.traceability_index import TraceabilityIndex
@@ -44,7 +47,9 @@ from strictdoc.export.html.html_templates import HTMLTemplates
 from strictdoc.export.html.renderers.link_renderer import LinkRenderer
 from strictdoc.export.html.renderers.markup_renderer import MarkupRenderer
 from strictdoc.helpers.cast import assert_cast
+from strictdoc.helpers.md5 import get_md5
 from strictdoc.helpers.timing import measure_performance
+from strictdoc.helpers.tracing import TraceCategory
 
 
 class SourceFileViewHTMLGenerator:
@@ -60,12 +65,14 @@ class SourceFileViewHTMLGenerator:
             source_file.output_file_full_path
         ):
             with measure_performance(
-                f"Skip: {source_file.in_doctree_source_file_rel_path}"
+                f"Skip: {source_file.in_doctree_source_file_rel_path}",
+                TraceCategory.SOURCE_FILE,
             ):
                 return
 
         with measure_performance(
-            f"File: {source_file.in_doctree_source_file_rel_path}"
+            f"File: {source_file.in_doctree_source_file_rel_path}",
+            TraceCategory.SOURCE_FILE,
         ):
             document_content = SourceFileViewHTMLGenerator.export(
                 project_config=project_config,
@@ -106,7 +113,7 @@ class SourceFileViewHTMLGenerator:
                 pygmented_source_file_lines,
                 pygments_styles,
             ) = SourceFileViewHTMLGenerator.get_pygmented_source_lines(
-                source_file, source_file_lines, trace_info
+                project_config, source_file, source_file_lines, trace_info
             )
         link_renderer = LinkRenderer(
             root_path=source_file.path_depth_prefix,
@@ -135,6 +142,7 @@ class SourceFileViewHTMLGenerator:
 
     @staticmethod
     def get_pygmented_source_lines(
+        project_config: ProjectConfig,
         source_file: SourceFile,
         source_file_lines: List[str],
         coverage_info: SourceFileTraceabilityInfo,
@@ -146,87 +154,12 @@ class SourceFileViewHTMLGenerator:
         assert isinstance(source_file_lines, list)
         assert isinstance(coverage_info, SourceFileTraceabilityInfo)
 
-        if source_file.is_python_file():
-            lexer = PythonLexer()
-        elif source_file.is_c_file():
-            lexer = CLexer()
-        elif source_file.is_cpp_file():
-            lexer = CppLexer()
-        elif source_file.is_tex_file():
-            lexer = TexLexer()
-        elif source_file.is_toml_file():
-            lexer = TOMLLexer()
-        elif source_file.is_jinja_file():
-            lexer = HtmlDjangoLexer()
-        elif source_file.is_javascript_file():
-            lexer = JavascriptLexer()
-        elif source_file.is_yaml_file():
-            lexer = YamlLexer()
-        elif source_file.is_rst_file():
-            lexer = RstLexer()
-        else:
-            try:
-                lexer = get_lexer_for_filename(source_file.file_name)
-            except ClassNotFound:
-                lexer = TextLexer()
-
-        # HACK:
-        # Otherwise, Pygments will skip the first line as if it does not exist.
-        # This behavior surprisingly has an effect on the first line if its empty.
-        hack_first_line: bool = False
-        if source_file_lines[0] == "\n":
-            source_file_lines[0] = " \n"
-            hack_first_line = True
-
-        # HACK:
-        # Pygments does not process lines if they are empty and are at the end
-        # of a file. Adding a marker to the end so that Pygments do not cut the
-        # corners.
-        source_file_content = "".join(source_file_lines)
-        source_file_content_with_marker = source_file_content + "\n###"
-
+        lexer = SourceFileViewHTMLGenerator.get_lexer(source_file)
         html_formatter = HtmlFormatter()
-        pygmented_source_file_content = highlight(
-            source_file_content_with_marker, lexer, html_formatter
-        )
-
-        # HACK: split content into lines by cutting off the header and footer
-        # parts generated by Pygments:
-        # <div class="highlight"><pre> and </pre></div>
-        # TODO: Implement proper splitting.
-        start_pattern = '<div class="highlight"><pre>'
-        end_pattern = "</pre></div>\n"
-        assert pygmented_source_file_content.startswith(start_pattern)
-        assert pygmented_source_file_content.endswith(end_pattern), (
-            f"{pygmented_source_file_content}"
-        )
-
-        slice_start = len(start_pattern)
-        slice_end = len(pygmented_source_file_content) - len(end_pattern)
-        pygmented_source_file_content = pygmented_source_file_content[
-            slice_start:slice_end
-        ]
         pygmented_source_file_lines: List[Union[str, SourceMarkerTuple]] = list(
-            pygmented_source_file_content.split("\n")
-        )
-        if hack_first_line:
-            pygmented_source_file_lines[0] = "<span></span>"
-
-        if pygmented_source_file_lines[-1] == "":
-            pygmented_source_file_lines.pop()
-        assert "###" in pygmented_source_file_lines[-1], (
-            "Expected marker to be in place."
-        )
-        # Pop ###, pop "\n"
-        pygmented_source_file_lines.pop()
-        if pygmented_source_file_lines[-1] == "":
-            pygmented_source_file_lines.pop()
-
-        assert len(pygmented_source_file_lines) == len(source_file_lines), (
-            f"Something went wrong when running Pygments against "
-            f"the source file: "
-            f"{len(pygmented_source_file_lines)} == {len(source_file_lines)}, "
-            f"{pygmented_source_file_lines} == {source_file_lines}."
+            SourceFileViewHTMLGenerator.highlight_source_lines(
+                project_config, source_file_lines, lexer, html_formatter
+            )
         )
 
         for marker in coverage_info.markers:
@@ -285,6 +218,120 @@ class SourceFileViewHTMLGenerator:
             for line in pygmented_source_file_lines
         ], Markup(pygments_styles)
 
+    @staticmethod
+    def get_lexer(source_file: SourceFile) -> Lexer:
+        if source_file.is_python_file():
+            return PythonLexer()
+        if source_file.is_c_file():
+            return CLexer()
+        if source_file.is_cpp_file():
+            return CppLexer()
+        if source_file.is_tex_file():
+            return TexLexer()
+        if source_file.is_toml_file():
+            return TOMLLexer()
+        if source_file.is_jinja_file():
+            return HtmlDjangoLexer()
+        if source_file.is_javascript_file():
+            return JavascriptLexer()
+        if source_file.is_yaml_file():
+            return YamlLexer()
+        if source_file.is_rst_file():
+            return RstLexer()
+        try:
+            return get_lexer_for_filename(source_file.file_name)
+        except ClassNotFound:
+            return TextLexer()
+
+    @staticmethod
+    def highlight_source_lines(
+        project_config: ProjectConfig,
+        source_file_lines: List[str],
+        lexer: Lexer,
+        html_formatter: HtmlFormatter,
+    ) -> List[str]:
+        """
+        Return the highlighted HTML of each line of a source file.
+
+        The highlighting does not depend on the markers and the requirements
+        of a file, so it is cached by the content of the file and the lexer.
+        A file that only gets new traceability is not highlighted again.
+        """
+
+        source_file_content = "".join(source_file_lines)
+        cache_key = f"{lexer.__class__.__name__}/{get_md5(source_file_content)}"
+        cache_store = CacheStore.get_instance(project_config)
+        cached_lines: Optional[bytes] = cache_store.get(
+            "pygments", cache_key, version=pygments.__version__
+        )
+        if cached_lines is not None:
+            return cached_lines.decode("utf-8").split("\n")
+
+        # HACK:
+        # Otherwise, Pygments will skip the first line as if it does not exist.
+        # This behavior surprisingly has an effect on the first line if its empty.
+        hack_first_line: bool = False
+        if source_file_lines[0] == "\n":
+            source_file_content = " " + source_file_content
+            hack_first_line = True
+
+        # HACK:
+        # Pygments does not process lines if they are empty and are at the end
+        # of a file. Adding a marker to the end so that Pygments do not cut the
+        # corners.
+        source_file_content_with_marker = source_file_content + "\n###"
+
+        pygmented_source_file_content = highlight(
+            source_file_content_with_marker, lexer, html_formatter
+        )
+
+        # HACK: split content into lines by cutting off the header and footer
+        # parts generated by Pygments:
+        # <div class="highlight"><pre> and </pre></div>
+        # TODO: Implement proper splitting.
+        start_pattern = '<div class="highlight"><pre>'
+        end_pattern = "</pre></div>\n"
+        assert pygmented_source_file_content.startswith(start_pattern)
+        assert pygmented_source_file_content.endswith(end_pattern), (
+            f"{pygmented_source_file_content}"
+        )
+
+        slice_start = len(start_pattern)
+        slice_end = len(pygmented_source_file_content) - len(end_pattern)
+        pygmented_source_file_content = pygmented_source_file_content[
+            slice_start:slice_end
+        ]
+        pygmented_source_file_lines: List[str] = (
+            pygmented_source_file_content.split("\n")
+        )
+        if hack_first_line:
+            pygmented_source_file_lines[0] = "<span></span>"
+
+        if pygmented_source_file_lines[-1] == "":
+            pygmented_source_file_lines.pop()
+        assert "###" in pygmented_source_file_lines[-1], (
+            "Expected marker to be in place."
+        )
+        # Pop ###, pop "\n"
+        pygmented_source_file_lines.pop()
+        if pygmented_source_file_lines[-1] == "":
+            pygmented_source_file_lines.pop()
+
+        assert len(pygmented_source_file_lines) == len(source_file_lines), (
+            f"Something went wrong when running Pygments against "
+            f"the source file: "
+            f"{len(pygmented_source_file_lines)} == {len(source_file_lines)}, "
+            f"{pygmented_source_file_lines} == {source_file_lines}."
+        )
+
+        cache_store.put(
+            "pygments",
+            cache_key,
+            "\n".join(pygmented_source_file_lines).encode("utf-8"),
+            version=pygments.__version__,
+        )
+        return pygmented_source_file_lines
+
     @staticmethod
     def mark_safe(
         line: Union[str, SourceMarkerTuple],
@@ -1,15 +1,16 @@
+import hashlib
 import importlib
 import os
 import sys
 from collections import defaultdict
-from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import orjson
 from html2pdf4doc.html2pdf4doc import PATH_TO_HTML2PDF4DOC_JS
 
 from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.backend.sdoc.models.node import SDocNode
 from strictdoc.core.asset_manager import AssetDir
 from strictdoc.core.document_meta import DocumentMeta
 from strictdoc.core.project_config import ProjectConfig, ProjectFeature
@@ -50,16 +51,19 @@ from strictdoc.export.html.generators.traceability_matrix import (
 from strictdoc.export.html.html_templates import HTMLTemplates
 from strictdoc.export.html.renderers.link_renderer import LinkRenderer
 from strictdoc.export.html.renderers.markup_renderer import MarkupRenderer
+from strictdoc.export.html.static_search_index import StaticSearchIndex
 from strictdoc.export.html.tools.html_embedded import HTMLEmbedder
 from strictdoc.helpers.cast import assert_cast
 from strictdoc.helpers.exception import StrictDocException
 from strictdoc.helpers.file_modification_time import get_file_modification_time
 from strictdoc.helpers.file_system import sync_dir
 from strictdoc.helpers.git_client import GitClient
+from strictdoc.helpers.md5 import get_md5
 from strictdoc.helpers.mid import MID
-from strictdoc.helpers.parallelizer import Parallelizer
+from strictdoc.helpers.parallelizer import NullParallelizer, Parallelizer
 from strictdoc.helpers.paths import SDocRelativePath
 from strictdoc.helpers.timing import measure_performance, timing_decorator
+from strictdoc.helpers.tracing import TraceCategory
 
 
 class HTMLGenerator:
@@ -92,22 +96,17 @@ class HTMLGenerator:
             traceability_index=traceability_index
         )
 
-        # Export all documents in parallel.
-        export_binding = partial(
-            self.export_single_document_with_performance,
-            traceability_index=traceability_index,
-        )
-
         # By default, do not export included documents. Only, if the option to
         # include is provided.
-        documents_to_export: List[SDocDocument] = []
+        documents_to_export: List[int] = []
+        # The up-to-date documents whose DEEP-TRACE page shows a changed
+        # distant ancestor or descendant.
+        deep_traces_to_export: List[int] = []
 
-        if self.project_config.export_included_documents:
-            documents_to_export[:] = (
-                traceability_index.document_tree.document_list
-            )
-        else:
-            for document_ in traceability_index.document_tree.document_list:
+        for document_idx_, document_ in enumerate(
+            traceability_index.document_tree.document_list
+        ):
+            if not self.project_config.export_included_documents:
                 if document_.document_is_included():
                     continue
 
@@ -123,21 +122,34 @@ class HTMLGenerator:
                         document_meta.output_document_full_path
                     )
                 ):
-                    with measure_performance(f"Skip: {document_.title}"):
+                    with measure_performance(
+                        f"Skip: {document_.title}", TraceCategory.DOCUMENT
+                    ):
+                        if traceability_index.file_dependency_manager.must_generate(
+                            document_meta.get_html_deep_traceability_path()
+                        ):
+                            deep_traces_to_export.append(document_idx_)
                         continue
 
-                documents_to_export.append(document_)
-
-        if len(documents_to_export) > 0:
-            if len(traceability_index.document_tree.document_list) <= 25:
-                parallelizer.run_parallel(documents_to_export, export_binding)
-            else:
-                print(  # noqa: T201
-                    "NOTE: Running document export without parallelization "
-                    "because the document tree contains more than 25 documents."
-                )
-                for document_ in documents_to_export:
-                    export_binding(document_)
+            documents_to_export.append(document_idx_)
+
+        # Export all documents in parallel. Each worker process receives the
+        # generator and the traceability index only once, when it starts, and
+        # then only gets the positions of the documents in the document list.
+        # This way, the export scales to arbitrarily large document trees
+        # without pickling the whole traceability index for every document.
+        parallelizer.run_parallel_with_context(
+            [
+                (document_idx_, DocumentType.all())
+                for document_idx_ in documents_to_export
+            ]
+            + [
+                (document_idx_, (DocumentType.DEEPTRACE,))
+                for document_idx_ in deep_traces_to_export
+            ],
+            HTMLGenerator._process_worker_export_document,
+            context=(self, traceability_index),
+        )
 
         # Export document tree.
         # FIXME: It is important that this export is **after** the parallelized
@@ -169,6 +181,7 @@ class HTMLGenerator:
         ):
             self.export_source_coverage_screen(
                 traceability_index=traceability_index,
+                parallelizer=parallelizer,
             )
 
         print(  # noqa: T201
@@ -351,6 +364,47 @@ class HTMLGenerator:
                         message=f'Copying project assets "{output_relative_path.relative_path}"',
                     )
 
+    @staticmethod
+    def _process_worker_export_document(
+        context: Tuple["HTMLGenerator", TraceabilityIndex],
+        document_task: Tuple[int, Tuple[DocumentType, ...]],
+    ) -> None:
+        html_generator, traceability_index = context
+        document_idx, specific_documents = document_task
+        document = traceability_index.document_tree.document_list[document_idx]
+        if specific_documents == DocumentType.all():
+            html_generator.export_single_document_with_performance(
+                document, traceability_index
+            )
+            return
+        pages = ", ".join(
+            document_type_.value for document_type_ in specific_documents
+        )
+        with measure_performance(
+            f"Published: {document.title} ({pages})", TraceCategory.DOCUMENT
+        ):
+            html_generator.export_single_document(
+                document,
+                traceability_index,
+                specific_documents=specific_documents,
+            )
+
+    @staticmethod
+    def _process_worker_export_source_file(
+        context: Tuple["HTMLGenerator", TraceabilityIndex],
+        source_file_idx: int,
+    ) -> None:
+        html_generator, traceability_index = context
+        source_tree = assert_cast(
+            traceability_index.document_tree.source_tree, SourceTree
+        )
+        SourceFileViewHTMLGenerator.export_to_file(
+            project_config=html_generator.project_config,
+            source_file=source_tree.source_files[source_file_idx],
+            traceability_index=traceability_index,
+            html_templates=html_generator.html_templates,
+        )
+
     def export_single_document_with_performance(
         self,
         document: SDocDocument,
@@ -360,7 +414,9 @@ class HTMLGenerator:
         if specific_documents is None:
             specific_documents = DocumentType.all()
 
-        with measure_performance(f"Published: {document.title}"):
+        with measure_performance(
+            f"Published: {document.title}", TraceCategory.DOCUMENT
+        ):
             self.export_single_document(
                 document,
                 traceability_index,
@@ -398,6 +454,28 @@ class HTMLGenerator:
             self.project_config,
             document,
         )
+        document_nodes = [
+            node_
+            for node_, _ in traceability_index.get_document_iterator(
+                document
+            ).all_content(print_fragments=True)
+            if isinstance(node_, SDocNode)
+        ]
+        # The links in the fields depend on the page type.
+        document_type_features = {
+            DocumentType.TABLE: ProjectFeature.TABLE_SCREEN,
+            DocumentType.TRACE: ProjectFeature.TRACEABILITY_SCREEN,
+            DocumentType.DEEPTRACE: ProjectFeature.DEEP_TRACEABILITY_SCREEN,
+            DocumentType.PDF: ProjectFeature.HTML2PDF,
+        }
+        for document_type_ in specific_documents:
+            document_type_feature = document_type_features.get(document_type_)
+            if document_type_feature is None or (
+                self.project_config.is_feature_activated(document_type_feature)
+            ):
+                markup_renderer.prerender_node_fields(
+                    document_type_, document_nodes
+                )
 
         if DocumentType.DOCUMENT in specific_documents:
             # Single Document pages.
@@ -579,23 +657,38 @@ class HTMLGenerator:
         self,
         *,
         traceability_index: TraceabilityIndex,
+        parallelizer: Optional[Parallelizer] = None,
     ) -> None:
-        assert isinstance(
-            traceability_index.document_tree.source_tree, SourceTree
-        ), traceability_index.document_tree.source_tree
+        source_tree = traceability_index.document_tree.source_tree
+        assert isinstance(source_tree, SourceTree), source_tree
         print("Generating source files:")  # noqa: T201
-        for (
-            source_file
-        ) in traceability_index.document_tree.source_tree.source_files:
-            if not source_file.is_referenced:
+        source_files_to_export: List[int] = []
+        for source_file_idx_, source_file_ in enumerate(
+            source_tree.source_files
+        ):
+            if not source_file_.is_referenced:
                 continue
 
-            SourceFileViewHTMLGenerator.export_to_file(
-                project_config=self.project_config,
-                source_file=source_file,
-                traceability_index=traceability_index,
-                html_templates=self.html_templates,
-            )
+            if not traceability_index.file_dependency_manager.must_generate(
+                source_file_.output_file_full_path
+            ):
+                with measure_performance(
+                    f"Skip: {source_file_.in_doctree_source_file_rel_path}",
+                    TraceCategory.SOURCE_FILE,
+                ):
+                    continue
+
+            source_files_to_export.append(source_file_idx_)
+
+        # Like the documents, the source files are exported in parallel and
+        # the workers only get the positions of the files in the source tree.
+        if parallelizer is None:
+            parallelizer = NullParallelizer()
+        parallelizer.run_parallel_with_context(
+            source_files_to_export,
+            HTMLGenerator._process_worker_export_source_file,
+            context=(self, traceability_index),
+        )
 
         source_coverage_content = SourceFileCoverageHTMLGenerator.export(
             project_config=self.project_config,
@@ -673,124 +766,157 @@ class HTMLGenerator:
         traceability_index: TraceabilityIndex,
     ) -> None:
         """
-        Export a static search index as dictionaries in .js files.
+        Export a static search index as a manifest and per-document shards.
+
+        Each document has its own shard file which is only regenerated when
+        the document changes. The shard file name contains a hash of its
+        content, so that the browser can fetch and cache the shards
+        individually. The manifest lists the current shards of all documents.
 
         @relation(SDOC-SRS-155, scope=function)
         @relation(SDOC-SRS-156, scope=function)
         """
 
-        # First check if there is nothing to do because no documents have been
-        # changed or regenerated.
-        for document_ in traceability_index.document_tree.document_list:
-            assert document_.meta is not None
-            if traceability_index.file_dependency_manager.must_generate(
-                document_.meta.output_document_full_path
-            ):
-                break
-        else:
-            print(  # noqa: T201
-                "All documents are up-to-date. "
-                "Skipping the generation of a search index."
-            )
-            # If no documents need to be regenerated, set the search_index_timestamp
-            # to the timestamp of the first document. The assumption here is
-            # that StrictDoc does not randomize the document list, and the first
-            # document will always be the same.
-            # The HTML/JS code can rely on this timestamp to decide whether it
-            # has to re-read the search index from the JS file or it can simply
-            # fetch it from the DB which is 2x faster when it comes to very
-            # large indexes.
-            if len(traceability_index.document_tree.document_list) > 0:
-                first_document = traceability_index.document_tree.document_list[
-                    0
-                ]
-                assert first_document.meta is not None
-                traceability_index.search_index_timestamp = (
-                    get_file_modification_time(
-                        first_document.meta.input_doc_full_path
-                    )
-                )
-            return
-
-        global_index: Dict[str, Set[int]] = defaultdict(set)
-        global_map_nodes_by_mid: Dict[int, Dict[str, str]] = {}
+        output_html_static_files = os.path.join(
+            self.project_config.export_output_html_root,
+            self.project_config.dir_for_sdoc_assets,
+        )
+        path_to_shards_dir = os.path.join(
+            output_html_static_files, StaticSearchIndex.SHARDS_DIR
+        )
+        Path(path_to_shards_dir).mkdir(parents=True, exist_ok=True)
 
-        document_index_list: List[Dict[str, Set[str]]] = []
-        document_map_list: List[Dict[int, Dict[str, str]]] = []
+        existing_shard_files: Dict[str, str] = {}
+        for shard_file_name_ in os.listdir(path_to_shards_dir):
+            existing_shard_files[shard_file_name_.split("-", 1)[0]] = (
+                shard_file_name_
+            )
 
-        map_mid_to_numbers: Dict[str, int] = {}
+        link_renderer = LinkRenderer(
+            root_path="",
+            static_path=self.project_config.dir_for_sdoc_assets,
+        )
 
+        manifest_shards: List[Dict[str, str]] = []
+        updated_shards = 0
         with measure_performance("Build search index"):
             for document_ in traceability_index.document_tree.document_list:
-                assert document_.meta is not None
-                document_index_list.append(
-                    document_.search_index.document_index
+                document_meta = assert_cast(document_.meta, DocumentMeta)
+
+                shard_name = get_md5(
+                    os.path.relpath(
+                        document_meta.output_document_full_path,
+                        self.project_config.export_output_html_root,
+                    )
                 )
-                map_nodes_by_numbers: Dict[int, Dict[str, str]] = {}
-                for (
-                    node_mid_,
-                    node_dict_,
-                ) in document_.search_index.map_nodes_by_mid.items():
-                    if node_mid_ not in map_mid_to_numbers:
-                        map_mid_to_numbers[node_mid_] = (
-                            len(map_mid_to_numbers) + 1
+
+                shard_file_name: Optional[str] = existing_shard_files.pop(
+                    shard_name, None
+                )
+                if shard_file_name is not None and (
+                    get_file_modification_time(
+                        document_meta.input_doc_full_path
+                    )
+                    < get_file_modification_time(
+                        os.path.join(path_to_shards_dir, shard_file_name)
+                    )
+                    and not traceability_index.file_dependency_manager.must_generate(
+                        document_meta.output_document_full_path
+                    )
+                ):
+                    manifest_shards.append(
+                        StaticSearchIndex.create_manifest_entry(
+                            shard_name, shard_file_name
                         )
-                    document_mid_number = map_mid_to_numbers[node_mid_]
-                    assert isinstance(document_mid_number, int)
-                    map_nodes_by_numbers[document_mid_number] = node_dict_
-
-                document_map_list.append(map_nodes_by_numbers)
-            for document_index_ in document_index_list:
-                for term_, document_mids_ in document_index_.items():
-                    document_mid_numbers = set()
-                    for document_mid_ in document_mids_:
-                        document_mid_number = map_mid_to_numbers[document_mid_]
-                        document_mid_numbers.add(document_mid_number)
-                    global_index[term_].update(document_mid_numbers)
-            for map_nodes_by_mid_ in document_map_list:
-                global_map_nodes_by_mid.update(map_nodes_by_mid_)
+                    )
+                    continue
 
-        link_renderer = LinkRenderer(
-            root_path="",
-            static_path=self.project_config.dir_for_sdoc_assets,
-        )
-        for _, node_ in global_map_nodes_by_mid.items():
-            node = traceability_index.get_node_by_mid(MID(node_["MID"]))
-            node_["_LINK"] = link_renderer.render_local_anchor(node)
+                shard_content = self._create_static_html_search_index_shard(
+                    document_, shard_name, traceability_index, link_renderer
+                )
+                new_shard_file_name = (
+                    f"{shard_name}-{hashlib.md5(shard_content).hexdigest()}.js"
+                )
+                with open(
+                    os.path.join(path_to_shards_dir, new_shard_file_name), "wb"
+                ) as shard_file_:
+                    shard_file_.write(shard_content)
+                if shard_file_name is not None and (
+                    shard_file_name != new_shard_file_name
+                ):
+                    os.unlink(os.path.join(path_to_shards_dir, shard_file_name))
+                if shard_file_name != new_shard_file_name:
+                    updated_shards += 1
+                manifest_shards.append(
+                    StaticSearchIndex.create_manifest_entry(
+                        shard_name, new_shard_file_name
+                    )
+                )
 
-        def default(obj: Any) -> Any:
-            if isinstance(obj, set):
-                return list(obj)
-            raise TypeError
+        # The remaining shards belong to the documents that do not exist
+        # anymore.
+        for stale_shard_file_name_ in existing_shard_files.values():
+            os.unlink(os.path.join(path_to_shards_dir, stale_shard_file_name_))
+            updated_shards += 1
 
-        with measure_performance("Serialize search index to JS"):
-            document_content = (
-                b"window.SDOC_SEARCH_INDEX = "
-                + orjson.dumps(
-                    global_index,
-                    option=orjson.OPT_NON_STR_KEYS,
-                    default=default,
-                )
-                + b";\n\n"
+        if updated_shards == 0:
+            print(  # noqa: T201
+                "All documents are up-to-date. "
+                "Skipping the generation of a search index."
             )
 
-        with measure_performance("Serialize lookup map {MID => node} to JS"):
-            document_content += (
-                b"window.SDOC_MAP_MID_TO_NODES = "
-                + orjson.dumps(
-                    global_map_nodes_by_mid, option=orjson.OPT_NON_STR_KEYS
-                )
+        with measure_performance("Serialize search index to JS"):
+            manifest_content = (
+                b"window.SDOC_SEARCH_INDEX_MANIFEST = "
+                + orjson.dumps({"shards": manifest_shards})
                 + b";\n"
             )
 
         # Export StrictDoc's own assets.
-        output_html_static_files = os.path.join(
-            self.project_config.export_output_html_root,
-            self.project_config.dir_for_sdoc_assets,
-        )
-        output_html_source_coverage = os.path.join(
+        output_html_search_index = os.path.join(
             output_html_static_files,
             "static_html_search_index.js",
         )
-        with open(output_html_source_coverage, "wb") as file:
-            file.write(document_content)
+        with open(output_html_search_index, "wb") as file:
+            file.write(manifest_content)
+
+    @staticmethod
+    def _create_static_html_search_index_shard(
+        document: SDocDocument,
+        shard_name: str,
+        traceability_index: TraceabilityIndex,
+        link_renderer: LinkRenderer,
+    ) -> bytes:
+        # Every shard numbers its nodes locally, starting from 0. The browser
+        # shifts these numbers when it combines the shards.
+        term_postings: Dict[str, Set[int]] = defaultdict(set)
+        map_mid_to_numbers: Dict[str, int] = {}
+        nodes: List[Dict[str, str]] = []
+        for (
+            node_mid_,
+            node_dict_,
+        ) in document.search_index.map_nodes_by_mid.items():
+            map_mid_to_numbers[node_mid_] = len(nodes)
+            node = traceability_index.get_node_by_mid(MID(node_mid_))
+            nodes.append(
+                dict(node_dict_, _LINK=link_renderer.render_local_anchor(node))
+            )
+        for term_, node_mids_ in document.search_index.document_index.items():
+            term_postings[term_].update(
+                map_mid_to_numbers[node_mid_] for node_mid_ in node_mids_
+            )
+
+        return (
+            b"window.SDOC_SEARCH_INDEX_SHARDS = "
+            b"window.SDOC_SEARCH_INDEX_SHARDS || {};\n"
+            b"window.SDOC_SEARCH_INDEX_SHARDS["
+            + orjson.dumps(shard_name)
+            + b"] = "
+            + orjson.dumps(
+                {
+                    "index": StaticSearchIndex.create(term_postings),
+                    "nodes": nodes,
+                }
+            )
+            + b";\n"
+        )
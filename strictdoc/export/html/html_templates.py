@@ -1,25 +1,20 @@
 import datetime
-import glob
-import hashlib
-import os.path
-import shutil
-from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Optional
 
 from jinja2 import (
+    BytecodeCache,
     Environment,
     FileSystemLoader,
-    ModuleLoader,
     StrictUndefined,
     Template,
 )
+from jinja2.bccache import Bucket
 from markupsafe import Markup
 
 from strictdoc import environment
+from strictdoc.core.cache_store import CacheStore
 from strictdoc.core.project_config import ProjectConfig
 from strictdoc.export.html.jinja.assert_extension import AssertExtension
-from strictdoc.helpers.file_modification_time import get_file_modification_time
-from strictdoc.helpers.timing import measure_performance
 
 
 class JinjaEnvironment:
@@ -48,11 +43,6 @@ class HTMLTemplates:
     ) -> "HTMLTemplates":
         assert isinstance(strictdoc_last_update, datetime.datetime)
         if enable_caching:
-            cacheable_templates = CompiledHTMLTemplates(project_config)
-            cacheable_templates.reset_jinja_environment_if_outdated(
-                strictdoc_last_update
-            )
-            cacheable_templates.compile_jinja_templates()
             return CompiledHTMLTemplates(project_config)
 
         return NormalHTMLTemplates()
@@ -60,10 +50,22 @@ class HTMLTemplates:
     def jinja_environment(self) -> JinjaEnvironment:
         raise NotImplementedError
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Jinja environments cannot be pickled. When the templates are passed
+        # to a worker process, the environment is recreated lazily there.
+        state = self.__dict__.copy()
+        state["_jinja_environment"] = None
+        return state
+
 
 class NormalHTMLTemplates(HTMLTemplates):
     def __init__(self) -> None:
-        self._jinja_environment: JinjaEnvironment = JinjaEnvironment(
+        self._jinja_environment: Optional[JinjaEnvironment] = None
+
+    def jinja_environment(self) -> JinjaEnvironment:
+        if self._jinja_environment is not None:
+            return self._jinja_environment
+        self._jinja_environment = JinjaEnvironment(
             Environment(
                 loader=FileSystemLoader(
                     environment.get_path_to_html_templates()
@@ -73,83 +75,53 @@ class NormalHTMLTemplates(HTMLTemplates):
                 autoescape=True,
             )
         )
-
-    def jinja_environment(self) -> JinjaEnvironment:
         return self._jinja_environment
 
 
-class CompiledHTMLTemplates(HTMLTemplates):
+class CacheStoreBytecodeCache(BytecodeCache):
+    """
+    Stores the compiled Jinja templates in the StrictDoc cache store.
+
+    Jinja validates the checksum of a template source when the bytecode is
+    loaded, so a changed template is recompiled automatically.
+    """
+
     def __init__(self, project_config: ProjectConfig):
-        path_to_output_dir_hash = hashlib.md5(
-            project_config.output_dir.encode("utf-8")
-        ).hexdigest()
-        self.path_to_jinja_cache_bucket_dir = os.path.join(
-            project_config.get_path_to_cache_dir(),
+        self.project_config: ProjectConfig = project_config
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        bytecode: Optional[bytes] = CacheStore.get_instance(
+            self.project_config
+        ).get("jinja", bucket.key, version=bucket.checksum)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        CacheStore.get_instance(self.project_config).put(
             "jinja",
-            path_to_output_dir_hash,
+            bucket.key,
+            bucket.bytecode_to_string(),
+            version=bucket.checksum,
         )
-        self._jinja_environment: Optional[JinjaEnvironment] = None
 
-    def compile_jinja_templates(self) -> None:
-        if os.path.isdir(self.path_to_jinja_cache_bucket_dir):
-            return
-        jinja_environment = Environment(
-            loader=FileSystemLoader(environment.get_path_to_html_templates()),
-            undefined=StrictUndefined,
-            extensions=[AssertExtension],
-            autoescape=True,
-        )
-        # TODO: Check if this line is still needed (might be some older workaround).
-        jinja_environment.globals.update(isinstance=isinstance)
-        with measure_performance("Compile Jinja templates"):
-
-            def filter_function_(name: str) -> bool:
-                # On macOS, the .DS_Store files make Jinja templates compiler
-                # to crash.
-                # https://github.com/strictdoc-project/strictdoc/issues/1266
-                if name.endswith(".DS_Store"):
-                    return False
-                return True
-
-            Path(self.path_to_jinja_cache_bucket_dir).mkdir(
-                parents=True, exist_ok=True
-            )
-            jinja_environment.compile_templates(
-                self.path_to_jinja_cache_bucket_dir,
-                zip=None,
-                filter_func=filter_function_,
-                ignore_errors=False,
-            )
+
+class CompiledHTMLTemplates(HTMLTemplates):
+    def __init__(self, project_config: ProjectConfig):
+        self.project_config: ProjectConfig = project_config
+        self._jinja_environment: Optional[JinjaEnvironment] = None
 
     def jinja_environment(self) -> JinjaEnvironment:
         if self._jinja_environment is not None:
             return self._jinja_environment
-        assert os.path.isdir(self.path_to_jinja_cache_bucket_dir)
         self._jinja_environment = JinjaEnvironment(
             Environment(
-                loader=ModuleLoader(self.path_to_jinja_cache_bucket_dir),
+                loader=FileSystemLoader(
+                    environment.get_path_to_html_templates()
+                ),
                 undefined=StrictUndefined,
                 extensions=[AssertExtension],
                 autoescape=True,
+                bytecode_cache=CacheStoreBytecodeCache(self.project_config),
             )
         )
         return self._jinja_environment
-
-    def reset_jinja_environment_if_outdated(
-        self, strictdoc_last_update: datetime.datetime
-    ) -> None:
-        assert isinstance(strictdoc_last_update, datetime.datetime)
-
-        if os.path.isdir(self.path_to_jinja_cache_bucket_dir):
-            jinja_cache_files: List[str] = list(
-                glob.iglob(
-                    f"{self.path_to_jinja_cache_bucket_dir}/**/*.py",
-                    recursive=True,
-                )
-            )
-
-            jinja_cache_mtime = get_file_modification_time(jinja_cache_files[0])
-
-            if strictdoc_last_update > jinja_cache_mtime:
-                self._jinja_environment = None
-                shutil.rmtree(self.path_to_jinja_cache_bucket_dir)
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from markupsafe import Markup
 
@@ -124,6 +124,62 @@ class MarkupRenderer:
         if (document_type, node_field) in self.cache:
             return self.cache[(document_type, node_field)]
 
+        output = self.fragment_writer.write(
+            self._get_fragment(document_type, node_field)
+        )
+        self.cache[(document_type, node_field)] = output
+
+        return output
+
+    def prerender_node_fields(
+        self, document_type: DocumentType, nodes: Iterable[SDocNode]
+    ) -> None:
+        """
+        Render the fields of the nodes that a page shows in one batch.
+
+        The RST fragments are rendered with a single docutils run instead of
+        one run per field, see RstToHtmlFragmentWriter.write_batch(). The
+        other markups are cheap to render one by one.
+        """
+
+        if not isinstance(self.fragment_writer, RstToHtmlFragmentWriter):
+            return
+
+        # The same fields as the node templates render.
+        node_fields: List[SDocNodeField] = []
+        for node_ in nodes:
+            if node_.has_reserved_statement():
+                node_fields.append(node_.get_content_field())
+            if node_.rationale is not None:
+                node_fields.append(
+                    node_.get_field_by_name(RequirementFieldName.RATIONALE)
+                )
+            node_fields.extend(node_.get_comment_fields())
+            if node_.has_meta:
+                node_fields.extend(
+                    meta_field_[1]
+                    for meta_field_ in node_.enumerate_meta_fields(
+                        skip_single_lines=True
+                    )
+                )
+        node_fields = [
+            node_field_
+            for node_field_ in dict.fromkeys(node_fields)
+            if (document_type, node_field_) not in self.cache
+        ]
+
+        outputs = self.fragment_writer.write_batch(
+            [
+                self._get_fragment(document_type, node_field_)
+                for node_field_ in node_fields
+            ]
+        )
+        for node_field_, output_ in zip(node_fields, outputs):
+            self.cache[(document_type, node_field_)] = output_
+
+    def _get_fragment(
+        self, document_type: DocumentType, node_field: SDocNodeField
+    ) -> str:
         prev_part = None
         parts_output = ""
         for part in node_field.parts:
@@ -152,8 +208,4 @@ class MarkupRenderer:
             else:
                 raise NotImplementedError
             prev_part = part
-
-        output = self.fragment_writer.write(parts_output)
-        self.cache[(document_type, node_field)] = output
-
-        return output
+        return parts_output
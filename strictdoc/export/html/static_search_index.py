@@ -0,0 +1,103 @@
+"""
+A compact format of the static HTML search index.
+
+The search box of the static HTML export finds all nodes that contain a token
+starting or ending with a search term. Instead of storing every prefix and
+every suffix of every token, the index stores the sorted dictionary of the
+whole tokens, and the browser finds the matching tokens with a binary search:
+
+- terms: all tokens, sorted.
+- postings: for each term, the sorted numbers of the nodes that contain it.
+- suffix_order: the indexes of the terms sorted by the reversed terms, which
+  makes the suffix search a binary search as well.
+
+The index is split into shards, one per document. The
+static_html_search_index.js file is a manifest that lists the current shard
+file of every document. The name of a shard file contains a hash of its
+content, so the browser downloads only the shards that have changed since it
+cached them.
+
+See static_html_search.js for the reading side.
+
+@relation(SDOC-SRS-155, scope=file)
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Set
+
+
+@dataclass
+class StaticSearchIndex:
+    # The folder with the shard files, relative to the manifest.
+    SHARDS_DIR = "search_index"
+
+    terms: List[str]
+    postings: List[List[int]]
+    suffix_order: List[int]
+
+    @classmethod
+    def create(cls, term_postings: Dict[str, Set[int]]) -> "StaticSearchIndex":
+        terms: List[str] = sorted(term_postings.keys())
+        return StaticSearchIndex(
+            terms=terms,
+            postings=[sorted(term_postings[term_]) for term_ in terms],
+            suffix_order=sorted(
+                range(len(terms)), key=lambda term_idx_: terms[term_idx_][::-1]
+            ),
+        )
+
+    @staticmethod
+    def create_manifest_entry(
+        shard_name: str, shard_file_name: str
+    ) -> Dict[str, str]:
+        return {
+            "name": shard_name,
+            "path": f"{StaticSearchIndex.SHARDS_DIR}/{shard_file_name}",
+        }
+
+    def lookup(self, query: str) -> Set[int]:
+        """
+        Find all nodes with a token that starts or ends with the query.
+
+        This mirrors the lookup that static_html_search.js does in the browser.
+        """
+
+        result: Set[int] = set()
+        for term_idx_ in self._iterate_matching_terms(query):
+            result.update(self.postings[term_idx_])
+        return result
+
+    def _iterate_matching_terms(self, query: str) -> Iterator[int]:
+        term_idx = self._lower_bound(
+            len(self.terms), lambda idx_: self.terms[idx_], query
+        )
+        while term_idx < len(self.terms) and self.terms[term_idx].startswith(
+            query
+        ):
+            yield term_idx
+            term_idx += 1
+
+        order_idx = self._lower_bound(
+            len(self.suffix_order),
+            lambda idx_: self.terms[self.suffix_order[idx_]][::-1],
+            query[::-1],
+        )
+        while order_idx < len(self.suffix_order):
+            term_idx = self.suffix_order[order_idx]
+            if not self.terms[term_idx].endswith(query):
+                break
+            yield term_idx
+            order_idx += 1
+
+    @staticmethod
+    def _lower_bound(
+        size: int, get_key: Callable[[int], str], value: str
+    ) -> int:
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            if get_key(middle) < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -1,9 +1,37 @@
+"""
+Rendering of RST fragments (node fields) to HTML.
+
+Every call of docutils' publish_parts() sets up a complete parser and writer,
+which costs much more than parsing a short fragment itself. Besides rendering
+single fragments, the writer renders all fragments of a document in one
+docutils run, see write_batch():
+
+- The fragments are joined into one RST source, separated by raw HTML
+  comments with a unique sentinel. The HTML body of the run is split at the
+  sentinels back into the HTML of every fragment.
+- A fragment is only rendered in a batch if its result cannot depend on the
+  other fragments. The fragments with section titles, document-wide targets
+  and definitions, a leading field list (docinfo) or an indented first line
+  (a block quote that would belong to the preceding separator) are rendered
+  on their own.
+- If docutils reports a problem, the fragment that the reported line belongs
+  to is rendered on its own to raise the same error as write() would. If
+  that fragment renders fine on its own, the whole batch falls back to
+  rendering every fragment separately.
+
+The rendered fragments are cached in memory in front of the persistent
+CacheStore, so that the same fragment is only looked up once per process.
+"""
+
+import bisect
 import hashlib
 import io
 import os
 import re
-from pathlib import Path
-from typing import Optional, Tuple
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from docutils.core import publish_parts
 from docutils.parsers.rst import directives, roles
@@ -11,6 +39,7 @@ from docutils.utils import SystemMessage
 from markupsafe import Markup
 
 from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.core.cache_store import CacheStore
 from strictdoc.core.project_config import ProjectConfig, ProjectFeature
 from strictdoc.export.rst.directives.raw_html_role import raw_html_role
 from strictdoc.export.rst.directives.sphinx_style_math import (
@@ -25,8 +54,37 @@ from strictdoc.export.rst.directives.wildcard_enhanced_image import (
     WildcardEnhancedImage,
 )
 
+# The underline or overline of a section title, or a transition.
+RST_ADORNMENT_LINE_REGEX = re.compile(
+    r"^([!-/:-@\[-`{-~])\1+[ \t]*$", re.MULTILINE
+)
+
+# The explicit markup whose effect is not limited to the fragment itself:
+# hyperlink targets, substitution definitions, footnotes and citations, and
+# the directives that change the whole document.
+RST_DOCUMENT_WIDE_MARKUP_REGEX = re.compile(
+    r"^[ \t]*(?:\.\. (?:_|\||\[|(?:contents|sectnum|section-numbering"
+    r"|header|footer|title|meta|include|role|default-role|target-notes)::)"
+    r"|__ )",
+    re.MULTILINE,
+)
+
+# A field list at the beginning of a document is transformed to docinfo.
+RST_LEADING_FIELD_LIST_REGEX = re.compile(r"\A\s*:[^:`\s][^:`]*:(?:\s|\Z)")
+
+# An indented first line would continue the content of the raw HTML separator
+# that precedes the fragment in a batch.
+RST_LEADING_INDENT_REGEX = re.compile(r"\A(?:[ \t]*\n)*[ \t]+\S")
+
 
 class RstToHtmlFragmentWriter:
+    # The rendered fragments of all writers of this process, least recently
+    # used first.
+    MEMORY_CACHE_MAX_SIZE = 32 * 1024 * 1024
+    _memory_cache: "OrderedDict[str, str]" = OrderedDict()
+    _memory_cache_size: int = 0
+    _memory_cache_lock: threading.Lock = threading.Lock()
+
     directives.register_directive("image", WildcardEnhancedImage)
 
     roles.register_local_role("rawhtml", raw_html_role)
@@ -38,14 +96,7 @@ class RstToHtmlFragmentWriter:
         context_document: Optional[SDocDocument],
     ):
         self.source_path: str
-        path_to_output_dir_md5: str = hashlib.md5(
-            project_config.output_dir.encode("utf-8")
-        ).hexdigest()
-
-        path_to_tmp_dir = project_config.get_path_to_cache_dir()
-        self.path_to_rst_cache_dir = os.path.join(
-            path_to_tmp_dir, "rst", path_to_output_dir_md5
-        )
+        self.project_config: ProjectConfig = project_config
 
         if context_document is not None:
             assert context_document.meta is not None
@@ -71,6 +122,13 @@ class RstToHtmlFragmentWriter:
             self.source_path = "<string>"
         self.context_document: Optional[SDocDocument] = context_document
 
+        # The rendered HTML depends on the document, e.g., the image and CSV
+        # paths are resolved against its output folder, so the cache keys
+        # contain the source path as well as the output root.
+        self.cache_key_prefix: str = hashlib.md5(
+            (project_config.output_dir + self.source_path).encode("utf-8")
+        ).hexdigest()
+
         if project_config.is_feature_activated(ProjectFeature.MATHJAX):
             if project_config.is_running_on_server:
                 roles.register_canonical_role("eq", eq_role_for_server)
@@ -84,36 +142,193 @@ class RstToHtmlFragmentWriter:
     def write(self, rst_fragment: str, use_cache: bool = True) -> Markup:
         assert isinstance(rst_fragment, str), rst_fragment
 
-        # Do not try to cache very small fragments.
-        if len(rst_fragment) < 40:
+        if not use_cache:
             return Markup(self._write_no_cache(rst_fragment))
 
-        path_to_rst_fragment_bucket_dir = os.path.join(
-            self.path_to_rst_cache_dir, str(len(rst_fragment))
-        )
+        cache_key = self._get_cache_key(rst_fragment)
+        cached_html = self._read_from_cache(rst_fragment, cache_key)
+        if cached_html is not None:
+            return Markup(cached_html)
+
+        rendered_html: str = self._write_no_cache(rst_fragment)
+        self._save_to_cache(rst_fragment, cache_key, rendered_html)
+
+        return Markup(rendered_html)
+
+    def write_batch(self, rst_fragments: List[str]) -> List[Markup]:
+        """
+        Render many RST fragments, with as few docutils runs as possible.
+
+        The result is the same as calling write() for every fragment.
+        """
+
+        rendered_html: List[Optional[str]] = [None] * len(rst_fragments)
+        uncached_fragments: Dict[str, List[int]] = {}
+        for fragment_idx_, rst_fragment_ in enumerate(rst_fragments):
+            assert isinstance(rst_fragment_, str), rst_fragment_
+            cached_html = self._read_from_cache(
+                rst_fragment_, self._get_cache_key(rst_fragment_)
+            )
+            if cached_html is not None:
+                rendered_html[fragment_idx_] = cached_html
+            else:
+                uncached_fragments.setdefault(rst_fragment_, []).append(
+                    fragment_idx_
+                )
+
+        batched_fragments: List[str] = []
+        for rst_fragment_, fragment_idxs_ in uncached_fragments.items():
+            if self._can_render_in_batch(rst_fragment_):
+                batched_fragments.append(rst_fragment_)
+                continue
+            fragment_html = self._write_no_cache(rst_fragment_)
+            self._save_to_cache(
+                rst_fragment_,
+                self._get_cache_key(rst_fragment_),
+                fragment_html,
+            )
+            for fragment_idx_ in fragment_idxs_:
+                rendered_html[fragment_idx_] = fragment_html
+
+        for rst_fragment_, fragment_html_ in zip(
+            batched_fragments, self._write_batch_no_cache(batched_fragments)
+        ):
+            self._save_to_cache(
+                rst_fragment_,
+                self._get_cache_key(rst_fragment_),
+                fragment_html_,
+            )
+            for fragment_idx_ in uncached_fragments[rst_fragment_]:
+                rendered_html[fragment_idx_] = fragment_html_
+
+        return [Markup(html_) for html_ in rendered_html]
+
+    @classmethod
+    def clear_memory_cache(cls) -> None:
+        with cls._memory_cache_lock:
+            cls._memory_cache.clear()
+            cls._memory_cache_size = 0
+
+    def _get_cache_key(self, rst_fragment: str) -> str:
         fragment_md5 = hashlib.md5(rst_fragment.encode("utf-8")).hexdigest()
-        path_to_cached_fragment = os.path.join(
-            path_to_rst_fragment_bucket_dir, fragment_md5
+        return f"{self.cache_key_prefix}/{fragment_md5}"
+
+    def _read_from_cache(
+        self, rst_fragment: str, cache_key: str
+    ) -> Optional[str]:
+        memory_cache = RstToHtmlFragmentWriter._memory_cache
+        with RstToHtmlFragmentWriter._memory_cache_lock:
+            cached_html: Optional[str] = memory_cache.get(cache_key)
+            if cached_html is not None:
+                memory_cache.move_to_end(cache_key)
+                return cached_html
+
+        # Do not try to cache very small fragments on disk.
+        if len(rst_fragment) < 40:
+            return None
+
+        cache_store = CacheStore.get_instance(self.project_config)
+        cached_fragment: Optional[bytes] = cache_store.get("rst", cache_key)
+        if cached_fragment is None:
+            return None
+        cached_html = cached_fragment.decode("UTF-8")
+        self._save_to_memory_cache(cache_key, cached_html)
+        return cached_html
+
+    def _save_to_cache(
+        self, rst_fragment: str, cache_key: str, rendered_html: str
+    ) -> None:
+        self._save_to_memory_cache(cache_key, rendered_html)
+        if len(rst_fragment) >= 40:
+            cache_store = CacheStore.get_instance(self.project_config)
+            cache_store.put("rst", cache_key, rendered_html.encode("UTF-8"))
+
+    @classmethod
+    def _save_to_memory_cache(cls, cache_key: str, rendered_html: str) -> None:
+        with cls._memory_cache_lock:
+            memory_cache = cls._memory_cache
+            previous_html = memory_cache.pop(cache_key, None)
+            if previous_html is not None:
+                cls._memory_cache_size -= len(previous_html)
+            memory_cache[cache_key] = rendered_html
+            cls._memory_cache_size += len(rendered_html)
+            while cls._memory_cache_size > cls.MEMORY_CACHE_MAX_SIZE:
+                _, evicted_html = memory_cache.popitem(last=False)
+                cls._memory_cache_size -= len(evicted_html)
+
+    @staticmethod
+    def _can_render_in_batch(rst_fragment: str) -> bool:
+        return (
+            RST_ADORNMENT_LINE_REGEX.search(rst_fragment) is None
+            and RST_DOCUMENT_WIDE_MARKUP_REGEX.search(rst_fragment) is None
+            and RST_LEADING_FIELD_LIST_REGEX.match(rst_fragment) is None
+            and RST_LEADING_INDENT_REGEX.match(rst_fragment) is None
         )
-        if use_cache and os.path.isdir(path_to_rst_fragment_bucket_dir):
-            if os.path.isfile(path_to_cached_fragment):
-                with open(
-                    path_to_cached_fragment, "rb"
-                ) as cached_fragment_file_:
-                    return Markup(cached_fragment_file_.read().decode("UTF-8"))
-        else:
-            Path(path_to_rst_fragment_bucket_dir).mkdir(
-                parents=True, exist_ok=True
-            )
 
-        rendered_html: str = self._write_no_cache(rst_fragment)
-        rendered_html_bytes = rendered_html.encode("UTF-8")
+    def _write_batch_no_cache(self, rst_fragments: List[str]) -> List[str]:
+        if len(rst_fragments) < 2:
+            return [
+                self._write_no_cache(rst_fragment_)
+                for rst_fragment_ in rst_fragments
+            ]
 
-        if use_cache:
-            with open(path_to_cached_fragment, "wb") as cached_fragment_file_:
-                cached_fragment_file_.write(rendered_html_bytes)
+        sentinel = f"<!-- strictdoc-fragment-{uuid.uuid4().hex} -->"
+        separator = f"\n\n.. raw:: html\n\n   {sentinel}\n\n"
+        separator_lines = separator.count("\n")
+        rst_source_parts: List[str] = [separator]
+        # The first line of every fragment in the joined source.
+        fragment_lines: List[int] = []
+        next_line = separator_lines + 1
+        for rst_fragment_ in rst_fragments:
+            fragment_lines.append(next_line)
+            next_line += rst_fragment_.count("\n") + separator_lines
+            rst_source_parts.extend((rst_fragment_, separator))
+        rst_source = "".join(rst_source_parts)
 
-        return Markup(rendered_html)
+        warning_stream = io.StringIO()
+        try:
+            output = publish_parts(
+                rst_source,
+                writer_name="html",
+                settings_overrides={"warning_stream": warning_stream},
+                source_path=self.source_path,
+            )
+        except SystemMessage:
+            output = None
+
+        html_parts = (
+            output["html_body"].split(sentinel)
+            if output is not None and warning_stream.tell() == 0
+            else []
+        )
+        if len(html_parts) != len(rst_fragments) + 2:
+            # Render the fragment with the reported problem on its own to
+            # raise the same error as write(). Otherwise, the batch is not
+            # reliable and every fragment is rendered on its own.
+            match = re.search(
+                r".*:(?P<line>\d+): \(.*\) ", warning_stream.getvalue()
+            )
+            if match is not None:
+                fragment_idx = (
+                    bisect.bisect_right(
+                        fragment_lines, int(match.group("line"))
+                    )
+                    - 1
+                )
+                if fragment_idx >= 0:
+                    self._write_no_cache(rst_fragments[fragment_idx])
+            return [
+                self._write_no_cache(rst_fragment_)
+                for rst_fragment_ in rst_fragments
+            ]
+
+        # html_parts: the opening tag of the document, the fragments, the
+        # closing tag of the document.
+        document_start, document_end = html_parts[0], html_parts[-1]
+        return [
+            document_start + fragment_html_ + document_end
+            for fragment_html_ in html_parts[1:-1]
+        ]
 
     def _write_no_cache(self, rst_fragment: str) -> str:
         assert isinstance(rst_fragment, str), rst_fragment
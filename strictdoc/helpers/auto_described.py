@@ -2,7 +2,16 @@
 # for simplicity.
 __version__ = "0.0.1"
 
-from typing import Any, Callable, Optional, Type, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 T = TypeVar("T", bound=Type[Any])
 
@@ -43,13 +52,28 @@ def auto_described(
     return factory
 
 
+def get_attributes(obj: object) -> Dict[str, Any]:
+    """
+    Return the attributes of an object, including the ones stored in the
+    __slots__ of its class and base classes.
+    """
+
+    attributes: Dict[str, Any] = dict(getattr(obj, "__dict__", {}))
+    for clz in reversed(type(obj).__mro__):
+        slots = clz.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                attributes[slot] = getattr(obj, slot)
+    return attributes
+
+
 def auto_str(obj: object) -> str:
     items = []
 
     # This is a rather defensive implementation that prevents auto_str from
     # breaking on the objects with recursive references:
     # Example: A -> B -> A.
-    for prop, value in obj.__dict__.items():
+    for prop, value in get_attributes(obj).items():
         if isinstance(value, list):
             if len(value) == 0:
                 item = f"{prop} = []"
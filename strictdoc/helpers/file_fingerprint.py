@@ -0,0 +1,151 @@
+"""
+Cheap file fingerprints backed by a single manifest file.
+
+Calculating an MD5 checksum requires reading a whole file. For the cache
+lookups, it is enough to know that a file has not changed since its checksum
+was calculated, which can be decided by comparing the file size, the
+modification time and the inode number. The manifest stores these stat values
+together with the last known MD5 checksum of each file, so that a full hashing
+only happens when the stat values of a file change.
+
+The manifest is an append-only text file that is shared by all StrictDoc
+processes, including the worker processes of the parallelizer. Every update is
+written as a single line with a single write call, and the last line of a given
+file wins when the manifest is read.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from strictdoc.helpers.md5 import get_file_md5
+
+
+class FileFingerprint(NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @staticmethod
+    def create_from_stat(file_stat: os.stat_result) -> "FileFingerprint":
+        return FileFingerprint(
+            file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino
+        )
+
+
+class FileFingerprintManifest:
+    # A file that was modified within this time window before its checksum was
+    # calculated could be modified again without changing its modification
+    # time (a coarse file system timestamp resolution). Such "racily clean"
+    # files are always re-hashed until they become old enough.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    # The manifest is compacted when it contains more outdated lines than
+    # actual entries.
+    COMPACTION_MIN_LINES = 1000
+
+    _instances: Dict[str, "FileFingerprintManifest"] = {}
+
+    def __init__(self, path_to_manifest: str) -> None:
+        self.path_to_manifest: str = path_to_manifest
+        self.entries: Dict[str, Tuple[FileFingerprint, str]] = {}
+        self._load()
+
+    @staticmethod
+    def get_instance(path_to_manifest: str) -> "FileFingerprintManifest":
+        """
+        Return a manifest that is loaded only once per process.
+        """
+
+        manifest: Optional[FileFingerprintManifest] = (
+            FileFingerprintManifest._instances.get(path_to_manifest)
+        )
+        if manifest is None:
+            manifest = FileFingerprintManifest(path_to_manifest)
+            FileFingerprintManifest._instances[path_to_manifest] = manifest
+        return manifest
+
+    def get_file_md5(self, path_to_file: str, verify_content: bool) -> str:
+        """
+        Return the MD5 checksum of a file, re-hashing only if it has changed.
+
+        If verify_content is True, the file content is always hashed, and the
+        manifest is only used to keep the stored checksums up to date.
+        """
+
+        file_stat = os.stat(path_to_file)
+        fingerprint = FileFingerprint.create_from_stat(file_stat)
+
+        entry = self.entries.get(path_to_file)
+        if not verify_content and entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        file_md5: str = get_file_md5(path_to_file)
+
+        if (
+            entry is None or entry[0] != fingerprint or entry[1] != file_md5
+        ) and time.time_ns() - file_stat.st_mtime_ns > self.RACY_WINDOW_NS:
+            self.entries[path_to_file] = (fingerprint, file_md5)
+            self._append(path_to_file, fingerprint, file_md5)
+
+        return file_md5
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.path_to_manifest):
+            return
+
+        with open(self.path_to_manifest, encoding="utf8") as manifest_file:
+            lines = manifest_file.readlines()
+
+        for line_ in lines:
+            # A line can be incomplete if another process is writing it right
+            # now. Such lines are simply ignored.
+            parts = line_.rstrip("\n").split("\t", 4)
+            if len(parts) != 5 or not line_.endswith("\n"):
+                continue
+            file_md5, size, mtime_ns, inode, path_to_file = parts
+            try:
+                fingerprint = FileFingerprint(
+                    int(size), int(mtime_ns), int(inode)
+                )
+            except ValueError:
+                continue
+            self.entries[path_to_file] = (fingerprint, file_md5)
+
+        if len(lines) > max(self.COMPACTION_MIN_LINES, 2 * len(self.entries)):
+            self._compact()
+
+    def _append(
+        self, path_to_file: str, fingerprint: FileFingerprint, file_md5: str
+    ) -> None:
+        Path(os.path.dirname(self.path_to_manifest)).mkdir(
+            parents=True, exist_ok=True
+        )
+        with open(self.path_to_manifest, "a", encoding="utf8") as manifest_file:
+            manifest_file.write(
+                self._serialize_entry(path_to_file, fingerprint, file_md5)
+            )
+
+    def _compact(self) -> None:
+        path_to_tmp_manifest = f"{self.path_to_manifest}.{os.getpid()}.tmp"
+        with open(path_to_tmp_manifest, "w", encoding="utf8") as manifest_file:
+            for path_to_file_, (
+                fingerprint_,
+                file_md5_,
+            ) in self.entries.items():
+                manifest_file.write(
+                    self._serialize_entry(
+                        path_to_file_, fingerprint_, file_md5_
+                    )
+                )
+        os.replace(path_to_tmp_manifest, self.path_to_manifest)
+
+    @staticmethod
+    def _serialize_entry(
+        path_to_file: str, fingerprint: FileFingerprint, file_md5: str
+    ) -> str:
+        return (
+            f"{file_md5}\t{fingerprint.size}\t{fingerprint.mtime_ns}\t"
+            f"{fingerprint.inode}\t{path_to_file}\n"
+        )
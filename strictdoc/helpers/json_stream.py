@@ -0,0 +1,127 @@
+"""
+Incremental reading of large JSON documents.
+
+The JSON reports produced by other tools, such as the gcov coverage reports,
+can be hundreds of megabytes large, while only one array of the top-level
+object is of interest and each of its items can be converted on its own.
+json.load() keeps the whole decoded document in memory, so the items of the
+array are instead decoded one by one from a buffer that only holds the
+not-yet-consumed part of the stream.
+"""
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+WHITESPACE_REGEX = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamBuffer:
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        assert chunk_size > 0, chunk_size
+        self.stream: TextIO = stream
+        self.chunk_size: int = chunk_size
+        self.buffer: str = ""
+        self.position: int = 0
+        self.eof: bool = False
+        self.decoder: json.JSONDecoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """
+        Skip the whitespace and return the next character without consuming it.
+        """
+
+        while True:
+            match = WHITESPACE_REGEX.match(self.buffer, self.position)
+            assert match is not None
+            self.position = match.end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read_more():
+                raise json.JSONDecodeError(
+                    "Unexpected end of data", self.buffer, self.position
+                )
+
+    def consume(self, expected_chars: str) -> str:
+        char = self.peek()
+        if char not in expected_chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of: {expected_chars!r}",
+                self.buffer,
+                self.position,
+            )
+        self.position += 1
+        return char
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                # The value continues in the part of the stream that has not
+                # been read yet.
+                if self._read_more():
+                    continue
+                raise
+            # A number at the end of the buffer can continue in the next chunk.
+            if end == len(self.buffer) and self._read_more():
+                continue
+            self.position = end
+            return value
+
+    def _read_more(self) -> bool:
+        if self.eof:
+            return False
+        # Drop the consumed part of the buffer. The chunk grows with the
+        # unconsumed part, so that a value that spans many chunks is decoded
+        # a logarithmic number of times.
+        self.buffer = self.buffer[self.position :]
+        self.position = 0
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer)))
+        if len(chunk) == 0:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+
+def iterate_json_array_items(
+    stream: TextIO, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Any]:
+    """
+    Yield the decoded items of the array stored under a top-level object key.
+
+    The values of the other top-level keys are decoded and discarded. If the
+    key is missing or its value is not an array, nothing is yielded.
+    Malformed input raises json.JSONDecodeError.
+    """
+
+    buffer = _JSONStreamBuffer(stream, chunk_size)
+    buffer.consume("{")
+    if buffer.peek() == "}":
+        return
+    while True:
+        if buffer.peek() != '"':
+            raise json.JSONDecodeError(
+                "Expecting property name enclosed in double quotes",
+                buffer.buffer,
+                buffer.position,
+            )
+        name = buffer.decode_value()
+        buffer.consume(":")
+        if name == key and buffer.peek() == "[":
+            buffer.consume("[")
+            if buffer.peek() == "]":
+                buffer.consume("]")
+            else:
+                while True:
+                    yield buffer.decode_value()
+                    if buffer.consume(",]") == "]":
+                        break
+        else:
+            buffer.decode_value()
+        if buffer.consume(",}") == "}":
+            return
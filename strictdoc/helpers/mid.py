@@ -2,6 +2,8 @@ import uuid
 
 
 class MID(str):
+    __slots__ = ()
+
     def __new__(cls, mid_value: str) -> "MID":
         assert isinstance(mid_value, str) and len(mid_value) > 0, mid_value
         return super().__new__(cls, mid_value)
@@ -6,8 +6,25 @@ Run StrictDoc child tasks as separate processes.
 
 import multiprocessing
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from itertools import islice, repeat
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+)
 
 from strictdoc import environment
 from strictdoc.helpers.exception import (
@@ -16,6 +33,12 @@ from strictdoc.helpers.exception import (
 )
 
 MultiprocessingLambdaType = Callable[[Any], Any]
+MultiprocessingContextLambdaType = Callable[[Any, Any], Any]
+
+# The context shared by all tasks of run_parallel_with_context(). It is set
+# once per worker process by the pool initializer, so that a large object
+# (e.g., the traceability index) is not pickled together with every task.
+_worker_state: Dict[str, Any] = {"context": None}
 
 
 def processing_func_wrapper(
@@ -28,6 +51,28 @@ def processing_func_wrapper(
         return None, StrictDocChildProcessException(ExceptionInfo(exception_))
 
 
+def processing_chunk_wrapper(
+    func: MultiprocessingLambdaType, input_args: List[Any]
+) -> List[Tuple[Optional[Any], Optional[StrictDocChildProcessException]]]:
+    return [
+        processing_func_wrapper(func, input_arg_) for input_arg_ in input_args
+    ]
+
+
+def initialize_worker_context(context: Any) -> None:
+    _worker_state["context"] = context
+
+
+def processing_func_with_context_wrapper(
+    func: MultiprocessingContextLambdaType, input_arg: Any
+) -> Tuple[Optional[Any], Optional[StrictDocChildProcessException]]:
+    try:
+        result = func(_worker_state["context"], input_arg)
+        return result, None
+    except Exception as exception_:
+        return None, StrictDocChildProcessException(ExceptionInfo(exception_))
+
+
 class Parallelizer(ABC):
     @staticmethod
     def create(parallelize: bool) -> "Parallelizer":
@@ -43,13 +88,65 @@ class Parallelizer(ABC):
     ) -> Iterable[Any]:
         raise NotImplementedError
 
+    @abstractmethod
+    def run_parallel_streaming(
+        self,
+        contents: Iterable[Any],
+        processing_func: MultiprocessingLambdaType,
+        chunk_size: Optional[int] = None,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Run processing_func(item) for each item of contents and yield the
+        results while the remaining items are still being processed.
+
+        The items are sent to the workers in chunks of chunk_size items, so
+        that the function and its bound arguments are pickled once per chunk,
+        not once per item. By default, the chunk size is chosen so that each
+        worker gets a few chunks. At most max_chunks_in_flight chunks are
+        submitted or waiting to be yielded at a time, so the contents can be
+        a lazy iterable and a slow consumer does not make the results pile up.
+
+        If ordered is True, the results are yielded in the order of the
+        contents. Otherwise, they are yielded in the order in which the chunks
+        complete.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def run_parallel_with_context(
+        self,
+        contents: List[Any],
+        processing_func: MultiprocessingContextLambdaType,
+        context: Any,
+    ) -> Iterable[Any]:
+        """
+        Run processing_func(context, item) for each item of contents.
+
+        The context is delivered to each worker process only once, when the
+        worker starts, and the items are submitted in chunks. This makes it
+        possible to distribute many small work units that all need access to
+        the same large read-only object. The order of the results matches the
+        order of the contents.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def shutdown(self) -> None:
         raise NotImplementedError
 
 
 class MultiprocessingParallelizer(Parallelizer):
+    # The chunk size for contents without a known length.
+    DEFAULT_CHUNK_SIZE = 16
+
     def __init__(self) -> None:
+        """
+        Create a pool of worker processes that is reused by all parallel runs
+        except run_parallel_with_context(), which needs its own workers.
+        """
+
         process_number: int = multiprocessing.cpu_count()
 
         if environment.is_github_ci_windows():  # pragma: no cover
@@ -62,6 +159,7 @@ class MultiprocessingParallelizer(Parallelizer):
             )
             process_number = 2
 
+        self.process_number: int = process_number
         self.executor = ProcessPoolExecutor(max_workers=process_number)
 
     def run_parallel(
@@ -89,6 +187,111 @@ class MultiprocessingParallelizer(Parallelizer):
         except Exception as e:
             raise e
 
+    def run_parallel_streaming(
+        self,
+        contents: Iterable[Any],
+        processing_func: MultiprocessingLambdaType,
+        chunk_size: Optional[int] = None,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        if chunk_size is None:
+            chunk_size = (
+                max(1, len(contents) // (self.process_number * 4))
+                if isinstance(contents, Sized)
+                else self.DEFAULT_CHUNK_SIZE
+            )
+        if max_chunks_in_flight is None:
+            max_chunks_in_flight = self.process_number * 2
+        assert chunk_size > 0 and max_chunks_in_flight > 0
+
+        contents_iterator = iter(contents)
+        future_to_chunk_index: Dict[Future[Any], int] = {}
+        # The chunks that completed before the chunks that precede them.
+        completed_chunks: Dict[int, List[Any]] = {}
+        next_chunk_index = 0
+        next_chunk_index_to_yield = 0
+        has_more_contents = True
+        try:
+            while True:
+                while (
+                    has_more_contents
+                    and len(future_to_chunk_index) + len(completed_chunks)
+                    < max_chunks_in_flight
+                ):
+                    chunk = list(islice(contents_iterator, chunk_size))
+                    if len(chunk) == 0:
+                        has_more_contents = False
+                        break
+                    future = self.executor.submit(
+                        processing_chunk_wrapper, processing_func, chunk
+                    )
+                    future_to_chunk_index[future] = next_chunk_index
+                    next_chunk_index += 1
+
+                if len(future_to_chunk_index) == 0:
+                    assert len(completed_chunks) == 0
+                    return
+
+                done_futures, _ = wait(
+                    future_to_chunk_index, return_when=FIRST_COMPLETED
+                )
+                for future_ in done_futures:
+                    chunk_index = future_to_chunk_index.pop(future_)
+                    chunk_results = []
+                    for result_, exception_ in future_.result():
+                        if exception_ is not None:
+                            raise exception_
+                        chunk_results.append(result_)
+                    if ordered:
+                        completed_chunks[chunk_index] = chunk_results
+                    else:
+                        yield from chunk_results
+
+                while next_chunk_index_to_yield in completed_chunks:
+                    yield from completed_chunks.pop(next_chunk_index_to_yield)
+                    next_chunk_index_to_yield += 1
+        finally:
+            # The consumer stopped early, or a task failed.
+            for future_ in future_to_chunk_index:
+                future_.cancel()
+
+    def run_parallel_with_context(
+        self,
+        contents: List[Any],
+        processing_func: MultiprocessingContextLambdaType,
+        context: Any,
+    ) -> Iterable[Any]:
+        if len(contents) == 0:
+            return []
+
+        # A few chunks per process is a compromise between the IPC overhead
+        # of many small tasks and the load balancing between the workers.
+        chunk_size = max(1, len(contents) // (self.process_number * 4))
+
+        # A dedicated pool is needed because the context can only be passed
+        # to the worker processes when they are started. With the fork start
+        # method, the workers inherit the context without pickling it, which
+        # is cheaper than sending a large context to the workers of the
+        # shared pool. A small context is better bound to the processing
+        # function and passed to run_parallel_streaming() instead.
+        with ProcessPoolExecutor(
+            max_workers=min(self.process_number, len(contents)),
+            initializer=initialize_worker_context,
+            initargs=(context,),
+        ) as executor:
+            results = []
+            for result_, exception_ in executor.map(
+                processing_func_with_context_wrapper,
+                repeat(processing_func),
+                contents,
+                chunksize=chunk_size,
+            ):
+                if exception_ is not None:
+                    raise exception_
+                results.append(result_)
+            return results
+
     def shutdown(self) -> None:
         self.executor.shutdown(wait=True)
 
@@ -104,5 +307,27 @@ class NullParallelizer(Parallelizer):
             results.append(processing_func(content))
         return results
 
+    def run_parallel_streaming(
+        self,
+        contents: Iterable[Any],
+        processing_func: MultiprocessingLambdaType,
+        chunk_size: Optional[int] = None,  # noqa: ARG002
+        max_chunks_in_flight: Optional[int] = None,  # noqa: ARG002
+        ordered: bool = True,  # noqa: ARG002
+    ) -> Iterator[Any]:
+        for content in contents:
+            yield processing_func(content)
+
+    def run_parallel_with_context(
+        self,
+        contents: List[Any],
+        processing_func: MultiprocessingContextLambdaType,
+        context: Any,
+    ) -> Iterable[Any]:
+        results = []
+        for content in contents:
+            results.append(processing_func(context, content))
+        return results
+
     def shutdown(self) -> None:
         pass
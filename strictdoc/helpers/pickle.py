@@ -2,8 +2,8 @@ import pickle
 from typing import Any, Optional
 
 
-def pickle_dump(obj: Any) -> bytes:
-    return pickle.dumps(obj, 0)
+def pickle_dump(obj: Any, protocol: int = 0) -> bytes:
+    return pickle.dumps(obj, protocol)
 
 
 def pickle_load(content: bytes) -> Optional[Any]:
@@ -3,6 +3,27 @@ from typing import Any, Protocol
 from textx import get_model
 
 
+class TextXPositionSlots:
+    """
+    A base class of the model classes with __slots__ that provides the slots
+    for the source positions that textX assigns to the parsed objects.
+
+    When a meta-model is created, textX assigns class attributes with the
+    same names to every user class. These class attributes shadow the slots
+    and must be removed with restore_position_slots().
+    """
+
+    __slots__ = ("_tx_position", "_tx_position_end")
+
+
+def restore_position_slots(meta_model: Any) -> None:
+    for user_class_ in meta_model.user_classes.values():
+        if issubclass(user_class_, TextXPositionSlots):
+            for attr_name_ in TextXPositionSlots.__slots__:
+                if attr_name_ in user_class_.__dict__:
+                    delattr(user_class_, attr_name_)
+
+
 def drop_textx_meta(textx_object: Any) -> None:
     textx_object._tx_parser = None  # pylint: disable=protected-access
     textx_object._tx_attrs = None  # pylint: disable=protected-access
@@ -6,6 +6,7 @@ from typing import Callable, Iterator, TypeVar
 from typing_extensions import ParamSpec
 
 from strictdoc.helpers.math import round_up
+from strictdoc.helpers.tracing import TraceCategory, get_tracer
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -16,8 +17,18 @@ def timing_decorator(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
         @wraps(func)
         def wrap(*args: P.args, **kw: P.kwargs) -> R:
             print(f"Step '{name}' start.", flush=True)  # noqa: T201
+            tracer = get_tracer()
+            span = (
+                tracer.start_span(name, TraceCategory.PHASE)
+                if tracer is not None
+                else None
+            )
             time_start = time()
-            result = func(*args, **kw)
+            try:
+                result = func(*args, **kw)
+            finally:
+                if tracer is not None and span is not None:
+                    tracer.end_span(span)
             time_end = time()
             print(  # noqa: T201
                 f"Step '{name}' took: {round_up(time_end - time_start, 2)} sec.",
@@ -31,9 +42,19 @@ def timing_decorator(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
 
 
 @contextlib.contextmanager
-def measure_performance(title: str) -> Iterator[None]:
+def measure_performance(
+    title: str, category: str = TraceCategory.STEP
+) -> Iterator[None]:
+    tracer = get_tracer()
+    span = tracer.start_span(title, category) if tracer is not None else None
     time_start = time()
-    yield
+    try:
+        yield
+    finally:
+        # The span is closed even if the measured step fails, so that the
+        # trace stays well-formed.
+        if tracer is not None and span is not None:
+            tracer.end_span(span)
     time_end = time()
 
     time_diff = time_end - time_start
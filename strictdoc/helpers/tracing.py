@@ -0,0 +1,279 @@
+"""
+Structured tracing of StrictDoc's performance.
+
+When tracing is enabled with "strictdoc --trace-output <path> <command>",
+every measure_performance() block and every timing_decorator() step is
+recorded as a span with its name, category, process and thread, wall time,
+CPU time and the peak memory of its process. The spans of all processes,
+including the worker processes of the parallelizer, are merged into a file in
+the Chrome trace-event format, which can be opened with chrome://tracing or
+https://ui.perfetto.dev, and a summary of the phases is printed.
+
+Each process appends its spans to its own file in a temporary folder. The
+folder is passed to the worker processes through an environment variable, so
+that the workers started with both "fork" and "spawn" record their spans.
+
+When tracing is disabled, a span only costs a check of a module variable.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# The resource module is not available on Windows.
+if sys.platform != "win32":
+    import resource
+
+
+class TraceCategory:
+    PHASE = "phase"
+    DOCUMENT = "document"
+    SOURCE_FILE = "source file"
+    STEP = "step"
+
+    ALL = [PHASE, DOCUMENT, SOURCE_FILE, STEP]
+
+
+class TraceSpan:
+    __slots__ = ("category", "cpu_time_start", "name", "time_start")
+
+    def __init__(self, name: str, category: str) -> None:
+        self.name: str = name
+        self.category: str = category
+        self.time_start: float = time.time()
+        self.cpu_time_start: float = time.thread_time()
+
+
+class Tracer:
+    ENV_TRACE_DIR = "STRICTDOC_TRACE_DIR"
+
+    def __init__(self, path_to_trace_dir: str) -> None:
+        self.path_to_trace_dir: str = path_to_trace_dir
+        self.lock: threading.Lock = threading.Lock()
+        # A forked worker process inherits the tracer of the main process, so
+        # the file is opened again when the process has changed.
+        self._trace_file: Optional[TextIO] = None
+        self._trace_file_pid: Optional[int] = None
+
+    @staticmethod
+    def enable() -> "Tracer":
+        global _tracer  # noqa: PLW0603
+        assert _tracer is None, "Tracing is already enabled."
+        path_to_trace_dir = tempfile.mkdtemp(prefix="strictdoc_trace_")
+        os.environ[Tracer.ENV_TRACE_DIR] = path_to_trace_dir
+        _tracer = Tracer(path_to_trace_dir)
+        return _tracer
+
+    @staticmethod
+    def disable() -> None:
+        global _tracer  # noqa: PLW0603
+        if _tracer is None:
+            return
+        _tracer.close()
+        shutil.rmtree(_tracer.path_to_trace_dir, ignore_errors=True)
+        os.environ.pop(Tracer.ENV_TRACE_DIR, None)
+        _tracer = None
+
+    def start_span(self, name: str, category: str) -> TraceSpan:
+        return TraceSpan(name, category)
+
+    def end_span(self, span: TraceSpan) -> None:
+        time_end = time.time()
+        cpu_time = time.thread_time() - span.cpu_time_start
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": int(span.time_start * 1_000_000),
+            "dur": int((time_end - span.time_start) * 1_000_000),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {
+                "cpu_ms": round(cpu_time * 1000, 3),
+                "peak_memory_mb": get_peak_memory_mb(),
+            },
+        }
+        line = json.dumps(event) + "\n"
+        with self.lock:
+            self._get_trace_file().write(line)
+
+    def close(self) -> None:
+        with self.lock:
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+                self._trace_file_pid = None
+
+    def collect_events(self) -> List[Dict[str, Any]]:
+        """
+        Return the spans recorded by all processes, sorted by their start.
+        """
+
+        self.close()
+        events: List[Dict[str, Any]] = []
+        for file_name_ in sorted(os.listdir(self.path_to_trace_dir)):
+            with open(
+                os.path.join(self.path_to_trace_dir, file_name_),
+                encoding="utf-8",
+            ) as trace_file_:
+                for line_ in trace_file_:
+                    # A worker can be killed in the middle of writing a line.
+                    if line_.endswith("\n"):
+                        events.append(json.loads(line_))
+        events.sort(key=lambda event_: (event_["ts"], -event_["dur"]))
+        return events
+
+    def write_chrome_trace(self, path_to_output: str) -> List[Dict[str, Any]]:
+        events = self.collect_events()
+
+        main_pid = os.getpid()
+        metadata_events: List[Dict[str, Any]] = []
+        for pid_ in sorted({event_["pid"] for event_ in events} | {main_pid}):
+            metadata_events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid_,
+                    "args": {
+                        "name": "strictdoc"
+                        if pid_ == main_pid
+                        else f"strictdoc worker {pid_}"
+                    },
+                }
+            )
+
+        output_dir = os.path.dirname(os.path.abspath(path_to_output))
+        os.makedirs(output_dir, exist_ok=True)
+        with open(path_to_output, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {
+                    "traceEvents": metadata_events + events,
+                    "displayTimeUnit": "ms",
+                },
+                output_file,
+            )
+        return events
+
+    def _get_trace_file(self) -> TextIO:
+        pid = os.getpid()
+        if self._trace_file is None or self._trace_file_pid != pid:
+            # The file is line-buffered: the worker processes exit without
+            # flushing their files, and a forked process must not inherit
+            # the unwritten spans of its parent.
+            self._trace_file = open(  # noqa: SIM115
+                os.path.join(self.path_to_trace_dir, f"{pid}.jsonl"),
+                "a",
+                buffering=1,
+                encoding="utf-8",
+            )
+            self._trace_file_pid = pid
+        return self._trace_file
+
+
+def get_peak_memory_mb() -> Optional[float]:
+    if sys.platform == "win32":  # pragma: no cover
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak resident set size is reported in bytes on macOS and in
+    # kilobytes on Linux.
+    if sys.platform != "darwin":
+        max_rss *= 1024
+    return round(max_rss / (1024 * 1024), 1)
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+@contextlib.contextmanager
+def trace_span(name: str, category: str) -> Iterator[None]:
+    """
+    Record a span like measure_performance() but without printing its time.
+    """
+
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+    span = tracer.start_span(name, category)
+    try:
+        yield
+    finally:
+        tracer.end_span(span)
+
+
+def create_trace_report(events: List[Dict[str, Any]]) -> str:
+    """
+    Summarize the recorded spans: the wall and CPU time of each phase, the
+    totals of the documents and source files and the peak memory.
+    """
+
+    def format_line_(title: str, value: str) -> str:
+        return f"{title} ".ljust(60, ".") + f" {value}"
+
+    main_pid = os.getpid()
+    lines: List[str] = ["Trace summary:"]
+    for event_ in events:
+        if event_["cat"] == TraceCategory.PHASE and event_["pid"] == main_pid:
+            lines.append(
+                format_line_(
+                    event_["name"],
+                    f"{event_['dur'] / 1_000_000:0.2f}s wall, "
+                    f"{event_['args']['cpu_ms'] / 1000:0.2f}s CPU",
+                )
+            )
+
+    for category_, title_ in (
+        (TraceCategory.DOCUMENT, "Documents"),
+        (TraceCategory.SOURCE_FILE, "Source files"),
+    ):
+        category_events = [
+            event_ for event_ in events if event_["cat"] == category_
+        ]
+        if len(category_events) == 0:
+            continue
+        slowest_event = max(category_events, key=lambda event_: event_["dur"])
+        lines.append(
+            format_line_(
+                title_,
+                f"{len(category_events)} spans, "
+                f"{sum(event_['dur'] for event_ in category_events) / 1_000_000:0.2f}s "
+                f"total, slowest: {slowest_event['name']} "
+                f"({slowest_event['dur'] / 1_000_000:0.2f}s)",
+            )
+        )
+
+    peak_memory_by_pid: Dict[int, float] = {}
+    for event_ in events:
+        peak_memory_mb = event_["args"].get("peak_memory_mb")
+        if peak_memory_mb is not None:
+            peak_memory_by_pid[event_["pid"]] = max(
+                peak_memory_by_pid.get(event_["pid"], 0.0), peak_memory_mb
+            )
+    if len(peak_memory_by_pid) > 0:
+        peak_memory_report = f"{peak_memory_by_pid.get(main_pid, 0.0)} MB"
+        worker_peak_memory = [
+            peak_memory_mb_
+            for pid_, peak_memory_mb_ in peak_memory_by_pid.items()
+            if pid_ != main_pid
+        ]
+        if len(worker_peak_memory) > 0:
+            peak_memory_report += (
+                f", workers: {len(worker_peak_memory)}, "
+                f"up to {max(worker_peak_memory)} MB each"
+            )
+        lines.append(format_line_("Peak memory", peak_memory_report))
+    return "\n".join(lines)
+
+
+_tracer: Optional[Tracer] = (
+    Tracer(os.environ[Tracer.ENV_TRACE_DIR])
+    if Tracer.ENV_TRACE_DIR in os.environ
+    else None
+)
@@ -0,0 +1,153 @@
+"""
+The watching of the project files that are changed outside the server.
+
+The uvicorn reload only restarts the server when StrictDoc's own files change.
+When the documents or the source files are changed outside the server, e.g.,
+by a "git pull" or by an editor, the watcher reports the changed files, so
+that the server re-indexes the project in place and only outdates the pages
+that depend on the changed files, see PageUpdateTracker.update_files().
+
+The watcher polls the stat values of the project files, so it works the same
+on all platforms and needs no extra dependencies. The server itself updates
+the modification time of the documents it renders, so a file only counts as
+changed when its MD5 checksum changes too.
+
+@relation(SDOC-SRS-2, scope=file)
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from strictdoc.core.document_finder import DocumentFinder
+from strictdoc.core.finders.source_files_finder import SourceFilesFinder
+from strictdoc.core.project_config import ProjectConfig, ProjectFeature
+from strictdoc.helpers.file_fingerprint import FileFingerprint
+from strictdoc.helpers.md5 import get_file_md5
+
+FileState = Tuple[FileFingerprint, str]
+
+
+class ProjectFileWatcher:
+    POLL_INTERVAL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        project_config: ProjectConfig,
+        on_change: Callable[[List[str]], None],
+    ) -> None:
+        self.project_config: ProjectConfig = project_config
+        self.on_change: Callable[[List[str]], None] = on_change
+        self.file_states: Dict[str, FileState] = {}
+        # The server edits and the re-indexing must not overlap, see
+        # suppress_changes().
+        self.lock: threading.Lock = threading.Lock()
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        assert self._thread is None, "The watcher is already started."
+        self.file_states = self._get_file_states()
+        self._thread = threading.Thread(
+            target=self._run, name="strictdoc-file-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def get_changed_files(self) -> List[str]:
+        """
+        Return the files that were created, changed or deleted since the
+        previous call.
+        """
+
+        file_states = self._get_file_states()
+        changed_files: Set[str] = set(
+            self.file_states.keys()
+        ).symmetric_difference(file_states.keys())
+        for path_to_file_, (_, file_md5_) in file_states.items():
+            previous_file_state = self.file_states.get(path_to_file_)
+            if (
+                previous_file_state is not None
+                and previous_file_state[1] != file_md5_
+            ):
+                changed_files.add(path_to_file_)
+        self.file_states = file_states
+        return sorted(changed_files)
+
+    def suppress_changes(self, written_files: List[str]) -> None:
+        """
+        Do not report the files that the server has written itself.
+
+        The server edits update the traceability index before the documents
+        are written, so re-indexing these files is not needed. Only the
+        states of the written files are refreshed, so that the files changed
+        outside the server since the previous poll are still reported. The
+        lock must be held for the whole edit, so that a re-index does not
+        replace the traceability index in the middle of it.
+        """
+
+        assert self.lock.locked(), "The lock must be held for the whole edit."
+        for path_to_file_ in written_files:
+            file_state = self._get_file_state(path_to_file_)
+            if file_state is not None:
+                self.file_states[path_to_file_] = file_state
+            else:
+                self.file_states.pop(path_to_file_, None)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.POLL_INTERVAL_SECONDS):
+            with self.lock:
+                changed_files = self.get_changed_files()
+                if len(changed_files) > 0:
+                    self.on_change(changed_files)
+
+    def _get_file_states(self) -> Dict[str, FileState]:
+        file_states: Dict[str, FileState] = {}
+        for path_to_file_ in self._get_project_files():
+            file_state = self._get_file_state(path_to_file_)
+            if file_state is not None:
+                file_states[path_to_file_] = file_state
+        return file_states
+
+    def _get_file_state(self, path_to_file: str) -> Optional[FileState]:
+        try:
+            file_fingerprint = FileFingerprint.create_from_stat(
+                os.stat(path_to_file)
+            )
+            previous_file_state = self.file_states.get(path_to_file)
+            # Only the files with new stat values are read again.
+            if (
+                previous_file_state is not None
+                and previous_file_state[0] == file_fingerprint
+            ):
+                return previous_file_state
+            return file_fingerprint, get_file_md5(path_to_file)
+        except FileNotFoundError:
+            # The file was deleted while the project was being scanned.
+            return None
+
+    def _get_project_files(self) -> Iterator[str]:
+        file_trees, _ = DocumentFinder.build_file_tree(
+            project_config=self.project_config
+        )
+        for file_tree_ in file_trees:
+            for _, doc_file_, _ in file_tree_.iterate():
+                yield doc_file_.full_path
+
+        if self.project_config.is_feature_activated(
+            ProjectFeature.REQUIREMENT_TO_SOURCE_TRACEABILITY
+        ):
+            source_tree = SourceFilesFinder.find_source_files(
+                project_config=self.project_config
+            )
+            for source_file_ in source_tree.source_files:
+                yield source_file_.full_path
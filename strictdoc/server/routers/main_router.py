@@ -1,16 +1,19 @@
+import asyncio
 import copy
 import datetime
+import json
 import os
 import re
 from mimetypes import guess_type
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile
 from fastapi.responses import RedirectResponse
 from reqif.models.error_handling import ReqIFXMLParsingError
 from reqif.parser import ReqIFParser
 from reqif.unparser import ReqIFUnparser
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData
 from starlette.requests import Request
 from starlette.responses import FileResponse, HTMLResponse, Response
@@ -22,6 +25,7 @@ from strictdoc.backend.reqif.p01_sdoc.reqif_to_sdoc_converter import (
 from strictdoc.backend.reqif.p01_sdoc.sdoc_to_reqif_converter import (
     P01_SDocToReqIFObjectConverter,
 )
+from strictdoc.backend.sdoc.errors.document_tree_error import DocumentTreeError
 from strictdoc.backend.sdoc.models.document import SDocDocument
 from strictdoc.backend.sdoc.models.document_grammar import (
     DocumentGrammar,
@@ -31,18 +35,11 @@ from strictdoc.backend.sdoc.models.grammar_element import (
     GrammarElementField,
     RequirementFieldType,
 )
-from strictdoc.backend.sdoc.models.model import (
-    SDocExtendedElementIF,
-    SDocNodeIF,
-)
 from strictdoc.backend.sdoc.models.node import (
     SDocNode,
 )
 from strictdoc.backend.sdoc.models.section import SDocSection
 from strictdoc.backend.sdoc.writer import SDWriter
-from strictdoc.backend.sdoc_source_code.models.source_file_info import (
-    SourceFileTraceabilityInfo,
-)
 from strictdoc.core.actions.export_action import ExportAction
 from strictdoc.core.analyzers.document_stats import DocumentTreeStats
 from strictdoc.core.analyzers.document_uid_analyzer import DocumentUIDAnalyzer
@@ -51,6 +48,7 @@ from strictdoc.core.document_tree import DocumentTree
 from strictdoc.core.project_config import ProjectConfig
 from strictdoc.core.query_engine.query_object import Query, QueryObject
 from strictdoc.core.query_engine.query_reader import QueryReader
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
 from strictdoc.core.transforms.constants import NodeCreationOrder
 from strictdoc.core.transforms.delete_requirement import (
     DeleteRequirementCommand,
@@ -139,6 +137,7 @@ from strictdoc.helpers.string import (
 )
 from strictdoc.helpers.timing import measure_performance
 from strictdoc.server.error_object import ErrorObject
+from strictdoc.server.file_watcher import ProjectFileWatcher
 from strictdoc.server.helpers.http import request_is_for_non_modified_file
 
 HTTP_STATUS_BAD_REQUEST = 400
@@ -147,6 +146,11 @@ HTTP_STATUS_GATEWAY_TIMEOUT = 504
 
 AUTOCOMPLETE_LIMIT = 50
 
+# "document-DEEP-TRACE.html" -> ("document", "-DEEP-TRACE")
+DOCUMENT_PAGE_PATH_REGEX = re.compile(
+    r"^(.*?)(-TABLE|-DEEP-TRACE|-TRACE|-PDF|\.standalone)?\.html$"
+)
+
 
 def create_main_router(project_config: ProjectConfig) -> APIRouter:
     parallelizer = NullParallelizer()
@@ -176,6 +180,78 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
     def env() -> JinjaEnvironment:
         return html_templates.jinja_environment()
 
+    def reindex_changed_files(changed_files: List[str]) -> None:
+        """
+        Re-index the project after its files were changed outside the server.
+
+        Only the changed files are parsed again, the unchanged ones are read
+        from the cache. The open pages of the documents that depend on the
+        changed files are notified to refresh.
+        """
+
+        print(  # noqa: T201
+            f"Project files changed: {len(changed_files)}, re-indexing."
+        )
+        previous_traceability_index = export_action.traceability_index
+        try:
+            traceability_index = TraceabilityIndexBuilder.create(
+                project_config=project_config, parallelizer=parallelizer
+            )
+        except DocumentTreeError as exc:
+            print(exc.to_print_message())  # noqa: T201
+            return
+        except (Exception, SystemExit) as exc:
+            # A file can be broken in the middle of an edit or a "git pull".
+            # The server keeps the previous index until the file is fixed.
+            print(  # noqa: T201
+                f"error: Could not re-index the changed files: {exc}"
+            )
+            return
+        documents = traceability_index.page_update_tracker.update_files(
+            previous_traceability_index, changed_files
+        )
+        export_action.traceability_index = traceability_index
+
+        document_rel_paths: Optional[List[str]] = None
+        if documents is not None:
+            document_rel_paths = sorted(
+                rel_path_
+                for rel_path_, document_ in (
+                    traceability_index.document_tree.map_docs_by_rel_paths.items()
+                )
+                if document_ in documents
+            )
+        manager.broadcast_threadsafe(
+            json.dumps(
+                {"event": "files_changed", "documents": document_rel_paths}
+            )
+        )
+
+    file_watcher = ProjectFileWatcher(
+        project_config, on_change=reindex_changed_files
+    )
+
+    async def lock_project_files() -> AsyncIterator[None]:
+        """
+        Hold the file watcher lock for a whole server edit.
+
+        A re-index of the files changed outside the server replaces the
+        traceability index, so it must not run between the update of the
+        index by an edit and the writing of the edited documents. The lock
+        is acquired in a worker thread, so that the event loop is not blocked
+        while a re-index is running.
+        """
+
+        await run_in_threadpool(file_watcher.lock.acquire)
+        try:
+            yield
+        finally:
+            file_watcher.lock.release()
+
+    def write_document(document: SDocDocument) -> None:
+        written_files = SDWriter(project_config).write_to_file(document)
+        file_watcher.suppress_changes(written_files)
+
     router = APIRouter()
 
     @router.get("/")
@@ -301,7 +377,11 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             },
         )
 
-    @router.post("/actions/document/create_section", response_class=Response)
+    @router.post(
+        "/actions/document/create_section",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
+    )
     async def create_section(request: Request) -> Response:
         request_form_data: FormData = await request.form()
         request_dict: Dict[str, str] = dict(request_form_data)
@@ -382,12 +462,17 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         section_document: SDocDocument = assert_cast(
             section.get_document(), SDocDocument
         )
-        SDWriter(project_config).write_to_file(section_document)
+        write_document(section_document)
+        export_action.traceability_index.query_index.invalidate_document(
+            section_document
+        )
 
         # Update the index because other documents might reference this
         # document's sections. These documents will be regenerated on demand,
         # when they are opened next time.
-        export_action.traceability_index.update_last_updated()
+        export_action.traceability_index.page_update_tracker.update_node(
+            section
+        )
 
         assert context_document.meta is not None
         link_renderer = LinkRenderer(
@@ -472,7 +557,11 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             },
         )
 
-    @router.post("/actions/document/update_section", response_class=Response)
+    @router.post(
+        "/actions/document/update_section",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
+    )
     async def put_update_section(request: Request) -> Response:
         request_form_data: FormData = await request.form()
         request_dict = dict(request_form_data)
@@ -541,12 +630,17 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             )
 
         # Saving new content to .SDoc file.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Update the index because other documents might reference this
         # document's sections. These documents will be regenerated on demand,
         # when they are opened next time.
-        export_action.traceability_index.update_last_updated()
+        export_action.traceability_index.page_update_tracker.update_node(
+            section
+        )
 
         context_document: SDocDocument = (
             export_action.traceability_index.get_node_by_mid(
@@ -833,7 +927,9 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
     @router.post(
-        "/actions/document/create_requirement", response_class=Response
+        "/actions/document/create_requirement",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     async def create_requirement(request: Request) -> Response:
         request_form_data: FormData = await request.form()
@@ -919,9 +1015,15 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             )
 
         # Saving new content to .SDoc files.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
         if document != context_document:
-            SDWriter(project_config).write_to_file(context_document)
+            write_document(context_document)
+            export_action.traceability_index.query_index.invalidate_document(
+                context_document
+            )
 
         # Exporting the updated document to HTML. Note that this happens after
         # the traceability index last update marker has been updated. This way
@@ -1067,7 +1169,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             },
         )
 
-    @router.post("/actions/document/update_requirement")
+    @router.post(
+        "/actions/document/update_requirement",
+        dependencies=[Depends(lock_project_files)],
+    )
     async def document__update_requirement(request: Request) -> Response:
         request_form_data: FormData = await request.form()
         request_dict = dict(request_form_data)
@@ -1162,7 +1267,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
         # Saving new content to .SDoc files.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Exporting the updated document to HTML. Note that this happens after
         # the traceability index last update marker has been updated. This way
@@ -1276,6 +1384,7 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
     @router.delete(
         "/actions/document/delete_section",
         response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     def delete_section(
         node_id: str, context_document_mid: str, confirmed: bool = False
@@ -1349,7 +1458,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
         # Saving new content to .SDoc file.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Rendering back the Turbo template.
         assert document.meta is not None
@@ -1394,6 +1506,7 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
     @router.delete(
         "/actions/document/delete_requirement",
         response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     def delete_requirement(
         node_id: str, context_document_mid: str, confirmed: bool = False
@@ -1447,7 +1560,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             )
 
         # Saving new content to .SDoc file.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         context_document: SDocDocument = (
             export_action.traceability_index.get_node_by_mid(
@@ -1497,7 +1613,11 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             },
         )
 
-    @router.post("/actions/document/move_node", response_class=Response)
+    @router.post(
+        "/actions/document/move_node",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
+    )
     async def move_node(request: Request) -> Response:
         request_form_data: FormData = await request.form()
         request_dict: Dict[str, str] = dict(request_form_data)
@@ -1560,7 +1680,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             raise NotImplementedError
 
         # Saving new content to .SDoc file.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Update the index because other documents might reference this
         # document's sections. These documents will be regenerated on demand,
@@ -1615,7 +1738,9 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
     @router.post(
-        "/actions/project_index/create_document", response_class=Response
+        "/actions/project_index/create_document",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     def document_tree__create_document(
         document_title: str = Form(""),
@@ -1737,7 +1862,7 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             output_document_dir_rel_path=SDocRelativePath("FIXME"),
         )
 
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
 
         export_action.build_index()
         export_action.export()
@@ -1937,7 +2062,11 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             },
         )
 
-    @router.post("/actions/document/save_config", response_class=Response)
+    @router.post(
+        "/actions/document/save_config",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
+    )
     async def document__save_edit_config(request: Request) -> Response:
         request_form_data: FormData = await request.form()
         request_dict: Dict[str, str] = dict(request_form_data)
@@ -1979,7 +2108,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             )
 
         # Re-generate the document's SDOC.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Update the index because other documents might be referenced by this
         # document's free text. These documents will be regenerated on demand,
@@ -2025,7 +2157,9 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
     @router.post(
-        "/actions/document/save_included_document", response_class=Response
+        "/actions/document/save_included_document",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     async def document__save_included_document(request: Request) -> Response:
         request_form_data: FormData = await request.form()
@@ -2065,7 +2199,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             )
 
         # Re-generate the document's SDOC.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Update the index because other documents might be referenced by this
         # document's free text. These documents will be regenerated on demand,
@@ -2212,7 +2349,11 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             },
         )
 
-    @router.post("/actions/document/save_grammar", response_class=Response)
+    @router.post(
+        "/actions/document/save_grammar",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
+    )
     async def document__save_grammar(request: Request) -> Response:
         request_form_data: FormData = await request.form()
         request_dict: Dict[str, str] = dict(request_form_data)
@@ -2254,7 +2395,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             )
 
         # Re-generate the document's SDOC.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Re-generate the document.
         html_generator.export_single_document(
@@ -2351,7 +2495,9 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
     @router.post(
-        "/actions/document/save_grammar_element", response_class=Response
+        "/actions/document/save_grammar_element",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     async def document__save_grammar_element(request: Request) -> Response:
         request_form_data: FormData = await request.form()
@@ -2386,7 +2532,10 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         update_grammar_action.perform()
 
         # Re-generate the document's SDOC.
-        SDWriter(project_config).write_to_file(document)
+        write_document(document)
+        export_action.traceability_index.query_index.invalidate_document(
+            document
+        )
 
         # Re-generate the document.
         html_generator.export_single_document(
@@ -2502,7 +2651,9 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         )
 
     @router.post(
-        "/actions/project_index/import_document_reqif", response_class=Response
+        "/actions/project_index/import_document_reqif",
+        response_class=Response,
+        dependencies=[Depends(lock_project_files)],
     )
     async def import_document_reqif(reqif_file: UploadFile) -> Response:
         contents = reqif_file.file.read().decode()
@@ -2575,7 +2726,7 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
                 output_document_dir_rel_path=SDocRelativePath("FIXME"),
             )
 
-            SDWriter(project_config).write_to_file(document)
+            write_document(document)
 
         export_action.build_index()
         export_action.export()
@@ -2715,35 +2866,8 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
                 error = f"error: {e}"
 
         if node_query is not None:
-            result: List[SDocExtendedElementIF] = []
             try:
-                document_tree = assert_cast(
-                    export_action.traceability_index.document_tree, DocumentTree
-                )
-                for document in document_tree.document_list:
-                    document_iterator = (
-                        export_action.traceability_index.get_document_iterator(
-                            document
-                        )
-                    )
-                    for node, _ in document_iterator.all_content(
-                        print_fragments=False
-                    ):
-                        if node_query.evaluate(node):
-                            result.append(node)
-
-                if (
-                    export_action.traceability_index.document_tree.source_tree
-                    is not None
-                ):
-                    for source_file_ in export_action.traceability_index.document_tree.source_tree.source_files:
-                        source_file_info_: SourceFileTraceabilityInfo = export_action.traceability_index.get_file_traceability_index().get_coverage_info(
-                            source_file_.in_doctree_source_file_rel_path_posix
-                        )
-                        if node_query.evaluate(source_file_info_):
-                            result.append(source_file_info_)
-
-                search_results = result
+                search_results = node_query.find_nodes()
             # Catch unexpected errors but exclude from code coverage, because
             # it is not clear yet how to write a test that triggers this.
             except (
@@ -2778,54 +2902,20 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         The UID of the node identified by the optional parameter "exclude_requirement_mid" is excluded,
         so that a node cannot be linked to itself.
 
+        The nodes whose UID starts with the first query word are listed first,
+        followed by the other matching nodes in the document order.
+
         @relation(SDOC-SRS-120, scope=function)
         """
         output = ""
         if q is not None:
-            query_words = q.lower().split()
-            resulting_nodes = []
-            document_tree = assert_cast(
-                export_action.traceability_index.document_tree, DocumentTree
-            )
-            for document in document_tree.document_list:
-                document_iterator = (
-                    export_action.traceability_index.get_document_iterator(
-                        document
-                    )
+            resulting_nodes = (
+                export_action.traceability_index.uid_autocomplete_index.search(
+                    q,
+                    exclude_node_mid=exclude_requirement_mid,
+                    limit=AUTOCOMPLETE_LIMIT,
                 )
-                for node_, _ in document_iterator.all_content(
-                    print_fragments=False
-                ):
-                    if not isinstance(node_, SDocNodeIF):
-                        continue
-
-                    if node_.node_type == "SECTION":
-                        continue
-
-                    if (
-                        node_.reserved_uid is not None
-                        and node_.reserved_mid != exclude_requirement_mid
-                    ):
-                        words_ = node_.reserved_uid.strip().lower()
-                        if node_.reserved_title is not None:
-                            words_ = (
-                                words_
-                                + " "
-                                + node_.reserved_title.strip().lower()
-                            )
-                        if all(word_ in words_ for word_ in query_words):
-                            resulting_nodes.append(node_)
-
-                            # Excluding the following branch from code coverage
-                            # because it is not practical to create a test that
-                            # reproduces going above the limit. The code is
-                            # simple, so it should be safe to exclude this
-                            # branch from coverage.
-                            if (
-                                len(resulting_nodes) >= AUTOCOMPLETE_LIMIT
-                            ):  # pragma: no cover
-                                break
-
+            )
             output = env().render_template_as_markup(
                 "autocomplete/uid/stream_autocomplete_uid.jinja.html",
                 nodes=resulting_nodes,
@@ -2989,6 +3079,38 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
         else:
             return get_asset(request, full_path)
 
+    def get_page_last_updated(page_path: str) -> datetime.datetime:
+        """
+        Return the time of the last edit that changed the content of a page.
+
+        An edit of a node only outdates the pages that show this node, see
+        PageUpdateTracker.
+        """
+
+        traceability_index = export_action.traceability_index
+        page_update_tracker = traceability_index.page_update_tracker
+        if page_path == "index.html":
+            return traceability_index.index_last_updated
+        if page_path.startswith("_source_files") or page_path in (
+            "traceability_matrix.html",
+            "source_coverage.html",
+            "project_statistics.html",
+        ):
+            return page_update_tracker.get_project_last_updated()
+
+        page_path_match = DOCUMENT_PAGE_PATH_REGEX.match(page_path)
+        if page_path_match is None:
+            return traceability_index.index_last_updated
+        base_page_path, page_suffix = page_path_match.groups()
+        document = traceability_index.document_tree.map_docs_by_rel_paths.get(
+            base_page_path + ".html"
+        )
+        if document is None:
+            return traceability_index.index_last_updated
+        return page_update_tracker.get_document_last_updated(
+            document, deep_trace=page_suffix == "-DEEP-TRACE"
+        )
+
     def get_document(request: Request, url_to_document: str) -> Response:
         document_relative_path: SDocRelativePath = SDocRelativePath.from_url(
             url_to_document
@@ -3007,7 +3129,7 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
                 full_path_to_document
             )
             if (
-                export_action.traceability_index.index_last_updated
+                get_page_last_updated(document_relative_path.relative_path)
                 > output_file_mtime
             ):
                 must_generate_document = True
@@ -3176,10 +3298,12 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
     class ConnectionManager:
         def __init__(self) -> None:
             self.active_connections: List[WebSocket] = []
+            self.loop: Optional[asyncio.AbstractEventLoop] = None
 
         async def connect(self, websocket: WebSocket) -> None:
             await websocket.accept()
             self.active_connections.append(websocket)
+            self.loop = asyncio.get_running_loop()
 
         def disconnect(self, websocket: WebSocket) -> None:
             self.active_connections.remove(websocket)
@@ -3188,6 +3312,13 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
             for connection in self.active_connections:
                 await connection.send_text(message)
 
+        def broadcast_threadsafe(self, message: str) -> None:
+            # The file watcher runs in its own thread, the websockets can only
+            # be used from the event loop they were accepted in.
+            if self.loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self.broadcast(message), self.loop)
+
     manager = ConnectionManager()
 
     @router.websocket("/ws/{client_id}")
@@ -3203,4 +3334,7 @@ def create_main_router(project_config: ProjectConfig) -> APIRouter:
                 f"Websocket: Client #{client_id} disconnected"
             )
 
+    if project_config.server_watch_files:
+        file_watcher.start()
+
     return router
@@ -1050,6 +1050,35 @@ def performance_snakeviz(context):
     run_invoke(context, command)
 
 
+@task()
+def benchmark(
+    context,
+    *,
+    preset: str = "small",
+    repeat: int = 3,
+    scenarios: Optional[str] = None,
+    output: str = "output/benchmark/results.json",
+    no_parallelization: bool = False,
+):
+    scenarios_argument = (
+        f"--scenarios {scenarios}" if scenarios is not None else ""
+    )
+    no_parallelization_argument = (
+        "--no-parallelization" if no_parallelization else ""
+    )
+    run_invoke(
+        context,
+        f"""
+        python tests/benchmarks/run_benchmarks.py
+            --preset {preset}
+            --repeat {repeat}
+            {scenarios_argument}
+            {no_parallelization_argument}
+            --output {output}
+        """,
+    )
+
+
 @task()
 def autouid(context):
     run_invoke(
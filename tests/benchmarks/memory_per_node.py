@@ -0,0 +1,93 @@
+"""
+Memory benchmark: the number of bytes that the traceability index holds per
+node of a synthetic SDoc project generated with synthetic_project.py.
+
+Usage: python tests/benchmarks/memory_per_node.py [--preset PRESET]
+           [--documents N] [--nodes-per-document N] [...]
+           [--graph-storage STORAGE]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+strictdoc_root_path = os.path.abspath(os.path.join(__file__, "../../.."))
+sys.path.insert(0, strictdoc_root_path)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_project import (  # noqa: E402
+    SyntheticProjectGenerator,
+    add_project_arguments,
+    create_config_from_arguments,
+    generate_synthetic_project,
+)
+
+from strictdoc.core.constants import GraphStorage  # noqa: E402
+from strictdoc.core.environment import SDocRuntimeEnvironment  # noqa: E402
+from strictdoc.core.project_config import ProjectConfig  # noqa: E402
+from strictdoc.core.traceability_index_builder import (  # noqa: E402
+    TraceabilityIndexBuilder,
+)
+from strictdoc.helpers.parallelizer import NullParallelizer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_project_arguments(parser)
+    parser.add_argument(
+        "--graph-storage",
+        choices=GraphStorage.ALL,
+        default=GraphStorage.DEFAULT,
+    )
+    args = parser.parse_args()
+    config = create_config_from_arguments(args)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_project = os.path.join(tmp_dir, "project")
+        generate_synthetic_project(path_to_project, config)
+
+        project_config = ProjectConfig.default_config(
+            SDocRuntimeEnvironment(strictdoc_root_path)
+        )
+        # Only the documents are measured, the source files are not read.
+        project_config.input_paths = [os.path.join(path_to_project, "docs")]
+        project_config.output_dir = os.path.join(tmp_dir, "output")
+        project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+        project_config.sdoc_parser = "native"
+        project_config.graph_storage = args.graph_storage
+
+        gc.collect()
+        tracemalloc.start()
+        memory_before, _ = tracemalloc.get_traced_memory()
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=NullParallelizer()
+        )
+        gc.collect()
+        memory_after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # The included documents are a part of the documents that include
+        # them, so their nodes are held by the index too.
+        number_of_nodes = (
+            config.documents * config.nodes_per_document
+            + config.included_documents
+            * max(1, config.nodes_per_document // 10)
+        )
+        assert (
+            traceability_index.get_node_by_uid(
+                SyntheticProjectGenerator.get_uid(0, 0)
+            )
+            is not None
+        )
+        print(  # noqa: T201
+            f"Nodes: {number_of_nodes}, "
+            f"memory: {memory_after - memory_before} bytes, "
+            f"bytes per node: {(memory_after - memory_before) // number_of_nodes}"
+        )
+
+
+if __name__ == "__main__":
+    main()
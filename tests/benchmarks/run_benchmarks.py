@@ -0,0 +1,482 @@
+"""
+Performance benchmarks of StrictDoc on a synthetic project.
+
+The benchmarks generate a project with synthetic_project.py and time the main
+stages of StrictDoc on it: finding and parsing the documents, building the
+traceability index with a cold and a warm cache, exporting the HTML tree and
+the static search index, and the responses of the web server.
+
+Each repetition of a scenario runs in a fresh process, so that the in-memory
+caches of one repetition do not make the next one faster. A "cold" scenario
+starts with an empty cache folder, a "warm" scenario reuses the cache folder
+that a preparation run has filled. The results are written as JSON, so that
+they can be collected and compared across commits and machines.
+
+Usage: python tests/benchmarks/run_benchmarks.py
+           [--preset PRESET] [--documents N] [...] [--repeat N]
+           [--scenarios NAME,...] [--output results.json]
+           [--no-parallelization] [--verbose]
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+strictdoc_root_path = os.path.abspath(os.path.join(__file__, "../../.."))
+sys.path.insert(0, strictdoc_root_path)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import uvicorn  # noqa: E402
+from synthetic_project import (  # noqa: E402
+    add_project_arguments,
+    create_config_from_arguments,
+    generate_synthetic_project,
+)
+
+from strictdoc import __version__, environment  # noqa: E402
+from strictdoc.cli.cli_arg_parser import (  # noqa: E402
+    SDocArgsParser,
+    ServerCommandConfig,
+)
+from strictdoc.cli.command_parser_builder import (  # noqa: E402
+    CommandParserBuilder,
+)
+from strictdoc.core.document_finder import DocumentFinder  # noqa: E402
+from strictdoc.core.project_config import (  # noqa: E402
+    ProjectConfig,
+    ProjectConfigLoader,
+)
+from strictdoc.core.traceability_index_builder import (  # noqa: E402
+    TraceabilityIndexBuilder,
+)
+from strictdoc.export.html.html_generator import HTMLGenerator  # noqa: E402
+from strictdoc.export.html.html_templates import HTMLTemplates  # noqa: E402
+from strictdoc.helpers.parallelizer import (  # noqa: E402
+    NullParallelizer,
+    Parallelizer,
+)
+from strictdoc.helpers.tracing import get_peak_memory_mb  # noqa: E402
+from strictdoc.server.app import create_app  # noqa: E402
+
+# The results are measured in seconds, per measurement name.
+Measurements = Dict[str, float]
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+class BenchmarkContext:
+    def __init__(
+        self,
+        path_to_project: str,
+        path_to_output_dir: str,
+        path_to_cache_dir: str,
+        parallelize: bool,
+    ) -> None:
+        self.path_to_project: str = path_to_project
+        self.path_to_output_dir: str = path_to_output_dir
+        self.path_to_cache_dir: str = path_to_cache_dir
+        self.parallelize: bool = parallelize
+
+
+def create_export_project_config(context: BenchmarkContext) -> ProjectConfig:
+    args = (
+        CommandParserBuilder()
+        .build()
+        .parse_args(
+            [
+                "export",
+                context.path_to_project,
+                "--output-dir",
+                context.path_to_output_dir,
+            ]
+        )
+    )
+    export_config = SDocArgsParser(args).get_export_config()
+    project_config = ProjectConfigLoader.load_from_path_or_get_default(
+        path_to_config=context.path_to_project,
+        environment=environment,
+    )
+    project_config.integrate_export_config(export_config)
+    project_config.dir_for_sdoc_cache = context.path_to_cache_dir
+    return project_config
+
+
+@contextlib.contextmanager
+def create_parallelizer(context: BenchmarkContext) -> Iterator[Parallelizer]:
+    parallelizer = Parallelizer.create(context.parallelize)
+    try:
+        yield parallelizer
+    finally:
+        parallelizer.shutdown()
+
+
+def scenario_find_sdoc_content(context: BenchmarkContext) -> Measurements:
+    project_config = create_export_project_config(context)
+    with create_parallelizer(context) as parallelizer:
+        time_start = time.perf_counter()
+        DocumentFinder.find_sdoc_content(project_config, parallelizer)
+        return {"find_sdoc_content": time.perf_counter() - time_start}
+
+
+def scenario_traceability_index(context: BenchmarkContext) -> Measurements:
+    project_config = create_export_project_config(context)
+    with create_parallelizer(context) as parallelizer:
+        time_start = time.perf_counter()
+        TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=parallelizer
+        )
+        return {"traceability_index": time.perf_counter() - time_start}
+
+
+def scenario_export_html(context: BenchmarkContext) -> Measurements:
+    project_config = create_export_project_config(context)
+    with create_parallelizer(context) as parallelizer:
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=parallelizer
+        )
+        html_templates = HTMLTemplates.create(
+            project_config=project_config,
+            enable_caching=not traceability_index.is_small_project(),
+            strictdoc_last_update=traceability_index.strictdoc_last_update,
+        )
+        html_generator = HTMLGenerator(project_config, html_templates)
+
+        time_start = time.perf_counter()
+        html_generator.export_complete_tree(
+            traceability_index=traceability_index, parallelizer=parallelizer
+        )
+        return {"export_complete_tree": time.perf_counter() - time_start}
+
+
+def scenario_static_search_index(context: BenchmarkContext) -> Measurements:
+    project_config = create_export_project_config(context)
+    with create_parallelizer(context) as parallelizer:
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=parallelizer
+        )
+    html_templates = HTMLTemplates.create(
+        project_config=project_config,
+        enable_caching=False,
+        strictdoc_last_update=traceability_index.strictdoc_last_update,
+    )
+    html_generator = HTMLGenerator(project_config, html_templates)
+
+    time_start = time.perf_counter()
+    html_generator.export_static_html_search_index(
+        traceability_index=traceability_index
+    )
+    return {"static_search_index": time.perf_counter() - time_start}
+
+
+def scenario_server(context: BenchmarkContext) -> Measurements:
+    """
+    Start the server in a thread and time the responses of its main pages.
+
+    The pages are generated when they are opened for the first time, so the
+    document page is requested twice: the first response includes the page
+    generation, the second one is served from the generated page.
+    """
+
+    project_config = ProjectConfigLoader.load_from_path_or_get_default(
+        path_to_config=context.path_to_project,
+        environment=environment,
+    )
+    project_config.integrate_server_config(
+        ServerCommandConfig(
+            input_path=context.path_to_project,
+            output_path=context.path_to_output_dir,
+            config_path=None,
+            reload=False,
+            host=None,
+            port=None,
+        )
+    )
+    project_config.dir_for_sdoc_cache = context.path_to_cache_dir
+
+    # The links to a document and a source file page are taken from an
+    # index that is built in the same way as the server builds its own.
+    traceability_index = TraceabilityIndexBuilder.create(
+        project_config=project_config, parallelizer=NullParallelizer()
+    )
+    document = next(
+        document_
+        for document_ in traceability_index.document_tree.document_list
+        if not document_.document_is_included()
+    )
+    assert document.meta is not None
+    endpoints: List[Tuple[str, str]] = [
+        ("server_index", "/"),
+        ("server_document_cold", "/" + document.meta.get_html_doc_link()),
+        ("server_document_warm", "/" + document.meta.get_html_doc_link()),
+        ("server_search", "/search?q=node.is_requirement"),
+        ("server_autocomplete_uid", "/autocomplete/uid?q=REQ-1"),
+    ]
+    source_tree = traceability_index.document_tree.source_tree
+    if source_tree is not None:
+        source_file = next(
+            (
+                source_file_
+                for source_file_ in source_tree.source_files
+                if source_file_.is_referenced
+            ),
+            None,
+        )
+        if source_file is not None:
+            endpoints.append(
+                (
+                    "server_source_file",
+                    (
+                        "/_source_files/"
+                        f"{source_file.in_doctree_source_file_rel_path_posix}"
+                        ".html"
+                    ),
+                )
+            )
+
+    with socket.socket() as socket_:
+        socket_.bind(("127.0.0.1", 0))
+        port = socket_.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(project_config=project_config),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+        )
+    )
+    server_thread = threading.Thread(target=server.run, daemon=True)
+    server_thread.start()
+    try:
+        while not server.started:
+            assert server_thread.is_alive(), "The server could not start."
+            time.sleep(0.05)
+
+        measurements: Measurements = {}
+        for measurement_, endpoint_ in endpoints:
+            time_start = time.perf_counter()
+            with urllib.request.urlopen(
+                f"http://127.0.0.1:{port}{endpoint_}"
+            ) as response_:
+                assert response_.status == 200, (endpoint_, response_.status)
+                response_.read()
+            measurements[measurement_] = time.perf_counter() - time_start
+        return measurements
+    finally:
+        server.should_exit = True
+        server_thread.join()
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[BenchmarkContext], Measurements],
+        warm_cache: bool,
+    ) -> None:
+        self.name: str = name
+        self.function: Callable[[BenchmarkContext], Measurements] = function
+        self.warm_cache: bool = warm_cache
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("find_sdoc_content", scenario_find_sdoc_content, False),
+    Scenario("traceability_index_cold", scenario_traceability_index, False),
+    Scenario("traceability_index_warm", scenario_traceability_index, True),
+    Scenario("export_html_cold", scenario_export_html, False),
+    Scenario("export_html_warm", scenario_export_html, True),
+    Scenario("static_search_index", scenario_static_search_index, True),
+    Scenario("server", scenario_server, True),
+]
+
+
+def run_scenario_in_process(
+    scenario_name: str, context: BenchmarkContext, verbose: bool
+) -> Tuple[Measurements, Optional[float]]:
+    scenario = next(
+        scenario_ for scenario_ in SCENARIOS if scenario_.name == scenario_name
+    )
+    # StrictDoc reports its progress to stdout, which would bury the results.
+    # The process only runs this scenario, so its stdout is redirected for
+    # good, together with the worker processes that it starts.
+    if not verbose:
+        sys.stdout.flush()
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    measurements = scenario.function(context)
+    return measurements, get_peak_memory_mb()
+
+
+def run_scenario(
+    scenario: Scenario, context: BenchmarkContext, verbose: bool
+) -> Tuple[Measurements, Optional[float]]:
+    # A new process per run, so that the modules and in-memory caches of the
+    # previous runs are not reused.
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(
+            run_scenario_in_process, scenario.name, context, verbose
+        ).result()
+
+
+@contextlib.contextmanager
+def create_context(
+    path_to_project: str, path_to_work_dir: str, parallelize: bool
+) -> Iterator[BenchmarkContext]:
+    path_to_run_dir = tempfile.mkdtemp(dir=path_to_work_dir)
+    try:
+        yield BenchmarkContext(
+            path_to_project=path_to_project,
+            path_to_output_dir=os.path.join(path_to_run_dir, "output"),
+            path_to_cache_dir=os.path.join(path_to_run_dir, "cache"),
+            parallelize=parallelize,
+        )
+    finally:
+        shutil.rmtree(path_to_run_dir, ignore_errors=True)
+
+
+def get_git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=strictdoc_root_path,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_project_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value_: value_.split(","),
+        default=[scenario_.name for scenario_ in SCENARIOS],
+        help="A comma-separated list of: "
+        + ", ".join(scenario_.name for scenario_ in SCENARIOS),
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Path to the JSON file with the results.",
+    )
+    parser.add_argument("--no-parallelization", action="store_true")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Do not hide the output of StrictDoc.",
+    )
+    args = parser.parse_args()
+    assert args.repeat > 0, args.repeat
+
+    scenarios_by_name = {scenario_.name: scenario_ for scenario_ in SCENARIOS}
+    for scenario_name_ in args.scenarios:
+        if scenario_name_ not in scenarios_by_name:
+            parser.error(f"Unknown scenario: {scenario_name_}")
+
+    project_config = create_config_from_arguments(args)
+    parallelize = not args.no_parallelization
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="strictdoc_benchmark_") as tmp_dir:
+        path_to_project = os.path.join(tmp_dir, "project")
+        generate_synthetic_project(path_to_project, project_config)
+        print(f"Project: {project_config}", flush=True)  # noqa: T201
+
+        for scenario_name_ in args.scenarios:
+            scenario = scenarios_by_name[scenario_name_]
+            times: Dict[str, List[float]] = {}
+            peak_memory: List[float] = []
+            with contextlib.ExitStack() as stack:
+                warm_context: Optional[BenchmarkContext] = None
+                if scenario.warm_cache:
+                    warm_context = stack.enter_context(
+                        create_context(path_to_project, tmp_dir, parallelize)
+                    )
+                    run_scenario(scenario, warm_context, args.verbose)
+
+                for _ in range(args.repeat):
+                    with (
+                        contextlib.nullcontext(warm_context)
+                        if warm_context is not None
+                        else create_context(
+                            path_to_project, tmp_dir, parallelize
+                        )
+                    ) as context_:
+                        if warm_context is not None:
+                            # Only the cache is warm, the output is created
+                            # again.
+                            shutil.rmtree(
+                                context_.path_to_output_dir, ignore_errors=True
+                            )
+                        measurements, peak_memory_mb = run_scenario(
+                            scenario, context_, args.verbose
+                        )
+                    for measurement_, time_ in measurements.items():
+                        times.setdefault(measurement_, []).append(time_)
+                    if peak_memory_mb is not None:
+                        peak_memory.append(peak_memory_mb)
+
+            for measurement_, times_ in times.items():
+                result = {
+                    "scenario": scenario.name,
+                    "measurement": measurement_,
+                    "times": [round(time_, 4) for time_ in times_],
+                    "min": round(min(times_), 4),
+                    "median": round(statistics.median(times_), 4),
+                    "mean": round(statistics.mean(times_), 4),
+                    "max": round(max(times_), 4),
+                    "peak_memory_mb": max(peak_memory)
+                    if len(peak_memory) > 0
+                    else None,
+                }
+                results.append(result)
+                print(  # noqa: T201
+                    f"{scenario.name}/{measurement_} ".ljust(60, ".")
+                    + f" median {result['median']:0.3f}s, "
+                    f"min {result['min']:0.3f}s, max {result['max']:0.3f}s",
+                    flush=True,
+                )
+
+    report = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "strictdoc_version": __version__,
+        "git_revision": get_git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parallelization": parallelize,
+        "repeat": args.repeat,
+        "project": project_config.to_dict(),
+        "results": results,
+    }
+    if args.output is not None:
+        output_dir = os.path.dirname(os.path.abspath(args.output))
+        os.makedirs(output_dir, exist_ok=True)
+        with open(args.output, "w", encoding="utf8") as output_file_:
+            json.dump(report, output_file_, indent=2)
+        print(f"Results written to: {args.output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
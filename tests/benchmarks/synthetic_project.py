@@ -0,0 +1,403 @@
+"""
+Generator of synthetic StrictDoc projects for the performance benchmarks.
+
+The generated project is fully determined by its configuration, including the
+random seed, so that the benchmark results of different runs and machines are
+comparable.
+
+Usage: python tests/benchmarks/synthetic_project.py OUTPUT_DIR
+           [--preset PRESET] [--documents N] [--nodes-per-document N] [...]
+"""
+
+import argparse
+import os
+import random
+import shutil
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List
+
+STATUSES = ("Draft", "Active", "Approved", "Deprecated")
+
+RST_HEAVY_STATEMENT = """\
+The system shall process the **input {index}** as described below:
+
+- The *first* item refers to ``parameter_{index}``.
+- The second item links to `the documentation <https://strictdoc.readthedocs.io>`_.
+
+  - A nested item with a footnote-like remark.
+
+.. list-table:: Parameters of {uid}
+   :header-rows: 1
+
+   * - Name
+     - Value
+   * - Timeout
+     - {index} ms
+   * - Retries
+     - 3
+
+.. code-block:: c
+
+    int process_{index}(int value) {{
+        return value * {index};
+    }}
+
+.. note::
+
+    This note is a part of the requirement {uid}.
+"""
+
+RST_HEAVY_RATIONALE = """\
+The behavior is required by the upstream specification, see the table in the
+statement. The values were agreed with the **stakeholders** of the
+``{uid}`` feature.
+"""
+
+
+@dataclass
+class SyntheticProjectConfig:
+    documents: int = 10
+    nodes_per_document: int = 50
+    sections_per_document: int = 5
+    # The average number of Parent relations of a node. The parents are
+    # chosen among the nodes of the previous documents, so that the relation
+    # chains go through the whole document tree.
+    relation_density: float = 1.0
+    # The fraction of the nodes with RST lists, tables, code blocks and a
+    # RATIONALE field.
+    rst_heavy_ratio: float = 0.2
+    # The number of documents that include another document with
+    # [DOCUMENT_FROM_FILE].
+    included_documents: int = 2
+    # The number of C and Python source files with the markers that trace to
+    # the requirements.
+    source_files: int = 20
+    markers_per_source_file: int = 5
+    seed: int = 1
+
+    PRESETS = {
+        "tiny": {
+            "documents": 3,
+            "nodes_per_document": 10,
+            "included_documents": 1,
+            "source_files": 4,
+        },
+        "small": {},
+        "medium": {
+            "documents": 30,
+            "nodes_per_document": 200,
+            "included_documents": 5,
+            "source_files": 100,
+        },
+        "large": {
+            "documents": 100,
+            "nodes_per_document": 500,
+            "included_documents": 10,
+            "source_files": 500,
+            "markers_per_source_file": 10,
+        },
+    }
+
+    @staticmethod
+    def create_from_preset(
+        preset: str, **overrides: int
+    ) -> "SyntheticProjectConfig":
+        assert preset in SyntheticProjectConfig.PRESETS, preset
+        config_values: Dict[str, float] = dict(
+            SyntheticProjectConfig.PRESETS[preset]
+        )
+        config_values.update(
+            {
+                key_: value_
+                for key_, value_ in overrides.items()
+                if value_ is not None
+            }
+        )
+        return SyntheticProjectConfig(**config_values)  # type: ignore[arg-type]
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+class SyntheticProjectGenerator:
+    def __init__(self, config: SyntheticProjectConfig) -> None:
+        assert config.documents > 0, config
+        assert config.nodes_per_document > 0, config
+        assert config.sections_per_document > 0, config
+        assert 0 <= config.included_documents <= config.documents, config
+        self.config: SyntheticProjectConfig = config
+        self.random: random.Random = random.Random(config.seed)
+
+    def generate(self, path_to_project: str) -> None:
+        """
+        Write the project to path_to_project: strictdoc.toml, the documents in
+        docs/ and the source files in src/.
+        """
+
+        config = self.config
+        if os.path.exists(path_to_project):
+            shutil.rmtree(path_to_project)
+        path_to_docs = os.path.join(path_to_project, "docs")
+        path_to_sources = os.path.join(path_to_project, "src")
+        os.makedirs(path_to_docs)
+        os.makedirs(path_to_sources)
+
+        self._write(
+            os.path.join(path_to_project, "strictdoc.toml"),
+            self.create_strictdoc_toml(),
+        )
+
+        previous_uids: List[str] = []
+        all_uids: List[str] = []
+        for document_idx_ in range(config.documents):
+            document_uids = [
+                self.get_uid(document_idx_, node_idx_)
+                for node_idx_ in range(config.nodes_per_document)
+            ]
+            self._write(
+                os.path.join(path_to_docs, f"document_{document_idx_}.sdoc"),
+                self.create_document(
+                    document_idx_, document_uids, previous_uids
+                ),
+            )
+            previous_uids = document_uids
+            all_uids.extend(document_uids)
+
+        for document_idx_ in range(config.included_documents):
+            self._write(
+                os.path.join(path_to_docs, f"_included_{document_idx_}.sdoc"),
+                self.create_included_document(document_idx_),
+            )
+
+        for source_file_idx_ in range(config.source_files):
+            extension = "c" if source_file_idx_ % 2 == 0 else "py"
+            self._write(
+                os.path.join(
+                    path_to_sources,
+                    f"module_{source_file_idx_ // 50}",
+                    f"file_{source_file_idx_}.{extension}",
+                ),
+                self.create_source_file(source_file_idx_, extension, all_uids),
+            )
+
+    def create_strictdoc_toml(self) -> str:
+        features = [
+            "TABLE_SCREEN",
+            "TRACEABILITY_SCREEN",
+            "DEEP_TRACEABILITY_SCREEN",
+            "SEARCH",
+            "PROJECT_STATISTICS_SCREEN",
+            "TRACEABILITY_MATRIX_SCREEN",
+        ]
+        if self.config.source_files > 0:
+            features.append("REQUIREMENT_TO_SOURCE_TRACEABILITY")
+        features_string = "".join(f'  "{feature_}",\n' for feature_ in features)
+        return f"""\
+[project]
+title = "Synthetic Benchmark Project"
+
+features = [
+{features_string}]
+
+include_doc_paths = [
+  "docs/**",
+]
+
+include_source_paths = [
+  "src/**",
+]
+"""
+
+    def create_document(
+        self,
+        document_idx: int,
+        document_uids: List[str],
+        parent_uids: List[str],
+    ) -> str:
+        config = self.config
+        lines: List[str] = [
+            "[DOCUMENT]",
+            f"TITLE: Document {document_idx}",
+            "",
+        ]
+        nodes_per_section = -(
+            -config.nodes_per_document // config.sections_per_document
+        )
+        for node_idx_, uid_ in enumerate(document_uids):
+            if node_idx_ % nodes_per_section == 0:
+                if node_idx_ > 0:
+                    lines.extend(["[[/SECTION]]", ""])
+                lines.extend(
+                    [
+                        "[[SECTION]]",
+                        f"TITLE: Section {node_idx_ // nodes_per_section}",
+                        "",
+                    ]
+                )
+            lines.extend(self.create_node(node_idx_, uid_, parent_uids))
+        lines.extend(["[[/SECTION]]", ""])
+
+        if document_idx < config.included_documents:
+            lines.extend(
+                [
+                    "[DOCUMENT_FROM_FILE]",
+                    f"FILE: _included_{document_idx}.sdoc",
+                    "",
+                ]
+            )
+        return "\n".join(lines)
+
+    def create_included_document(self, document_idx: int) -> str:
+        lines: List[str] = [
+            "[DOCUMENT]",
+            f"TITLE: Included document {document_idx}",
+            "",
+        ]
+        for node_idx_ in range(max(1, self.config.nodes_per_document // 10)):
+            lines.extend(
+                self.create_node(
+                    node_idx_, f"INC-{document_idx}-{node_idx_}", []
+                )
+            )
+        return "\n".join(lines)
+
+    def create_node(
+        self, node_idx: int, uid: str, parent_uids: List[str]
+    ) -> List[str]:
+        config = self.config
+        lines: List[str] = [
+            "[REQUIREMENT]",
+            f"UID: {uid}",
+            f"STATUS: {STATUSES[node_idx % len(STATUSES)]}",
+            f"TITLE: Requirement {uid}",
+        ]
+        is_rst_heavy = self.random.random() < config.rst_heavy_ratio
+        if is_rst_heavy:
+            lines.extend(
+                [
+                    "STATEMENT: >>>",
+                    RST_HEAVY_STATEMENT.format(index=node_idx, uid=uid),
+                    "<<<",
+                    "RATIONALE: >>>",
+                    RST_HEAVY_RATIONALE.format(uid=uid),
+                    "<<<",
+                ]
+            )
+        else:
+            lines.append(
+                f"STATEMENT: The system shall do the thing number "
+                f"{node_idx} of {uid}."
+            )
+
+        if len(parent_uids) > 0:
+            number_of_parents = int(config.relation_density) + (
+                1 if self.random.random() < config.relation_density % 1 else 0
+            )
+            selected_parent_uids = self.random.sample(
+                parent_uids, min(number_of_parents, len(parent_uids))
+            )
+            if len(selected_parent_uids) > 0:
+                lines.append("RELATIONS:")
+                for parent_uid_ in selected_parent_uids:
+                    lines.extend(["- TYPE: Parent", f"  VALUE: {parent_uid_}"])
+        lines.append("")
+        return lines
+
+    def create_source_file(
+        self, source_file_idx: int, extension: str, uids: List[str]
+    ) -> str:
+        comment = "//" if extension == "c" else "#"
+        marked_uids = self.random.sample(
+            uids, min(self.config.markers_per_source_file, len(uids))
+        )
+        lines: List[str] = [
+            f"{comment} @relation({marked_uids[0]}, scope=file)",
+            "",
+        ]
+        for function_idx_, uid_ in enumerate(marked_uids):
+            function_name = f"function_{source_file_idx}_{function_idx_}"
+            lines.append(f"{comment} @relation({uid_}, scope=range_start)")
+            if extension == "c":
+                lines.extend(
+                    [
+                        f"int {function_name}(int value) {{",
+                        "    int result = value;",
+                        "    for (int i = 0; i < 10; i++) {",
+                        f"        result += i * {function_idx_};",
+                        "    }",
+                        "    return result;",
+                        "}",
+                    ]
+                )
+            else:
+                lines.extend(
+                    [
+                        f"def {function_name}(value):",
+                        "    result = value",
+                        "    for i in range(10):",
+                        f"        result += i * {function_idx_}",
+                        "    return result",
+                    ]
+                )
+            lines.extend([f"{comment} @relation({uid_}, scope=range_end)", ""])
+        return "\n".join(lines)
+
+    @staticmethod
+    def get_uid(document_idx: int, node_idx: int) -> str:
+        return f"REQ-{document_idx}-{node_idx}"
+
+    @staticmethod
+    def _write(path_to_file: str, content: str) -> None:
+        os.makedirs(os.path.dirname(path_to_file), exist_ok=True)
+        with open(path_to_file, "w", encoding="utf8") as file_:
+            file_.write(content)
+
+
+def generate_synthetic_project(
+    path_to_project: str, config: SyntheticProjectConfig
+) -> None:
+    SyntheticProjectGenerator(config).generate(path_to_project)
+
+
+def add_project_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--preset",
+        choices=list(SyntheticProjectConfig.PRESETS.keys()),
+        default="small",
+    )
+    for field_ in fields(SyntheticProjectConfig):
+        parser.add_argument(
+            "--" + field_.name.replace("_", "-"),
+            type=float if field_.type in (float, "float") else int,
+            default=None,
+            help=f"Overrides the preset value: {field_.default}.",
+        )
+
+
+def create_config_from_arguments(
+    args: argparse.Namespace,
+) -> SyntheticProjectConfig:
+    return SyntheticProjectConfig.create_from_preset(
+        args.preset,
+        **{
+            field_.name: getattr(args, field_.name)
+            for field_ in fields(SyntheticProjectConfig)
+        },
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output_dir")
+    add_project_arguments(parser)
+    args = parser.parse_args()
+
+    config = create_config_from_arguments(args)
+    generate_synthetic_project(args.output_dir, config)
+    print(  # noqa: T201
+        f"Generated a synthetic project: {args.output_dir}\n{config}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import pytest
+from textx import TextXSyntaxError
+
+from strictdoc.backend.sdoc.constants import SDocParser
+from strictdoc.backend.sdoc.native_parser import (
+    NativeParserNoMatch,
+    find_model_difference,
+)
+from strictdoc.backend.sdoc.reader import SDReader
+from strictdoc.helpers.exception import StrictDocException
+
+SDOC_INPUTS = [
+    """\
+[DOCUMENT]
+TITLE: Minimal document
+""",
+    """\
+[DOCUMENT]
+MID: 0f8c43a0c03a4f1e8d71c0a2b23c6b4f
+TITLE: Document with config
+UID: DOC-1
+VERSION: 1.0
+CLASSIFICATION: Public
+REQ_PREFIX: REQ-
+ROOT: True
+OPTIONS:
+  ENABLE_MID: True
+  MARKUP: RST
+  AUTO_LEVELS: Off
+  LAYOUT: Website
+  VIEW_STYLE: Table
+  NODE_IN_TOC: True
+  DEFAULT_VIEW: PRINT_VIEW
+METADATA:
+  AUTHOR: Alice
+  Some-Key: Some value
+VIEWS:
+- ID: PRINT_VIEW
+  NAME: Print view
+  TAGS:
+  - OBJECT_TYPE: REQUIREMENT
+    VISIBLE_FIELDS:
+    - NAME: UID
+      PLACEMENT: XYZ
+    - NAME: TITLE
+  HIDDEN_TAGS:
+  - TEXT
+
+[GRAMMAR]
+ELEMENTS:
+- TAG: TEXT
+  FIELDS:
+  - TITLE: STATEMENT
+    TYPE: String
+    REQUIRED: True
+- TAG: REQUIREMENT
+  PROPERTIES:
+    IS_COMPOSITE: True
+    VIEW_STYLE: Narrative
+  FIELDS:
+  - TITLE: UID
+    TYPE: String
+    REQUIRED: False
+  - TITLE: STATUS
+    TYPE: SingleChoice(Draft, In Review, Approved)
+    REQUIRED: False
+  - TITLE: TAGS
+    TYPE: Tag
+    REQUIRED: False
+  - TITLE: TITLE
+    TYPE: String
+    REQUIRED: False
+  - TITLE: STATEMENT
+    TYPE: String
+    REQUIRED: False
+  RELATIONS:
+  - TYPE: Parent
+  - TYPE: Parent
+    ROLE: Refines
+  - TYPE: File
+""",
+    """\
+[DOCUMENT]
+TITLE: Document with nodes
+
+[TEXT]
+STATEMENT: >>>
+Some text with [LINK: REQ-2] and [LINK: ANCHOR-1].
+<<<
+
+[[SECTION]]
+TITLE: Section 1
+
+[REQUIREMENT]
+UID: REQ-1
+TITLE: Requirement 1
+STATEMENT: >>>
+Statement
+
+[ANCHOR: ANCHOR-1, Anchor title]
+
+Another paragraph.
+<<<
+
+[[/SECTION]]
+
+[[REQUIREMENT]]
+UID: REQ-2
+TITLE: Composite requirement
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-1
+  ROLE: Refines
+- TYPE: File
+  VALUE: file.py
+
+[REQUIREMENT]
+UID: REQ-3
+RELATIONS:
+- TYPE: Child
+  VALUE: REQ-1
+
+[[/REQUIREMENT]]
+""",
+    """\
+[DOCUMENT]
+TITLE: Document with old sections
+
+[SECTION]
+TITLE: Section 1
+
+[TEXT]
+STATEMENT: Free text.
+
+[SECTION]
+UID: SECT-2
+LEVEL: None
+TITLE: Section 2
+
+[REQUIREMENT]
+STATEMENT: Single-line statement
+
+[/SECTION]
+
+[/SECTION]
+""",
+]
+
+
+@pytest.mark.parametrize("input_sdoc", SDOC_INPUTS)
+def test_01_native_parser_produces_the_same_model(input_sdoc):
+    textx_document, textx_parse_context = SDReader._read(
+        input_sdoc, sdoc_parser=SDocParser.TEXTX
+    )
+    native_document, native_parse_context = SDReader._read(
+        input_sdoc, sdoc_parser=SDocParser.NATIVE
+    )
+    assert (
+        find_model_difference(
+            (textx_document, textx_parse_context),
+            (native_document, native_parse_context),
+        )
+        is None
+    )
+
+    # The conformance mode runs both parsers and returns the textX model.
+    SDReader._read(input_sdoc, sdoc_parser=SDocParser.CONFORMANCE)
+
+
+def test_02_native_parser_does_not_match_invalid_input():
+    input_sdoc = """\
+[DOCUMENT]
+TITLE: Document
+
+[REQUIREMENT]
+STATEMENT: >>>
+Unterminated multiline field
+"""
+
+    with pytest.raises(NativeParserNoMatch):
+        SDReader.native_parser_model.parse(input_sdoc, None, {})
+
+    # The syntax errors are reported by textX.
+    with pytest.raises(StrictDocException) as textx_exception:
+        SDReader._read(input_sdoc, sdoc_parser=SDocParser.TEXTX)
+    with pytest.raises(StrictDocException) as native_exception:
+        SDReader._read(input_sdoc, sdoc_parser=SDocParser.NATIVE)
+    assert isinstance(native_exception.value.__cause__, TextXSyntaxError)
+    assert str(native_exception.value) == str(textx_exception.value)
+
+
+def test_03_model_difference_is_reported():
+    lhs, _ = SDReader._read(
+        """\
+[DOCUMENT]
+TITLE: Document
+
+[REQUIREMENT]
+TITLE: Requirement 1
+""",
+        sdoc_parser=SDocParser.TEXTX,
+    )
+    rhs, _ = SDReader._read(
+        """\
+[DOCUMENT]
+TITLE: Document
+
+[REQUIREMENT]
+TITLE: Requirement 2
+""",
+        sdoc_parser=SDocParser.NATIVE,
+    )
+    difference = find_model_difference(lhs, rhs)
+    assert difference is not None
+    assert "Requirement 1" in difference
@@ -95,7 +95,11 @@ def hello_world_2():
 """.lstrip()
 
     reader = SourceFileTraceabilityReader()
-    _ = reader.read(source_input)
+    traceability_info = reader.read(source_input)
+
+    assert traceability_info.markers == []
+    assert traceability_info.file_stats.lines_total == 3
+    assert traceability_info.file_stats.lines_non_empty == 2
 
 
 def test_006_empty_file():
@@ -387,6 +391,43 @@ def hello_world():
     assert markers[0].ng_range_line_end == 6
 
 
+def test_070_reader_reused_for_several_files():
+    source_input_1 = """
+# @relation(REQ-001, scope=range_start)
+CONTENT 1
+# @relation(REQ-001, scope=range_end)
+""".lstrip()
+
+    source_input_2 = """
+# @relation(REQ-002, scope=range_start)
+CONTENT 2
+""".lstrip()
+
+    source_input_3 = """
+CONTENT 3
+# @relation(REQ-003, scope=line)
+CONTENT 3
+""".lstrip()
+
+    reader = SourceFileTraceabilityReader()
+
+    traceability_info_1 = reader.read(source_input_1)
+    with pytest.raises(StrictDocSemanticError):
+        reader.read(source_input_2)
+    traceability_info_3 = reader.read(source_input_3)
+
+    assert [marker_.reqs for marker_ in traceability_info_1.markers] == [
+        ["REQ-001"],
+        ["REQ-001"],
+    ]
+    assert list(traceability_info_1.ng_map_reqs_to_markers) == ["REQ-001"]
+    assert [marker_.reqs for marker_ in traceability_info_3.markers] == [
+        ["REQ-003"]
+    ]
+    assert list(traceability_info_3.ng_map_reqs_to_markers) == ["REQ-003"]
+    assert traceability_info_3.markers[0].ng_source_line_begin == 2
+
+
 def test_validation_01_one_range_marker_begin_req_not_equal_to_end_req():
     source_input = """
 # @sdoc[REQ-001]
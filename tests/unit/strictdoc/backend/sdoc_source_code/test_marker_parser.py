@@ -183,3 +183,16 @@ def test_23_parses_within_doxygen_comment():
     assert function_range.reqs_objs[2].uid == "REQ-6"
     assert function_range.reqs_objs[2].ng_source_line == 13
     assert function_range.reqs_objs[2].ng_source_column == 8
+
+
+def test_30_comment_without_markers():
+    input_string = """\
+/**
+ * Some text.
+ */
+"""
+
+    source_node = MarkerParser.parse(input_string, 1, 3, 1, "function")
+    assert source_node.entity_name == "function"
+    assert source_node.markers == []
+    assert source_node.fields == {}
@@ -16,6 +16,7 @@ def test_export_01_minimal():
 
     assert args.command == "export"
     assert args.debug is False
+    assert args.trace_output is None
     assert args.fields == ["uid", "statement", "parent"]
     assert args.formats == ["html"]
     assert args.input_paths == ["docs"]
@@ -157,6 +158,20 @@ def test_export_09_config():
     assert export_config.get_path_to_config() == "/path/to/strictdoc.toml"
 
 
+def test_export_10_sdoc_parser():
+    parser = cli_args_parser()
+
+    args = parser.parse_args(["export", "docs"])
+    assert args.sdoc_parser is None
+
+    args = parser.parse_args(["export", "docs", "--sdoc-parser", "native"])
+    assert args.sdoc_parser == "native"
+
+    config_parser = create_sdoc_args_parser(args)
+    export_config = config_parser.get_export_config()
+    assert export_config.sdoc_parser == "native"
+
+
 def test_passthrough_01_minimal():
     parser = cli_args_parser()
 
@@ -181,6 +196,7 @@ def test_passthrough_01_minimal():
         ("reqif_enable_mid", False),
         ("reqif_multiline_is_xhtml", False),
         ("reqif_profile", None),
+        ("trace_output", None),
         ("view", None),
     ]
 
@@ -211,5 +227,46 @@ def test_passthrough_02_minimal():
         ("reqif_enable_mid", False),
         ("reqif_multiline_is_xhtml", False),
         ("reqif_profile", None),
+        ("trace_output", None),
         ("view", None),
     ]
+
+
+def test_cache_01_stats():
+    parser = cli_args_parser()
+
+    args = parser.parse_args(["cache", "stats", "--output-dir", "SANDBOX/"])
+
+    assert sorted(args._get_kwargs()) == [
+        ("command", "cache"),
+        ("config", None),
+        ("debug", False),
+        ("output_dir", "SANDBOX/"),
+        ("subcommand", "stats"),
+        ("trace_output", None),
+    ]
+
+    cache_config = create_sdoc_args_parser(args).get_cache_config()
+    assert cache_config.subcommand == "stats"
+    assert cache_config.output_dir == "SANDBOX/"
+    assert cache_config.max_size_mb is None
+
+
+def test_cache_02_prune():
+    parser = cli_args_parser()
+
+    args = parser.parse_args(["cache", "prune", "--max-size-mb", "0"])
+
+    assert sorted(args._get_kwargs()) == [
+        ("command", "cache"),
+        ("config", None),
+        ("debug", False),
+        ("max_size_mb", 0),
+        ("output_dir", None),
+        ("subcommand", "prune"),
+        ("trace_output", None),
+    ]
+
+    cache_config = create_sdoc_args_parser(args).get_cache_config()
+    assert cache_config.subcommand == "prune"
+    assert cache_config.max_size_mb == 0
@@ -0,0 +1,140 @@
+import os
+import tempfile
+
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.core.project_config import ProjectConfig
+from strictdoc.core.query_engine.query_object import QueryObject
+from strictdoc.core.query_engine.query_reader import QueryReader
+from strictdoc.core.traceability_index import TraceabilityIndex
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
+from strictdoc.helpers.parallelizer import NullParallelizer
+
+SDOC_INPUT_1 = """[DOCUMENT]
+TITLE: Document 1
+
+[REQUIREMENT]
+UID: REQ-1
+STATUS: Active
+TITLE: Requirement 1
+STATEMENT: The system shall do something.
+
+[[SECTION]]
+TITLE: Section about Apples
+
+[REQUIREMENT]
+UID: REQ-2
+STATUS: Draft
+TITLE: Requirement 2
+STATEMENT: The system shall eat apples.
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-1
+
+[[/SECTION]]
+"""
+
+SDOC_INPUT_2 = """[DOCUMENT]
+TITLE: Document 2
+
+[TEXT]
+STATEMENT: Some text about apples.
+
+[REQUIREMENT]
+UID: REQ-3
+TITLE: Requirement 3
+STATEMENT: The system shall do something else.
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-2
+"""
+
+QUERIES = [
+    'node.contains("apples")',
+    'node.contains("Requirement")',
+    'node.contains("xyz")',
+    "node.is_requirement",
+    "node.is_section",
+    "(node.is_requirement and node.has_parent_requirements)",
+    "(node.is_requirement and node.has_child_requirements)",
+    '(node.is_requirement and node["STATUS"] == "Active")',
+    '(node.is_requirement and node["STATUS"] != "Active")',
+    '(node.is_requirement and node["STATUS"] == None)',
+    '(node.is_requirement and node["STATUS"] != None)',
+    '(node.is_requirement and not node.contains("apples"))',
+    '(node.is_section or node["UID"] == "REQ-3")',
+    '(node.is_requirement and "Requirement" in node["TITLE"])',
+]
+
+
+def create_traceability_index(
+    default_project_config: ProjectConfig, tmp_dir: str
+) -> TraceabilityIndex:
+    project_config = default_project_config
+    project_config.input_paths = [os.path.join(tmp_dir, "input")]
+    project_config.output_dir = os.path.join(tmp_dir, "output")
+    project_config.export_output_html_root = os.path.join(
+        tmp_dir, "output", "html"
+    )
+    project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+    os.mkdir(project_config.input_paths[0])
+    for file_name_, content_ in (
+        ("document_1.sdoc", SDOC_INPUT_1),
+        ("document_2.sdoc", SDOC_INPUT_2),
+    ):
+        with open(
+            os.path.join(project_config.input_paths[0], file_name_), "w"
+        ) as file_:
+            file_.write(content_)
+    return TraceabilityIndexBuilder.create(
+        project_config=project_config, parallelizer=NullParallelizer()
+    )
+
+
+def evaluate_all_nodes(
+    traceability_index: TraceabilityIndex, query_object: QueryObject
+):
+    result = []
+    for document_ in traceability_index.document_tree.document_list:
+        document_iterator = traceability_index.get_document_iterator(document_)
+        for node_, _ in document_iterator.all_content(print_fragments=False):
+            if query_object.evaluate(node_):
+                result.append(node_)
+    return result
+
+
+def test_01_index_finds_same_nodes_as_evaluation(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+        for query_ in QUERIES:
+            query_object = QueryObject(
+                QueryReader.read(query_), traceability_index
+            )
+            expected_nodes = evaluate_all_nodes(
+                traceability_index, query_object
+            )
+            assert query_object.find_nodes() == expected_nodes, query_
+
+
+def test_02_invalidated_document_is_reindexed(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+        query_object = QueryObject(
+            QueryReader.read('node["STATUS"] == "Active"'), traceability_index
+        )
+        requirement_1 = traceability_index.get_node_by_uid("REQ-1")
+        requirement_2 = traceability_index.get_node_by_uid("REQ-2")
+        assert query_object.find_nodes() == [requirement_1]
+
+        requirement_2.set_field_value(
+            field_name="STATUS", form_field_index=0, value="Active"
+        )
+        # The index does not see the edit until the document is invalidated.
+        assert query_object.find_nodes() == [requirement_1]
+
+        document: SDocDocument = requirement_2.get_document()
+        traceability_index.query_index.invalidate_document(document)
+        assert query_object.find_nodes() == [requirement_1, requirement_2]
@@ -0,0 +1,100 @@
+import pytest
+
+from strictdoc.backend.sdoc.models.section import SDocSection
+from strictdoc.core.document_tree import DocumentTree
+from strictdoc.core.query_engine.query_object import (
+    NodeContainsExpression,
+    NodeHasParentRequirementsExpression,
+    NodeIsRequirementExpression,
+    QueryCompiler,
+    QueryObject,
+)
+from strictdoc.core.query_engine.query_reader import QueryReader
+from strictdoc.core.traceability_index import TraceabilityIndex
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
+from tests.unit.helpers.document_builder import DocumentBuilder
+
+
+def create_traceability_index():
+    document_builder = DocumentBuilder()
+    requirement_1 = document_builder.add_requirement("REQ-001")
+    requirement_2 = document_builder.add_requirement("REQ-002")
+    document_builder.add_requirement_relation(
+        relation_type="Parent",
+        source_requirement_id="REQ-002",
+        target_requirement_id="REQ-001",
+        role=None,
+    )
+    document = document_builder.build()
+    document_tree = DocumentTree(
+        file_tree=[],
+        document_list=[document],
+        map_docs_by_paths={},
+        map_docs_by_rel_paths={},
+        map_grammars_by_filenames={},
+    )
+    traceability_index: TraceabilityIndex = (
+        TraceabilityIndexBuilder.create_from_document_tree(
+            document_tree, project_config=document_builder.project_config
+        )
+    )
+    return traceability_index, requirement_1, requirement_2
+
+
+def test_01_compiled_query_evaluates_nodes():
+    traceability_index, requirement_1, requirement_2 = (
+        create_traceability_index()
+    )
+    query_object = QueryObject(
+        QueryReader.read(
+            '(node.is_requirement and node["UID"] != "REQ-003" '
+            "and node.has_parent_requirements)"
+        ),
+        traceability_index,
+    )
+    assert query_object.evaluate(requirement_1) is False
+    assert query_object.evaluate(requirement_2) is True
+
+    query_object = QueryObject(
+        QueryReader.read('(node["UID"] == "REQ-001" or node["UID"] == None)'),
+        traceability_index,
+    )
+    assert query_object.evaluate(requirement_1) is True
+    assert query_object.evaluate(requirement_2) is False
+
+
+def test_02_expressions_that_may_raise_are_not_reordered():
+    traceability_index, _, _ = create_traceability_index()
+    section = SDocSection(
+        parent=None,
+        mid=None,
+        uid=None,
+        custom_level=None,
+        title="Section",
+        requirement_prefix=None,
+        section_contents=[],
+    )
+
+    query = QueryReader.read(
+        "(node.is_requirement and node.has_parent_requirements)"
+    )
+    assert QueryObject(query, traceability_index).evaluate(section) is False
+
+    query = QueryReader.read(
+        "(node.has_parent_requirements and node.is_requirement)"
+    )
+    with pytest.raises(TypeError):
+        QueryObject(query, traceability_index).evaluate(section)
+
+
+def test_03_cheap_expressions_are_compiled_first():
+    traceability_index, _, _ = create_traceability_index()
+    compiler = QueryCompiler(traceability_index)
+
+    contains = compiler.compile(NodeContainsExpression(None, "REQ"))
+    has_parent = compiler.compile(NodeHasParentRequirementsExpression(None, ""))
+    is_requirement = compiler.compile(NodeIsRequirementExpression(None, ""))
+    assert contains.may_raise
+    assert has_parent.may_raise
+    assert not is_requirement.may_raise
+    assert is_requirement.cost < has_parent.cost < contains.cost
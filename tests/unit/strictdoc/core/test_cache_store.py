@@ -0,0 +1,128 @@
+import gc
+import os
+import sqlite3
+import tempfile
+import threading
+import weakref
+from typing import List, Tuple
+
+from strictdoc.core.cache_store import CacheStore
+
+
+def test_01_get_and_put():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_store = CacheStore(
+            os.path.join(tmp_dir, CacheStore.FILE_NAME), max_size=1024
+        )
+        assert cache_store.get("sdoc", "input.sdoc") is None
+
+        cache_store.put("sdoc", "input.sdoc", b"AAA", version="1")
+        assert cache_store.get("sdoc", "input.sdoc", version="1") == b"AAA"
+        assert cache_store.get("sdoc", "input.sdoc", version="2") is None
+        assert cache_store.get("rst", "input.sdoc", version="1") is None
+
+        # A new version replaces the outdated item.
+        cache_store.put("sdoc", "input.sdoc", b"BBBB", version="2")
+        assert cache_store.get("sdoc", "input.sdoc", version="1") is None
+        assert cache_store.get("sdoc", "input.sdoc", version="2") == b"BBBB"
+        assert cache_store.get_total_size() == 4
+
+
+def test_02_least_recently_used_items_are_evicted():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_store = CacheStore(
+            os.path.join(tmp_dir, CacheStore.FILE_NAME), max_size=1000
+        )
+        for idx_ in range(4):
+            cache_store.put("rst", f"fragment{idx_}", b"X" * 200)
+            cache_store.connection.execute(
+                "UPDATE items SET last_access = ? WHERE key = ?",
+                (idx_, f"fragment{idx_}"),
+            )
+
+        # Accessing an item makes it the most recently used one.
+        assert cache_store.get("rst", "fragment0") is not None
+
+        cache_store.put("rst", "fragment4", b"X" * 300)
+
+        assert cache_store.get_total_size() <= 800
+        assert cache_store.get("rst", "fragment0") is not None
+        assert cache_store.get("rst", "fragment1") is None
+        assert cache_store.get("rst", "fragment4") is not None
+
+
+def test_03_prune_and_stats():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_db = os.path.join(tmp_dir, CacheStore.FILE_NAME)
+        cache_store = CacheStore(path_to_db, max_size=1024)
+        cache_store.put("jinja", "template1", b"X" * 10)
+        cache_store.put("jinja", "template2", b"X" * 20)
+        cache_store.put("sdoc", "input.sdoc", b"X" * 30)
+
+        # The store is shared with other processes through the same file.
+        other_cache_store = CacheStore(path_to_db, max_size=1024)
+        assert other_cache_store.get_stats() == [
+            ("jinja", 2, 30),
+            ("sdoc", 1, 30),
+        ]
+
+        assert other_cache_store.prune(0) == (3, 60)
+        assert cache_store.get_stats() == []
+
+
+def test_04_every_thread_has_its_own_connection(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        default_project_config.dir_for_sdoc_cache = tmp_dir
+        cache_store = CacheStore.get_instance(default_project_config)
+        cache_store.put("rst", "fragment", b"AAA")
+        assert CacheStore.get_instance(default_project_config) is cache_store
+
+        # The server handles the requests in a thread pool.
+        values: List[bytes] = []
+        thread_cache_stores: List[weakref.ref[CacheStore]] = []
+
+        def read_in_thread_() -> None:
+            thread_cache_store = CacheStore.get_instance(default_project_config)
+            assert thread_cache_store is not cache_store
+            value = thread_cache_store.get("rst", "fragment")
+            assert value is not None
+            values.append(value)
+            thread_cache_stores.append(weakref.ref(thread_cache_store))
+
+        thread = threading.Thread(target=read_in_thread_)
+        thread.start()
+        thread.join()
+        assert values == [b"AAA"]
+
+        # The store of a finished thread is released with its connection.
+        gc.collect()
+        assert thread_cache_stores[0]() is None
+
+
+def test_05_failed_lookup_is_a_cache_miss():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_store = CacheStore(
+            os.path.join(tmp_dir, CacheStore.FILE_NAME), max_size=1024
+        )
+        cache_store.put("rst", "fragment", b"AAA")
+
+        # Any failing SELECT raises sqlite3.OperationalError, like a store
+        # that stays locked for longer than the connection timeout.
+        cache_store.connection.execute("DROP TABLE items")
+
+        assert cache_store.get("rst", "fragment") is None
+
+
+def test_06_failed_prune_does_not_fail_the_write(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_store = CacheStore(
+            os.path.join(tmp_dir, CacheStore.FILE_NAME), max_size=100
+        )
+
+        def prune_locked_store_(_max_size: int) -> Tuple[int, int]:
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(cache_store, "prune", prune_locked_store_)
+
+        cache_store.put("rst", "fragment", b"X" * 200)
+        assert cache_store.get("rst", "fragment") == b"X" * 200
@@ -0,0 +1,135 @@
+import os
+import tempfile
+
+import pytest
+
+from strictdoc.backend.sdoc.constants import SDocParser
+from strictdoc.backend.sdoc.models.document import SDocDocument
+from strictdoc.backend.sdoc.reader import SDReader
+from strictdoc.backend.sdoc_source_code.test_reports.junit_xml_reader import (
+    JUnitXMLReader,
+)
+from strictdoc.core.document_caching_reader import DocumentCachingReader
+from strictdoc.core.file_tree import File
+from strictdoc.core.project_config import ProjectConfig
+from strictdoc.helpers.paths import SDocRelativePath
+
+JUNIT_XML_INPUT = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="{name}" tests="1" failures="0" disabled="0" skipped="0" time="0">
+  <testcase name="Test1.Case1" classname="Test1.Case1" time="0.1" status="run"/>
+</testsuite>
+"""
+
+
+def create_junit_xml_file(tmp_dir: str, name: str) -> File:
+    path_to_file = os.path.join(tmp_dir, "report.ctest.junit.xml")
+    with open(path_to_file, "w", encoding="utf8") as file_:
+        file_.write(JUNIT_XML_INPUT.format(name=name))
+    return File(0, path_to_file, SDocRelativePath("report.ctest.junit.xml"))
+
+
+def create_project_config(
+    default_project_config: ProjectConfig, tmp_dir: str
+) -> ProjectConfig:
+    project_config = default_project_config
+    project_config.output_dir = os.path.join(tmp_dir, "output")
+    project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+    return project_config
+
+
+def test_01_test_report_is_read_from_cache(default_project_config, monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+        doc_file = create_junit_xml_file(tmp_dir, "Suite 1")
+
+        document = DocumentCachingReader.read_from_file(
+            doc_file, project_config
+        )
+        assert isinstance(document, SDocDocument)
+        assert document.title == "Test report: Suite 1"
+
+        read_from_file = JUnitXMLReader.read_from_file
+
+        def read_from_file_not_expected(*_args, **_kwargs):
+            raise AssertionError("The report must be read from the cache.")
+
+        monkeypatch.setattr(
+            JUnitXMLReader, "read_from_file", read_from_file_not_expected
+        )
+        cached_document = DocumentCachingReader.read_from_file(
+            doc_file, project_config
+        )
+        assert cached_document is not document
+        assert cached_document.title == "Test report: Suite 1"
+
+        # A changed report is read again.
+        doc_file = create_junit_xml_file(tmp_dir, "Suite 22")
+        with pytest.raises(AssertionError):
+            DocumentCachingReader.read_from_file(doc_file, project_config)
+        monkeypatch.setattr(JUnitXMLReader, "read_from_file", read_from_file)
+        document = DocumentCachingReader.read_from_file(
+            doc_file, project_config
+        )
+        assert document.title == "Test report: Suite 22"
+
+
+def test_02_test_report_depends_on_test_report_roots(
+    default_project_config, monkeypatch
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+        doc_file = create_junit_xml_file(tmp_dir, "Suite 1")
+
+        DocumentCachingReader.read_from_file(doc_file, project_config)
+
+        number_of_reads = 0
+        read_from_file = JUnitXMLReader.read_from_file
+
+        def read_from_file_counted(*args, **kwargs):
+            nonlocal number_of_reads
+            number_of_reads += 1
+            return read_from_file(*args, **kwargs)
+
+        monkeypatch.setattr(
+            JUnitXMLReader, "read_from_file", read_from_file_counted
+        )
+        project_config.test_report_root_dict = {
+            "report.ctest.junit.xml": "tests"
+        }
+        DocumentCachingReader.read_from_file(doc_file, project_config)
+        DocumentCachingReader.read_from_file(doc_file, project_config)
+        assert number_of_reads == 1
+
+
+def test_03_sdoc_document_depends_on_sdoc_parser(
+    default_project_config, monkeypatch
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+        path_to_file = os.path.join(tmp_dir, "document.sdoc")
+        with open(path_to_file, "w", encoding="utf8") as file_:
+            file_.write("[DOCUMENT]\nTITLE: Document 1\n")
+        doc_file = File(0, path_to_file, SDocRelativePath("document.sdoc"))
+
+        project_config.sdoc_parser = SDocParser.TEXTX
+        DocumentCachingReader.read_from_file(doc_file, project_config)
+
+        used_sdoc_parsers = []
+        read_with_parse_context = SDReader.read_with_parse_context
+
+        def read_with_parse_context_recorded(*args, **kwargs):
+            used_sdoc_parsers.append(kwargs["sdoc_parser"])
+            return read_with_parse_context(*args, **kwargs)
+
+        monkeypatch.setattr(
+            SDReader,
+            "read_with_parse_context",
+            staticmethod(read_with_parse_context_recorded),
+        )
+        project_config.sdoc_parser = SDocParser.NATIVE
+        document = DocumentCachingReader.read_from_file(
+            doc_file, project_config
+        )
+        DocumentCachingReader.read_from_file(doc_file, project_config)
+        assert used_sdoc_parsers == [SDocParser.NATIVE]
+        assert document.title == "Document 1"
@@ -1,12 +1,18 @@
 import pytest
 
 from strictdoc.core.graph.abstract_bucket import ALL_EDGES
+from strictdoc.core.graph.compact_many_to_many_set import (
+    CompactManyToManySet,
+)
 from strictdoc.core.graph.many_to_many_set import ManyToManySet
 from strictdoc.helpers.ordered_set import OrderedSet
 
+MANY_TO_MANY_SET_CLASSES = [ManyToManySet, CompactManyToManySet]
 
-def test_01_basic():
-    many2many_set = ManyToManySet(int, int)
+
+@pytest.mark.parametrize("many2many_set_class", MANY_TO_MANY_SET_CLASSES)
+def test_01_basic(many2many_set_class):
+    many2many_set = many2many_set_class(int, int)
 
     assert many2many_set.get_link_values(lhs_node=1) == OrderedSet()
 
@@ -34,8 +40,9 @@ def test_01_basic():
     assert not many2many_set.has_link(lhs_node=1)
 
 
-def test_02_basic():
-    many2many_set = ManyToManySet(int, int)
+@pytest.mark.parametrize("many2many_set_class", MANY_TO_MANY_SET_CLASSES)
+def test_02_basic(many2many_set_class):
+    many2many_set = many2many_set_class(int, int)
     many2many_set.delete_link_weak(lhs_node=1, rhs_node=2)
 
     many2many_set.create_link(lhs_node=1, rhs_node=2)
@@ -45,15 +52,17 @@ def test_02_basic():
     assert many2many_set.get_link_values(lhs_node=1) == OrderedSet()
 
 
-def test_03_basic():
-    many2many_set = ManyToManySet(int, int)
+@pytest.mark.parametrize("many2many_set_class", MANY_TO_MANY_SET_CLASSES)
+def test_03_basic(many2many_set_class):
+    many2many_set = many2many_set_class(int, int)
 
     with pytest.raises(TypeError):
         many2many_set.create_link(lhs_node="WRONG", rhs_node=2)
 
 
-def test_10_edges():
-    many2many_set = ManyToManySet(int, int)
+@pytest.mark.parametrize("many2many_set_class", MANY_TO_MANY_SET_CLASSES)
+def test_10_edges(many2many_set_class):
+    many2many_set = many2many_set_class(int, int)
 
     many2many_set.create_link(lhs_node=1, rhs_node=2, edge="refines")
     assert many2many_set.get_link_values(lhs_node=1, edge="refines") == {2}
@@ -65,8 +74,9 @@ def test_10_edges():
     )
 
 
-def test_12_working_with_all_edges():
-    many2many_set = ManyToManySet(int, int)
+@pytest.mark.parametrize("many2many_set_class", MANY_TO_MANY_SET_CLASSES)
+def test_12_working_with_all_edges(many2many_set_class):
+    many2many_set = many2many_set_class(int, int)
 
     assert many2many_set.get_count(edge="refines") == 0
     assert many2many_set.get_count(edge="verifies") == 0
@@ -94,3 +104,40 @@ def test_12_working_with_all_edges():
     assert many2many_set.get_count(edge="refines") == 0
     assert many2many_set.get_count(edge="verifies") == 0
     assert many2many_set.get_count(edge=ALL_EDGES) == 0
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_20_compact_links_and_edits_after_compaction(compact):
+    many2many_set = CompactManyToManySet(int, int)
+    many2many_set.create_link(lhs_node=1, rhs_node=2)
+    many2many_set.create_link(lhs_node=1, rhs_node=3, edge="refines")
+    many2many_set.create_link(lhs_node=1, rhs_node=4)
+    many2many_set.create_link(lhs_node=5, rhs_node=2)
+    if compact:
+        many2many_set.compact()
+
+    # The links are grouped by edge like in ManyToManySet.
+    assert list(many2many_set.get_link_values(lhs_node=1)) == [2, 4, 3]
+    assert many2many_set.get_link_values_with_edges(lhs_node=1) == [
+        (2, None),
+        (4, None),
+        (3, "refines"),
+    ]
+    assert list(many2many_set.get_link_values_reverse(rhs_node=2)) == [1, 5]
+    assert many2many_set.get_count() == 3
+    assert many2many_set.get_count(edge=ALL_EDGES) == 4
+
+    many2many_set.create_link(lhs_node=5, rhs_node=6)
+    many2many_set.delete_link(lhs_node=1, rhs_node=2, edge=None)
+    assert list(many2many_set.get_link_values(lhs_node=1)) == [4, 3]
+    assert list(many2many_set.get_link_values(lhs_node=5)) == [2, 6]
+    assert list(many2many_set.get_link_values_reverse(rhs_node=2)) == [5]
+
+    many2many_set.delete_all_links(lhs_node=5)
+    assert not many2many_set.has_link(lhs_node=5)
+    assert many2many_set.get_link_values_reverse(rhs_node=2) == OrderedSet()
+    assert many2many_set.get_link_values_reverse(rhs_node=6) == OrderedSet()
+
+    many2many_set.compact()
+    assert list(many2many_set.get_link_values(lhs_node=1)) == [4, 3]
+    assert many2many_set.get_count(edge=ALL_EDGES) == 2
@@ -0,0 +1,197 @@
+import datetime
+import os
+import tempfile
+
+from strictdoc.core.project_config import ProjectConfig
+from strictdoc.core.traceability_index import TraceabilityIndex
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
+from strictdoc.helpers.parallelizer import NullParallelizer
+
+SDOC_INPUTS = {
+    "document_1.sdoc": """[DOCUMENT]
+TITLE: Document 1
+
+[REQUIREMENT]
+UID: REQ-1
+TITLE: Requirement 1
+""",
+    "document_2.sdoc": """[DOCUMENT]
+TITLE: Document 2
+
+[REQUIREMENT]
+UID: REQ-2
+TITLE: Requirement 2
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-1
+""",
+    "document_3.sdoc": """[DOCUMENT]
+TITLE: Document 3
+
+[REQUIREMENT]
+UID: REQ-3
+TITLE: Requirement 3
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-2
+""",
+    "document_4.sdoc": """[DOCUMENT]
+TITLE: Document 4
+
+[TEXT]
+STATEMENT: >>>
+See [LINK: REQ-1].
+<<<
+""",
+    "document_5.sdoc": """[DOCUMENT]
+TITLE: Document 5
+
+[REQUIREMENT]
+UID: REQ-5
+TITLE: Requirement 5
+""",
+}
+
+
+def create_traceability_index(
+    default_project_config: ProjectConfig, tmp_dir: str
+) -> TraceabilityIndex:
+    project_config = default_project_config
+    project_config.input_paths = [os.path.join(tmp_dir, "input")]
+    project_config.output_dir = os.path.join(tmp_dir, "output")
+    project_config.export_output_html_root = os.path.join(
+        tmp_dir, "output", "html"
+    )
+    project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+    os.mkdir(project_config.input_paths[0])
+    for file_name_, content_ in SDOC_INPUTS.items():
+        with open(
+            os.path.join(project_config.input_paths[0], file_name_), "w"
+        ) as file_:
+            file_.write(content_)
+    return TraceabilityIndexBuilder.create(
+        project_config=project_config, parallelizer=NullParallelizer()
+    )
+
+
+def test_01_node_update_outdates_dependent_pages(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+        documents = {
+            document_.title: document_
+            for document_ in traceability_index.document_tree.document_list
+        }
+        page_update_tracker = traceability_index.page_update_tracker
+
+        pages_generated = datetime.datetime.today()
+        page_update_tracker.update_node(
+            traceability_index.get_node_by_uid("REQ-1")
+        )
+
+        def outdated_documents_(deep_trace: bool):
+            return sorted(
+                title_
+                for title_, document_ in documents.items()
+                if page_update_tracker.get_document_last_updated(
+                    document_, deep_trace=deep_trace
+                )
+                > pages_generated
+            )
+
+        assert outdated_documents_(deep_trace=False) == [
+            "Document 1",
+            "Document 2",
+            "Document 4",
+        ]
+        assert outdated_documents_(deep_trace=True) == [
+            "Document 1",
+            "Document 2",
+            "Document 3",
+            "Document 4",
+        ]
+        assert page_update_tracker.get_project_last_updated() > pages_generated
+
+        traceability_index.update_last_updated()
+        assert outdated_documents_(deep_trace=False) == [
+            "Document 1",
+            "Document 2",
+            "Document 3",
+            "Document 4",
+            "Document 5",
+        ]
+
+
+def test_02_changed_files_outdate_dependent_pages(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        previous_traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+        pages_generated = datetime.datetime.today()
+
+        # Document 5 gets a parent in Document 3.
+        path_to_document_5 = os.path.join(tmp_dir, "input", "document_5.sdoc")
+        with open(path_to_document_5, "a") as file_:
+            file_.write("RELATIONS:\n- TYPE: Parent\n  VALUE: REQ-3\n")
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=default_project_config,
+            parallelizer=NullParallelizer(),
+        )
+        page_update_tracker = traceability_index.page_update_tracker
+        outdated_documents = page_update_tracker.update_files(
+            previous_traceability_index, [path_to_document_5]
+        )
+        assert outdated_documents is not None
+        assert sorted(document_.title for document_ in outdated_documents) == [
+            "Document 1",
+            "Document 2",
+            "Document 3",
+            "Document 5",
+        ]
+
+        def outdated_documents_(deep_trace: bool):
+            return sorted(
+                document_.title
+                for document_ in traceability_index.document_tree.document_list
+                if page_update_tracker.get_document_last_updated(
+                    document_, deep_trace=deep_trace
+                )
+                > pages_generated
+            )
+
+        assert outdated_documents_(deep_trace=False) == [
+            "Document 3",
+            "Document 5",
+        ]
+        assert outdated_documents_(deep_trace=True) == [
+            "Document 1",
+            "Document 2",
+            "Document 3",
+            "Document 5",
+        ]
+
+
+def test_03_changed_document_tree_outdates_all_pages(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        previous_traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+
+        path_to_document_6 = os.path.join(tmp_dir, "input", "document_6.sdoc")
+        with open(path_to_document_6, "w") as file_:
+            file_.write("[DOCUMENT]\nTITLE: Document 6\n")
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=default_project_config,
+            parallelizer=NullParallelizer(),
+        )
+        assert (
+            traceability_index.page_update_tracker.update_files(
+                previous_traceability_index, [path_to_document_6]
+            )
+            is None
+        )
+        assert (
+            traceability_index.index_last_updated
+            > previous_traceability_index.index_last_updated
+        )
@@ -0,0 +1,125 @@
+import os
+import tempfile
+
+from strictdoc.core.reachability_index import compute_closure, iterate_bits
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
+from strictdoc.helpers.parallelizer import NullParallelizer
+
+SDOC_INPUTS = {
+    "document_1.sdoc": """[DOCUMENT]
+TITLE: Document 1
+
+[REQUIREMENT]
+UID: REQ-1
+TITLE: Requirement 1
+
+[REQUIREMENT]
+UID: REQ-5
+TITLE: Requirement 5
+""",
+    "document_2.sdoc": """[DOCUMENT]
+TITLE: Document 2
+
+[REQUIREMENT]
+UID: REQ-2
+TITLE: Requirement 2
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-1
+
+[REQUIREMENT]
+UID: REQ-3
+TITLE: Requirement 3
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-2
+""",
+    "document_3.sdoc": """[DOCUMENT]
+TITLE: Document 3
+
+[REQUIREMENT]
+UID: REQ-4
+TITLE: Requirement 4
+RELATIONS:
+- TYPE: Parent
+  VALUE: REQ-3
+- TYPE: Parent
+  VALUE: REQ-1
+""",
+}
+
+
+def test_01_closure_of_chains_and_diamonds():
+    # 0 <- 1 <- 2 <- 3, 0 <- 3.
+    closure = compute_closure([[], [0], [1], [2, 0]])
+    assert [list(iterate_bits(bits_)) for bits_ in closure] == [
+        [],
+        [0],
+        [0, 1],
+        [0, 1, 2],
+    ]
+
+
+def test_02_closure_of_cycles():
+    # 0 -> 1 -> 2 -> 0, 2 -> 3.
+    closure = compute_closure([[1], [2], [0, 3], []])
+    assert [list(iterate_bits(bits_)) for bits_ in closure] == [
+        [0, 1, 2, 3],
+        [0, 1, 2, 3],
+        [0, 1, 2, 3],
+        [],
+    ]
+
+
+def test_10_ancestors_and_descendants_follow_server_edits(
+    default_project_config,
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = default_project_config
+        project_config.input_paths = [os.path.join(tmp_dir, "input")]
+        project_config.output_dir = os.path.join(tmp_dir, "output")
+        project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+        os.mkdir(project_config.input_paths[0])
+        for file_name_, content_ in SDOC_INPUTS.items():
+            with open(
+                os.path.join(project_config.input_paths[0], file_name_), "w"
+            ) as file_:
+                file_.write(content_)
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=NullParallelizer()
+        )
+
+        def ancestors_(uid: str):
+            return sorted(
+                node_.reserved_uid
+                for node_ in traceability_index.get_ancestor_requirements(
+                    traceability_index.get_node_by_uid(uid)
+                )
+            )
+
+        def descendants_(uid: str):
+            return sorted(
+                node_.reserved_uid
+                for node_ in traceability_index.get_descendant_requirements(
+                    traceability_index.get_node_by_uid(uid)
+                )
+            )
+
+        assert ancestors_("REQ-4") == ["REQ-1", "REQ-2", "REQ-3"]
+        assert descendants_("REQ-1") == ["REQ-2", "REQ-3", "REQ-4"]
+        assert ancestors_("REQ-5") == []
+
+        requirement_1 = traceability_index.get_node_by_uid("REQ-1")
+        traceability_index.update_requirement_parent_uid(
+            requirement_1, "REQ-5", None
+        )
+        assert ancestors_("REQ-4") == ["REQ-1", "REQ-2", "REQ-3", "REQ-5"]
+        assert descendants_("REQ-5") == ["REQ-1", "REQ-2", "REQ-3", "REQ-4"]
+
+        requirement_3 = traceability_index.get_node_by_uid("REQ-3")
+        traceability_index.remove_requirement_parent_uid(
+            requirement_3, "REQ-2", None
+        )
+        assert ancestors_("REQ-4") == ["REQ-1", "REQ-3", "REQ-5"]
+        assert ancestors_("REQ-3") == []
+        assert descendants_("REQ-2") == []
@@ -0,0 +1,140 @@
+import datetime
+import os
+import tempfile
+
+from strictdoc.core.cache_store import CacheStore
+from strictdoc.core.project_config import ProjectConfig
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
+from strictdoc.core.traceability_index_snapshot import (
+    TraceabilityIndexSnapshot,
+)
+from strictdoc.helpers.parallelizer import NullParallelizer
+
+SDOC_INPUT = """[DOCUMENT]
+TITLE: Document 1
+
+[REQUIREMENT]
+UID: REQ-1
+TITLE: Requirement 1
+"""
+
+
+def create_project_config(
+    default_project_config: ProjectConfig, tmp_dir: str
+) -> ProjectConfig:
+    project_config = default_project_config
+    project_config.input_paths = [os.path.join(tmp_dir, "input")]
+    project_config.output_dir = os.path.join(tmp_dir, "output")
+    project_config.export_output_html_root = os.path.join(
+        tmp_dir, "output", "html"
+    )
+    project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+    os.mkdir(project_config.input_paths[0])
+    with open(
+        os.path.join(project_config.input_paths[0], "document.sdoc"), "w"
+    ) as file_:
+        file_.write(SDOC_INPUT)
+    return project_config
+
+
+def test_01_unchanged_project_is_loaded_from_snapshot(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=NullParallelizer()
+        )
+
+        fingerprint = TraceabilityIndexSnapshot.get_fingerprint(
+            project_config, traceability_index.strictdoc_last_update, False
+        )
+        snapshot_index = TraceabilityIndexSnapshot.read_from_cache(
+            project_config, fingerprint
+        )
+
+        assert snapshot_index is not None
+        assert snapshot_index is not traceability_index
+        assert len(snapshot_index.document_tree.document_list) == 1
+        assert snapshot_index.get_node_by_uid("REQ-1").reserved_title == (
+            "Requirement 1"
+        )
+
+
+def test_02_changed_input_invalidates_snapshot(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+        strictdoc_last_update = datetime.datetime.fromtimestamp(0)
+
+        fingerprint_before = TraceabilityIndexSnapshot.get_fingerprint(
+            project_config, strictdoc_last_update, False
+        )
+        with open(
+            os.path.join(project_config.input_paths[0], "document.sdoc"), "a"
+        ) as file_:
+            file_.write("STATEMENT: Changed\n")
+        fingerprint_after = TraceabilityIndexSnapshot.get_fingerprint(
+            project_config, strictdoc_last_update, False
+        )
+
+        assert fingerprint_before != fingerprint_after
+        assert (
+            TraceabilityIndexSnapshot.read_from_cache(
+                project_config, fingerprint_after
+            )
+            is None
+        )
+
+
+def test_03_snapshot_is_stored_in_cache_store(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+
+        TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=NullParallelizer()
+        )
+
+        bucket_stats = {
+            stats_.bucket: stats_
+            for stats_ in CacheStore.get_instance(project_config).get_stats()
+        }
+        assert bucket_stats[TraceabilityIndexSnapshot.CACHE_BUCKET].items == 1
+
+
+def test_04_failed_snapshot_is_skipped(default_project_config, capsys):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+        traceability_index = TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=NullParallelizer()
+        )
+        # A lambda cannot be pickled.
+        traceability_index.unpicklable = lambda: None
+
+        TraceabilityIndexSnapshot.save_to_cache(
+            traceability_index, project_config, "FINGERPRINT"
+        )
+
+        assert (
+            "warning: Skip saving the traceability index snapshot"
+            in capsys.readouterr().out
+        )
+        assert (
+            TraceabilityIndexSnapshot.read_from_cache(
+                project_config, "FINGERPRINT"
+            )
+            is None
+        )
+
+
+def test_05_server_does_not_save_snapshot(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = create_project_config(default_project_config, tmp_dir)
+        project_config.is_running_on_server = True
+
+        TraceabilityIndexBuilder.create(
+            project_config=project_config, parallelizer=NullParallelizer()
+        )
+
+        assert TraceabilityIndexSnapshot.CACHE_BUCKET not in {
+            stats_.bucket
+            for stats_ in CacheStore.get_instance(project_config).get_stats()
+        }
@@ -0,0 +1,116 @@
+import os
+import tempfile
+
+from strictdoc.core.project_config import ProjectConfig
+from strictdoc.core.traceability_index import TraceabilityIndex
+from strictdoc.core.traceability_index_builder import TraceabilityIndexBuilder
+from strictdoc.helpers.parallelizer import NullParallelizer
+
+SDOC_INPUT = """[DOCUMENT]
+TITLE: Document 1
+
+[REQUIREMENT]
+UID: SYS-1
+TITLE: System requirement about apples
+
+[[SECTION]]
+UID: SECT-1
+TITLE: Section
+
+[REQUIREMENT]
+UID: REQ-10
+TITLE: Requirement about pears
+
+[REQUIREMENT]
+UID: REQ-1
+TITLE: Requirement about apples
+
+[[/SECTION]]
+
+[REQUIREMENT]
+TITLE: Requirement without UID
+"""
+
+
+def create_traceability_index(
+    default_project_config: ProjectConfig, tmp_dir: str
+) -> TraceabilityIndex:
+    project_config = default_project_config
+    project_config.input_paths = [os.path.join(tmp_dir, "input")]
+    project_config.output_dir = os.path.join(tmp_dir, "output")
+    project_config.export_output_html_root = os.path.join(
+        tmp_dir, "output", "html"
+    )
+    project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+    os.mkdir(project_config.input_paths[0])
+    with open(
+        os.path.join(project_config.input_paths[0], "document.sdoc"), "w"
+    ) as file_:
+        file_.write(SDOC_INPUT)
+    return TraceabilityIndexBuilder.create(
+        project_config=project_config, parallelizer=NullParallelizer()
+    )
+
+
+def search_uids(traceability_index: TraceabilityIndex, query: str, limit=50):
+    return [
+        node_.reserved_uid
+        for node_ in traceability_index.uid_autocomplete_index.search(
+            query, exclude_node_mid=None, limit=limit
+        )
+    ]
+
+
+def test_01_uid_prefix_matches_come_first(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+
+        assert search_uids(traceability_index, "req") == [
+            "REQ-1",
+            "REQ-10",
+            "SYS-1",
+        ]
+        assert search_uids(traceability_index, "APPLES") == ["SYS-1", "REQ-1"]
+        assert search_uids(traceability_index, "1 apples") == [
+            "SYS-1",
+            "REQ-1",
+        ]
+        assert search_uids(traceability_index, "req-1 apples") == ["REQ-1"]
+        assert search_uids(traceability_index, "sect") == []
+        assert search_uids(traceability_index, "") == [
+            "SYS-1",
+            "REQ-10",
+            "REQ-1",
+        ]
+        assert search_uids(traceability_index, "", limit=2) == [
+            "SYS-1",
+            "REQ-10",
+        ]
+
+        requirement = traceability_index.get_node_by_uid("REQ-1")
+        assert traceability_index.uid_autocomplete_index.search(
+            "req-1", exclude_node_mid=requirement.reserved_mid, limit=50
+        ) == [traceability_index.get_node_by_uid("REQ-10")]
+
+
+def test_02_index_is_updated_with_the_traceability_index(
+    default_project_config,
+):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        traceability_index = create_traceability_index(
+            default_project_config, tmp_dir
+        )
+        assert search_uids(traceability_index, "pears") == ["REQ-10"]
+
+        requirement = traceability_index.get_node_by_uid("REQ-10")
+        requirement.set_field_value(
+            field_name="UID", form_field_index=0, value="REQ-20"
+        )
+        traceability_index.update_requirement_uid(requirement, "REQ-10")
+        assert search_uids(traceability_index, "pears") == ["REQ-20"]
+        assert search_uids(traceability_index, "req-1") == ["REQ-1"]
+
+        traceability_index.delete_requirement(requirement)
+        assert search_uids(traceability_index, "pears") == []
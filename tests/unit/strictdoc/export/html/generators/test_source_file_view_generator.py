@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+from pygments.formatters.html import HtmlFormatter
+from pygments.lexers.python import PythonLexer
+
+from strictdoc.core.cache_store import CacheStore
+from strictdoc.export.html.generators.source_file_view_generator import (
+    SourceFileViewHTMLGenerator,
+)
+
+
+def test_01_highlighted_lines_are_cached(default_project_config):
+    source_file_lines = [
+        "\n",
+        "def hello():\n",
+        '    print("Hello world")\n',
+        "\n",
+        "\n",
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = default_project_config
+        project_config.dir_for_sdoc_cache = os.path.join(tmp_dir, "cache")
+
+        highlighted_lines = SourceFileViewHTMLGenerator.highlight_source_lines(
+            project_config,
+            list(source_file_lines),
+            PythonLexer(),
+            HtmlFormatter(),
+        )
+        assert len(highlighted_lines) == len(source_file_lines)
+        assert highlighted_lines[0] == "<span></span>"
+        assert '<span class="k">def</span>' in highlighted_lines[1]
+
+        cache_store = CacheStore.get_instance(project_config)
+        assert [
+            (stats_.bucket, stats_.items) for stats_ in cache_store.get_stats()
+        ] == [("pygments", 1)]
+
+        assert (
+            SourceFileViewHTMLGenerator.highlight_source_lines(
+                project_config,
+                list(source_file_lines),
+                PythonLexer(),
+                HtmlFormatter(),
+            )
+            == highlighted_lines
+        )
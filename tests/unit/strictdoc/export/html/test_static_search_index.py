@@ -0,0 +1,38 @@
+from strictdoc.export.html.static_search_index import StaticSearchIndex
+
+
+def test_01_terms_are_sorted():
+    search_index = StaticSearchIndex.create(
+        {
+            "statement": {3, 1},
+            "requirement": {2},
+            "parent": {1},
+        }
+    )
+
+    assert search_index.terms == ["parent", "requirement", "statement"]
+    assert search_index.postings == [[1], [2], [1, 3]]
+    # Reversed: "tnemeriuqer" < "tnemetats" < "tnerap".
+    assert search_index.suffix_order == [1, 2, 0]
+
+
+def test_02_lookup_by_prefix_and_suffix():
+    search_index = StaticSearchIndex.create(
+        {
+            "requirement": {1},
+            "require": {2},
+            "statement": {3},
+            "parent": {4},
+            "sdoc-123": {5},
+        }
+    )
+
+    assert search_index.lookup("requirement") == {1}
+    assert search_index.lookup("req") == {1, 2}
+    assert search_index.lookup("ment") == {1, 3}
+    assert search_index.lookup("ent") == {1, 3, 4}
+    assert search_index.lookup("-123") == {5}
+    # Only prefixes and suffixes are matched, not arbitrary substrings.
+    assert search_index.lookup("quire") == {2}
+    assert search_index.lookup("tate") == set()
+    assert search_index.lookup("zzz") == set()
@@ -1,4 +1,7 @@
 import os
+from types import SimpleNamespace
+
+import pytest
 
 from strictdoc import environment
 from strictdoc.core.project_config import ProjectConfig
@@ -129,3 +132,96 @@ Hello. What nex?
         "RST markup syntax error on line 7: "
         "Bullet list ends without a blank line; unexpected unindent."
     )
+
+
+def test_batch_01_same_result_as_single_fragments(tmp_path):
+    rst_inputs = [
+        "- First item is a bullet point.\n",
+        "Plain *text* with a `link <https://strictdoc.readthedocs.io>`_.\n",
+        # Not rendered in a batch: a section title, a target, a field list.
+        "Section\n=======\n\nText.\n",
+        ".. _target:\n\nText with a target.\n",
+        ":Author: StrictDoc\n",
+        "",
+        "- First item is a bullet point.\n",
+        "A literal block::\n\n    code\n",
+    ]
+
+    project_config = ProjectConfig.default_config(environment=environment)
+    project_config.dir_for_sdoc_cache = str(tmp_path)
+    writer = RstToHtmlFragmentWriter(
+        context_document=None, project_config=project_config
+    )
+    expected_html_outputs = [
+        writer.write(rst_input_, use_cache=False) for rst_input_ in rst_inputs
+    ]
+
+    RstToHtmlFragmentWriter.clear_memory_cache()
+    assert writer.write_batch(rst_inputs) == expected_html_outputs
+    # The second time, the fragments come from the memory cache.
+    assert writer.write_batch(rst_inputs) == expected_html_outputs
+
+
+def test_batch_02_error_is_attributed_to_fragment(tmp_path):
+    rst_inputs = [
+        "Some text.\n",
+        "- Bullet list\nwithout a blank line.\n",
+        "More text.\n",
+    ]
+
+    project_config = ProjectConfig.default_config(environment=environment)
+    project_config.dir_for_sdoc_cache = str(tmp_path)
+    writer = RstToHtmlFragmentWriter(
+        context_document=None, project_config=project_config
+    )
+    RstToHtmlFragmentWriter.clear_memory_cache()
+    with pytest.raises(RuntimeError) as exc_info:
+        writer.write_batch(rst_inputs)
+    assert "RST markup syntax error on line 2" in str(exc_info.value)
+    assert "RST fragment: >>>\n- Bullet list\n" in str(exc_info.value)
+
+
+def test_batch_03_indented_fragment_is_not_raw_html(tmp_path):
+    rst_inputs = [
+        "Some text.\n",
+        "   An indented <b>block quote</b> of a requirement.\n",
+        "\n  Another indented block quote after a blank line.\n",
+        "More text.\n",
+    ]
+
+    project_config = ProjectConfig.default_config(environment=environment)
+    project_config.dir_for_sdoc_cache = str(tmp_path)
+    writer = RstToHtmlFragmentWriter(
+        context_document=None, project_config=project_config
+    )
+    expected_html_outputs = [
+        writer.write(rst_input_, use_cache=False) for rst_input_ in rst_inputs
+    ]
+    assert "&lt;b&gt;block quote&lt;/b&gt;" in expected_html_outputs[1]
+
+    RstToHtmlFragmentWriter.clear_memory_cache()
+    assert writer.write_batch(rst_inputs) == expected_html_outputs
+
+
+def test_cache_01_fragments_are_cached_per_document(tmp_path):
+    project_config = ProjectConfig.default_config(environment=environment)
+    project_config.dir_for_sdoc_cache = str(tmp_path / "cache")
+
+    html_outputs = []
+    for document_dir_, image_file_ in (("a", "x.png"), ("b", "x.svg")):
+        path_to_document_dir = tmp_path / document_dir_
+        path_to_document_dir.mkdir()
+        (path_to_document_dir / image_file_).write_text("")
+        context_document = SimpleNamespace(
+            meta=SimpleNamespace(
+                output_document_dir_full_path=str(path_to_document_dir)
+            )
+        )
+        writer = RstToHtmlFragmentWriter(
+            context_document=context_document, project_config=project_config
+        )
+        html_outputs.append(writer.write(".. image:: x.*\n"))
+
+    assert "x.png" in html_outputs[0]
+    assert "x.svg" in html_outputs[1]
+    assert "x.png" not in html_outputs[1]
@@ -19,3 +19,21 @@ def test_auto_described():
     expected_string = "Example(dict_var = {}, set_var = set(0 elements), bytes_var = b'', int_var = 5, other_class_var = Example_OtherClass(...))"
     assert example.__str__() == expected_string
     assert example.__repr__() == expected_string
+
+
+def test_auto_described_with_slots():
+    class Example_Base:
+        __slots__ = ("base_var",)
+
+    @auto_described
+    class Example(Example_Base):
+        __slots__ = ("int_var", "unset_var")
+
+        def __init__(self):
+            self.base_var: str = "base"
+            self.int_var: int = 5
+
+    example = Example()
+
+    expected_string = 'Example(base_var = "base", int_var = 5)'
+    assert example.__str__() == expected_string
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+
+from strictdoc.helpers.file_fingerprint import FileFingerprintManifest
+from strictdoc.helpers.md5 import get_file_md5
+
+
+def create_old_file(path_to_file: str, content: str) -> None:
+    with open(path_to_file, "w", encoding="utf8") as file_:
+        file_.write(content)
+    # Move the modification time out of the racy window.
+    old_time_ns = time.time_ns() - 10 * FileFingerprintManifest.RACY_WINDOW_NS
+    os.utime(path_to_file, ns=(old_time_ns, old_time_ns))
+
+
+def test_01_checksum_is_reused_if_stat_is_unchanged():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_file = os.path.join(tmp_dir, "input.sdoc")
+        path_to_manifest = os.path.join(tmp_dir, "cache", "file_fingerprints")
+        create_old_file(path_to_file, "AAA")
+        file_stat = os.stat(path_to_file)
+
+        manifest = FileFingerprintManifest(path_to_manifest)
+        assert manifest.get_file_md5(
+            path_to_file, verify_content=False
+        ) == get_file_md5(path_to_file)
+
+        # Same size and modification time: the stored checksum is returned
+        # without reading the file.
+        with open(path_to_file, "w", encoding="utf8") as file_:
+            file_.write("BBB")
+        os.utime(
+            path_to_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns)
+        )
+        assert manifest.get_file_md5(
+            path_to_file, verify_content=False
+        ) != get_file_md5(path_to_file)
+
+        # Content verification always hashes the file.
+        assert manifest.get_file_md5(
+            path_to_file, verify_content=True
+        ) == get_file_md5(path_to_file)
+
+
+def test_02_changed_file_is_rehashed_and_manifest_is_reloaded():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_file = os.path.join(tmp_dir, "input.sdoc")
+        path_to_manifest = os.path.join(tmp_dir, "cache", "file_fingerprints")
+        create_old_file(path_to_file, "AAA")
+
+        manifest = FileFingerprintManifest(path_to_manifest)
+        manifest.get_file_md5(path_to_file, verify_content=False)
+
+        create_old_file(path_to_file, "BBBB")
+        assert manifest.get_file_md5(
+            path_to_file, verify_content=False
+        ) == get_file_md5(path_to_file)
+
+        reloaded_manifest = FileFingerprintManifest(path_to_manifest)
+        assert reloaded_manifest.entries == manifest.entries
+        assert len(reloaded_manifest.entries) == 1
+
+
+def test_03_recently_modified_file_is_not_recorded():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_file = os.path.join(tmp_dir, "input.sdoc")
+        path_to_manifest = os.path.join(tmp_dir, "cache", "file_fingerprints")
+        with open(path_to_file, "w", encoding="utf8") as file_:
+            file_.write("AAA")
+
+        manifest = FileFingerprintManifest(path_to_manifest)
+        assert manifest.get_file_md5(
+            path_to_file, verify_content=False
+        ) == get_file_md5(path_to_file)
+        assert len(manifest.entries) == 0
+        assert not os.path.exists(path_to_manifest)
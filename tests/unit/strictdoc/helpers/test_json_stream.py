@@ -0,0 +1,50 @@
+import io
+import json
+
+import pytest
+
+from strictdoc.helpers.json_stream import iterate_json_array_items
+
+JSON_INPUT = {
+    "format_version": "1",
+    "files": [
+        {"file": "src/main.c", "functions": [{"execution_count": 12345}]},
+        {"file": "src/ünicode.c", "functions": [], "ratio": 0.5},
+        [True, False, None, 'a \\" b'],
+    ],
+    "gcc_version": "12.2.0",
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_01_items_are_decoded_across_chunks(chunk_size):
+    content = json.dumps(JSON_INPUT, indent=2, ensure_ascii=False)
+
+    items = list(
+        iterate_json_array_items(
+            io.StringIO(content), "files", chunk_size=chunk_size
+        )
+    )
+
+    assert items == JSON_INPUT["files"]
+
+
+def test_02_missing_or_empty_array():
+    assert list(iterate_json_array_items(io.StringIO("{}"), "files")) == []
+    assert (
+        list(iterate_json_array_items(io.StringIO('{"files": []}'), "files"))
+        == []
+    )
+    assert (
+        list(iterate_json_array_items(io.StringIO('{"files": 1}'), "files"))
+        == []
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", "[]", '{"files": [1, 2', '{"files": [1 2]}', "{files: []}"],
+)
+def test_03_malformed_input(content):
+    with pytest.raises(json.JSONDecodeError):
+        list(iterate_json_array_items(io.StringIO(content), "files"))
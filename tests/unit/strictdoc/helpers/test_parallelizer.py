@@ -75,3 +75,86 @@ def test_use_case_when_interrupted_with_sigterm():
         )
     finally:
         parallelizer.shutdown()
+
+
+def child_process_that_adds_context(context, input_number):
+    return context + input_number
+
+
+def child_process_with_context_that_fails(_, __):
+    raise AssertionError("This child process always fails.")
+
+
+def test_run_parallel_with_context():
+    parallelizer = MultiprocessingParallelizer()
+
+    input_items = list(range(100))
+
+    try:
+        output_items = parallelizer.run_parallel_with_context(
+            input_items, child_process_that_adds_context, context=1000
+        )
+
+        assert list(output_items) == [1000 + item for item in input_items]
+    finally:
+        parallelizer.shutdown()
+
+
+def test_run_parallel_with_context_if_child_process_fails():
+    parallelizer = MultiprocessingParallelizer()
+
+    try:
+        with pytest.raises(Exception) as exc_info:
+            parallelizer.run_parallel_with_context(
+                ["FAKE_INPUT"],
+                child_process_with_context_that_fails,
+                context=None,
+            )
+
+        assert exc_info.type is StrictDocChildProcessException
+        assert exc_info.value.args[0].exception.args[0] == (
+            "This child process always fails."
+        )
+    finally:
+        parallelizer.shutdown()
+
+
+def test_run_parallel_streaming():
+    parallelizer = MultiprocessingParallelizer()
+
+    try:
+        output_items = parallelizer.run_parallel_streaming(
+            iter(range(100)),
+            child_process_that_multiplies_by_two,
+            chunk_size=3,
+            max_chunks_in_flight=2,
+        )
+        assert list(output_items) == [item * 2 for item in range(100)]
+
+        output_items = parallelizer.run_parallel_streaming(
+            list(range(100)),
+            child_process_that_multiplies_by_two,
+            ordered=False,
+        )
+        assert sorted(output_items) == [item * 2 for item in range(100)]
+    finally:
+        parallelizer.shutdown()
+
+
+def test_run_parallel_streaming_if_child_process_fails():
+    parallelizer = MultiprocessingParallelizer()
+
+    try:
+        with pytest.raises(Exception) as exc_info:
+            list(
+                parallelizer.run_parallel_streaming(
+                    ["FAKE_INPUT"], child_process_that_fails
+                )
+            )
+
+        assert exc_info.type is StrictDocChildProcessException
+        assert exc_info.value.args[0].exception.args[0] == (
+            "This child process always fails."
+        )
+    finally:
+        parallelizer.shutdown()
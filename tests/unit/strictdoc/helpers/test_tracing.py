@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from strictdoc.helpers.parallelizer import MultiprocessingParallelizer
+from strictdoc.helpers.timing import measure_performance, timing_decorator
+from strictdoc.helpers.tracing import (
+    TraceCategory,
+    Tracer,
+    create_trace_report,
+    get_tracer,
+    trace_span,
+)
+
+
+@timing_decorator("Traced phase")
+def traced_phase():
+    with measure_performance("Published: Document", TraceCategory.DOCUMENT):
+        pass
+
+
+def child_process_with_span(input_number):
+    with measure_performance(
+        f"File: {input_number}", TraceCategory.SOURCE_FILE
+    ):
+        return input_number * 2
+
+
+def test_01_disabled_by_default():
+    assert get_tracer() is None
+
+    traced_phase()
+
+    assert get_tracer() is None
+
+
+def test_02_spans_of_main_and_worker_processes():
+    tracer = Tracer.enable()
+    parallelizer = MultiprocessingParallelizer()
+    try:
+        traced_phase()
+        assert list(
+            parallelizer.run_parallel([1, 2, 3], child_process_with_span)
+        ) == [2, 4, 6]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path_to_trace = os.path.join(tmp_dir, "trace", "trace.json")
+            events = tracer.write_chrome_trace(path_to_trace)
+            with open(path_to_trace, encoding="utf-8") as trace_file:
+                chrome_trace = json.load(trace_file)
+    finally:
+        parallelizer.shutdown()
+        Tracer.disable()
+    assert get_tracer() is None
+
+    assert [
+        (event_["name"], event_["cat"], event_["pid"] == os.getpid())
+        for event_ in events
+    ][:2] == [
+        ("Traced phase", TraceCategory.PHASE, True),
+        ("Published: Document", TraceCategory.DOCUMENT, True),
+    ]
+    worker_events = [
+        event_ for event_ in events if event_["pid"] != os.getpid()
+    ]
+    assert sorted(event_["name"] for event_ in worker_events) == [
+        "File: 1",
+        "File: 2",
+        "File: 3",
+    ]
+    for event_ in events:
+        assert event_["ph"] == "X"
+        assert event_["dur"] >= 0
+        assert event_["args"]["cpu_ms"] >= 0
+
+    assert chrome_trace["traceEvents"][-len(events) :] == events
+    assert {
+        event_["pid"]
+        for event_ in chrome_trace["traceEvents"]
+        if event_["ph"] == "M"
+    } == {event_["pid"] for event_ in events}
+
+    trace_report = create_trace_report(events)
+    assert "Traced phase ...." in trace_report
+    assert "Documents ...." in trace_report
+    assert "Source files ...." in trace_report
+    assert "3 spans" in trace_report
+
+
+def test_03_spans_of_failed_steps_are_recorded():
+    tracer = Tracer.enable()
+    try:
+        with pytest.raises(ValueError):
+            with measure_performance("Failed step"):
+                with trace_span("Failed span", TraceCategory.DOCUMENT):
+                    raise ValueError
+        events = tracer.collect_events()
+    finally:
+        Tracer.disable()
+
+    assert [event_["name"] for event_ in events] == [
+        "Failed step",
+        "Failed span",
+    ]
@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+from strictdoc.server.file_watcher import ProjectFileWatcher
+
+
+def test_01_changed_files(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = default_project_config
+        project_config.input_paths = [tmp_dir]
+        path_to_document_1 = os.path.join(tmp_dir, "document_1.sdoc")
+        path_to_document_2 = os.path.join(tmp_dir, "document_2.sdoc")
+        for path_to_document_ in (path_to_document_1, path_to_document_2):
+            with open(path_to_document_, "w") as file_:
+                file_.write("[DOCUMENT]\nTITLE: Document\n")
+
+        file_watcher = ProjectFileWatcher(
+            project_config, on_change=lambda _: None
+        )
+        file_watcher.file_states = file_watcher._get_file_states()
+        assert file_watcher.get_changed_files() == []
+
+        # The server touches the documents that it renders.
+        os.utime(path_to_document_1, ns=(0, 0))
+        assert file_watcher.get_changed_files() == []
+
+        with open(path_to_document_1, "a") as file_:
+            file_.write("\n[TEXT]\nSTATEMENT: Text\n")
+        os.remove(path_to_document_2)
+        path_to_document_3 = os.path.join(tmp_dir, "document_3.sdoc")
+        with open(path_to_document_3, "w") as file_:
+            file_.write("[DOCUMENT]\nTITLE: Document 3\n")
+        assert file_watcher.get_changed_files() == sorted(
+            [path_to_document_1, path_to_document_2, path_to_document_3]
+        )
+        assert file_watcher.get_changed_files() == []
+
+
+def test_02_suppress_changes_of_written_files(default_project_config):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_config = default_project_config
+        project_config.input_paths = [tmp_dir]
+        path_to_document_1 = os.path.join(tmp_dir, "document_1.sdoc")
+        path_to_document_2 = os.path.join(tmp_dir, "document_2.sdoc")
+        for path_to_document_ in (path_to_document_1, path_to_document_2):
+            with open(path_to_document_, "w") as file_:
+                file_.write("[DOCUMENT]\nTITLE: Document\n")
+
+        file_watcher = ProjectFileWatcher(
+            project_config, on_change=lambda _: None
+        )
+        file_watcher.file_states = file_watcher._get_file_states()
+
+        # A file changed outside the server before the server writes another
+        # one is still reported.
+        with open(path_to_document_1, "a") as file_:
+            file_.write("\n[TEXT]\nSTATEMENT: Outside\n")
+        path_to_document_3 = os.path.join(tmp_dir, "document_3.sdoc")
+        with file_watcher.lock:
+            for path_to_document_ in (path_to_document_2, path_to_document_3):
+                with open(path_to_document_, "w") as file_:
+                    file_.write("[DOCUMENT]\nTITLE: Server\n")
+            file_watcher.suppress_changes(
+                [path_to_document_2, path_to_document_3]
+            )
+        assert file_watcher.get_changed_files() == [path_to_document_1]